@@ -7,7 +7,8 @@ from flask_restx import Api
 from config import DevelopmentConfig
 
 
-facade = HBnBFacade()
+# Built at import, before create_app(): durable mode is set by HBNB_DATA_DIR
+facade = HBnBFacade(data_dir=DevelopmentConfig.DATA_DIR)
 
 
 def create_app(config_class=DevelopmentConfig):
@@ -0,0 +1,205 @@
+#!/usr/bin/python3
+"""Thread-safe InMemoryRepository with striped reader/writer locks"""
+
+import threading
+
+from app.persistence.repository import InMemoryRepository
+
+
+class RWLock:
+    """
+    Reader/writer lock: many readers or one writer.
+
+    Writers are preferred (new readers wait while a writer is queued), so a
+    stream of reads cannot starve a delete. Both sides are reentrant for the
+    thread holding them, and the writer may also read. Upgrading a read lock
+    to a write lock would deadlock and raises RuntimeError instead.
+    """
+
+    def __init__(self):
+        self._mutex = threading.Lock()
+        self._cond = threading.Condition(self._mutex)
+        self._readers = {}          # thread id -> read depth
+        self._writer = None         # thread id holding the write lock
+        self._write_depth = 0
+        self._writers_waiting = 0
+
+    def acquire_read(self):
+        me = threading.get_ident()
+        with self._mutex:
+            if self._writer == me or me in self._readers:
+                self._readers[me] = self._readers.get(me, 0) + 1
+                return
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers[me] = 1
+
+    def release_read(self):
+        me = threading.get_ident()
+        with self._mutex:
+            depth = self._readers[me] - 1
+            if depth:
+                self._readers[me] = depth
+            else:
+                del self._readers[me]
+                if not self._readers:
+                    self._cond.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        with self._mutex:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("Cannot upgrade a read lock to a write lock")
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self):
+        with self._mutex:
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+
+class StripedLocks:
+    """A fixed array of RWLocks; a key always maps to the same stripe"""
+
+    def __init__(self, stripes=64):
+        self._locks = [RWLock() for _ in range(stripes)]
+
+    def stripe(self, key):
+        try:
+            return hash(key) % len(self._locks)
+        except TypeError:
+            # Unhashable input (e.g. a malformed id from a JSON body)
+            return hash(repr(key)) % len(self._locks)
+
+    def read(self, *keys):
+        return _Held(self._sorted(keys), write=False)
+
+    def write(self, *keys):
+        return _Held(self._sorted(keys), write=True)
+
+    def _sorted(self, keys):
+        # Each stripe once, in index order: two threads locking overlapping
+        # key sets always queue in the same order (no deadlock)
+        if len(keys) == 1:
+            return [self._locks[self.stripe(keys[0])]]
+        return [self._locks[i] for i in sorted({self.stripe(key) for key in keys})]
+
+
+class _Held:
+    """Context manager holding a list of RWLocks (a class: cheaper than a generator)"""
+
+    __slots__ = ('_locks', '_write', '_acquired')
+
+    def __init__(self, locks, write):
+        self._locks = locks
+        self._write = write
+
+    def __enter__(self):
+        self._acquired = []
+        try:
+            for lock in self._locks:
+                lock.acquire_write() if self._write else lock.acquire_read()
+                self._acquired.append(lock)
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+
+    def __exit__(self, *exc):
+        for lock in reversed(self._acquired):
+            lock.release_write() if self._write else lock.release_read()
+        self._acquired = []
+
+
+class ConcurrentInMemoryRepository(InMemoryRepository):
+    """
+    InMemoryRepository safe to share between request threads.
+
+    - Objects are guarded by striped RW locks on their id: get() reads,
+      add()/update()/delete() write. Operations on ids of different stripes
+      never wait for each other.
+    - Index entries have their own stripes, keyed by (attribute, value).
+      Lock order is always object stripes, then index stripes, each in
+      stripe order.
+    - get_all() copies the storage dict (one atomic C-level copy) and takes
+      no lock: it returns a consistent point-in-time snapshot and never
+      blocks or waits for writers.
+    - locked(*ids) / read_locked(*ids) hold several ids at once for compound
+      operations (check-then-act across repositories, cascades). Calls to
+      this repository from inside the block are fine (locks are reentrant),
+      but a read-locked id cannot be written in the same block.
+
+    Objects are shared references: a caller mutating one outside update()
+    must hold locked(obj.id) and call reindex(obj).
+    """
+
+    def __init__(self, indexes=(), multi_indexes=(), stripes=64):
+        super().__init__(indexes, multi_indexes)
+        self._object_locks = StripedLocks(stripes)
+        self._index_locks = StripedLocks(stripes)
+
+    def locked(self, *obj_ids):
+        return self._object_locks.write(*obj_ids)
+
+    def read_locked(self, *obj_ids):
+        return self._object_locks.read(*obj_ids)
+
+    def add(self, obj):
+        with self.locked(obj.id):
+            super().add(obj)
+
+    def get(self, obj_id):
+        with self.read_locked(obj_id):
+            return super().get(obj_id)
+
+    def get_all(self):
+        return list(self._storage.copy().values())
+
+    def update(self, obj_id, data):
+        with self.locked(obj_id):
+            return super().update(obj_id, data)
+
+    def delete(self, obj_id):
+        with self.locked(obj_id):
+            return super().delete(obj_id)
+
+    def reindex(self, obj):
+        with self.locked(obj.id):
+            super().reindex(obj)
+
+    def get_by_attribute(self, attr_name, attr_value):
+        if attr_name in self._indexes or attr_name in self._multi_indexes:
+            with self._index_locks.read((attr_name, attr_value)):
+                return super().get_by_attribute(attr_name, attr_value)
+        return next((obj for obj in self.get_all() if getattr(obj, attr_name, None) == attr_value), None)
+
+    def get_all_by_attribute(self, attr_name, attr_value):
+        if attr_name in self._indexes or attr_name in self._multi_indexes:
+            with self._index_locks.read((attr_name, attr_value)):
+                return super().get_all_by_attribute(attr_name, attr_value)
+        return [obj for obj in self.get_all() if getattr(obj, attr_name, None) == attr_value]
+
+    def _reindex(self, obj):
+        # Called with obj's stripe write-locked: lock the entries it leaves and joins
+        if not self._attrs:
+            return
+        current = zip(self._attrs, self._indexed_values.get(obj.id, ()))
+        keys = [(attr, getattr(obj, attr, None)) for attr in self._attrs]
+        with self._index_locks.write(*keys, *current):
+            super()._reindex(obj)
+
+    def _unindex(self, obj_id):
+        # super()._reindex() unindexes with the locks above already held (reentrant)
+        with self._index_locks.write(*zip(self._attrs, self._indexed_values.get(obj_id, ()))):
+            super()._unindex(obj_id)
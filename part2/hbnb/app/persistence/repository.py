@@ -2,6 +2,7 @@
 """Repository pattern with InMemoryRepository"""
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 
 class Repository(ABC):
     @abstractmethod
@@ -30,10 +31,30 @@ class Repository(ABC):
 
 
 class InMemoryRepository(Repository):
-    def __init__(self):
+    """
+    Dict storage with optional hash indexes on attributes.
+
+    indexes:       unique attributes (e.g. 'email'):   value -> obj id
+    multi_indexes: one-to-many attributes (e.g. 'place_id'): value -> {obj id: None}
+                   (a dict keeps insertion order, like a scan would)
+
+    Lookups on an indexed attribute are O(1); other attributes are scanned.
+    Indexes follow add(), update() and delete(). An object changed in place
+    must be passed to reindex(). None values are not indexed.
+
+    Not thread-safe: see ConcurrentInMemoryRepository for threaded servers.
+    """
+
+    def __init__(self, indexes=(), multi_indexes=()):
         self._storage = {}
+        self._indexes = {attr: {} for attr in indexes}
+        self._multi_indexes = {attr: {} for attr in multi_indexes}
+        self._attrs = tuple(self._indexes) + tuple(self._multi_indexes)
+        # obj id -> values of _attrs as currently indexed (to unindex old values)
+        self._indexed_values = {}
 
     def add(self, obj):
+        self._reindex(obj)
         self._storage[obj.id] = obj
 
     def get(self, obj_id):
@@ -46,13 +67,97 @@ class InMemoryRepository(Repository):
         obj = self.get(obj_id)
         if obj:
             obj.update(data)
+            self._reindex(obj)
+        return obj
 
     def delete(self, obj_id):
         if obj_id in self._storage:
+            self._unindex(obj_id)
             del self._storage[obj_id]
+            return True
+        return False
 
     def get_by_attribute(self, attr_name, attr_value):
+        if attr_name in self._indexes:
+            obj_id = self._indexes[attr_name].get(attr_value) if attr_value is not None else None
+            return self._storage.get(obj_id)
+        if attr_name in self._multi_indexes:
+            return next(iter(self.get_all_by_attribute(attr_name, attr_value)), None)
         return next(
             (obj for obj in self._storage.values() if getattr(obj, attr_name, None) == attr_value),
             None
         )
+
+    def get_all_by_attribute(self, attr_name, attr_value):
+        """All objects whose attribute equals attr_value (indexed: O(matches))"""
+        if attr_name in self._multi_indexes:
+            ids = self._multi_indexes[attr_name].get(attr_value, {}) if attr_value is not None else {}
+            # .get(): an id can be indexed just before add() stores its object
+            return [obj for obj in map(self._storage.get, ids) if obj is not None]
+        if attr_name in self._indexes:
+            obj = self.get_by_attribute(attr_name, attr_value)
+            return [obj] if obj is not None else []
+        return [obj for obj in self._storage.values() if getattr(obj, attr_name, None) == attr_value]
+
+    def load(self, objects):
+        """Bulk add (e.g. objects recovered from disk), before the repository is shared"""
+        # Column by column: C-level zips instead of one _insert() per object
+        ids = [obj.id for obj in objects]
+        self._storage.update(zip(ids, objects))
+        if not self._attrs:
+            return
+        columns = [[getattr(obj, attr, None) for obj in objects] for attr in self._attrs]
+        for index, column in zip(self._indexes.values(), columns):
+            index.update((value, obj_id) for value, obj_id in zip(column, ids) if value is not None)
+        for index, column in zip(self._multi_indexes.values(), columns[len(self._indexes):]):
+            for value, obj_id in zip(column, ids):
+                if value is not None:
+                    entry = index.get(value)
+                    if entry is None:
+                        index[value] = entry = {}
+                    entry[obj_id] = None
+        self._indexed_values.update(zip(ids, zip(*columns)))
+
+    def locked(self, *obj_ids):
+        """Hold obj_ids for a compound operation (no-op: single-threaded use)"""
+        return nullcontext()
+
+    def read_locked(self, *obj_ids):
+        return nullcontext()
+
+    def reindex(self, obj):
+        """Move obj to the index entries of its current attribute values"""
+        if obj.id in self._storage:
+            self._reindex(obj)
+
+    def _reindex(self, obj):
+        if not self._attrs:
+            return
+        values = tuple(getattr(obj, attr, None) for attr in self._attrs)
+        # Check first: on a duplicate, the object stays indexed as before
+        for (attr, index), value in zip(self._indexes.items(), values):
+            if value is not None and index.get(value, obj.id) != obj.id:
+                raise ValueError(f"Duplicate {attr} '{value}'")
+        self._unindex(obj.id)
+        self._insert(obj.id, values)
+
+    def _insert(self, obj_id, values):
+        for index, value in zip(self._indexes.values(), values):
+            if value is not None:
+                index[value] = obj_id
+        for index, value in zip(self._multi_indexes.values(), values[len(self._indexes):]):
+            if value is not None:
+                index.setdefault(value, {})[obj_id] = None
+        self._indexed_values[obj_id] = values
+
+    def _unindex(self, obj_id):
+        for attr, value in zip(self._attrs, self._indexed_values.pop(obj_id, ())):
+            if attr in self._indexes:
+                if self._indexes[attr].get(value) == obj_id:
+                    del self._indexes[attr][value]
+            else:
+                ids = self._multi_indexes[attr].get(value)
+                if ids is not None:
+                    ids.pop(obj_id, None)
+                    if not ids:
+                        del self._multi_indexes[attr][value]
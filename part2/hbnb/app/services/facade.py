@@ -1,4 +1,5 @@
-from app.persistence.repository import InMemoryRepository
+from app.persistence.concurrent_repository import ConcurrentInMemoryRepository
+from app.persistence.durable_store import DurableStore, DurableInMemoryRepository
 from datetime import datetime
 from app.models.user import User
 from app.models.amenity import Amenity
@@ -6,11 +7,25 @@ from app.models.place import Place
 from app.models.review import Review
 
 class HBnBFacade:
-    def __init__(self):
-        self.user_repo = InMemoryRepository()
-        self.amenity_repo = InMemoryRepository()
-        self.place_repo = InMemoryRepository()
-        self.review_repo = InMemoryRepository()
+    def __init__(self, repository_class=ConcurrentInMemoryRepository, data_dir=None):
+        # data_dir: durable mode, every change is logged there and reloaded
+        # on the next start (see DurableStore)
+        self.store = DurableStore(data_dir) if data_dir else None
+
+        def repository(name, model, **indexes):
+            if self.store:
+                return DurableInMemoryRepository(self.store, name, model, **indexes)
+            return repository_class(**indexes)
+
+        # Hash indexes: O(1) signup email check and per-owner/per-place lookups.
+        # Compound operations lock users, then amenities, then places, then
+        # reviews (always in that order, so they cannot deadlock).
+        self.user_repo = repository('users', User, indexes=('email',))
+        self.amenity_repo = repository('amenities', Amenity)
+        self.place_repo = repository('places', Place, multi_indexes=('owner_id',))
+        self.review_repo = repository('reviews', Review, multi_indexes=('place_id', 'user_id'))
+        if self.store:
+            self.store.open()
 
 
     # --- Users ---
@@ -30,7 +45,11 @@ class HBnBFacade:
         # KEY FIX: Call save() to run validation (password hashing removed from User.save())
         user.save() 
         
-        self.user_repo.add(user)
+        try:
+            self.user_repo.add(user)
+        except ValueError:
+            # A concurrent signup took the email after the check above
+            raise ValueError("Email already registered")
         return user
 
     def get_user(self, user_id):
@@ -53,24 +72,24 @@ class HBnBFacade:
         for field in ['id', 'email', 'created_at']: # updated_at must be updated by save()
             if field in data:
                 raise ValueError(f"Cannot update '{field}'")
-        user.update(data) # user.update() calls user.save() internally
-        return user
+        return self.user_repo.update(user_id, data) # user.update() calls user.save() internally
 
     def delete_user(self, user_id):
         """Delete a user and their associated places (cascade-like logic)"""
-        user = self.user_repo.get(user_id)
-        if not user:
-            return False
-
-        # Find and delete all places owned by this user
-        places_to_delete = [
-            place.id for place in self.place_repo.get_all() 
-            if place.owner_id == user_id
-        ]
-        for place_id in places_to_delete:
-            self.place_repo.delete(place_id) 
-
-        self.user_repo.delete(user_id)
+        # Write lock: no place can be created for this owner meanwhile
+        with self.user_repo.locked(user_id):
+            user = self.user_repo.get(user_id)
+            if not user:
+                return False
+
+            # Find and delete all places owned by this user
+            places_to_delete = [
+                place.id for place in self.place_repo.get_all_by_attribute('owner_id', user_id)
+            ]
+            for place_id in places_to_delete:
+                self.place_repo.delete(place_id) 
+
+            self.user_repo.delete(user_id)
         return True
 
     # --- Amenities ---
@@ -101,62 +120,70 @@ class HBnBFacade:
         if not amenity:
             return None
         if "name" in amenity_data:
-            amenity.name = amenity_data["name"]
-            amenity.save() # Use save() to update updated_at and validate
+            with self.amenity_repo.locked(amenity_id):
+                amenity.name = amenity_data["name"]
+                amenity.save() # Use save() to update updated_at and validate
+                self.amenity_repo.reindex(amenity) # Changed in place (durable mode logs it)
         return amenity
 
     def delete_amenity(self, amenity_id):
         """Delete an amenity and update places that might reference it."""
-        amenity = self.amenity_repo.get(amenity_id)
-        if not amenity:
-            return False
-
-        # Update all places to remove this amenity from their list
-        for place in self.place_repo.get_all():
-            # Ensure the list contains objects before checking
-            if isinstance(place.amenities, list) and place.amenities and hasattr(place.amenities[0], 'id'):
-                # Filter out the amenity object by its ID
-                original_length = len(place.amenities)
-                place.amenities = [a for a in place.amenities if a.id != amenity_id]
-                
-                # If the list changed, save the place
-                if len(place.amenities) < original_length:
-                    place.save()
-        
-        self.amenity_repo.delete(amenity_id)
+        with self.amenity_repo.locked(amenity_id):
+            amenity = self.amenity_repo.get(amenity_id)
+            if not amenity:
+                return False
+
+            # Update all places to remove this amenity from their list
+            for place in self.place_repo.get_all():
+                # Ensure the list contains objects before checking
+                if isinstance(place.amenities, list) and place.amenities and hasattr(place.amenities[0], 'id'):
+                    with self.place_repo.locked(place.id):
+                        # Filter out the amenity object by its ID
+                        original_length = len(place.amenities)
+                        place.amenities = [a for a in place.amenities if a.id != amenity_id]
+
+                        # If the list changed, save the place
+                        if len(place.amenities) < original_length:
+                            place.save()
+                            self.place_repo.reindex(place)
+
+            self.amenity_repo.delete(amenity_id)
         return True
 
     # --- Places ---
     def create_place(self, place_data):
-        owner = self.user_repo.get(place_data.get("owner_id"))
-        if not owner:
-            raise ValueError("Owner not found")
-
-        # Retrieve amenity objects from IDs
-        amenity_ids = place_data.get("amenities", [])
-        amenities = []
-        if amenity_ids:
-            for a_id in amenity_ids:
-                amenity = self.amenity_repo.get(a_id)
-                if not amenity:
-                    raise ValueError(f"Amenity ID '{a_id}' not found")
-                amenities.append(amenity)
-
-        # Use kwargs for deserialization robustness in Place model
-        place_kwargs = {
-            "title": place_data["title"],
-            "description": place_data.get("description", ""),
-            "price": place_data["price"],
-            "latitude": place_data["latitude"],
-            "longitude": place_data["longitude"],
-            "owner_id": owner.id,
-            "amenities": amenities # Pass objects, not IDs
-        }
+        # Read locks: the owner and the amenities cannot be deleted meanwhile
+        with self.user_repo.read_locked(place_data.get("owner_id")), \
+                self.amenity_repo.read_locked(*(place_data.get("amenities") or [])):
+            owner = self.user_repo.get(place_data.get("owner_id"))
+            if not owner:
+                raise ValueError("Owner not found")
+
+            # Retrieve amenity objects from IDs
+            amenity_ids = place_data.get("amenities", [])
+            amenities = []
+            if amenity_ids:
+                for a_id in amenity_ids:
+                    amenity = self.amenity_repo.get(a_id)
+                    if not amenity:
+                        raise ValueError(f"Amenity ID '{a_id}' not found")
+                    amenities.append(amenity)
+
+            # Use kwargs for deserialization robustness in Place model
+            place_kwargs = {
+                "title": place_data["title"],
+                "description": place_data.get("description", ""),
+                "price": place_data["price"],
+                "latitude": place_data["latitude"],
+                "longitude": place_data["longitude"],
+                "owner_id": owner.id,
+                "amenities": amenities # Pass objects, not IDs
+            }
         
-        # Place constructor now handles validation and BaseModel initialization
-        place = Place(**place_kwargs) 
+            # Place constructor now handles validation and BaseModel initialization
+            place = Place(**place_kwargs) 
         
-        self.place_repo.add(place)
+            self.place_repo.add(place)
         return place
 
     def get_place(self, place_id):
@@ -189,8 +216,7 @@ class HBnBFacade:
                 update_data[key] = value
 
         # Update the place object using the update method (which handles validation and save)
-        place.update(update_data) 
-        return place
+        return self.place_repo.update(place_id, update_data)
 
     def delete_place(self, place_id):
         """Delete a place."""
@@ -215,16 +241,17 @@ class HBnBFacade:
         user_id = review_data.get('user_id')
         place_id = review_data.get('place_id')
 
-        if not user_id or not self.user_repo.get(user_id):
-            raise ValueError("Invalid or missing user_id.")
-        if not place_id or not self.place_repo.get(place_id):
-            raise ValueError("Invalid or missing place_id.")
+        with self.user_repo.read_locked(user_id), self.place_repo.read_locked(place_id):
+            if not user_id or not self.user_repo.get(user_id):
+                raise ValueError("Invalid or missing user_id.")
+            if not place_id or not self.place_repo.get(place_id):
+                raise ValueError("Invalid or missing place_id.")
 
-        review = Review(**review_data)
+            review = Review(**review_data)
         
-        review.save() 
+            review.save() 
         
-        self.review_repo.add(review)
+            self.review_repo.add(review)
         return review
 
     def get_review(self, review_id):
@@ -240,7 +267,7 @@ class HBnBFacade:
         if not self.place_repo.get(place_id):
              return []
 
-        return [r for r in self.review_repo.get_all() if getattr(r, 'place_id', None) == place_id]
+        return self.review_repo.get_all_by_attribute('place_id', place_id)
 
     def update_review(self, review_id, review_data):
         """
@@ -255,9 +282,7 @@ class HBnBFacade:
             if field in review_data:
                 raise ValueError(f"Cannot update '{field}'")
         
-        review.update(review_data) 
-
-        return review
+        return self.review_repo.update(review_id, review_data)
 
     def delete_review(self, review_id):
         """Deletes a Review by ID."""
@@ -0,0 +1,7 @@
+#!/usr/bin/python3
+"""
+Benchmarks for the HBnB in-memory API (not part of the test suite).
+
+Each module is a standalone script run from the part2/hbnb directory:
+    python -m benchmarks.bench_contention --threads 8 16 32
+"""
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+"""
+Benchmark: repository throughput under thread contention.
+
+Preloads N reviews spread over P places, then runs T threads for a fixed
+duration, each doing a request-like mix on random ids:
+    70% get(id), 15% get_all_by_attribute('place_id'), 10% update(id),
+    5% add() + delete() of a new review
+and, in one extra thread, get_all() snapshots in a loop (a listing).
+
+Compared repositories:
+- coarse : InMemoryRepository behind one global RLock (the simplest safe option)
+- striped: ConcurrentInMemoryRepository (striped RW locks, lock-free get_all)
+
+Usage (from part2/hbnb):
+    python -m benchmarks.bench_contention                  # 8, 16, 32 threads
+    python -m benchmarks.bench_contention --objects 100000 --seconds 5 --threads 32
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from app.models.review import Review
+from app.persistence.concurrent_repository import ConcurrentInMemoryRepository
+from app.persistence.repository import InMemoryRepository
+
+
+class CoarseLockedRepository(InMemoryRepository):
+    """Baseline: every operation (get_all included) under one lock"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.RLock()
+
+    def _locked(method):
+        def wrapper(self, *args):
+            with self._lock:
+                return method(self, *args)
+        return wrapper
+
+    add = _locked(InMemoryRepository.add)
+    get = _locked(InMemoryRepository.get)
+    get_all = _locked(InMemoryRepository.get_all)
+    update = _locked(InMemoryRepository.update)
+    delete = _locked(InMemoryRepository.delete)
+    get_all_by_attribute = _locked(InMemoryRepository.get_all_by_attribute)
+
+
+def preload(repo, objects, places):
+    ids = []
+    for i in range(objects):
+        review = Review(text="Bench", rating=3, place_id=f"place-{i % places}", user_id=f"user-{i}")
+        repo.add(review)
+        ids.append(review.id)
+    return ids
+
+
+def run(repo, ids, places, threads, seconds):
+    """Return (operations per second, get_all snapshots per second)"""
+    stop = threading.Event()
+    counts = [0] * threads
+    snapshots = [0]
+
+    def worker(slot):
+        rng = random.Random(slot)
+        done = 0
+        while not stop.is_set():
+            roll = rng.random()
+            if roll < 0.70:
+                repo.get(rng.choice(ids))
+            elif roll < 0.85:
+                repo.get_all_by_attribute('place_id', f"place-{rng.randrange(places)}")
+            elif roll < 0.95:
+                repo.update(rng.choice(ids), {'rating': rng.randint(1, 5)})
+            else:
+                review = Review(text="Bench", rating=3, place_id="place-0", user_id=f"user-{slot}")
+                repo.add(review)
+                repo.delete(review.id)
+            done += 1
+        counts[slot] = done
+
+    def lister():
+        while not stop.is_set():
+            repo.get_all()
+            snapshots[0] += 1
+
+    pool = [threading.Thread(target=worker, args=(slot,)) for slot in range(threads)]
+    pool.append(threading.Thread(target=lister))
+    for thread in pool:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in pool:
+        thread.join()
+    return sum(counts) / seconds, snapshots[0] / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--objects', type=int, default=100000)
+    parser.add_argument('--places', type=int, default=1000)
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--threads', type=int, nargs='+', default=[8, 16, 32])
+    args = parser.parse_args()
+
+    repos = {
+        'coarse': CoarseLockedRepository(multi_indexes=('place_id',)),
+        'striped': ConcurrentInMemoryRepository(multi_indexes=('place_id',)),
+    }
+    ids = {}
+    for name, repo in repos.items():
+        ids[name] = preload(repo, args.objects, args.places)
+
+    print(f"{args.objects} reviews, {args.places} places, {args.seconds:g}s per run")
+    print(f"{'threads':>8} {'repository':>10} {'ops/s':>12} {'get_all/s':>10}")
+    for threads in args.threads:
+        for name, repo in repos.items():
+            ops, snapshots = run(repo, ids[name], args.places, threads, args.seconds)
+            print(f"{threads:>8} {name:>10} {ops:>12,.0f} {snapshots:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
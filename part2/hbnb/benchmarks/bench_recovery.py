@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+"""
+Benchmark: durable mode write cost and crash recovery time.
+
+Fills a durable review repository with N objects (logged), takes a
+snapshot, appends a log tail of T updates, then times recovery
+(snapshot + log replay into a fresh repository, indexes rebuilt).
+
+Usage (from part2/hbnb):
+    python -m benchmarks.bench_recovery                    # 1 000 000 reviews
+    python -m benchmarks.bench_recovery --objects 100000 --tail 10000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from app.models.review import Review
+from app.persistence.durable_store import DurableStore, DurableInMemoryRepository
+
+
+def open_repository(data_dir):
+    store = DurableStore(data_dir, snapshot_every=0)
+    repo = DurableInMemoryRepository(store, 'reviews', Review, multi_indexes=('place_id', 'user_id'))
+    return store, repo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--objects', type=int, default=1000000)
+    parser.add_argument('--tail', type=int, default=100000, help="updates logged after the snapshot")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        store, repo = open_repository(data_dir)
+        store.open()
+
+        started = time.perf_counter()
+        ids = []
+        for i in range(args.objects):
+            review = Review(text="Bench", rating=3, place_id=f"place-{i % 1000}", user_id=f"user-{i % 50000}")
+            repo.add(review)
+            ids.append(review.id)
+        elapsed = time.perf_counter() - started
+        print(f"add (logged)     {args.objects / elapsed:>12,.0f} ops/s")
+
+        started = time.perf_counter()
+        store.snapshot()
+        print(f"snapshot         {time.perf_counter() - started:>12.2f} s")
+
+        rng = random.Random(0)
+        started = time.perf_counter()
+        for _ in range(args.tail):
+            repo.update(rng.choice(ids), {'rating': rng.randint(1, 5)})
+        elapsed = time.perf_counter() - started
+        print(f"update (logged)  {args.tail / max(elapsed, 1e-9):>12,.0f} ops/s")
+        store.close()
+
+        for filename in sorted(os.listdir(data_dir)):
+            size = os.path.getsize(os.path.join(data_dir, filename))
+            print(f"{filename:<16} {size / 1e6:>12.1f} MB")
+
+        store, repo = open_repository(data_dir)
+        started = time.perf_counter()
+        store.open()
+        elapsed = time.perf_counter() - started
+        store.close()
+        print(f"recovery         {elapsed:>12.2f} s  ({len(repo.get_all())} objects)")
+
+
+if __name__ == '__main__':
+    main()
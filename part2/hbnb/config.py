@@ -3,6 +3,8 @@ import os
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'default_secret_key')
     DEBUG = False
+    # Durable in-memory storage (snapshot + log files); unset: memory only
+    DATA_DIR = os.getenv('HBNB_DATA_DIR')
 
 class DevelopmentConfig(Config):
     DEBUG = True
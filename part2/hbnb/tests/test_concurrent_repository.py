@@ -0,0 +1,114 @@
+import threading
+import unittest
+from app.persistence.concurrent_repository import ConcurrentInMemoryRepository, RWLock
+from app.services.facade import HBnBFacade
+from app.models.review import Review
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+
+class TestRWLock(unittest.TestCase):
+
+    def test_reentrant_and_no_upgrade(self):
+        lock = RWLock()
+        lock.acquire_write()
+        lock.acquire_write()
+        lock.acquire_read()
+        lock.release_read()
+        lock.release_write()
+        lock.release_write()
+
+        lock.acquire_read()
+        with self.assertRaises(RuntimeError):
+            lock.acquire_write()
+        lock.release_read()
+
+    def test_writer_excludes_readers(self):
+        lock, seen = RWLock(), []
+        lock.acquire_write()
+        reader = threading.Thread(target=lambda: (lock.acquire_read(), seen.append('read'), lock.release_read()))
+        reader.start()
+        reader.join(0.1)
+        self.assertEqual(seen, [])
+        lock.release_write()
+        reader.join(5)
+        self.assertEqual(seen, ['read'])
+
+
+class TestConcurrentInMemoryRepository(unittest.TestCase):
+
+    def test_parallel_writers_keep_indexes_consistent(self):
+        repo = ConcurrentInMemoryRepository(multi_indexes=('place_id',), stripes=4)
+
+        def work(i):
+            for n in range(200):
+                review = Review(text="Nice", rating=4, place_id=f"place-{n % 5}", user_id=f"user-{i}")
+                repo.add(review)
+                if n % 2:
+                    repo.delete(review.id)
+
+        run_threads(work, 8)
+        self.assertEqual(len(repo.get_all()), 8 * 100)
+        for n in range(5):
+            indexed = repo.get_all_by_attribute('place_id', f"place-{n}")
+            self.assertEqual(len(indexed), len([r for r in repo.get_all() if r.place_id == f"place-{n}"]))
+
+    def test_get_all_snapshot_while_locked(self):
+        repo = ConcurrentInMemoryRepository()
+        review = Review(text="Nice", rating=4, place_id="p", user_id="u")
+        repo.add(review)
+        snapshot = []
+        with repo.locked(review.id):
+            reader = threading.Thread(target=lambda: snapshot.extend(repo.get_all()))
+            reader.start()
+            reader.join(5)
+        self.assertEqual(snapshot, [review])
+
+
+class TestFacadeRaces(unittest.TestCase):
+
+    def test_concurrent_signups_with_same_email(self):
+        facade, errors = HBnBFacade(), []
+
+        def signup(i):
+            try:
+                facade.create_user({"first_name": "Jane", "last_name": "Doe",
+                                    "email": "jane@example.com"})
+            except ValueError as e:
+                errors.append(str(e))
+
+        run_threads(signup, 16)
+        self.assertEqual(len(facade.get_all_user()), 1)
+        self.assertEqual(errors, ["Email already registered"] * 15)
+
+    def test_delete_user_leaves_no_orphan_place(self):
+        facade = HBnBFacade()
+        owner = facade.create_user({"first_name": "Jane", "last_name": "Doe",
+                                    "email": "jane@example.com"})
+        place = {"title": "Flat", "price": 50.0, "latitude": 48.0,
+                 "longitude": 2.0, "owner_id": owner.id}
+
+        def work(i):
+            if i == 0:
+                facade.delete_user(owner.id)
+                return
+            for _ in range(50):
+                try:
+                    facade.create_place(dict(place))
+                except ValueError:
+                    return
+
+        run_threads(work, 8)
+        self.assertIsNone(facade.get_user(owner.id))
+        self.assertEqual(facade.place_repo.get_all_by_attribute('owner_id', owner.id), [])
+        self.assertEqual([p for p in facade.get_all_places() if p.owner_id == owner.id], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from app.services.facade import HBnBFacade
+
+
+class TestDurableStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = self.tmp.name
+        self.facade = HBnBFacade(data_dir=self.data_dir)
+
+    def tearDown(self):
+        self.facade.store.close()
+        self.tmp.cleanup()
+
+    def reopen(self):
+        self.facade.store.close()
+        self.facade = HBnBFacade(data_dir=self.data_dir)
+        return self.facade
+
+    def _seed(self):
+        owner = self.facade.create_user({"first_name": "Jane", "last_name": "Doe",
+                                         "email": "jane@example.com"})
+        wifi = self.facade.create_amenity({"name": "WiFi"})
+        place = self.facade.create_place({"title": "Flat", "price": 50.0, "latitude": 48.0,
+                                          "longitude": 2.0, "owner_id": owner.id,
+                                          "amenities": [wifi.id]})
+        review = self.facade.create_review({"text": "Lovely", "rating": 5,
+                                            "user_id": owner.id, "place_id": place.id})
+        return owner, wifi, place, review
+
+    def test_log_replay(self):
+        owner, wifi, place, review = self._seed()
+        self.facade.update_place(place.id, {"title": "Loft"})
+        self.facade.delete_review(review.id)
+
+        facade = self.reopen()
+        self.assertEqual(facade.get_user_by_email("jane@example.com").id, owner.id)
+        restored = facade.get_place(place.id)
+        self.assertEqual(restored.title, "Loft")
+        self.assertEqual(restored.created_at, place.created_at)
+        # References point at the restored objects, not copies
+        self.assertIs(restored.amenities[0], facade.get_amenity(wifi.id))
+        self.assertIsNone(facade.get_review(review.id))
+        self.assertEqual([p.id for p in facade.place_repo.get_all_by_attribute('owner_id', owner.id)],
+                         [place.id])
+
+    def test_snapshot_then_log(self):
+        owner, wifi, place, review = self._seed()
+        self.facade.store.snapshot()
+        self.facade.update_amenity(wifi.id, {"name": "Fiber"})
+        self.facade.delete_review(review.id)
+        self.assertEqual(sorted(os.listdir(self.data_dir)), ['log-1.bin', 'snapshot-1.bin'])
+
+        facade = self.reopen()
+        # The place (from the snapshot) links to the amenity updated in the log
+        self.assertEqual(facade.get_place(place.id).amenities[0].name, "Fiber")
+        self.assertIs(facade.get_place(place.id).amenities[0], facade.get_amenity(wifi.id))
+        self.assertIsNone(facade.get_review(review.id))
+        self.assertEqual(facade.get_user(owner.id).email, "jane@example.com")
+
+    def test_torn_tail_is_dropped(self):
+        owner, _wifi, _place, _review = self._seed()
+        self.facade.update_user(owner.id, {"first_name": "Janet"})
+        self.facade.store.close()
+        log = os.path.join(self.data_dir, 'log-0.bin')
+        os.truncate(log, os.path.getsize(log) - 3)
+
+        facade = self.reopen()
+        self.assertEqual(facade.get_user(owner.id).first_name, "Jane")
+        facade.update_user(owner.id, {"first_name": "Jo"})
+        self.assertEqual(self.reopen().get_user(owner.id).first_name, "Jo")
+
+
+if __name__ == '__main__':
+    unittest.main()
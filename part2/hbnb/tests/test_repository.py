@@ -0,0 +1,67 @@
+import unittest
+from app.persistence.repository import InMemoryRepository
+from app.models.user import User
+from app.models.review import Review
+
+
+class TestInMemoryRepositoryIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.users = InMemoryRepository(indexes=('email',))
+        self.reviews = InMemoryRepository(multi_indexes=('place_id', 'user_id'))
+
+    def _user(self, email):
+        # Built like HBnBFacade.create_user (kwargs skip id generation)
+        user = User()
+        user.first_name, user.last_name, user.email = "Jane", "Doe", email
+        self.users.add(user)
+        return user
+
+    def _review(self, place_id, user_id):
+        review = Review(text="Nice", rating=4, place_id=place_id, user_id=user_id)
+        self.reviews.add(review)
+        return review
+
+    def test_unique_index_follows_update_and_delete(self):
+        jane = self._user("jane@example.com")
+        self.assertIs(self.users.get_by_attribute('email', "jane@example.com"), jane)
+
+        self.users.update(jane.id, {'email': "jane.doe@example.com"})
+        self.assertIsNone(self.users.get_by_attribute('email', "jane@example.com"))
+        self.assertIs(self.users.get_by_attribute('email', "jane.doe@example.com"), jane)
+
+        self.users.delete(jane.id)
+        self.assertIsNone(self.users.get_by_attribute('email', "jane.doe@example.com"))
+
+    def test_duplicate_unique_value(self):
+        self._user("jane@example.com")
+        with self.assertRaises(ValueError):
+            self._user("jane@example.com")
+        self.assertEqual(len(self.users.get_all()), 1)
+
+        john = self._user("john@example.com")
+        with self.assertRaises(ValueError):
+            john.email = "jane@example.com"
+            self.users.reindex(john)
+        # Still indexed under its previous value
+        self.assertIs(self.users.get_by_attribute('email', "john@example.com"), john)
+
+    def test_multi_index(self):
+        first = self._review("place-1", "user-1")
+        second = self._review("place-1", "user-2")
+        other = self._review("place-2", "user-1")
+        self.assertEqual(self.reviews.get_all_by_attribute('place_id', "place-1"), [first, second])
+        self.assertEqual(self.reviews.get_all_by_attribute('user_id', "user-1"), [first, other])
+
+        self.reviews.delete(first.id)
+        self.assertEqual(self.reviews.get_all_by_attribute('place_id', "place-1"), [second])
+        self.assertEqual(self.reviews.get_all_by_attribute('place_id', "place-3"), [])
+
+    def test_unindexed_attribute_is_scanned(self):
+        review = self._review("place-1", "user-1")
+        self.assertEqual(self.reviews.get_all_by_attribute('rating', 4), [review])
+        self.assertIs(self.reviews.get_by_attribute('text', "Nice"), review)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,8 +11,23 @@ from flask_jwt_extended import JWTManager
 from flask_jwt_extended.exceptions import NoAuthorizationError
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from flask_cors import CORS
 from config import DevelopmentConfig
+from app.persistence.cache import EntityCache
+from app.persistence.amenity_catalog import AmenityCatalog
+from app.persistence.unit_of_work import UnitOfWork
+from app.persistence.tombstones import TombstoneLog
+from app.persistence import cascades
+from app.persistence import pool
+from app.persistence import sqlite_profile
+from app.persistence import migrations
+from app.persistence.query_stats import QueryStats
+from app.utils.bcrypt_pool import BcryptPool, BcryptPoolSaturated
+from app.utils.serializers import compile_serializers
+from app.utils import json_encoding
+from app.utils import change_feed
+from app.utils.metrics import Metrics
 
 # ========================================
 # Initialize Flask extensions (before app creation)
@@ -20,6 +35,13 @@ from config import DevelopmentConfig
 bcrypt = Bcrypt()  # Password hashing (bcrypt algorithm)
 jwt = JWTManager()  # JWT token management (authentication)
 db = SQLAlchemy()  # ORM for database operations
+entity_cache = EntityCache()  # Serialized entity snapshots (read-through, LRU/TTL)
+amenity_catalog = AmenityCatalog()  # In-memory amenity id <-> name maps
+unit_of_work = UnitOfWork()  # One COMMIT per request (models/repositories only flush)
+bcrypt_pool = BcryptPool()  # Password hashing off the request threads (bounded)
+tombstone_log = TombstoneLog()  # Deletions recorded for change feeds
+query_stats = QueryStats()  # Per-request SQL count/timing (Server-Timing, logs)
+metrics = Metrics()  # Prometheus metrics (GET /metrics)
 
 # Facade will be imported after db is initialized to avoid circular imports
 facade = None
@@ -46,7 +68,10 @@ def create_app(config_class=DevelopmentConfig):
                 "http://127.0.0.1:3000"
             ],
             "methods": ["GET", "POST", "PUT", "DELETE"],
-            "allow_headers": ["Content-Type", "Authorization"]
+            "allow_headers": ["Content-Type", "Authorization"],
+            # Let browser clients read the pagination headers of GET /places/
+            # and the validators of conditional GETs
+            "expose_headers": ["X-Next-Cursor", "Link", "ETag", "X-Sync-Since"]
         }
     })
     
@@ -54,11 +79,23 @@ def create_app(config_class=DevelopmentConfig):
     # Initialize extensions with app context
     # ========================================
     bcrypt.init_app(app)
+    bcrypt_pool.init_app(app)
     jwt.init_app(app)
+    pool.init_app(app)  # DB_POOL_* -> SQLALCHEMY_ENGINE_OPTIONS, before the engine exists
     db.init_app(app)
+    metrics.init_app(app, db)  # First before_request hook: request timings include the other hooks
+    change_feed.init_app(app)  # Feed start time (X-Sync-Since), before any hook reads the database
+    query_stats.init_app(app, db)  # Counts the queries of the hooks registered after it
+    sqlite_profile.init_app(app, db)  # SQLITE_PRAGMAS on each new connection (WAL, foreign keys...)
+    cascades.init_app(app, db)  # Passive ON DELETE CASCADE deletes, before the hooks reading them
+    entity_cache.init_app(app, db)
+    amenity_catalog.init_app(app, db)
+    unit_of_work.init_app(app, db)
+    tombstone_log.init_app(app, db)
+    json_encoding.init_app(app)
 
     # ========================================
-    # Create database tables (development only)
+    # Check the database schema version (see app.persistence.migrations)
     # ========================================
     with app.app_context():
         # Import models so SQLAlchemy knows about them
@@ -66,9 +103,14 @@ def create_app(config_class=DevelopmentConfig):
         from app.models.place import Place
         from app.models.amenity import Amenity
         from app.models.review import Review
-        
-        # Create all tables if they don't exist
-        db.create_all()
+        from app.models.tombstone import Tombstone  # Deletion log (change feeds)
+
+        # Generate the to_dict() column serializers once, at startup
+        compile_serializers((User, Place, Amenity, Review))
+
+    # One SELECT on schema_version; AUTO_MIGRATE applies pending migrations,
+    # otherwise `flask db upgrade` must (no more create_all() on every start)
+    migrations.init_app(app, db)
     
     # ========================================
     # Initialize facade after app context is created
@@ -149,6 +191,8 @@ def create_app(config_class=DevelopmentConfig):
         authorizations=authorizations,  # Enable JWT auth in Swagger UI
         security='Bearer'  # Apply Bearer auth globally
     )
+    # Encode every namespace's responses with the JSON_ENCODER (orjson by default)
+    api.representations['application/json'] = json_encoding.output_json
 
     # ========================================
     # GLOBAL ERROR HANDLERS (Flask-RESTX + PyJWT)
@@ -187,6 +231,28 @@ def create_app(config_class=DevelopmentConfig):
             'message': 'Request does not contain a valid access token.'
         }, 401
 
+    @api.errorhandler(BcryptPoolSaturated)
+    def handle_bcrypt_pool_saturated(error):
+        """
+        Handle a full password hashing pool (503 Service Unavailable).
+        Login/signup bursts are shed instead of blocking every worker.
+        """
+        return {
+            'error': 'Service busy',
+            'message': str(error)
+        }, 503, {'Retry-After': '1'}
+
+    @api.errorhandler(PoolTimeoutError)
+    def handle_pool_timeout(_error):
+        """
+        Handle an exhausted database connection pool (503 Service Unavailable).
+        Raised after DB_POOL_TIMEOUT seconds without a free connection.
+        """
+        return {
+            'error': 'Service busy',
+            'message': 'No database connection available. Please retry later.'
+        }, 503, {'Retry-After': '1'}
+
     # ========================================
     # Register API namespaces (route blueprints)
     # ========================================
@@ -195,6 +261,7 @@ def create_app(config_class=DevelopmentConfig):
     from .api.v1.reviews import reviews_ns
     from .api.v1.amenities import amenities_ns
     from .api.v1.auth import auth_ns
+    from .api.v1.changes import changes_ns
 
     # Add namespaces to API with URL prefixes
     api.add_namespace(users_ns, path='/api/v1/users')
@@ -202,5 +269,7 @@ def create_app(config_class=DevelopmentConfig):
     api.add_namespace(reviews_ns, path='/api/v1')
     api.add_namespace(amenities_ns, path='/api/v1/amenities')
     api.add_namespace(auth_ns, path='/api/v1/auth')
+    api.add_namespace(changes_ns, path='/api/v1/changes')
+    metrics.register_namespaces(api)  # Request metrics labelled by namespace
 
     return app
\ No newline at end of file
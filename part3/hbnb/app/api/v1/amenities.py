@@ -13,10 +13,15 @@ Routes:
     DELETE /amenities/<id>       - Delete an amenity (ADMIN ONLY)
 """
 
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, reqparse
 from flask import request
 from app import facade as facade_instance
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from werkzeug.exceptions import HTTPException
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.utils.serializers import compile_marshaller
+from app.utils.http_cache import conditional
+from app.utils.timestamps import iso_timestamp
 
 # Create a namespace for amenity-related operations
 amenities_ns = Namespace('amenities', description='Amenity operations')
@@ -42,6 +47,16 @@ amenity_response_model = amenities_ns.model('AmenityResponse', {
     'updated_at': fields.String(description='ISO 8601 timestamp of last update')
 })
 
+# Compiled equivalent of marshal(data, amenity_response_model, mask=X-Fields) for list responses
+marshal_amenity = compile_marshaller(amenity_response_model)
+
+# Query string parser for GET /amenities/ (change feed)
+amenity_list_parser = reqparse.RequestParser()
+amenity_list_parser.add_argument(
+    'updated_since', type=iso_timestamp, location='args',
+    help='ISO 8601 time: only amenities created or modified at or after it (change feed)'
+)
+
 
 # -----------------------
 # API Routes
@@ -96,11 +111,10 @@ class AmenityList(Resource):
             amenity_data = amenities_ns.payload
             amenity_name = amenity_data.get('name', '').strip()
             
-            # Check if amenity with this name already exists (case-insensitive)
-            existing_amenities = facade_instance.get_all_amenities()
-            for amenity in existing_amenities:
-                if amenity.name.lower() == amenity_name.lower():
-                    amenities_ns.abort(409, f'Amenity "{amenity_name}" already exists')
+            # Check if amenity with this name already exists (case-insensitive,
+            # in-memory amenity catalog lookup)
+            if amenity_name and facade_instance.get_amenity_id_by_name(amenity_name):
+                amenities_ns.abort(409, f'Amenity "{amenity_name}" already exists')
             
             # Create the amenity in the database
             new_amenity = facade_instance.create_amenity(amenity_data)
@@ -108,6 +122,10 @@ class AmenityList(Resource):
             # Return the created amenity with 201 Created status
             return new_amenity.to_dict(), 201
             
+        except (HTTPException, PoolTimeoutError):
+            # Re-raise the 400/409 aborts above instead of turning them into 500,
+            # and pool timeouts (503 + Retry-After, handled globally)
+            raise
         except ValueError as e:
             # Handle validation errors (e.g., missing required fields)
             amenities_ns.abort(400, str(e))
@@ -115,8 +133,10 @@ class AmenityList(Resource):
             # Handle unexpected errors
             amenities_ns.abort(500, f"Internal error: {str(e)}")
 
-    @amenities_ns.marshal_list_with(amenity_response_model)
-    @amenities_ns.response(200, 'List of amenities retrieved successfully')
+    @conditional(lambda: facade_instance.get_amenities_version())
+    @amenities_ns.expect(amenity_list_parser)
+    @amenities_ns.response(200, 'List of amenities retrieved successfully', [amenity_response_model])
+    @amenities_ns.response(304, 'Not modified (If-None-Match / If-Modified-Since matched)')
     def get(self):
         """
         Retrieve a list of all amenities.
@@ -124,14 +144,23 @@ class AmenityList(Resource):
         This is a PUBLIC endpoint - no authentication required.
         Returns all amenities in the system that can be selected when creating/updating places.
         
+        ?updated_since=<ISO 8601> keeps the amenities created or modified
+        since then (oldest change first); deleted amenities are listed by
+        GET /api/v1/changes/deleted.
+        
         Returns:
             200: List of all amenities with their details
+            400: Invalid updated_since
         """
+        updated_since = amenity_list_parser.parse_args().get('updated_since')
+
         # Fetch all amenities from the database
-        amenities = facade_instance.get_all_amenities()
+        amenities = facade_instance.get_all_amenities(updated_since)
         
         # Convert each amenity object to a dictionary for JSON serialization
-        return [amenity.to_dict() for amenity in amenities]
+        # (list mode: compiled marshaller instead of marshal_list_with, same X-Fields mask)
+        marshal = marshal_amenity.for_request()
+        return [marshal(amenity.to_dict()) for amenity in amenities]
 
 
 @amenities_ns.route('/<string:amenity_id>')
@@ -146,8 +175,10 @@ class AmenityResource(Resource):
     - Deleting an amenity (DELETE - ADMIN ONLY)
     """
     
+    @conditional(lambda amenity_id: facade_instance.get_amenity_version(amenity_id))
     @amenities_ns.marshal_with(amenity_response_model)
     @amenities_ns.response(200, 'Amenity details retrieved successfully')
+    @amenities_ns.response(304, 'Not modified (If-None-Match / If-Modified-Since matched)')
     @amenities_ns.response(404, 'Amenity not found')
     def get(self, amenity_id):
         """
@@ -162,15 +193,15 @@ class AmenityResource(Resource):
             200: Amenity details
             404: Amenity with the given ID does not exist
         """
-        # Fetch the amenity from the database
-        amenity = facade_instance.get_amenity(amenity_id)
+        # Fetch the serialized amenity (entity cache, database on a miss)
+        amenity = facade_instance.get_amenity_dict(amenity_id)
         
         # Return 404 if amenity doesn't exist
         if not amenity:
             amenities_ns.abort(404, 'Amenity not found')
         
         # Return the amenity details
-        return amenity.to_dict()
+        return amenity
 
     @jwt_required()  # Requires valid JWT token
     @amenities_ns.expect(amenity_model, validate=True)
@@ -221,10 +252,9 @@ class AmenityResource(Resource):
             
             # Check if new name conflicts with existing amenities (except itself)
             if new_name:
-                existing_amenities = facade_instance.get_all_amenities()
-                for existing in existing_amenities:
-                    if existing.id != amenity_id and existing.name.lower() == new_name.lower():
-                        amenities_ns.abort(409, f'Amenity "{new_name}" already exists')
+                existing_id = facade_instance.get_amenity_id_by_name(new_name)
+                if existing_id and existing_id != amenity_id:
+                    amenities_ns.abort(409, f'Amenity "{new_name}" already exists')
             
             # Update the amenity in the database
             updated_amenity = facade_instance.update_amenity(amenity_id, amenity_data)
@@ -235,6 +265,10 @@ class AmenityResource(Resource):
             # Return the updated amenity data
             return updated_amenity.to_dict()
             
+        except (HTTPException, PoolTimeoutError):
+            # Re-raise the 400/409 aborts above instead of turning them into 500,
+            # and pool timeouts (503 + Retry-After, handled globally)
+            raise
         except ValueError as e:
             # Handle validation errors
             amenities_ns.abort(400, str(e))
@@ -66,6 +66,7 @@ class Login(Resource):
     @auth_ns.response(200, 'Login successful', login_response_model)
     @auth_ns.response(400, 'Invalid input data')
     @auth_ns.response(401, 'Invalid credentials - wrong email or password')
+    @auth_ns.response(503, 'Too many concurrent logins - retry later')
     def post(self):
         """
         Authenticate user and generate a JWT access token.
@@ -88,13 +89,11 @@ class Login(Resource):
         # Extract credentials from the request body
         credentials = auth_ns.payload
         
-        # Step 1: Retrieve the user from database using their email
-        user = facade_instance.get_user_by_email(credentials['email'])
-        
-        # Step 2: Verify user exists and password is correct
-        # - If user doesn't exist, user will be None
-        # - verify_password() uses bcrypt to compare hashed password
-        if not user or not user.verify_password(credentials['password']):
+        # Step 1 + 2: Retrieve the user by email and verify the password
+        # - bcrypt runs on the bounded bcrypt pool (503 when saturated)
+        # - A hash made with an outdated work factor is upgraded here
+        user = facade_instance.authenticate(credentials['email'], credentials['password'])
+        if not user:
             return {'error': 'Invalid credentials'}, 401
 
         # Step 3: Create a JWT token containing user information
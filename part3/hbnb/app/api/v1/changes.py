@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+"""
+Change feed API endpoints for the HBnB application.
+
+Clients mirroring the API (search indexes, caches, mobile apps) sync
+incrementally instead of downloading every listing again:
+
+1. Created/modified entities: every list endpoint accepts
+   ?updated_since=<ISO 8601> (GET /places/, /users/, /amenities/,
+   /api/v1/ for reviews, /places/<id>/reviews)
+2. Deleted entities: GET /changes/deleted?since=<ISO 8601> returns the
+   tombstones written when they were deleted
+
+Each poll then costs O(changes), not O(table). Bounds are inclusive. Do
+not resume from the largest updated_at / deleted_at received: rows are
+stamped before their transaction commits, so a row with an earlier
+timestamp can still appear after the poll. Send back the X-Sync-Since
+header of the previous response instead (the poll's start minus
+CHANGE_FEED_LAG, see app.utils.change_feed): as long as no transaction
+outlasts the lag, nothing is missed (recent entities may come back twice).
+
+Routes:
+    GET /changes/deleted  - Entities deleted since a time (public)
+"""
+
+from flask_restx import Namespace, Resource, fields, reqparse
+from app import facade as facade_instance
+from app.persistence.tombstones import TRACKED_TABLES
+from app.utils.timestamps import iso_timestamp
+
+
+# Create a namespace for change feed operations
+changes_ns = Namespace('changes', description='Change feeds for incremental sync')
+
+
+# -----------------------
+# Swagger API Models
+# -----------------------
+
+# Response model for one deletion
+tombstone_model = changes_ns.model('Tombstone', {
+    'type': fields.String(description="Entity type (table name)", example='places'),
+    'id': fields.String(description='UUID of the deleted entity'),
+    'deleted_at': fields.String(description='Deletion time (ISO 8601, UTC)')
+})
+
+# Query string parser for GET /changes/deleted
+deleted_parser = reqparse.RequestParser()
+deleted_parser.add_argument(
+    'since', type=iso_timestamp, location='args', required=True,
+    help='ISO 8601 time: deletions at or after it are returned'
+)
+deleted_parser.add_argument(
+    'type', type=str, location='args', choices=tuple(sorted(TRACKED_TABLES)),
+    help='Only deletions of this entity type'
+)
+
+
+# -----------------------
+# API Routes
+# -----------------------
+
+@changes_ns.route('/deleted')
+class DeletedList(Resource):
+    """
+    Handles retrieval of deleted entities (tombstones).
+    """
+
+    @changes_ns.expect(deleted_parser)
+    @changes_ns.marshal_list_with(tombstone_model)
+    @changes_ns.response(200, 'Deletions retrieved successfully')
+    @changes_ns.response(400, 'Missing or invalid since/type')
+    def get(self):
+        """
+        List the entities deleted since a time, oldest first.
+
+        This is a public endpoint - no authentication required (only ids
+        of entities that were public before their deletion are returned).
+
+        Deleting a user or a place also deletes its places/reviews: each
+        of them gets its own tombstone.
+
+        Returns:
+            200: List of {type, id, deleted_at}
+            400: since is missing or not ISO 8601, or type is unknown
+        """
+        args = deleted_parser.parse_args()
+        tombstones = facade_instance.get_deleted_since(args['since'], args.get('type'))
+        return [tombstone.to_dict() for tombstone in tombstones]
@@ -7,7 +7,10 @@ Places represent accommodations that can be rented, such as apartments, houses,
 
 Routes:
     POST   /places/              - Create a new place (owner only)
-    GET    /places/              - List all places (public)
+    POST   /places/batch         - Create many places in one transaction (owner only)
+    GET    /places/              - List places (public, optional ?limit=&cursor= pagination
+                                   and price/amenity/bounding-box filters)
+    GET    /places/nearby        - Places within radius_km of (lat, lon), closest first (public)
     GET    /places/<id>          - Get place details (public)
     PUT    /places/<id>          - Update a place (owner/admin only)
     DELETE /places/<id>          - Delete a place (owner/admin only)
@@ -19,10 +22,18 @@ Each place includes:
 - Reviews (ratings and comments from users)
 """
 
-from flask_restx import Namespace, Resource, fields
-from flask import request
+from urllib.parse import urlencode
+
+from flask_restx import Namespace, Resource, fields, reqparse
+from flask import request, current_app
 from app import facade as facade_instance
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from werkzeug.exceptions import HTTPException
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.utils.serializers import compile_marshaller
+from app.utils.json_encoding import stream_list
+from app.utils.http_cache import conditional
+from app.utils.timestamps import iso_timestamp
 
 
 # Create a namespace for place-related operations
@@ -111,9 +122,26 @@ place_response = places_ns.model('PlaceResponse', {
     'reviews': fields.List(
         fields.Nested(review_display_model), 
         description='List of reviews for this place'
+    ),
+    'rating_count': fields.Integer(description='Number of reviews'),
+    'rating_sum': fields.Integer(description='Sum of all review ratings'),
+    'rating_average': fields.Float(description='Average rating (0 when there is no review)'),
+    'rating_histogram': fields.List(
+        fields.Integer,
+        description='Number of reviews per rating, from 1 star to 5 stars'
     )
 })
 
+# Response model for radius search (place + distance from the search center)
+place_nearby_response = places_ns.inherit('PlaceNearbyResponse', place_response, {
+    'distance_km': fields.Float(description='Great-circle distance from the search point (km)')
+})
+
+# Compiled equivalents of marshal(data, model, mask=X-Fields) for list responses
+# (one generated function per model instead of walking the fields per row)
+marshal_place = compile_marshaller(place_response)
+marshal_place_nearby = compile_marshaller(place_nearby_response)
+
 # Input model for updating an existing place (all fields optional)
 place_update_model = places_ns.model('PlaceUpdateInput', {
     'title': fields.String(description='New title for the place'),
@@ -129,6 +157,67 @@ place_update_model = places_ns.model('PlaceUpdateInput', {
 })
 
 
+# Per-item result of a batch creation
+place_batch_result = places_ns.model('PlaceBatchResult', {
+    'index': fields.Integer(description='Position of the item in the request array'),
+    'status': fields.Integer(description='201 created, 400 invalid item, 403 owner_id mismatch'),
+    'id': fields.String(description='UUID of the created place (created items only)'),
+    'error': fields.String(description='Why the item was rejected (rejected items only)')
+})
+
+
+# Query string parser for the place listing (keyset pagination)
+# Without limit/cursor the full list is returned (backward compatible)
+place_list_parser = reqparse.RequestParser()
+place_list_parser.add_argument(
+    'limit', type=int, location='args',
+    help='Maximum number of places per page (capped by PAGE_MAX_LIMIT)'
+)
+place_list_parser.add_argument(
+    'cursor', type=str, location='args',
+    help='Opaque cursor from the X-Next-Cursor header of the previous page'
+)
+
+# Listing filters (evaluated in SQL by PlaceRepository)
+place_list_parser.add_argument('min_price', type=float, location='args', help='Minimum price per night')
+place_list_parser.add_argument('max_price', type=float, location='args', help='Maximum price per night')
+place_list_parser.add_argument(
+    'amenities', type=str, action='split', location='args',
+    help='Comma-separated amenity IDs; only places having ALL of them are returned'
+)
+place_list_parser.add_argument('lat_min', type=float, location='args', help='Bounding box: minimum latitude')
+place_list_parser.add_argument('lat_max', type=float, location='args', help='Bounding box: maximum latitude')
+place_list_parser.add_argument('lon_min', type=float, location='args', help='Bounding box: minimum longitude')
+place_list_parser.add_argument('lon_max', type=float, location='args', help='Bounding box: maximum longitude')
+place_list_parser.add_argument(
+    'updated_since', type=iso_timestamp, location='args',
+    help='ISO 8601 time: only places created or modified at or after it (change feed)'
+)
+
+# Listing order (defaults to creation date)
+place_list_parser.add_argument(
+    'sort', type=str, location='args', choices=('created_at', '-rating'),
+    help="'created_at' (default) or '-rating' (best average rating first)"
+)
+
+# Streamed full listing (server-side cursor, constant memory)
+place_list_parser.add_argument(
+    'stream', type=str, location='args', choices=('array', 'ndjson'),
+    help="'array' (chunked JSON array) or 'ndjson' (one place per line); not with limit/cursor"
+)
+
+# Names of the filter arguments forwarded to the facade
+PLACE_FILTERS = ('min_price', 'max_price', 'amenities', 'lat_min', 'lat_max', 'lon_min', 'lon_max',
+                 'updated_since')
+
+# Query string parser for radius search
+nearby_parser = reqparse.RequestParser()
+nearby_parser.add_argument('lat', type=float, required=True, location='args', help='Latitude of the search center')
+nearby_parser.add_argument('lon', type=float, required=True, location='args', help='Longitude of the search center')
+nearby_parser.add_argument('radius_km', type=float, required=True, location='args', help='Search radius in kilometers')
+nearby_parser.add_argument('limit', type=int, location='args', help='Maximum number of places (capped by PAGE_MAX_LIMIT)')
+
+
 # -----------------------
 # API Routes
 # -----------------------
@@ -180,20 +269,15 @@ class PlaceList(Resource):
             if place_data.get('owner_id') != current_user_id:
                 places_ns.abort(403, 'You can only create places for yourself')
             
-            # Validate amenities if provided
+            # Validate amenities if provided (in-memory amenity catalog, no query)
             if 'amenities' in place_data and place_data['amenities']:
-                # Get all existing amenities from the database
-                existing_amenities = facade_instance.get_all_amenities()
-                existing_amenity_ids = [a.id for a in existing_amenities]
-                
-                # Check each amenity ID
-                for amenity_id in place_data['amenities']:
-                    if amenity_id not in existing_amenity_ids:
-                        places_ns.abort(
-                            400, 
-                            f'Amenity with ID {amenity_id} does not exist. '
-                            f'Please select from existing amenities or contact an admin to create new ones.'
-                        )
+                unknown = facade_instance.get_unknown_amenity_ids(place_data['amenities'])
+                if unknown:
+                    places_ns.abort(
+                        400, 
+                        f'Amenity with ID {unknown[0]} does not exist. '
+                        f'Please select from existing amenities or contact an admin to create new ones.'
+                    )
             
             # Create the place in the database
             place = facade_instance.create_place(place_data)
@@ -202,6 +286,10 @@ class PlaceList(Resource):
             # via the configured relationships in the Place model
             return place.to_dict(), 201
             
+        except (HTTPException, PoolTimeoutError):
+            # Re-raise the 400/409 aborts above instead of turning them into 500,
+            # and pool timeouts (503 + Retry-After, handled globally)
+            raise
         except ValueError as e:
             # Handle validation errors from the facade/model
             places_ns.abort(400, str(e))
@@ -209,30 +297,224 @@ class PlaceList(Resource):
             # Handle unexpected errors
             places_ns.abort(500, f"Internal error: {str(e)}")
 
-    @places_ns.marshal_list_with(place_response)
-    @places_ns.response(200, 'List of places retrieved successfully')
+    @conditional(lambda: facade_instance.get_places_version())
+    @places_ns.expect(place_list_parser)
+    @places_ns.response(200, 'List of places retrieved successfully', [place_response])
+    @places_ns.response(304, 'Not modified (If-None-Match / If-Modified-Since matched)')
+    @places_ns.response(400, 'Invalid limit or cursor')
     def get(self):
         """
-        Retrieve a list of all places.
+        Retrieve a list of places.
         
         This is a public endpoint - no authentication required.
-        Returns all places with their full details including:
+        Returns places with their full details including:
         - Owner information
         - Associated amenities
         - User reviews
         
-        SQLAlchemy eager loads all relationships automatically,
-        so no additional queries are needed for nested data.
+        Pagination (optional, keyset based):
+        - ?limit=N returns at most N places ordered by creation date
+        - The X-Next-Cursor response header holds the cursor of the next page
+          (also exposed as a Link: <...>; rel="next" header)
+        - ?cursor=<X-Next-Cursor>&limit=N fetches the following page
+        - No X-Next-Cursor header means this is the last page
+        - Page cost does not grow with depth (no OFFSET scan)
+        
+        Without limit/cursor, all matching places are returned in a single response.
+        
+        Streaming (optional, full listing only):
+        - ?stream=array : same JSON array, sent in chunks as rows are read
+        - ?stream=ndjson : application/x-ndjson, one place per line
+        Rows come from a server-side cursor, STREAM_BATCH_SIZE at a time, so
+        memory use does not grow with the number of places.
+        
+        Filters (optional, combined with AND, evaluated by the database):
+        - ?min_price=&max_price= : price range
+        - ?amenities=<id1>,<id2> : places offering ALL listed amenities
+        - ?lat_min=&lat_max=&lon_min=&lon_max= : geographic bounding box
+        - ?updated_since=<ISO 8601> : places created or modified since then
+          (inclusive, a review change touches its place). Deleted places
+          are listed by GET /api/v1/changes/deleted
+        When paginating, send the same filters with every page.
+        
+        Sorting (optional):
+        - ?sort=created_at : oldest first (default)
+        - ?sort=-rating : best average rating first (uses the rating
+          aggregates stored on places, no join over reviews)
+        A cursor is only valid for the sort it was issued with.
+        
+        Returns:
+            200: List of places with complete information
+            400: Invalid limit, cursor or filter value, or stream with limit/cursor
+        """
+        args = place_list_parser.parse_args()
+        limit, cursor = args.get('limit'), args.get('cursor')
+        sort = args.get('sort') or 'created_at'
+        filters = {name: args.get(name) for name in PLACE_FILTERS if args.get(name) is not None}
+        if 'amenities' in filters:
+            filters['amenities'] = [a.strip() for a in filters['amenities'] if a.strip()]
+        marshal = marshal_place.for_request()  # X-Fields mask, parsed once
+
+        if args.get('stream'):
+            if limit is not None or cursor:
+                places_ns.abort(400, 'stream cannot be combined with limit or cursor')
+            try:
+                places = facade_instance.iter_places(
+                    filters, sort, current_app.config['STREAM_BATCH_SIZE']
+                )
+            except ValueError as e:
+                places_ns.abort(400, str(e))
+            return stream_list(args['stream'], places, lambda p: marshal(p.to_dict()))
+
+        # Legacy behaviour: no pagination parameters -> full list
+        if limit is None and not cursor:
+            places = facade_instance.get_all_places(filters, sort)
+            return [marshal(p.to_dict()) for p in places]
+
+        # Clamp the page size to the configured bounds
+        if limit is None:
+            limit = current_app.config['PAGE_DEFAULT_LIMIT']
+        limit = min(limit, current_app.config['PAGE_MAX_LIMIT'])
+
+        try:
+            places, next_cursor = facade_instance.get_places_page(limit, cursor, filters, sort)
+        except ValueError as e:
+            places_ns.abort(400, str(e))
+
+        headers = {}
+        if next_cursor:
+            headers['X-Next-Cursor'] = next_cursor
+            # Keep the caller's filters in the next link, only swap the cursor
+            query = {k: v for k, v in request.args.items() if k not in ('limit', 'cursor')}
+            query.update(limit=limit, cursor=next_cursor)
+            headers['Link'] = f'<{request.base_url}?{urlencode(query)}>; rel="next"'
+
+        return [marshal(p.to_dict()) for p in places], 200, headers
+
+
+@places_ns.route('/batch')
+class PlaceBatch(Resource):
+    """
+    Bulk creation of places (host onboarding, imports).
+    """
+
+    @jwt_required()  # Requires valid JWT token
+    @places_ns.expect([place_model])
+    @places_ns.response(201, 'All places created', [place_batch_result])
+    @places_ns.response(207, 'Some items were rejected (see per-item status)', [place_batch_result])
+    @places_ns.response(400, 'Body is not an array, is too large, or no item is valid')
+    def post(self):
+        """
+        Create many places in a single request and a single transaction.
+        
+        The body is an array of PlaceInput objects. Each item is validated
+        on its own: invalid items are reported and skipped, valid items are
+        all inserted together with ONE commit.
+        
+        Protection rules (same as POST /places/):
+        - User must be authenticated (JWT token required)
+        - Each item's owner_id must match the authenticated user (403 for that item)
+        - Amenities must exist (all ids of the batch checked with one query)
+        
+        Size limit: PLACE_BATCH_MAX_SIZE items per request.
         
         Returns:
-            200: List of all places with complete information
+            201: Every item was created
+            207: Mixed results - check each item's status
+            400: Invalid body, too many items, or no item could be created
         """
-        # Fetch all places from the database
-        places = facade_instance.get_all_places()
+        current_user_id = get_jwt_identity()
+        
+        items = request.get_json(silent=True)
+        if not isinstance(items, list) or not items:
+            places_ns.abort(400, 'Request body must be a non-empty array of places')
+        max_size = current_app.config['PLACE_BATCH_MAX_SIZE']
+        if len(items) > max_size:
+            places_ns.abort(400, f'A batch can contain at most {max_size} places')
+        
+        results = [None] * len(items)
+        accepted = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results[index] = {'index': index, 'status': 400, 'error': 'Item must be an object'}
+            elif item.get('owner_id') != current_user_id:
+                # Users can only create places for themselves
+                results[index] = {'index': index, 'status': 403,
+                                  'error': 'You can only create places for yourself'}
+            else:
+                accepted.append(index)
         
-        # Convert each place object to a dictionary for JSON serialization
-        # SQLAlchemy relationships (owner, amenities, reviews) are automatically loaded
-        return [p.to_dict() for p in places]
+        if accepted:
+            try:
+                outcomes = facade_instance.create_places_batch(
+                    [items[index] for index in accepted], current_user_id
+                )
+            except ValueError as e:
+                places_ns.abort(400, str(e))
+            for index, (place_id, error) in zip(accepted, outcomes):
+                if place_id is not None:
+                    results[index] = {'index': index, 'status': 201, 'id': place_id}
+                else:
+                    results[index] = {'index': index, 'status': 400, 'error': error}
+        
+        created = sum(1 for r in results if r['status'] == 201)
+        if created == len(results):
+            status = 201
+        elif created:
+            status = 207
+        else:
+            status = 400
+        return results, status
+
+
+@places_ns.route('/nearby')
+class PlaceNearby(Resource):
+    """
+    Radius search: places around a geographic point.
+    """
+
+    @conditional(lambda: facade_instance.get_places_version())
+    @places_ns.expect(nearby_parser)
+    @places_ns.response(200, 'Places within the radius, closest first', [place_nearby_response])
+    @places_ns.response(304, 'Not modified (If-None-Match / If-Modified-Since matched)')
+    @places_ns.response(400, 'Invalid coordinates or radius')
+    def get(self):
+        """
+        Find places within radius_km of (lat, lon).
+        
+        This is a public endpoint - no authentication required.
+        
+        Search strategy (see PlaceRepository.get_places_nearby):
+        - Candidates come from the 9 geohash cells covering the circle
+          (indexed prefix lookups, no full table scan)
+        - Each candidate is then checked with the exact haversine distance
+        
+        Returns:
+            200: List of places sorted by distance, each with distance_km
+            400: lat/lon out of range, radius_km <= 0 or above NEARBY_MAX_RADIUS_KM
+        """
+        args = nearby_parser.parse_args()
+        max_radius = current_app.config['NEARBY_MAX_RADIUS_KM']
+        if args['radius_km'] > max_radius:
+            places_ns.abort(400, f'radius_km must not exceed {max_radius}')
+
+        limit = min(args.get('limit') or current_app.config['PAGE_MAX_LIMIT'],
+                    current_app.config['PAGE_MAX_LIMIT'])
+
+        try:
+            results = facade_instance.get_places_nearby(
+                args['lat'], args['lon'], args['radius_km'], limit
+            )
+        except ValueError as e:
+            places_ns.abort(400, str(e))
+
+        marshal = marshal_place_nearby.for_request()
+        places = []
+        for place, distance in results:
+            place_dict = place.to_dict()
+            place_dict['distance_km'] = round(distance, 3)
+            places.append(marshal(place_dict))
+        return places
 
 
 @places_ns.route('/<string:place_id>')
@@ -247,8 +529,10 @@ class PlaceResource(Resource):
     - Deleting a place (DELETE - owner/admin only)
     """
     
+    @conditional(lambda place_id: facade_instance.get_place_version(place_id))
     @places_ns.marshal_with(place_response)
     @places_ns.response(200, 'Place details retrieved successfully')
+    @places_ns.response(304, 'Not modified (If-None-Match / If-Modified-Since matched)')
     @places_ns.response(404, 'Place not found')
     def get(self, place_id):
         """
@@ -268,16 +552,15 @@ class PlaceResource(Resource):
             200: Place details with all relationships loaded
             404: Place with the given ID does not exist
         """
-        # Fetch the place from the database
-        place = facade_instance.get_place(place_id)
+        # Fetch the serialized place (entity cache, database on a miss)
+        # The snapshot includes owner, amenities, reviews and rating aggregates
+        place = facade_instance.get_place_dict(place_id)
         
         # Return 404 if place doesn't exist
         if not place:
             places_ns.abort(404, 'Place not found')
 
-        # SQLAlchemy automatically loads owner, amenities, and reviews
-        # via the configured relationships in the Place model
-        return place.to_dict()
+        return place
 
     @jwt_required()  # Requires valid JWT token
     @places_ns.expect(place_update_model, validate=True)
@@ -324,32 +607,28 @@ class PlaceResource(Resource):
         is_admin = claims.get('is_admin', False)
         
         # Fetch the place to verify it exists and check ownership
-        place = facade_instance.get_place(place_id)
+        # (cached snapshot: rejected requests never touch the database)
+        place = facade_instance.get_place_dict(place_id)
         if not place:
             places_ns.abort(404, "Place not found")
         
         # Authorization check: Only owner or admin can update
-        if place.owner_id != current_user_id and not is_admin:
+        if place['owner']['id'] != current_user_id and not is_admin:
             places_ns.abort(403, 'You can only update your own places')
         
         try:
             # Extract update data from request body
             place_data = request.get_json()
             
-            # Validate amenities if provided in the update
+            # Validate amenities if provided in the update (in-memory amenity catalog, no query)
             if 'amenities' in place_data:
-                # Get all existing amenities from the database
-                existing_amenities = facade_instance.get_all_amenities()
-                existing_amenity_ids = [a.id for a in existing_amenities]
-                
-                # Check each amenity ID
-                for amenity_id in place_data['amenities']:
-                    if amenity_id not in existing_amenity_ids:
-                        places_ns.abort(
-                            400, 
-                            f'Amenity with ID {amenity_id} does not exist. '
-                            f'Please select from existing amenities or contact an admin.'
-                        )
+                unknown = facade_instance.get_unknown_amenity_ids(place_data['amenities'])
+                if unknown:
+                    places_ns.abort(
+                        400, 
+                        f'Amenity with ID {unknown[0]} does not exist. '
+                        f'Please select from existing amenities or contact an admin.'
+                    )
             
             # Update the place in the database
             # The facade will handle validation and prevent updating restricted fields
@@ -358,6 +637,10 @@ class PlaceResource(Resource):
             # SQLAlchemy automatically reloads relationships
             return updated_place.to_dict()
             
+        except (HTTPException, PoolTimeoutError):
+            # Re-raise the 400/409 aborts above instead of turning them into 500,
+            # and pool timeouts (503 + Retry-After, handled globally)
+            raise
         except ValueError as e:
             # Handle validation errors from the facade/model
             places_ns.abort(400, str(e))
@@ -380,7 +663,7 @@ class PlaceResource(Resource):
           * An admin user
         
         Cascade behavior:
-        - SQLAlchemy will automatically delete all associated reviews
+        - The database deletes all associated reviews (ON DELETE CASCADE)
         - Amenities are NOT deleted (they are global resources shared across places)
         - The relationship entries in place_amenity table are removed
         
@@ -400,16 +683,17 @@ class PlaceResource(Resource):
         is_admin = claims.get('is_admin', False)
         
         # Fetch the place to verify it exists and check ownership
-        place = facade_instance.get_place(place_id)
+        # (cached snapshot: rejected requests never touch the database)
+        place = facade_instance.get_place_dict(place_id)
         if not place:
             places_ns.abort(404, 'Place not found')
         
         # Authorization check: Only owner or admin can delete
-        if place.owner_id != current_user_id and not is_admin:
+        if place['owner']['id'] != current_user_id and not is_admin:
             places_ns.abort(403, 'You can only delete your own places')
         
         # Delete the place from the database
-        # SQLAlchemy cascade will handle related reviews
+        # The database cascade (ON DELETE CASCADE) removes its reviews
         facade_instance.delete_place(place_id)
 
         # Return 204 No Content on successful deletion
@@ -20,11 +20,17 @@ Business rules:
 - Rating must be between 1.0 (worst) and 5.0 (best)
 """
 
-from flask_restx import Namespace, Resource, fields
-from flask import request
+from flask_restx import Namespace, Resource, fields, reqparse
+from flask import request, current_app
 from app import facade as facade_instance
+from app.services.facade import DuplicateReviewError
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from werkzeug.exceptions import HTTPException
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.utils.serializers import compile_marshaller
+from app.utils.json_encoding import stream_list
+from app.utils.http_cache import conditional
+from app.utils.timestamps import iso_timestamp
 
 
 # Create a namespace for review-related operations
@@ -89,6 +95,27 @@ review_response_model = reviews_ns.model('ReviewResponse', {
     'updated_at': fields.String(description='ISO 8601 timestamp of last update'),
 })
 
+# Compiled equivalent of marshal(data, review_response_model, mask=X-Fields) for list responses
+marshal_review = compile_marshaller(review_response_model)
+
+# Query string parser for GET /reviews/ (streamed listing)
+review_list_parser = reqparse.RequestParser()
+review_list_parser.add_argument(
+    'stream', type=str, location='args', choices=('array', 'ndjson'),
+    help="'array' (chunked JSON array) or 'ndjson' (one review per line)"
+)
+review_list_parser.add_argument(
+    'updated_since', type=iso_timestamp, location='args',
+    help='ISO 8601 time: only reviews created or modified at or after it (change feed)'
+)
+
+# Query string parser for GET /places/<place_id>/reviews
+place_review_list_parser = reqparse.RequestParser()
+place_review_list_parser.add_argument(
+    'updated_since', type=iso_timestamp, location='args',
+    help='ISO 8601 time: only reviews created or modified at or after it (change feed)'
+)
+
 # Input model for updating an existing review
 review_update_model = reviews_ns.model('ReviewUpdate', {
     'text': fields.String(description='New review content'),
@@ -152,32 +179,34 @@ class ReviewList(Resource):
             
             place_id = review_data.get('place_id')
             
-            # Verify the place exists and get its details
-            place = facade_instance.get_place(place_id)
-            if not place:
+            # Verify the place exists and get its owner (one column: the
+            # place's reviews and amenities are not loaded)
+            owner_id = facade_instance.get_place_owner_id(place_id)
+            if owner_id is None:
                 reviews_ns.abort(404, 'Place not found')
             
             # Business rule: Users cannot review their own places
             # This prevents fake reviews and maintains review integrity
-            if place.owner_id == current_user_id:
+            if owner_id == current_user_id:
                 reviews_ns.abort(403, 'You cannot review your own place')
             
-            # Business rule: One review per user per place
-            # Check if user has already reviewed this place
-            if facade_instance.user_has_reviewed_place(current_user_id, place_id):
-                reviews_ns.abort(409, 'You have already reviewed this place')
-            
             # Create the review in the database
+            # Business rule: One review per user per place - enforced by the
+            # unique constraint at INSERT time (DuplicateReviewError -> 409)
             review = facade_instance.create_review(review_data)
             
             # SQLAlchemy automatically loads related user and place data
             # via the configured relationships in the Review model
             return review.to_dict(), 201
         
-        except HTTPException:
-            # Re-raise HTTP exceptions (403, 404, 409, etc.)
+        except (HTTPException, PoolTimeoutError):
+            # Re-raise HTTP exceptions (403, 404, 409, etc.) and pool
+            # timeouts (503 + Retry-After, handled globally)
             # These are expected errors that should be returned to the client
             raise
+        except DuplicateReviewError as e:
+            # Business rule: One review per user per place
+            reviews_ns.abort(409, str(e))
         except ValueError as e:
             # Handle validation errors (e.g., rating out of range)
             reviews_ns.abort(400, str(e))
@@ -193,8 +222,10 @@ class ReviewList(Resource):
             print("=" * 80)
             reviews_ns.abort(500, f"Internal error: {str(e)}")
 
-    @reviews_ns.marshal_list_with(review_response_model)
-    @reviews_ns.response(200, 'List of reviews retrieved successfully')
+    @conditional(lambda: facade_instance.get_reviews_version())
+    @reviews_ns.expect(review_list_parser)
+    @reviews_ns.response(200, 'List of reviews retrieved successfully', [review_response_model])
+    @reviews_ns.response(304, 'Not modified (If-None-Match / If-Modified-Since matched)')
     def get(self):
         """
         Retrieve a list of all reviews in the system.
@@ -205,15 +236,33 @@ class ReviewList(Resource):
         SQLAlchemy automatically loads relationships (user, place) for each review,
         so no additional queries are needed.
         
+        Streaming (optional):
+        - ?stream=array : same JSON array, sent in chunks as rows are read
+        - ?stream=ndjson : application/x-ndjson, one review per line
+        Rows come from a server-side cursor (memory does not grow with the table).
+        
+        Change feed (optional):
+        - ?updated_since=<ISO 8601> : reviews created or modified since then
+          (inclusive, oldest change first). Deleted reviews are listed by
+          GET /api/v1/changes/deleted
+        
         Returns:
             200: List of all reviews with complete information
+            400: Invalid updated_since
         """
+        args = review_list_parser.parse_args()
+        stream, updated_since = args.get('stream'), args.get('updated_since')
+        marshal = marshal_review.for_request()
+        if stream:
+            reviews = facade_instance.iter_reviews(current_app.config['STREAM_BATCH_SIZE'], updated_since)
+            return stream_list(stream, reviews, lambda r: marshal(r.to_dict()))
+
         # Fetch all reviews from the database
-        reviews = facade_instance.get_all_reviews()
+        reviews = facade_instance.get_all_reviews(updated_since)
         
         # Convert each review object to a dictionary for JSON serialization
         # SQLAlchemy relationships (user, place) are automatically loaded
-        return [r.to_dict() for r in reviews]
+        return [marshal(r.to_dict()) for r in reviews]
 
 
 @reviews_ns.route('/<string:review_id>')
@@ -228,8 +277,10 @@ class ReviewResource(Resource):
     - Deleting a review (DELETE - author/admin only)
     """
     
+    @conditional(lambda review_id: facade_instance.get_review_version(review_id))
     @reviews_ns.marshal_with(review_response_model)
     @reviews_ns.response(200, 'Review details retrieved successfully')
+    @reviews_ns.response(304, 'Not modified (If-None-Match / If-Modified-Since matched)')
     @reviews_ns.response(404, 'Review not found')
     def get(self, review_id):
         """
@@ -248,15 +299,14 @@ class ReviewResource(Resource):
             200: Review details with all relationships loaded
             404: Review with the given ID does not exist
         """
-        # Fetch the review from the database
-        review = facade_instance.get_review(review_id)
+        # Fetch the serialized review (entity cache, database on a miss)
+        review = facade_instance.get_review_dict(review_id)
         
         # Return 404 if review doesn't exist
         if not review:
             reviews_ns.abort(404, 'Review not found')
         
-        # SQLAlchemy automatically loads user and place relationships
-        return review.to_dict()
+        return review
 
     @jwt_required()  # Requires valid JWT token
     @reviews_ns.expect(review_update_model, validate=True)
@@ -301,12 +351,13 @@ class ReviewResource(Resource):
         is_admin = claims.get('is_admin', False)
         
         # Fetch the review to verify it exists and check authorship
-        review = facade_instance.get_review(review_id)
+        # (cached snapshot: rejected requests never touch the database)
+        review = facade_instance.get_review_dict(review_id)
         if not review:
             reviews_ns.abort(404, 'Review not found')
         
         # Authorization check: Only the review author or admin can update
-        if review.user_id != current_user_id and not is_admin:
+        if review['user']['id'] != current_user_id and not is_admin:
             reviews_ns.abort(403, 'You can only update your own reviews')
         
         try:
@@ -319,8 +370,8 @@ class ReviewResource(Resource):
             # SQLAlchemy automatically reloads relationships
             return updated_review.to_dict()
         
-        except HTTPException:
-            # Re-raise HTTP exceptions (403, 404, etc.)
+        except (HTTPException, PoolTimeoutError):
+            # Re-raise HTTP exceptions (403, 404, etc.) and pool timeouts (503)
             raise
         except ValueError as e:
             # Handle validation errors (e.g., invalid rating)
@@ -367,12 +418,13 @@ class ReviewResource(Resource):
         is_admin = claims.get('is_admin', False)
         
         # Fetch the review to verify it exists and check authorship
-        review = facade_instance.get_review(review_id)
+        # (cached snapshot: rejected requests never touch the database)
+        review = facade_instance.get_review_dict(review_id)
         if not review:
             reviews_ns.abort(404, 'Review not found')
         
         # Authorization check: Only the review author or admin can delete
-        if review.user_id != current_user_id and not is_admin:
+        if review['user']['id'] != current_user_id and not is_admin:
             reviews_ns.abort(403, 'You can only delete your own reviews')
         
         # Delete the review from the database
@@ -394,8 +446,10 @@ class PlaceReviewList(Resource):
     Useful for displaying all reviews on a place's detail page.
     """
     
-    @reviews_ns.marshal_list_with(review_response_model)
-    @reviews_ns.response(200, 'List of reviews for the place retrieved successfully')
+    @conditional(lambda place_id: facade_instance.get_reviews_version(place_id))
+    @reviews_ns.expect(place_review_list_parser)
+    @reviews_ns.response(200, 'List of reviews for the place retrieved successfully', [review_response_model])
+    @reviews_ns.response(304, 'Not modified (If-None-Match / If-Modified-Since matched)')
     @reviews_ns.response(404, 'Place not found')
     def get(self, place_id):
         """
@@ -412,16 +466,21 @@ class PlaceReviewList(Resource):
         - Calculating average ratings for a place
         - Showing review history
         
+        ?updated_since=<ISO 8601> keeps the reviews created or modified since then.
+        
         Args:
             place_id (str): UUID of the place to get reviews for
             
         Returns:
             200: List of reviews for the place
+            400: Invalid updated_since
             404: Place with the given ID does not exist
         """
+        updated_since = place_review_list_parser.parse_args().get('updated_since')
+
         # Fetch all reviews for the specified place
         # The facade will return None if the place doesn't exist
-        reviews_data = facade_instance.get_reviews_by_place(place_id)
+        reviews_data = facade_instance.get_reviews_by_place(place_id, updated_since)
 
         # Return 404 if place doesn't exist
         if reviews_data is None:
@@ -432,7 +491,8 @@ class PlaceReviewList(Resource):
         reviews = reviews_data if isinstance(reviews_data, list) else [reviews_data]
 
         # SQLAlchemy automatically loads user and place for each review
-        return [r.to_dict() for r in reviews]
+        marshal = marshal_review.for_request()
+        return [marshal(r.to_dict()) for r in reviews]
     
     @jwt_required()
     @reviews_ns.expect(review_create_model, validate=True)
@@ -476,26 +536,26 @@ class PlaceReviewList(Resource):
             # Set user_id to the authenticated user
             review_data['user_id'] = current_user_id
             
-            # Verify the place exists and get its details
-            place = facade_instance.get_place(place_id)
-            if not place:
+            # Verify the place exists and get its owner (one column)
+            owner_id = facade_instance.get_place_owner_id(place_id)
+            if owner_id is None:
                 reviews_ns.abort(404, 'Place not found')
             
             # Business rule: Users cannot review their own places
-            if place.owner_id == current_user_id:
+            if owner_id == current_user_id:
                 reviews_ns.abort(403, 'You cannot review your own place')
             
-            # Business rule: One review per user per place
-            if facade_instance.user_has_reviewed_place(current_user_id, place_id):
-                reviews_ns.abort(409, 'You have already reviewed this place')
-            
             # Create the review in the database
+            # Business rule: One review per user per place - enforced by the
+            # unique constraint at INSERT time (DuplicateReviewError -> 409)
             review = facade_instance.create_review(review_data)
             
             return review.to_dict(), 201
         
-        except HTTPException:
+        except (HTTPException, PoolTimeoutError):  # pool timeouts: 503, handled globally
             raise
+        except DuplicateReviewError as e:
+            reviews_ns.abort(409, str(e))
         except ValueError as e:
             reviews_ns.abort(400, str(e))
         except Exception as e:
@@ -19,10 +19,15 @@ Authorization model:
 - Only admins can delete users
 """
 
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, reqparse
 from flask import request
 from app import facade as facade_instance
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.utils.bcrypt_pool import BcryptPoolSaturated
+from app.utils.serializers import compile_marshaller
+from app.utils.http_cache import conditional
+from app.utils.timestamps import iso_timestamp
 
 
 # Create a namespace for user-related operations
@@ -71,6 +76,16 @@ user_response_model = users_ns.model('UserResponse', {
     'updated_at': fields.String(description='ISO 8601 timestamp of last update')
 })
 
+# Compiled equivalent of marshal(data, user_response_model, mask=X-Fields) for list responses
+marshal_user = compile_marshaller(user_response_model)
+
+# Query string parser for GET /users/ (change feed)
+user_list_parser = reqparse.RequestParser()
+user_list_parser.add_argument(
+    'updated_since', type=iso_timestamp, location='args',
+    help='ISO 8601 time: only users created or modified at or after it (change feed)'
+)
+
 # Input model for user self-update (regular users)
 user_update_model = users_ns.model('UserUpdateInput', {
     'first_name': fields.String(
@@ -166,6 +181,9 @@ class UserList(Resource):
         except (ValueError, TypeError) as e:
             # Handle validation errors (invalid email, missing fields, etc.)
             users_ns.abort(400, message=str(e))
+        except (BcryptPoolSaturated, PoolTimeoutError):
+            # Password hashing or database pool full: handled globally (503)
+            raise
         except Exception:
             # Handle unexpected errors
             users_ns.abort(500, message='Internal server error')
@@ -173,8 +191,10 @@ class UserList(Resource):
         # Return the created user (password is excluded by to_dict())
         return new_user.to_dict(), 201
 
-    @users_ns.marshal_list_with(user_response_model)
-    @users_ns.response(200, 'List of users retrieved successfully')
+    @conditional(lambda: facade_instance.get_users_version())
+    @users_ns.expect(user_list_parser)
+    @users_ns.response(200, 'List of users retrieved successfully', [user_response_model])
+    @users_ns.response(304, 'Not modified (If-None-Match / If-Modified-Since matched)')
     def get(self):
         """
         Retrieve a list of all registered users.
@@ -187,14 +207,22 @@ class UserList(Resource):
         - User search functionality
         - Admin dashboards
         
+        ?updated_since=<ISO 8601> keeps the users created or modified since
+        then (oldest change first); deleted users are listed by
+        GET /api/v1/changes/deleted.
+        
         Returns:
             200: List of all users
+            400: Invalid updated_since
         """
+        updated_since = user_list_parser.parse_args().get('updated_since')
+
         # Fetch all users from the database
-        users = facade_instance.get_all_user()
+        users = facade_instance.get_all_user(updated_since)
         
         # Convert each user object to a dictionary (excludes password)
-        return [u.to_dict() for u in users]
+        marshal = marshal_user.for_request()
+        return [marshal(u.to_dict()) for u in users]
 
 
 @users_ns.route('/<string:user_id>')
@@ -209,8 +237,10 @@ class UserResource(Resource):
     - Deleting a user (DELETE - admin only)
     """
 
+    @conditional(lambda user_id: facade_instance.get_user_version(user_id))
     @users_ns.marshal_with(user_response_model)
     @users_ns.response(200, 'User details retrieved successfully')
+    @users_ns.response(304, 'Not modified (If-None-Match / If-Modified-Since matched)')
     @users_ns.response(404, 'User not found')
     def get(self, user_id):
         """
@@ -226,15 +256,15 @@ class UserResource(Resource):
             200: User details
             404: User not found
         """
-        # Fetch the user from the database
-        user = facade_instance.get_user(user_id) 
+        # Fetch the serialized user (entity cache, database on a miss)
+        user = facade_instance.get_user_dict(user_id)
         
         # Return 404 if user doesn't exist
         if not user:
             users_ns.abort(404, 'User not found')
         
         # Return user data (password excluded by to_dict())
-        return user.to_dict()
+        return user
 
     @jwt_required()  # Requires valid JWT token
     @users_ns.expect(user_update_model, validate=True)
@@ -340,8 +370,8 @@ class UserResource(Resource):
         Cascade behavior:
         - All places owned by the user will be deleted
         - All reviews written by the user will be deleted
-        - All amenities created by the user will be deleted
-        - This is handled by SQLAlchemy cascade rules
+        - All reviews of those places will be deleted
+        - This is handled by the database (ON DELETE CASCADE foreign keys)
         
         Args:
             user_id (str): UUID of the user to delete
@@ -360,7 +390,7 @@ class UserResource(Resource):
             users_ns.abort(403, 'Admin privileges required')
         
         # Delete the user from the database
-        # SQLAlchemy cascade will handle related entities (places, reviews, amenities)
+        # ON DELETE CASCADE removes related places and reviews
         deleted = facade_instance.delete_user(user_id)
         
         # Return 404 if user doesn't exist
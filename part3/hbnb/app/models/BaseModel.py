@@ -6,7 +6,7 @@ This module defines the abstract base class that all entities inherit from.
 It provides common functionality shared across all database models:
 - Unique identifier (UUID)
 - Timestamp tracking (created_at, updated_at)
-- CRUD operations (save, delete, update)
+- CRUD operations (save, delete, update) - flush only, see app.persistence.unit_of_work
 - Serialization (to_dict)
 
 All models (User, Place, Review, Amenity) inherit from this class
@@ -14,6 +14,7 @@ to ensure consistent behavior and database schema.
 """
 
 from app import db
+from app.utils.serializers import serializer_for
 import uuid
 from datetime import datetime
 
@@ -46,6 +47,9 @@ class BaseModel(db.Model):
     # Mark this class as abstract - SQLAlchemy will not create a table for it
     # Child classes (User, Place, etc.) will each have their own tables
     __abstract__ = True
+
+    # Columns left out of to_dict() (overridden by child classes)
+    __serialize_exclude__ = ()
     
     # -----------------------
     # Common Database Columns
@@ -61,7 +65,9 @@ class BaseModel(db.Model):
     
     # Timestamp when the record was last modified
     # onupdate=datetime.utcnow automatically updates on every UPDATE
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # index=True (one index per table): ?updated_since= change feeds are range scans
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow,
+                           nullable=False, index=True)
 
     def save(self):
         """
@@ -70,7 +76,10 @@ class BaseModel(db.Model):
         This method:
         1. Updates the updated_at timestamp to current UTC time
         2. Adds the instance to the SQLAlchemy session
-        3. Commits the transaction to the database
+        3. Flushes (sends the INSERT/UPDATE inside the current transaction)
+        
+        The COMMIT is done by the unit of work: once per request, or at the
+        end of the outermost facade transaction() outside a request.
         
         Usage:
             >>> user = User(first_name="John", last_name="Doe")
@@ -82,7 +91,7 @@ class BaseModel(db.Model):
         """
         self.updated_at = datetime.utcnow()
         db.session.add(self)
-        db.session.commit()
+        db.session.flush()
 
     def delete(self):
         """
@@ -90,7 +99,8 @@ class BaseModel(db.Model):
         
         This method:
         1. Marks the instance for deletion in the SQLAlchemy session
-        2. Commits the transaction to permanently delete the record
+        2. Flushes (sends the DELETE inside the current transaction,
+           committed by the unit of work)
         
         Usage:
             >>> user = User.query.get(user_id)
@@ -101,7 +111,7 @@ class BaseModel(db.Model):
             For example, deleting a User will also delete their Places and Reviews.
         """
         db.session.delete(self)
-        db.session.commit()
+        db.session.flush()
 
     def update(self, data):
         """
@@ -112,7 +122,7 @@ class BaseModel(db.Model):
         2. Skips protected/immutable fields (id, created_at, __class__)
         3. Updates only attributes that exist on the model
         4. Updates the updated_at timestamp
-        5. Commits the changes to the database
+        5. Flushes the changes (committed by the unit of work)
         
         Args:
             data (dict): Dictionary of attribute names and new values
@@ -141,17 +151,20 @@ class BaseModel(db.Model):
                 setattr(self, key, value)
         # Update the modification timestamp
         self.updated_at = datetime.utcnow()
-        db.session.commit()
+        db.session.flush()
 
     def to_dict(self, **kwargs):
         """
         Convert the instance to a JSON-serializable dictionary.
         
         This method:
-        1. Iterates through all database columns
-        2. Retrieves the current value for each column
-        3. Converts datetime objects to ISO 8601 strings
-        4. Adds a '__class__' field with the model name
+        1. Retrieves the current value for each database column
+           (except the ones listed in __serialize_exclude__)
+        2. Converts datetime objects to ISO 8601 strings
+        3. Adds a '__class__' field with the model name
+
+        The work is done by a serializer function generated once per model
+        class, with the columns unrolled (see app.utils.serializers).
         
         Datetime conversion:
             - datetime objects are converted to ISO 8601 format
@@ -179,21 +192,13 @@ class BaseModel(db.Model):
         
         Note:
             - Relationships (e.g., user.places) are NOT included to avoid circular references
-            - Sensitive fields (e.g., password hashes) should be excluded in child classes
+            - Sensitive fields (e.g., password hashes) are listed in the child class's
+              __serialize_exclude__ so they are never read
             - The '__class__' field helps identify the model type in API responses
         """
-        data = {}
-        # Iterate through all database columns defined in the model
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            # Convert datetime objects to ISO 8601 string format for JSON compatibility
-            if isinstance(value, datetime):
-                data[column.name] = value.isoformat()
-            else:
-                data[column.name] = value
-        # Add model class name for type identification
-        data['__class__'] = self.__class__.__name__
-        return data
+        # Column loop generated once per class (see app.utils.serializers):
+        # no per-row reflection over __table__.columns
+        return serializer_for(type(self))(self)
 
     def __repr__(self):
         """
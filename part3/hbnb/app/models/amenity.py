@@ -65,7 +65,8 @@ class Amenity(BaseModel):
         'Place', 
         secondary='place_amenity',      # Association table name
         back_populates='amenities',     # Corresponding attribute in Place
-        lazy='subquery'                 # Eager load for performance
+        lazy='subquery',                # Eager load for performance
+        passive_deletes=True            # Links removed by place_amenity ON DELETE CASCADE
     )
 
     def __init__(self, name=None, **kwargs):
@@ -16,12 +16,16 @@ Business rules:
 - Price must be non-negative (stored as Decimal for precision)
 - Latitude must be between -90 and 90
 - Longitude must be between -180 and 180
+- geohash is derived from (latitude, longitude), never set directly
+- Rating aggregates (count, sum, average, 1-5 histogram) are materialized
+  on the row and maintained incrementally by the facade on review writes
 - Each place must have an owner (user who created it)
 - Deleting a place cascades to delete all its reviews
 """
 
 from app import db
 from app.models.BaseModel import BaseModel
+from app.utils.geo import encode_geohash
 from sqlalchemy.orm import validates
 from decimal import Decimal
 
@@ -29,12 +33,20 @@ from decimal import Decimal
 # Many-to-Many association table between Place and Amenity
 # This table has no model class, it's just a link table
 # CASCADE: When a place or amenity is deleted, the association is removed
+# ix_place_amenity_amenity_id: the primary key index starts with place_id, so
+# "places having amenity X" lookups (amenity filter) need their own index
 place_amenity = db.Table('place_amenity',
     db.Column('place_id', db.String(36), db.ForeignKey('places.id', ondelete='CASCADE'), primary_key=True),
-    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id', ondelete='CASCADE'), primary_key=True)
+    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_place_amenity_amenity_id', 'amenity_id')
 )
 
 
+# Aggregate columns maintained from reviews (see Place rating_* columns)
+RATING_COLUMNS = ('rating_count', 'rating_sum', 'rating_avg',
+                  'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5')
+
+
 class Place(BaseModel):
     """
     Place model representing rental properties/accommodations.
@@ -50,6 +62,11 @@ class Place(BaseModel):
         price (Decimal): Price per night (stored with 2 decimal precision)
         latitude (float): Geographic latitude coordinate (-90 to 90)
         longitude (float): Geographic longitude coordinate (-180 to 180)
+        geohash (str): Geohash of (latitude, longitude), kept in sync by the validators
+        rating_count (int): Number of reviews of this place
+        rating_sum (int): Sum of the ratings of those reviews
+        rating_avg (float): rating_sum / rating_count (0 when there are no reviews)
+        rating_1 .. rating_5 (int): Histogram, number of reviews per star value
         owner_id (str): UUID of the user who owns/created this place
         
     Relationships:
@@ -59,6 +76,19 @@ class Place(BaseModel):
     """
     
     __tablename__ = 'places'
+
+    # Replaced in to_dict() by the owner object and the rating histogram
+    __serialize_exclude__ = ('owner_id', 'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5')
+
+    # Composite index backing keyset pagination (ORDER BY created_at, id)
+    # Lets "next page" queries seek directly to the cursor instead of OFFSET scanning
+    # ix_places_price / ix_places_lat_lon back the listing filters
+    # (min_price/max_price and the lat/lon bounding box)
+    __table_args__ = (
+        db.Index('ix_places_created_at_id', 'created_at', 'id'),
+        db.Index('ix_places_price', 'price'),
+        db.Index('ix_places_lat_lon', 'latitude', 'longitude'),
+    )
     
     # -----------------------
     # Database Columns
@@ -78,9 +108,29 @@ class Place(BaseModel):
     latitude = db.Column(db.Float, nullable=False)
     longitude = db.Column(db.Float, nullable=False)
     
+    # Precomputed geohash of (latitude, longitude) for radius search
+    # Maintained by validate_latitude/validate_longitude, never set directly
+    # index=True: "nearby" queries become a few indexed prefix range scans
+    geohash = db.Column(db.String(12), nullable=True, index=True)
+    
+    # Materialized rating aggregates (kept up to date by HBnBFacade on review
+    # create/update/delete, see PlaceRepository.adjust_ratings)
+    # Reading or sorting by rating never joins or GROUP BYs the reviews table
+    # server_default lets existing rows be migrated with zeros
+    rating_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_avg = db.Column(db.Float, nullable=False, default=0.0, server_default='0')
+    rating_1 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_2 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_3 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_4 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_5 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    
     # Foreign key to User (who owns this place)
     # index=True for faster queries like "find all places by owner"
-    owner_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
+    # ON DELETE CASCADE: the database removes the places of a deleted user
+    owner_id = db.Column(db.String(36), db.ForeignKey('users.id', ondelete='CASCADE'),
+                         nullable=False, index=True)
     
     # -----------------------
     # Relationships
@@ -92,13 +142,18 @@ class Place(BaseModel):
     
     # One-to-Many: One place has many reviews
     # cascade='all, delete-orphan' deletes all reviews when place is deleted
+    # passive_deletes=True: reviews not already loaded are left to the
+    # database (reviews.place_id ON DELETE CASCADE), never SELECTed first
     # lazy=True loads reviews only when accessed (on-demand loading)
-    reviews = db.relationship('Review', backref='place', lazy=True, cascade='all, delete-orphan')
+    reviews = db.relationship('Review', backref='place', lazy=True, cascade='all, delete-orphan',
+                              passive_deletes=True)
     
     # Many-to-Many: Place has many amenities, Amenity has many places
     # secondary='place_amenity' specifies the association table
     # lazy='subquery' loads amenities in a single query for better performance
-    amenities = db.relationship('Amenity', secondary=place_amenity, lazy='subquery', back_populates='places')
+    # passive_deletes=True: place_amenity rows go with ON DELETE CASCADE
+    amenities = db.relationship('Amenity', secondary=place_amenity, lazy='subquery', back_populates='places',
+                                passive_deletes=True)
 
     def __init__(self, title=None, description=None, price=None, latitude=None, 
                  longitude=None, owner_id=None, amenities=None, **kwargs):
@@ -137,6 +192,12 @@ class Place(BaseModel):
             self.owner_id = owner_id
         if amenities:
             self.amenities = amenities if isinstance(amenities, list) else []
+        
+        # A new place has no reviews yet (column defaults only apply at INSERT,
+        # set them now so to_dict() works before the first flush)
+        for column in RATING_COLUMNS:
+            if getattr(self, column) is None:
+                setattr(self, column, 0)
 
     @validates('title')
     def validate_title(self, key, value):
@@ -234,6 +295,7 @@ class Place(BaseModel):
             raise TypeError("Latitude must be a number")
         if value < -90 or value > 90:
             raise ValueError("Latitude must be between -90 and 90")
+        self._refresh_geohash(float(value), self.longitude)
         return float(value)
 
     @validates('longitude')
@@ -265,8 +327,37 @@ class Place(BaseModel):
             raise TypeError("Longitude must be a number")
         if value < -180 or value > 180:
             raise ValueError("Longitude must be between -180 and 180")
+        self._refresh_geohash(self.latitude, float(value))
         return float(value)
 
+    def _refresh_geohash(self, latitude, longitude):
+        """
+        Recompute the geohash column from the (new) coordinates.
+        
+        Called by the latitude/longitude validators with the value being
+        set and the current value of the other coordinate. While one of
+        them is still unknown (object under construction), geohash stays None.
+        
+        Args:
+            latitude (float or None): Latitude to encode
+            longitude (float or None): Longitude to encode
+        """
+        if latitude is None or longitude is None:
+            self.geohash = None
+        else:
+            self.geohash = encode_geohash(latitude, longitude)
+
+    @property
+    def rating_histogram(self):
+        """
+        Number of reviews per star value.
+        
+        Returns:
+            list: [count of 1-star, 2-star, 3-star, 4-star, 5-star reviews]
+        """
+        return [self.rating_1 or 0, self.rating_2 or 0, self.rating_3 or 0,
+                self.rating_4 or 0, self.rating_5 or 0]
+
     def add_amenity(self, amenity):
         """
         Associate an amenity with this place (SQLAlchemy way).
@@ -302,11 +393,13 @@ class Place(BaseModel):
         - Owner information (nested object with id, name, email)
         - List of amenities (id and name only)
         - List of reviews (id, text, rating, user_id)
+        - Rating aggregates (count, sum, average, 1-5 histogram)
         
         Relationship loading:
-        - All relationships are automatically loaded by SQLAlchemy
-        - lazy='subquery' ensures amenities are loaded in one query
-        - reviews are loaded via lazy=True (on-demand)
+        - PlaceRepository eager-loads owner, amenities and reviews for every
+          place it returns, so serializing a list runs no extra queries
+        - On a Place loaded some other way, relationships are lazy-loaded
+          on access (1-2 extra SELECTs per place)
         
         Args:
             **kwargs: Additional arguments passed to BaseModel.to_dict()
@@ -333,7 +426,11 @@ class Place(BaseModel):
                 ],
                 'reviews': [
                     {'id': 'rev-1', 'text': 'Great!', 'rating': 5.0, 'user_id': 'u-2'}
-                ]
+                ],
+                'rating_count': 1,
+                'rating_sum': 5,
+                'rating_average': 5.0,
+                'rating_histogram': [0, 0, 0, 0, 1]
             }
         """
         # Get base dictionary from BaseModel (id, created_at, updated_at, etc.)
@@ -356,13 +453,16 @@ class Place(BaseModel):
         else:
             # Fallback if owner relationship is not loaded (shouldn't happen with eager loading)
             place_dict['owner'] = {
-                'id': place_dict.get('owner_id'),
+                'id': self.owner_id,
                 'first_name': None,
                 'last_name': None,
                 'email': None
             }
-        # Remove raw owner_id from output (replaced by owner object)
-        place_dict.pop('owner_id', None)
+
+        # ----- RATINGS ----- (materialized columns, no reviews query needed)
+        # rating_1..rating_5 (excluded columns) are folded into a single histogram list
+        place_dict['rating_average'] = place_dict.pop('rating_avg', 0.0)
+        place_dict['rating_histogram'] = self.rating_histogram
 
         # ----- AMENITIES ----- (SQLAlchemy relationship loaded via lazy='subquery')
         place_dict['amenities'] = []
@@ -397,4 +497,9 @@ class Place(BaseModel):
                  Format: <Place title>
                  Example: <Place Cozy Apartment in Paris>
         """
-        return f"<Place {self.title}>"
\ No newline at end of file
+        return f"<Place {self.title}>"
+
+
+# Sort index for rating-ordered listings (GET /places/?sort=-rating)
+# Declared after the class because the first column is descending
+db.Index('ix_places_rating_avg_created_at_id', Place.rating_avg.desc(), Place.created_at, Place.id)
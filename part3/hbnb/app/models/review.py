@@ -48,6 +48,9 @@ class Review(BaseModel):
     
     __tablename__ = 'reviews'
 
+    # Replaced in to_dict() by the nested user and place objects
+    __serialize_exclude__ = ('user_id', 'place_id')
+
     # Unique constraint: One user can only review each place once
     # This is enforced at the database level for data integrity
     __table_args__ = (
@@ -67,11 +70,15 @@ class Review(BaseModel):
     
     # Foreign key to User (who wrote the review)
     # index=True for faster queries like "find all reviews by user"
-    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
+    # ON DELETE CASCADE: the database removes the reviews of a deleted user
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id', ondelete='CASCADE'),
+                        nullable=False, index=True)
     
     # Foreign key to Place (being reviewed)
     # index=True for faster queries like "find all reviews for a place"
-    place_id = db.Column(db.String(36), db.ForeignKey('places.id'), nullable=False, index=True)
+    # ON DELETE CASCADE: the database removes the reviews of a deleted place
+    place_id = db.Column(db.String(36), db.ForeignKey('places.id', ondelete='CASCADE'),
+                         nullable=False, index=True)
     
     # -----------------------
     # Relationships
@@ -221,12 +228,10 @@ class Review(BaseModel):
         else:
             # Fallback if user relationship is not loaded
             review_dict['user'] = {
-                'id': review_dict.get('user_id'),
+                'id': self.user_id,
                 'first_name': None,
                 'last_name': None
             }
-        # Remove raw user_id from output (replaced by user object)
-        review_dict.pop('user_id', None)
 
         # ----- PLACE ----- (SQLAlchemy relationship loaded via backref)
         if hasattr(self, 'place') and self.place:
@@ -238,11 +243,9 @@ class Review(BaseModel):
         else:
             # Fallback if place relationship is not loaded
             review_dict['place'] = {
-                'id': review_dict.get('place_id'),
+                'id': self.place_id,
                 'title': None
             }
-        # Remove raw place_id from output (replaced by place object)
-        review_dict.pop('place_id', None)
 
         return review_dict
 
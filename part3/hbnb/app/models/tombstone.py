@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+"""
+Tombstone model for the HBnB application.
+
+A tombstone records that an entity (user, place, review or amenity) was
+deleted, and when. Deleted rows are gone from their table, so without it
+clients syncing with ?updated_since= would never learn about deletions.
+
+Database schema:
+- Primary key: id (auto-increment integer, not a UUID: rows are only ever
+  appended and read in order)
+- entity_type: table name of the deleted entity ('places', 'reviews', ...)
+- entity_id: UUID of the deleted entity
+- deleted_at: time of the deletion (UTC)
+
+Rows are written by app.persistence.tombstones.TombstoneLog, never by hand.
+"""
+
+from datetime import datetime
+
+from app import db
+
+
+class Tombstone(db.Model):
+    """
+    Deletion record of one entity.
+
+    Attributes:
+        id (int): Auto-increment primary key
+        entity_type (str): Table name of the deleted entity
+        entity_id (str): UUID of the deleted entity
+        deleted_at (datetime): When the entity was deleted (UTC)
+    """
+
+    __tablename__ = 'tombstones'
+
+    # Change feeds read "deletions of <type> since <time>": one range scan
+    __table_args__ = (
+        db.Index('ix_tombstones_entity_type_deleted_at', 'entity_type', 'deleted_at'),
+        db.Index('ix_tombstones_deleted_at', 'deleted_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    entity_type = db.Column(db.String(32), nullable=False)
+    entity_id = db.Column(db.String(36), nullable=False)
+    deleted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def to_dict(self):
+        """
+        Convert the tombstone to a JSON-serializable dictionary.
+
+        Returns:
+            dict: type, id (of the deleted entity) and deleted_at (ISO 8601)
+        """
+        return {
+            'type': self.entity_type,
+            'id': self.entity_id,
+            'deleted_at': self.deleted_at.isoformat(),
+        }
+
+    def __repr__(self):
+        """String representation for debugging"""
+        return f"<Tombstone {self.entity_type} {self.entity_id}>"
@@ -25,7 +25,7 @@ Business rules:
 - Deleting a user cascades to delete all their places and reviews
 """
 
-from app import db, bcrypt
+from app import db, bcrypt_pool
 from app.models.BaseModel import BaseModel
 from sqlalchemy.orm import validates
 from email_validator import validate_email, EmailNotValidError
@@ -54,6 +54,9 @@ class User(BaseModel):
     """
     
     __tablename__ = 'users'
+
+    # The password hash is never read by to_dict() (see BaseModel.to_dict)
+    __serialize_exclude__ = ('password',)
     
     # -----------------------
     # Database Columns
@@ -84,13 +87,18 @@ class User(BaseModel):
     # One-to-Many: User can own multiple places
     # back_populates='owner' creates bidirectional relationship with Place.owner
     # cascade='all, delete-orphan' deletes all places when user is deleted
+    # passive_deletes=True: unloaded places (and their reviews) are deleted by
+    # the database (places.owner_id ON DELETE CASCADE), not loaded one by one
     # lazy=True loads places only when accessed (on-demand loading)
-    places = db.relationship('Place', back_populates='owner', lazy=True, cascade='all, delete-orphan')
+    places = db.relationship('Place', back_populates='owner', lazy=True, cascade='all, delete-orphan',
+                             passive_deletes=True)
     
     # One-to-Many: User can write multiple reviews
     # backref='user' creates User.reviews attribute and Review.user attribute
     # cascade='all, delete-orphan' deletes all reviews when user is deleted
-    reviews = db.relationship('Review', backref='user', lazy=True, cascade='all, delete-orphan')
+    # passive_deletes=True: left to reviews.user_id ON DELETE CASCADE
+    reviews = db.relationship('Review', backref='user', lazy=True, cascade='all, delete-orphan',
+                              passive_deletes=True)
 
     def __init__(self, first_name=None, last_name=None, email=None, password=None, is_admin=False, **kwargs):
         """
@@ -151,12 +159,13 @@ class User(BaseModel):
         Security:
             - Minimum length: 6 characters (enforced here)
             - Maximum length: No limit (bcrypt handles it)
-            - Work factor: Default from bcrypt configuration
+            - Work factor: BCRYPT_LOG_ROUNDS from the app config
+            - Runs on the bcrypt worker pool (raises BcryptPoolSaturated when full)
         """
         if not password or len(password) < 6:
             raise ValueError("Password must be at least 6 characters long")
-        # Generate bcrypt hash and decode to UTF-8 string for database storage
-        self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+        # Generate bcrypt hash (UTF-8 string) on the bounded bcrypt pool
+        self.password = bcrypt_pool.hash_password(password)
 
     def verify_password(self, password):
         """
@@ -175,13 +184,24 @@ class User(BaseModel):
         Security:
             - Constant-time comparison (prevents timing attacks)
             - Automatically handles salt extraction from hash
+            - Runs on the bcrypt worker pool (raises BcryptPoolSaturated when full)
             
         Usage:
             >>> user = User.query.filter_by(email='john@example.com').first()
             >>> if user.verify_password('userPassword123'):
             >>>     print("Login successful")
         """
-        return bcrypt.check_password_hash(self.password, password)
+        return bcrypt_pool.check_password(self.password, password)
+
+    def password_needs_rehash(self):
+        """
+        Check whether the stored hash uses another work factor than BCRYPT_LOG_ROUNDS.
+        
+        Returns:
+            bool: True if the password should be re-hashed (done at login,
+                  the only time the plain text password is known)
+        """
+        return bcrypt_pool.needs_rehash(self.password)
 
     # -----------------------
     # SQLAlchemy Validators
@@ -326,14 +346,9 @@ class User(BaseModel):
                 'updated_at': '2023-11-09T10:30:00'
             }
         """
-        # Get base dictionary from BaseModel (includes all columns)
-        data = super().to_dict(**kwargs)
-        
-        # CRITICAL SECURITY: Remove password hash from response
-        # Never expose password hashes in API responses
-        data.pop('password', None)
-        
-        return data
+        # Get base dictionary from BaseModel (all columns but the password:
+        # CRITICAL SECURITY, it is excluded through __serialize_exclude__)
+        return super().to_dict(**kwargs)
 
     def __repr__(self):
         """
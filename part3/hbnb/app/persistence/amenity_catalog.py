@@ -0,0 +1,206 @@
+#!/usr/bin/python3
+"""
+In-process catalog of amenities (id <-> name) for the HBnB application.
+
+Amenities are a small, rarely written, global list that every place and
+amenity write validates against. Instead of reading the whole table and
+scanning it in Python on each request, the catalog keeps two dictionaries:
+
+- ids:   amenity id -> name          (place validation: "does this id exist?")
+- names: lowercase name -> amenity id (amenity validation: "is this name taken?")
+
+Both are O(1) lookups and need no SELECT once loaded.
+
+Consistency:
+- Loaded lazily with one SELECT id, name FROM amenities
+- Updated after every COMMIT that inserts/renames/deletes an amenity
+  (session hooks, same approach as EntityCache), which bumps `version`
+- An unknown id triggers a reload (at most once per
+  AMENITY_CATALOG_RELOAD_INTERVAL seconds), so amenities created by
+  another worker are picked up without restarting
+- A stale "name is free" answer is still caught by the UNIQUE constraint
+  on amenities.name at INSERT time
+"""
+
+import threading
+import time
+
+from sqlalchemy import event, select
+
+
+class AmenityCatalog:
+    """
+    Versioned id -> name / lowercase name -> id maps of all amenities.
+
+    The maps are replaced as a whole (copy-on-write), so readers never lock:
+    they grab the current (version, ids, names) tuple and use it.
+
+    Usage:
+        >>> amenity_catalog = AmenityCatalog()
+        >>> amenity_catalog.init_app(app, db)
+        >>> amenity_catalog.unknown_ids(['id-1', 'id-2'])
+        []
+        >>> amenity_catalog.id_for_name('wifi')
+        'id-1'
+    """
+
+    # session.info key holding the amenity changes of the current transaction
+    _PENDING = 'amenity_catalog_pending'
+    # session.info flag: a savepoint holding amenity changes was rolled back
+    _RELOAD = 'amenity_catalog_reload'
+
+    def __init__(self, app=None, db=None):
+        """Create an empty, not yet loaded catalog"""
+        self._lock = threading.Lock()
+        self._db = None
+        self._state = None          # (version, ids, names) or None before loading
+        self._version = 0
+        self._last_reload = 0.0
+        self.reload_interval = 1.0
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        """
+        Bind the catalog to an application and watch its session for amenity writes.
+
+        The catalog is emptied: it is reloaded from this app's database on first use.
+
+        Args:
+            app (Flask): Application (reads AMENITY_CATALOG_RELOAD_INTERVAL)
+            db (SQLAlchemy): Flask-SQLAlchemy instance
+        """
+        self._db = db
+        self.reload_interval = app.config.get('AMENITY_CATALOG_RELOAD_INTERVAL', 1.0)
+        with self._lock:
+            self._state = None
+            self._last_reload = 0.0
+
+        for name, listener in (('after_flush', self._collect),
+                               ('after_commit', self._apply_pending),
+                               ('after_soft_rollback', self._drop_pending)):
+            if not event.contains(db.session, name, listener):
+                event.listen(db.session, name, listener)
+
+        app.extensions['amenity_catalog'] = self
+
+    # -----------------------
+    # Lookups
+    # -----------------------
+
+    @property
+    def version(self):
+        """int: Incremented on every (re)load and every committed amenity change"""
+        return self._current()[0]
+
+    def unknown_ids(self, amenity_ids):
+        """
+        Return the amenity ids that do not exist.
+
+        Args:
+            amenity_ids (iterable): Amenity UUIDs to check
+
+        Returns:
+            list: Ids not in the catalog, in input order (empty when all exist)
+        """
+        ids = self._current()[1]
+        unknown = [a_id for a_id in amenity_ids if a_id not in ids]
+        if unknown and self._reload_if_due():
+            # Maybe created by another process since we loaded
+            ids = self._current()[1]
+            unknown = [a_id for a_id in unknown if a_id not in ids]
+        return unknown
+
+    def id_for_name(self, name):
+        """
+        Find an amenity by name, ignoring case and surrounding whitespace.
+
+        Args:
+            name (str): Amenity name (e.g. "wifi", " WiFi ")
+
+        Returns:
+            str: Id of the amenity using that name, or None
+        """
+        return self._current()[2].get(name.strip().lower())
+
+    def name_for_id(self, amenity_id):
+        """
+        Args: amenity_id (str): Amenity UUID
+        Returns: str: Name of the amenity, or None if unknown
+        """
+        return self._current()[1].get(amenity_id)
+
+    # -----------------------
+    # Loading
+    # -----------------------
+
+    def _current(self):
+        state = self._state
+        if state is None:
+            self._reload()
+            state = self._state
+        return state
+
+    def _reload(self):
+        """Replace both maps with the content of the amenities table (one SELECT)"""
+        table = self._db.metadata.tables['amenities']
+        rows = self._db.session.execute(select(table.c.id, table.c.name)).all()
+        with self._lock:
+            self._version += 1
+            self._state = (self._version,
+                           {a_id: name for a_id, name in rows},
+                           {name.lower(): a_id for a_id, name in rows})
+            self._last_reload = time.monotonic()
+
+    def _reload_if_due(self):
+        """Reload unless the last reload is more recent than reload_interval"""
+        if time.monotonic() - self._last_reload < self.reload_interval:
+            return False
+        self._reload()
+        return True
+
+    # -----------------------
+    # Session hooks
+    # -----------------------
+
+    def _collect(self, session, _flush_context):
+        """after_flush: remember amenities inserted/renamed (id -> name) or deleted (id -> None)"""
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+            if getattr(obj, '__tablename__', None) != 'amenities':
+                continue
+            changes = session.info.setdefault(self._PENDING, {})
+            changes[obj.id] = None if obj in session.deleted else obj.name
+
+    def _apply_pending(self, session):
+        """after_commit: apply the committed amenity changes to a new version of the maps"""
+        reload = session.info.pop(self._RELOAD, False)
+        changes = session.info.pop(self._PENDING, None)
+        if not changes:
+            return
+        with self._lock:
+            if self._state is None or reload:
+                # Not loaded yet, or some pending changes were rolled back
+                # with a savepoint: the next lookup reads the committed table
+                self._state = None
+                return
+            ids = dict(self._state[1])
+            for a_id, name in changes.items():
+                if name is None:
+                    ids.pop(a_id, None)
+                else:
+                    ids[a_id] = name
+            self._version += 1
+            self._state = (self._version, ids,
+                           {name.lower(): a_id for a_id, name in ids.items()})
+
+    def _drop_pending(self, session, previous_transaction):
+        """after_soft_rollback: nothing was written"""
+        # Also fired for savepoints (begin_nested): the enclosing transaction
+        # may still commit the changes flushed before them. Which pending
+        # changes the savepoint undid is unknown, so reload at the commit
+        if previous_transaction.parent is not None:
+            if session.info.get(self._PENDING):
+                session.info[self._RELOAD] = True
+            return
+        session.info.pop(self._PENDING, None)
+        session.info.pop(self._RELOAD, None)
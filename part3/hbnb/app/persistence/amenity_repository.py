@@ -13,8 +13,11 @@ The repository pattern provides:
 
 Amenity-specific queries:
 - get_amenity_by_name(): Find amenity by name (not unique, returns first match)
+- get_amenities_by_ids(): Load several amenities with one IN query
 """
 
+from sqlalchemy.orm import lazyload
+
 from app.models.amenity import Amenity
 from app.persistence.repository import SQLAlchemyRepository
 
@@ -32,6 +35,7 @@ class AmenityRepository(SQLAlchemyRepository):
     
     Amenity-specific methods:
     - get_amenity_by_name(name): Find amenity by name
+    - get_amenities_by_ids(ids): Load several amenities at once
     """
     
     def __init__(self):
@@ -69,4 +73,30 @@ class AmenityRepository(SQLAlchemyRepository):
             - Returns FIRST match only (names are not unique)
             - Returns None if no match found
         """
-        return self.model.query.filter_by(name=name).first()
\ No newline at end of file
+        return self.model.query.filter_by(name=name).first()
+    
+    def get_amenities_by_ids(self, amenity_ids):
+        """
+        Load several amenities in a single query (Amenity-specific method).
+        
+        Used when attaching amenities to a place: one
+        SELECT ... WHERE id IN (...) instead of one get() per amenity.
+        
+        Args:
+            amenity_ids (list): Amenity UUIDs
+            
+        Returns:
+            list: Amenity objects in the order of amenity_ids
+                  (unknown ids and duplicates are skipped)
+        
+        Usage:
+            >>> repo.get_amenities_by_ids(['am-1', 'am-2'])
+            [<Amenity am-1>, <Amenity am-2>]
+        """
+        if not amenity_ids:
+            return []
+        # lazyload: do not subquery-load every place of each amenity (Amenity.places
+        # is lazy='subquery'); attaching the amenity to a new place does not need them
+        query = self.model.query.options(lazyload(self.model.places))
+        by_id = {a.id: a for a in query.filter(self.model.id.in_(amenity_ids)).all()}
+        return [by_id[a_id] for a_id in dict.fromkeys(amenity_ids) if a_id in by_id]
@@ -0,0 +1,340 @@
+#!/usr/bin/python3
+"""
+Read-through entity cache for the HBnB repositories.
+
+Single-resource reads (GET /places/<id>, /users/<id>, ...) serialize the same
+rows over and over. This module keeps the serialized result (the to_dict()
+snapshot) in process memory so hot entities are served without a database
+round-trip.
+
+Design:
+- Keys: (table name, id) - e.g. ('places', 'abc-123')
+- Values: detached dict snapshots (deep-copied on read, never ORM objects)
+- Eviction: LRU bounded by ENTITY_CACHE_SIZE entries + TTL (ENTITY_CACHE_TTL seconds)
+- Invalidation: after every COMMIT, for each inserted/updated/deleted row:
+    * its own key
+    * every snapshot that embeds it (tags, e.g. a place embeds its owner)
+    * its many-to-one parents (a new review changes its place's snapshot)
+  * rows removed by ON DELETE CASCADE (see app.persistence.cascades)
+  Hooked on the SQLAlchemy session, so repository add/update/delete and
+  BaseModel.save/update/delete are all covered without explicit calls.
+- Versions: each snapshot also keeps (latest updated_at, digest of the
+  snapshot), so conditional GETs (app.utils.http_cache) are validated
+  from memory as well (see get_version())
+- Stats: hits/misses/evictions/invalidations counters (see stats())
+
+The cache is per process: with several workers, another worker's write is
+only seen once the TTL expires. Keep ENTITY_CACHE_TTL short in that setup.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import MANYTOONE
+
+from app.persistence.cascades import deleted_entities
+
+
+class EntityCache:
+    """
+    In-process LRU/TTL cache of serialized entities (Flask extension style).
+
+    Usage:
+        >>> entity_cache = EntityCache()
+        >>> entity_cache.init_app(app, db)
+        >>> entity_cache.get_or_load(Place, place_id, loader)
+
+    Configuration (app.config):
+        ENTITY_CACHE_SIZE (int): Maximum number of snapshots (0 disables the cache)
+        ENTITY_CACHE_TTL (float): Snapshot lifetime in seconds
+    """
+
+    # session.info key holding the keys written by the current transaction
+    _PENDING = 'entity_cache_pending'
+
+    def __init__(self, app=None, db=None):
+        """Create an empty cache (disabled until init_app() is called)"""
+        self._lock = threading.Lock()
+        # key -> (expires_at, snapshot, tags, version)
+        self._entries = OrderedDict()
+        # tag -> set of keys whose snapshot embeds that entity
+        self._tagged = {}
+        # Bumped on every invalidation (see get_or_load: no stale re-caching)
+        self._generation = 0
+        self.max_size = 0
+        self.ttl = 0
+        self._reset_stats()
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        """
+        Configure the cache for an application and hook it on the db session.
+
+        The cache content is cleared: entries from a previous app (e.g. another
+        test database) must never be served by this one.
+
+        Args:
+            app (Flask): Application whose config holds ENTITY_CACHE_SIZE/TTL
+            db (SQLAlchemy): Flask-SQLAlchemy instance whose session is watched
+        """
+        self.max_size = app.config.get('ENTITY_CACHE_SIZE', 0)
+        self.ttl = app.config.get('ENTITY_CACHE_TTL', 60)
+        self.clear()
+
+        # Session hooks are process-wide: register them only once
+        for name, listener in (('after_flush', self._collect),
+                               ('after_commit', self._flush_pending),
+                               ('after_soft_rollback', self._drop_pending)):
+            if not event.contains(db.session, name, listener):
+                event.listen(db.session, name, listener)
+
+        app.extensions['entity_cache'] = self
+
+    @property
+    def enabled(self):
+        """bool: True when snapshots are stored (ENTITY_CACHE_SIZE > 0)"""
+        return self.max_size > 0
+
+    # -----------------------
+    # Read path
+    # -----------------------
+
+    def get_or_load(self, model, obj_id, loader):
+        """
+        Return the snapshot of an entity, loading it on a miss.
+
+        Args:
+            model: SQLAlchemy model class (its table name is part of the key)
+            obj_id (str): UUID of the entity
+            loader (callable): loader(obj_id) -> ORM object or None
+
+        Returns:
+            dict: Private copy of the to_dict() snapshot, or None if not found
+                  (missing entities are not cached)
+        """
+        if not self.enabled:
+            obj = loader(obj_id)
+            return obj.to_dict() if obj is not None else None
+        entry = self._fetch(model, obj_id, loader)
+        return copy.deepcopy(entry[0]) if entry is not None else None
+
+    def get_version(self, model, obj_id, loader):
+        """
+        Return the version of an entity's snapshot, loading it on a miss.
+
+        The version is computed once, when the snapshot is stored, so a hit
+        costs no query and no serialization. Both parts change whenever the
+        snapshot does: the digest covers its content, the timestamp is the
+        latest updated_at of the entity and of the entities it embeds.
+
+        Args:
+            model: SQLAlchemy model class
+            obj_id (str): UUID of the entity
+            loader (callable): loader(obj_id) -> ORM object or None
+
+        Returns:
+            tuple: (latest updated_at, snapshot digest), or None if not found
+
+        Raises:
+            RuntimeError: If the cache is disabled (use a SQL version instead)
+        """
+        if not self.enabled:
+            raise RuntimeError("Entity cache is disabled (ENTITY_CACHE_SIZE = 0)")
+        entry = self._fetch(model, obj_id, loader)
+        return entry[1] if entry is not None else None
+
+    def _fetch(self, model, obj_id, loader):
+        """Return (shared snapshot, version) from the cache or the loader, None if not found"""
+        key = (model.__tablename__, obj_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1], entry[3]
+            if entry is not None:
+                # Expired: drop it now rather than waiting for LRU eviction
+                self._remove(key)
+            self._misses += 1
+            generation = self._generation
+
+        obj = loader(obj_id)
+        if obj is None:
+            return None
+        snapshot = obj.to_dict()
+        tags, last_modified = self._embedded(obj)
+        digest = hashlib.blake2b(repr(snapshot).encode('utf-8'), digest_size=8).hexdigest()
+        version = (last_modified, digest)
+
+        with self._lock:
+            # A commit invalidated something while we were loading: the
+            # snapshot may predate it, so serve it but do not keep it
+            if generation == self._generation:
+                self._store(key, snapshot, tags, version)
+        return snapshot, version
+
+    # -----------------------
+    # Invalidation
+    # -----------------------
+
+    def invalidate(self, table, obj_id):
+        """
+        Drop an entity and every snapshot that embeds it.
+
+        Args:
+            table (str): Table name of the entity (e.g. 'places')
+            obj_id (str): UUID of the entity
+        """
+        with self._lock:
+            self._invalidate((table, obj_id))
+
+    def invalidate_after_commit(self, session, table, obj_id):
+        """
+        Schedule an invalidation for when the current transaction commits.
+
+        Needed for bulk statements (query.update/delete) that bypass the
+        unit of work, so the flush hook never sees the affected rows.
+
+        Args:
+            session: SQLAlchemy session running the statement
+            table (str): Table name of the entity
+            obj_id (str): UUID of the entity
+        """
+        session.info.setdefault(self._PENDING, set()).add((table, obj_id))
+
+    def clear(self):
+        """Remove every snapshot and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._tagged.clear()
+            self._generation += 1
+            self._reset_stats()
+
+    def stats(self):
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: hits, misses, evictions, invalidations, size and hit_ratio
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'size': len(self._entries),
+                'hit_ratio': self._hits / lookups if lookups else 0.0,
+            }
+
+    # -----------------------
+    # Session hooks
+    # -----------------------
+
+    def _collect(self, session, _flush_context):
+        """after_flush: remember which entities this transaction wrote"""
+        pending = session.info.setdefault(self._PENDING, set())
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+            table = getattr(obj, '__tablename__', None)
+            if table is None:
+                continue
+            pending.add((table, obj.id))
+            # Parents embed their children (place.reviews, place rating, ...)
+            pending.update(self._parents_of(obj))
+        # Rows removed by ON DELETE CASCADE never were in the session
+        pending.update(deleted_entities(session))
+
+    def _flush_pending(self, session):
+        """after_commit: the new data is visible, drop the stale snapshots"""
+        pending = session.info.pop(self._PENDING, None)
+        if pending:
+            with self._lock:
+                for tag in pending:
+                    self._invalidate(tag)
+
+    def _drop_pending(self, session, previous_transaction):
+        """after_soft_rollback: nothing was written, keep the snapshots"""
+        # Also fired for savepoints (begin_nested): the enclosing transaction
+        # may still commit the changes flushed before them
+        if previous_transaction.parent is not None:
+            return
+        session.info.pop(self._PENDING, None)
+
+    # -----------------------
+    # Internals (callers hold self._lock unless stated otherwise)
+    # -----------------------
+
+    def _reset_stats(self):
+        self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def _store(self, key, snapshot, tags, version):
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, snapshot, tags, version)
+        for tag in tags:
+            self._tagged.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def _remove(self, key):
+        _expires, _snapshot, tags, _version = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[tag]
+
+    def _invalidate(self, tag):
+        self._generation += 1
+        for key in list(self._tagged.get(tag, ())):
+            self._remove(key)
+            self._invalidations += 1
+
+    @staticmethod
+    def _embedded(obj):
+        """
+        Entities embedded in obj's snapshot and their latest updated_at (lock not required).
+
+        Only relationships already loaded by to_dict() are followed, so
+        computing tags never issues extra queries.
+
+        Returns:
+            tuple: (set of (table, id) tags, max updated_at or None)
+        """
+        state = inspect(obj)
+        tags = {(obj.__tablename__, obj.id)}
+        stamps = [obj.updated_at] if obj.updated_at is not None else []
+        for rel in state.mapper.relationships:
+            if rel.key in state.unloaded:
+                continue
+            related = getattr(obj, rel.key)
+            if related is None:
+                continue
+            for item in (related if rel.uselist else [related]):
+                tags.add((item.__tablename__, item.id))
+                if item.updated_at is not None:
+                    stamps.append(item.updated_at)
+        return tags, max(stamps) if stamps else None
+
+    @staticmethod
+    def _parents_of(obj):
+        """(table, id) of the many-to-one parents referenced by obj's foreign keys"""
+        state = inspect(obj)
+        parents = set()
+        for rel in state.mapper.relationships:
+            if rel.direction is not MANYTOONE:
+                continue
+            for local, _remote in rel.local_remote_pairs:
+                value = state.attrs[state.mapper.get_property_by_column(local).key].value
+                if value is not None:
+                    parents.add((rel.mapper.local_table.name, value))
+        return parents
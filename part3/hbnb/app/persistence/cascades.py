@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+"""
+Database-side cascade deletes for the HBnB application.
+
+User.places, User.reviews, Place.reviews and the place_amenity links are
+declared with passive_deletes=True over ON DELETE CASCADE foreign keys:
+deleting a user is one DELETE FROM users, and the database removes their
+places, the reviews of those places and their own reviews. The ORM no
+longer loads every child into the session to delete it row by row.
+
+Two things still need to know which rows the database is about to remove:
+- TombstoneLog (change feeds): one tombstone per deleted entity
+- EntityCache: their snapshots must be evicted
+
+So, before each flush that deletes a user or a place, their passively
+cascaded descendants are found with a few id-only SELECTs (one per
+relationship level, whatever the number of rows) and kept in session.info;
+deleted_entities(session) returns them together with session.deleted.
+
+SQLite enforces foreign keys (and so ON DELETE CASCADE) only when
+"PRAGMA foreign_keys=ON" is sent on each connection:
+app.persistence.sqlite_profile always sends it, along with the rest of
+the SQLITE_PRAGMAS profile.
+
+Usage:
+    >>> cascades.init_app(app, db)      # before the hooks that read deleted_entities()
+    >>> for table, obj_id in deleted_entities(session): ...
+"""
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import ONETOMANY
+
+# session.info key: {(table, id)} removed by ON DELETE CASCADE in this flush
+_PASSIVE = 'passive_cascade_deleted'
+
+
+def init_app(app, db):
+    """
+    Watch the db session for passive cascades.
+
+    Args:
+        app (Flask): Application
+        db (SQLAlchemy): Flask-SQLAlchemy instance
+    """
+    # Session hooks are process-wide: register them only once
+    for name, listener in (('before_flush', _collect_passive),
+                           ('after_flush_postexec', _clear_passive)):
+        if not event.contains(db.session, name, listener):
+            event.listen(db.session, name, listener)
+
+
+def deleted_entities(session):
+    """
+    Entities deleted by the current flush, including passive cascades.
+
+    Valid in after_flush hooks (session.deleted still lists the flushed
+    deletions there).
+
+    Args:
+        session: SQLAlchemy session being flushed
+
+    Returns:
+        set: (table name, id) of every deleted entity
+    """
+    deleted = {(obj.__tablename__, obj.id) for obj in session.deleted
+               if getattr(obj, '__tablename__', None) is not None}
+    return deleted | session.info.get(_PASSIVE, set())
+
+
+# -----------------------
+# Internals
+# -----------------------
+
+def _passive_relationships(mapper):
+    """One-to-many relationships whose deletes are left to the database"""
+    return [rel for rel in mapper.relationships
+            if rel.passive_deletes and rel.direction is ONETOMANY and 'delete' in rel.cascade]
+
+
+def _collect_passive(session, _flush_context, _instances):
+    """before_flush: find (ids only) the rows ON DELETE CASCADE is going to remove"""
+    roots = {}
+    for obj in session.deleted:
+        mapper = inspect(obj).mapper
+        if _passive_relationships(mapper):
+            roots.setdefault(mapper, []).append(obj.id)
+    if not roots:
+        return
+
+    found = set()
+    # Walk the cascade level by level: each level is one SELECT per
+    # relationship, its parent ids given as a subquery (no huge IN lists)
+    frontier = [(mapper, ids) for mapper, ids in roots.items()]
+    with session.no_autoflush:
+        while frontier:
+            mapper, parent_ids = frontier.pop()
+            for rel in _passive_relationships(mapper):
+                child = rel.mapper
+                (_local, foreign_key), = rel.local_remote_pairs
+                child_ids = select(child.local_table.c.id).where(foreign_key.in_(parent_ids))
+                ids = session.execute(child_ids).scalars().all()
+                if ids:
+                    found.update((child.local_table.name, child_id) for child_id in ids)
+                    frontier.append((child, child_ids))
+    session.info.setdefault(_PASSIVE, set()).update(found)
+
+
+def _clear_passive(session, _flush_context):
+    """after_flush_postexec: the flush is over, forget its cascades"""
+    session.info.pop(_PASSIVE, None)
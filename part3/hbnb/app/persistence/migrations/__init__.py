@@ -0,0 +1,255 @@
+#!/usr/bin/python3
+"""
+Versioned schema migrations for the HBnB application.
+
+create_app() used to run db.create_all() on every start, in every worker:
+one reflection query per table before serving anything. It also never
+changed an existing table, so new columns, indexes or ON DELETE CASCADE
+foreign keys never reached databases created by an older version.
+
+Now the schema has a version, stored in the schema_version table (one row
+per applied migration), and:
+- Startup reads one row (SELECT max(version) FROM schema_version)
+- `flask db upgrade` applies the pending migrations, each in its own
+  transaction, and records their versions
+- AUTO_MIGRATE (development, tests) makes startup run the upgrade itself.
+  Without it, an outdated database is logged and the API answers 503
+  until `flask db upgrade` has been run
+
+Migrations are the modules of this package named vNNNN_<name>.py, applied
+in NNNN order. Each defines upgrade(connection) and must be idempotent on
+the databases it can meet (see app.persistence.migrations.ops).
+
+A database without schema_version is either:
+- Empty: the current models are created with metadata.create_all() and
+  every migration is recorded as applied (nothing to convert)
+- Created by db.create_all() before migrations existed: it is at version
+  0 and gets every migration
+
+Usage:
+    >>> migrations.init_app(app, db)        # in create_app(), models imported
+    $ flask --app run db upgrade            # deploy step
+    $ flask --app run db current
+"""
+
+import functools
+import importlib
+import pkgutil
+import re
+from collections import namedtuple
+from datetime import datetime
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select
+from sqlalchemy.exc import DBAPIError
+
+Migration = namedtuple('Migration', ('version', 'name', 'upgrade'))
+
+# Kept out of the models' metadata: create_all() never creates it
+schema_version = Table(
+    'schema_version', MetaData(),
+    Column('version', Integer, primary_key=True, autoincrement=False),
+    Column('name', String(100), nullable=False),
+    Column('applied_at', DateTime, nullable=False),
+)
+
+_MODULE = re.compile(r'^v(\d{4})_(\w+)$')
+
+
+def init_app(app, db):
+    """
+    Register the `flask db` commands and check the schema version.
+
+    Args:
+        app (Flask): Application (reads AUTO_MIGRATE)
+        db (SQLAlchemy): Flask-SQLAlchemy instance (models must be imported)
+    """
+    if 'db' not in app.cli.commands:
+        app.cli.add_command(db_cli)
+    app.extensions['migrations'] = state = {'db': db, 'behind': False}
+
+    with app.app_context():
+        current, head = current_version(db.engine), head_version()
+        if current == head:
+            return
+        if app.config.get('AUTO_MIGRATE'):
+            upgrade(db.engine, db.metadata)
+            return
+
+    app.logger.error("Database schema is at version %s, this code needs %s: run 'flask db upgrade'",
+                     current, head)
+    state['behind'] = True
+
+    @app.before_request
+    def _schema_guard():
+        """Answer 503 until the database has been upgraded (then stop checking)"""
+        if state['behind']:
+            if current_version(db.engine) != head_version():
+                return {'error': 'Service unavailable',
+                        'message': 'Database schema is out of date'}, 503
+            state['behind'] = False
+
+
+@functools.lru_cache(maxsize=None)
+def available():
+    """
+    Migrations of this package, in version order (discovered once).
+
+    Returns:
+        tuple: Migration(version, name, upgrade) tuples
+    """
+    migrations = []
+    for module in pkgutil.iter_modules(__path__):
+        match = _MODULE.match(module.name)
+        if match:
+            upgrade_func = importlib.import_module(f'{__name__}.{module.name}').upgrade
+            migrations.append(Migration(int(match.group(1)), match.group(2), upgrade_func))
+    return tuple(sorted(migrations))
+
+
+def head_version():
+    """Version of the newest migration (the schema this code expects)"""
+    return available()[-1].version
+
+
+def current_version(engine):
+    """
+    Schema version of the database: one single-row query.
+
+    Returns:
+        int or None: Highest applied version, None when schema_version does
+        not exist (empty database, or created before migrations)
+    """
+    try:
+        with engine.connect() as connection:
+            return connection.execute(select(func.max(schema_version.c.version))).scalar()
+    except DBAPIError:
+        return None
+
+
+def upgrade(engine, metadata):
+    """
+    Apply the pending migrations.
+
+    Args:
+        engine: SQLAlchemy engine of the database
+        metadata (MetaData): Models' metadata (create_all() of an empty database)
+
+    Returns:
+        list: Migrations applied (empty when already up to date)
+    """
+    migrations = available()
+    with engine.connect() as connection:
+        _without_foreign_keys(connection)
+        try:
+            with _transaction(connection):
+                schema_version.create(connection, checkfirst=True)
+                if _current(connection) is None and not _has_tables(connection, metadata):
+                    # Empty database: the current schema, every version applied
+                    metadata.create_all(connection)
+                    _record(connection, migrations)
+                    return migrations
+
+            applied = []
+            for migration in migrations:
+                with _transaction(connection):
+                    # Read again inside the (write-locked) transaction: another
+                    # worker may have applied it meanwhile
+                    if migration.version <= (_current(connection) or 0):
+                        continue
+                    migration.upgrade(connection)
+                    _record(connection, [migration])
+                applied.append(migration)
+            return applied
+        finally:
+            _with_foreign_keys(connection)
+
+
+# -----------------------
+# CLI
+# -----------------------
+
+db_cli = AppGroup('db', help='Database schema migrations.')
+
+
+@db_cli.command('upgrade')
+def upgrade_command():
+    """Apply the pending schema migrations."""
+    db = current_app.extensions['migrations']['db']
+    applied = upgrade(db.engine, db.metadata)
+    for migration in applied:
+        click.echo(f'Applied {migration.version:04d} {migration.name}')
+    click.echo(f'Schema at version {current_version(db.engine)}')
+    current_app.extensions['migrations']['behind'] = False
+
+
+@db_cli.command('current')
+def current_command():
+    """Show the schema version and the pending migrations."""
+    db = current_app.extensions['migrations']['db']
+    current = current_version(db.engine)
+    click.echo(f'Schema at version {current} (head: {head_version()})')
+    for migration in available():
+        if migration.version > (current or 0):
+            click.echo(f'Pending {migration.version:04d} {migration.name}')
+
+
+# -----------------------
+# Internals
+# -----------------------
+
+def _current(connection):
+    return connection.execute(select(func.max(schema_version.c.version))).scalar()
+
+
+def _has_tables(connection, metadata):
+    existing = set(inspect(connection).get_table_names())
+    return any(table in existing for table in metadata.tables)
+
+
+def _record(connection, migrations):
+    now = datetime.utcnow()
+    connection.execute(schema_version.insert(), [
+        {'version': m.version, 'name': m.name, 'applied_at': now} for m in migrations
+    ])
+
+
+class _transaction:
+    """
+    connection.begin(), plus on SQLite an explicit BEGIN IMMEDIATE.
+
+    pysqlite only opens transactions before INSERT/UPDATE/DELETE, so DDL
+    would autocommit statement by statement; IMMEDIATE also takes the write
+    lock first, so two workers starting together apply a migration once.
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def __enter__(self):
+        self._transaction = self._connection.begin()
+        if self._connection.dialect.name == 'sqlite':
+            self._connection.exec_driver_sql('BEGIN IMMEDIATE')
+        return self._transaction
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._transaction.commit()
+        else:
+            self._transaction.rollback()
+
+
+def _without_foreign_keys(connection):
+    """SQLite: table rebuilds need foreign keys off (settable outside transactions only)"""
+    if connection.dialect.name == 'sqlite':
+        connection.exec_driver_sql('PRAGMA foreign_keys=OFF')
+        connection.commit()
+
+
+def _with_foreign_keys(connection):
+    if connection.dialect.name == 'sqlite':
+        connection.rollback()
+        connection.exec_driver_sql('PRAGMA foreign_keys=ON')
+        connection.commit()
@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+"""
+Schema operations used by the migrations.
+
+Each operation looks at the current schema first and does nothing when the
+change is already there: a migration can meet a database created by a
+db.create_all() that already had some of its changes (new tables, indexes),
+and must then only add what is missing.
+
+SQLite cannot alter a foreign key: add_on_delete_cascade() rebuilds the
+table the way https://www.sqlite.org/lang_altertable.html describes (new
+table, copy, drop, rename, indexes). It requires foreign keys to be off,
+which the migration runner does around every migration.
+"""
+
+import re
+
+from sqlalchemy import ForeignKeyConstraint, Index, MetaData, Table, inspect
+from sqlalchemy.schema import AddConstraint, CreateColumn, DropConstraint
+
+
+def has_column(connection, table, column):
+    """True when `table` has a column named `column`"""
+    return any(c['name'] == column for c in inspect(connection).get_columns(table))
+
+
+def add_column(connection, table, column):
+    """
+    ALTER TABLE ... ADD COLUMN, unless the column exists.
+
+    Args:
+        connection: SQLAlchemy connection (inside the migration transaction)
+        table (str): Table name
+        column (Column): Unattached column (type, nullable, server_default)
+
+    Returns:
+        bool: True when the column was added
+    """
+    if has_column(connection, table, column.name):
+        return False
+    Table(table, MetaData(), column)  # CreateColumn compiles attached columns only
+    preparer = connection.dialect.identifier_preparer
+    ddl = CreateColumn(column).compile(dialect=connection.dialect)
+    connection.exec_driver_sql(f'ALTER TABLE {preparer.quote(table)} ADD COLUMN {ddl}')
+    return True
+
+
+def create_index(connection, name, table, *columns, unique=False, descending=()):
+    """
+    CREATE INDEX, unless an index with this name exists on the table.
+
+    Args:
+        name (str): Index name
+        table (str): Table name
+        *columns (str): Indexed column names, in order
+        unique (bool): UNIQUE index
+        descending (tuple): Names of the columns sorted descending
+    """
+    if any(index['name'] == name for index in inspect(connection).get_indexes(table)):
+        return False
+    reflected = Table(table, MetaData(), autoload_with=connection)
+    expressions = [reflected.c[c].desc() if c in descending else reflected.c[c] for c in columns]
+    Index(name, *expressions, unique=unique).create(connection)
+    return True
+
+
+def create_table(connection, table):
+    """CREATE TABLE (and its indexes), unless the table exists"""
+    if inspect(connection).has_table(table.name):
+        return False
+    table.create(connection)
+    return True
+
+
+def add_on_delete_cascade(connection, table, columns):
+    """
+    Make the foreign keys of `columns` ON DELETE CASCADE.
+
+    Args:
+        table (str): Table holding the foreign keys
+        columns (tuple): Foreign key column names
+
+    Returns:
+        bool: True when the table was changed
+    """
+    missing = [
+        fk for fk in inspect(connection).get_foreign_keys(table)
+        if len(fk['constrained_columns']) == 1 and fk['constrained_columns'][0] in columns
+        and (fk.get('options') or {}).get('ondelete', '').upper() != 'CASCADE'
+    ]
+    if not missing:
+        return False
+    if connection.dialect.name == 'sqlite':
+        _sqlite_rebuild_with_cascade(connection, table, [fk['constrained_columns'][0] for fk in missing])
+        return True
+
+    # Other databases: drop and re-add each constraint
+    metadata = MetaData()
+    reflected = Table(table, metadata, autoload_with=connection)
+    for constraint in list(reflected.foreign_key_constraints):
+        names = [c.name for c in constraint.columns]
+        if len(names) == 1 and names[0] in columns and (constraint.ondelete or '').upper() != 'CASCADE':
+            connection.execute(DropConstraint(constraint))
+            cascading = ForeignKeyConstraint(names, [e.target_fullname for e in constraint.elements],
+                                             name=constraint.name, ondelete='CASCADE')
+            reflected.append_constraint(cascading)
+            connection.execute(AddConstraint(cascading))
+    return True
+
+
+# -----------------------
+# Internals
+# -----------------------
+
+def _sqlite_rebuild_with_cascade(connection, table, columns):
+    """Recreate an SQLite table with ON DELETE CASCADE on the given foreign keys"""
+    if connection.exec_driver_sql('PRAGMA foreign_keys').scalar():
+        # DROP TABLE would cascade into (or fail on) the referencing rows
+        raise RuntimeError('SQLite foreign keys must be off to rebuild a table')
+
+    create_sql = connection.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).scalar_one()
+    index_sql = [row[0] for row in connection.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (table,))]
+
+    for column in columns:
+        pattern = re.compile(
+            r'(FOREIGN KEY\s*\(\s*"?%s"?\s*\)\s*REFERENCES\s+"?\w+"?\s*\([^)]*\))(?!\s*ON DELETE)'
+            % re.escape(column), re.IGNORECASE)
+        create_sql, count = pattern.subn(r'\1 ON DELETE CASCADE', create_sql)
+        if not count:
+            raise RuntimeError(f'Cannot find the foreign key of {table}.{column} in: {create_sql}')
+
+    temporary = f'_migrate_{table}'
+    create_sql = re.sub(r'^CREATE TABLE\s+"?%s"?' % re.escape(table), f'CREATE TABLE "{temporary}"',
+                        create_sql, count=1, flags=re.IGNORECASE)
+    connection.exec_driver_sql(create_sql)
+    connection.exec_driver_sql(f'INSERT INTO "{temporary}" SELECT * FROM "{table}"')
+    connection.exec_driver_sql(f'DROP TABLE "{table}"')
+    connection.exec_driver_sql(f'ALTER TABLE "{temporary}" RENAME TO "{table}"')
+    for sql in index_sql:
+        connection.exec_driver_sql(sql)
+
+    violations = connection.exec_driver_sql(f'PRAGMA foreign_key_check("{table}")').fetchall()
+    if violations:
+        raise RuntimeError(f'{table}: {len(violations)} rows reference missing parents')
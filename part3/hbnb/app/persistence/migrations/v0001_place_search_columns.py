@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+"""
+Places: geohash and the materialized rating aggregates.
+
+Adds places.geohash and rating_count/sum/avg/1..5, then fills them for the
+existing rows: geohash from (latitude, longitude), ratings from the reviews
+(one correlated UPDATE, the only time they are computed by aggregation).
+"""
+
+from sqlalchemy import Column, Float, Integer, String, text
+
+from app.persistence.migrations import ops
+from app.utils.geo import encode_geohash
+
+RATING_COLUMNS = ('rating_count', 'rating_sum', 'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5')
+
+
+def upgrade(connection):
+    if ops.add_column(connection, 'places', Column('geohash', String(12), nullable=True)):
+        rows = connection.execute(text('SELECT id, latitude, longitude FROM places')).all()
+        if rows:
+            connection.execute(text('UPDATE places SET geohash = :geohash WHERE id = :id'), [
+                {'id': place_id, 'geohash': encode_geohash(latitude, longitude)}
+                for place_id, latitude, longitude in rows
+            ])
+
+    added = [ops.add_column(connection, 'places', Column(name, Integer, nullable=False, server_default='0'))
+             for name in RATING_COLUMNS]
+    added.append(ops.add_column(connection, 'places',
+                                Column('rating_avg', Float, nullable=False, server_default='0')))
+    if any(added):
+        connection.execute(text(
+            'UPDATE places SET '
+            'rating_count = (SELECT count(*) FROM reviews WHERE reviews.place_id = places.id), '
+            'rating_sum = (SELECT coalesce(sum(rating), 0) FROM reviews WHERE reviews.place_id = places.id), '
+            + ', '.join(f'rating_{n} = (SELECT count(*) FROM reviews '
+                        f'WHERE reviews.place_id = places.id AND rating = {n})' for n in range(1, 6))
+        ))
+        connection.execute(text(
+            'UPDATE places SET rating_avg = rating_sum * 1.0 / rating_count WHERE rating_count > 0'
+        ))
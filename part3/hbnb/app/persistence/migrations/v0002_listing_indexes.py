@@ -0,0 +1,16 @@
+#!/usr/bin/python3
+"""
+Indexes of the place listings: pagination, filters, nearby search, sort by rating.
+"""
+
+from app.persistence.migrations import ops
+
+
+def upgrade(connection):
+    ops.create_index(connection, 'ix_places_geohash', 'places', 'geohash')
+    ops.create_index(connection, 'ix_places_created_at_id', 'places', 'created_at', 'id')
+    ops.create_index(connection, 'ix_places_price', 'places', 'price')
+    ops.create_index(connection, 'ix_places_lat_lon', 'places', 'latitude', 'longitude')
+    ops.create_index(connection, 'ix_places_rating_avg_created_at_id', 'places',
+                     'rating_avg', 'created_at', 'id', descending=('rating_avg',))
+    ops.create_index(connection, 'ix_place_amenity_amenity_id', 'place_amenity', 'amenity_id')
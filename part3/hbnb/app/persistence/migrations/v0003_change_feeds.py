@@ -0,0 +1,27 @@
+#!/usr/bin/python3
+"""
+Change feeds (?updated_since=): updated_at indexes and the tombstones table.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table
+
+from app.persistence.migrations import ops
+
+# The table as this migration creates it (app.models.tombstone may change later)
+tombstones = Table(
+    'tombstones', MetaData(),
+    Column('id', Integer, primary_key=True, autoincrement=True),
+    Column('entity_type', String(32), nullable=False),
+    Column('entity_id', String(36), nullable=False),
+    Column('deleted_at', DateTime, default=datetime.utcnow, nullable=False),
+    Index('ix_tombstones_entity_type_deleted_at', 'entity_type', 'deleted_at'),
+    Index('ix_tombstones_deleted_at', 'deleted_at'),
+)
+
+
+def upgrade(connection):
+    ops.create_table(connection, tombstones)
+    for table in ('users', 'places', 'reviews', 'amenities'):
+        ops.create_index(connection, f'ix_{table}_updated_at', table, 'updated_at')
@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+"""
+ON DELETE CASCADE on the foreign keys of places and reviews.
+
+Rows whose parent no longer exists (left by deletes that ran with SQLite
+foreign keys off) are removed first: the constraint would reject them.
+"""
+
+from sqlalchemy import text
+
+from app.persistence.migrations import ops
+
+
+def upgrade(connection):
+    connection.execute(text('DELETE FROM reviews WHERE user_id NOT IN (SELECT id FROM users) '
+                            'OR place_id NOT IN (SELECT id FROM places WHERE owner_id IN (SELECT id FROM users))'))
+    connection.execute(text('DELETE FROM place_amenity WHERE place_id NOT IN '
+                            '(SELECT id FROM places WHERE owner_id IN (SELECT id FROM users)) '
+                            'OR amenity_id NOT IN (SELECT id FROM amenities)'))
+    connection.execute(text('DELETE FROM places WHERE owner_id NOT IN (SELECT id FROM users)'))
+
+    ops.add_on_delete_cascade(connection, 'places', ('owner_id',))
+    ops.add_on_delete_cascade(connection, 'reviews', ('user_id', 'place_id'))
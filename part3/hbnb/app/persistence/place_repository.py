@@ -13,10 +13,101 @@ The repository pattern provides:
 
 Place-specific queries:
 - get_places_by_owner(): Find all places owned by a specific user
+- get_owner_id(): Owner of a place, one column (review submission checks)
+- get_places_page(): Keyset (cursor) pagination ordered by (created_at, id)
+- iter_all(): Full listing through a server-side cursor (streamed responses)
+- query_version() / get_collection_version(): What to_dict() shows, in one SELECT (ETags)
+- Listing filters (price range, amenities, bounding box) applied in SQL
+- get_places_nearby(): Radius search pruned by geohash prefix, then haversine
+- adjust_ratings(): Atomic update of the materialized rating aggregates
+
+Every read method eager-loads the relationships used by Place.to_dict()
+(owner, amenities, reviews), so serializing N places costs a constant
+number of SELECTs instead of 1 + 2N (N+1 query problem).
 """
 
-from app.models.place import Place
+import base64
+import binascii
+import json
+import math
+from datetime import datetime
+
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.orm import joinedload, lazyload, selectinload
+from sqlalchemy.orm.util import identity_key
+
+from app import db, entity_cache
+from app.models.amenity import Amenity
+from app.models.place import RATING_COLUMNS, Place, place_amenity
+from app.models.review import Review
+from app.models.user import User
 from app.persistence.repository import SQLAlchemyRepository
+from app.utils.geo import (
+    encode_geohash,
+    geohash_neighbors,
+    geohash_precision_for_radius,
+    haversine_km,
+)
+
+
+# Supported listing orders: name -> list of (attribute, descending)
+# Every order ends with (created_at, id) so the sort key is unique, which
+# keyset pagination requires. Each order is backed by a composite index.
+SORT_ORDERS = {
+    'created_at': [('created_at', False), ('id', False)],
+    '-rating': [('rating_avg', True), ('created_at', False), ('id', False)],
+}
+
+
+def encode_cursor(place, sort='created_at'):
+    """
+    Build an opaque pagination cursor pointing just after a place.
+
+    The cursor holds the sort name and the sort key of the last row of a
+    page (e.g. [created_at, id]), JSON-encoded then base64url-encoded so
+    clients treat it as a token.
+
+    Args:
+        place (Place): Last place returned on the current page
+        sort (str): Name of the order used for the page (key of SORT_ORDERS)
+
+    Returns:
+        str: URL-safe cursor string (no padding)
+    """
+    values = []
+    for attr, _descending in SORT_ORDERS[sort]:
+        value = getattr(place, attr)
+        values.append(value.isoformat() if isinstance(value, datetime) else value)
+    raw = json.dumps([sort, values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, sort='created_at'):
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor (str): Opaque cursor received from a client
+        sort (str): Order of the page being requested; must match the cursor
+
+    Returns:
+        list: Sort key values, in SORT_ORDERS[sort] order
+
+    Raises:
+        ValueError: If the cursor is malformed, was tampered with,
+                    or was issued for another sort order
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if cursor_sort != sort or len(values) != len(SORT_ORDERS[sort]):
+            raise ValueError
+        decoded = []
+        for (attr, _descending), value in zip(SORT_ORDERS[sort], values):
+            decoded.append(datetime.fromisoformat(value) if attr == 'created_at' else value)
+        return decoded
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise ValueError("Invalid pagination cursor")
 
 
 class PlaceRepository(SQLAlchemyRepository):
@@ -30,8 +121,22 @@ class PlaceRepository(SQLAlchemyRepository):
     - update(id, data): Update place by UUID
     - delete(id): Delete place by UUID
     
+    Overridden with eager loading (owner, amenities, reviews):
+    - get(id), get_all(filters)
+    
     Place-specific methods:
     - get_places_by_owner(owner_id): Find all places owned by a user
+    - get_places_page(limit, cursor, filters): One page of places + next cursor
+    - get_places_nearby(lat, lon, radius_km, limit): Places within a radius
+    - adjust_ratings(place_id, deltas): Update rating aggregates in one UPDATE
+    
+    Supported filters (dict, every key optional):
+    - min_price / max_price: price range (inclusive)
+    - amenities: list of amenity IDs, the place must have ALL of them
+    - lat_min / lat_max / lon_min / lon_max: bounding box (inclusive)
+    - updated_since: places created or modified at or after this naive UTC
+      datetime (inclusive; a new, edited or deleted review also touches
+      its place, see adjust_ratings)
     """
     
     def __init__(self):
@@ -43,7 +148,229 @@ class PlaceRepository(SQLAlchemyRepository):
         """
         # Call parent constructor with Place model
         super().__init__(Place)
+
+    @staticmethod
+    def _eager_options():
+        """
+        Loader options for everything Place.to_dict() touches.
+        
+        - owner: joinedload (many-to-one, one LEFT OUTER JOIN, safe with LIMIT)
+        - amenities: selectinload (one extra SELECT ... WHERE place_id IN (...))
+        - reviews: selectinload (one extra SELECT ... WHERE place_id IN (...))
+        
+        Amenity.places is declared lazy='subquery'; it is switched to lazy
+        loading here, otherwise loading the amenities of a page would drag in
+        every place linked to those amenities.
+        
+        Returns:
+            list: SQLAlchemy loader options (3 statements per query, whatever the row count)
+        """
+        return [
+            joinedload(Place.owner),
+            selectinload(Place.amenities).options(lazyload(Amenity.places)),
+            selectinload(Place.reviews),
+        ]
+
+    def _eager_query(self):
+        """Return a Place query with owner, amenities and reviews eager-loaded"""
+        return self.model.query.options(*self._eager_options())
+
+    def get(self, obj_id):
+        """
+        Retrieve a place by ID with its relationships eager-loaded.
+        
+        Args:
+            obj_id (str): UUID of the place
+            
+        Returns:
+            Place if found, None otherwise
+        """
+        return db.session.get(self.model, obj_id, options=self._eager_options())
+
+    def _apply_filters(self, query, filters):
+        """
+        Push listing filters down into the SQL WHERE clause.
+        
+        Nothing is filtered in Python: rows that do not match never leave
+        the database.
+        
+        - Price range uses ix_places_price
+        - Bounding box uses ix_places_lat_lon
+        - updated_since uses ix_places_updated_at
+        - Amenities (all-of) becomes:
+              id IN (SELECT place_id FROM place_amenity
+                     WHERE amenity_id IN (:ids)
+                     GROUP BY place_id
+                     HAVING COUNT(DISTINCT amenity_id) = :n)
+          which uses ix_place_amenity_amenity_id
+        
+        Args:
+            query: Place query to restrict
+            filters (dict or None): See class docstring for supported keys
+            
+        Returns:
+            Query: The restricted query
+        """
+        if not filters:
+            return query
+
+        if filters.get('min_price') is not None:
+            query = query.filter(self.model.price >= filters['min_price'])
+        if filters.get('max_price') is not None:
+            query = query.filter(self.model.price <= filters['max_price'])
+
+        if filters.get('lat_min') is not None:
+            query = query.filter(self.model.latitude >= filters['lat_min'])
+        if filters.get('lat_max') is not None:
+            query = query.filter(self.model.latitude <= filters['lat_max'])
+        if filters.get('lon_min') is not None:
+            query = query.filter(self.model.longitude >= filters['lon_min'])
+        if filters.get('lon_max') is not None:
+            query = query.filter(self.model.longitude <= filters['lon_max'])
+
+        if filters.get('updated_since') is not None:
+            query = query.filter(self.model.updated_at >= filters['updated_since'])
+
+        amenity_ids = set(filters.get('amenities') or [])
+        if amenity_ids:
+            having_all = (
+                select(place_amenity.c.place_id)
+                .where(place_amenity.c.amenity_id.in_(amenity_ids))
+                .group_by(place_amenity.c.place_id)
+                .having(func.count(func.distinct(place_amenity.c.amenity_id)) == len(amenity_ids))
+            )
+            query = query.filter(self.model.id.in_(having_all))
+
+        return query
+
+    def get_all(self, filters=None, sort=None):
+        """
+        Retrieve all places (optionally filtered/sorted) with relationships eager-loaded.
+        
+        Args:
+            filters (dict, optional): Listing filters (see class docstring)
+            sort (str, optional): Key of SORT_ORDERS (unordered when None)
+        
+        Returns:
+            list: Matching Place objects (3 SELECTs in total, not 1 + 2N)
+            
+        Raises:
+            ValueError: If sort is not a known order
+        """
+        query = self._apply_filters(self._eager_query(), filters)
+        if sort is not None:
+            if sort not in SORT_ORDERS:
+                raise ValueError(f"sort must be one of: {', '.join(SORT_ORDERS)}")
+            query = self._apply_sort(query, sort)
+        return query.all()
+
+    def iter_all(self, filters=None, sort=None, batch_size=500):
+        """
+        Same rows as get_all(), read through a server-side cursor.
+        
+        Rows are fetched batch_size at a time (yield_per + stream_results),
+        and relationships are eager-loaded per batch (selectinload runs one
+        IN query per batch). The session identity map only holds weak
+        references to unmodified objects, so the places of a batch are freed
+        once the caller has serialized them: memory stays flat whatever the
+        number of rows.
+        
+        Args:
+            filters (dict, optional): Listing filters (see class docstring)
+            sort (str, optional): Key of SORT_ORDERS (unordered when None)
+            batch_size (int): Rows per fetch
+        
+        Returns:
+            Query: Iterable of Place objects (the SQL runs when iterated)
+            
+        Raises:
+            ValueError: If sort is not a known order (raised here, before streaming)
+        """
+        query = self._apply_filters(self._eager_query(), filters)
+        if sort is not None:
+            if sort not in SORT_ORDERS:
+                raise ValueError(f"sort must be one of: {', '.join(SORT_ORDERS)}")
+            query = self._apply_sort(query, sort)
+        return query.execution_options(stream_results=True).yield_per(batch_size)
     
+    def query_version(self, obj_id):
+        """
+        Version of a place AND of everything its to_dict() embeds.
+        
+        One SELECT with correlated subqueries, no object is loaded:
+        - places.updated_at and the owner's users.updated_at
+        - max(updated_at) and count of its reviews (a new, edited or
+          deleted review changes the embedded list and the ratings)
+        - max(updated_at) and count of its amenities (renamed, linked, unlinked)
+        
+        Args:
+            obj_id (str): UUID of the place
+            
+        Returns:
+            tuple: (latest updated_at, review count, amenity count), or None if not found
+        """
+        of_place = Review.place_id == Place.id
+        linked = place_amenity.c.place_id == Place.id
+        row = db.session.execute(
+            select(
+                Place.updated_at,
+                select(User.updated_at).where(User.id == Place.owner_id).scalar_subquery(),
+                select(func.max(Review.updated_at)).where(of_place).scalar_subquery(),
+                select(func.max(Amenity.updated_at))
+                .select_from(place_amenity)
+                .join(Amenity, Amenity.id == place_amenity.c.amenity_id)
+                .where(linked).scalar_subquery(),
+                select(func.count()).select_from(Review).where(of_place).scalar_subquery(),
+                select(func.count()).select_from(place_amenity).where(linked).scalar_subquery(),
+            ).where(Place.id == obj_id)
+        ).first()
+        return None if row is None else self._fold_version(row, 4)
+
+    def get_collection_version(self):
+        """
+        Version of the place listings (GET /places/, /places/nearby).
+        
+        Listings embed owners, amenities and reviews, so all four tables
+        take part (any change to any of them gives a new collection ETag).
+        Their deletions (tombstones) also move the timestamp forward.
+        
+        Returns:
+            tuple: (latest updated_at/deleted_at, place count, review count,
+                    place/amenity link count)
+        """
+        row = db.session.execute(
+            select(
+                select(func.max(Place.updated_at)).scalar_subquery(),
+                select(func.max(User.updated_at)).scalar_subquery(),
+                select(func.max(Review.updated_at)).scalar_subquery(),
+                select(func.max(Amenity.updated_at)).scalar_subquery(),
+                self._last_deletion('places', 'users', 'reviews', 'amenities'),
+                select(func.count()).select_from(Place).scalar_subquery(),
+                select(func.count()).select_from(Review).scalar_subquery(),
+                select(func.count()).select_from(place_amenity).scalar_subquery(),
+            )
+        ).one()
+        return self._fold_version(row, 5)
+
+    def get_owner_id(self, place_id):
+        """
+        Get the owner of a place without loading the place.
+        
+        get() eager-loads the reviews and amenities, whose number grows with
+        the place's popularity: checks that only need the owner (review
+        submission) read this one column instead.
+        
+        Args:
+            place_id (str): UUID of the place
+            
+        Returns:
+            str: UUID of the owner, or None if the place does not exist
+            
+        SQL equivalent:
+            SELECT owner_id FROM places WHERE id = place_id
+        """
+        return db.session.scalar(select(Place.owner_id).where(Place.id == place_id))
+
     def get_places_by_owner(self, owner_id):
         """
         Get all places owned by a specific user (Place-specific method).
@@ -73,4 +400,224 @@ class PlaceRepository(SQLAlchemyRepository):
             - Results are NOT ordered (add .order_by() if needed)
             - Includes places even if they have no reviews/amenities
         """
-        return self.model.query.filter_by(owner_id=owner_id).all()
\ No newline at end of file
+        return self.model.query.filter_by(owner_id=owner_id).all()
+
+    def _apply_sort(self, query, sort):
+        """Add the ORDER BY of a SORT_ORDERS entry to a query"""
+        columns = []
+        for attr, descending in SORT_ORDERS[sort]:
+            column = getattr(self.model, attr)
+            columns.append(column.desc() if descending else column)
+        return query.order_by(*columns)
+
+    def _after_cursor(self, sort, values):
+        """
+        Keyset predicate: rows strictly after the cursor in the given order.
+        
+        For an order (a DESC, b, c) and cursor (va, vb, vc) this builds:
+            a < va
+            OR (a = va AND b > vb)
+            OR (a = va AND b = vb AND c > vc)
+        
+        Args:
+            sort (str): Key of SORT_ORDERS
+            values (list): Decoded cursor values
+            
+        Returns:
+            SQL expression usable in filter()
+        """
+        keys = [(getattr(self.model, attr), descending) for attr, descending in SORT_ORDERS[sort]]
+        clauses = []
+        for i, (column, descending) in enumerate(keys):
+            equal_prefix = [keys[j][0] == values[j] for j in range(i)]
+            step = column < values[i] if descending else column > values[i]
+            clauses.append(and_(*equal_prefix, step))
+        return or_(*clauses)
+
+    def get_places_page(self, limit, cursor=None, filters=None, sort='created_at'):
+        """
+        Get one page of places using keyset (cursor) pagination.
+
+        Places are ordered by (created_at, id) by default. Instead of OFFSET
+        (which makes the database walk and discard every previous row), each
+        page starts with a seek on the composite index ix_places_created_at_id:
+
+            WHERE created_at > :c OR (created_at = :c AND id > :id)
+            ORDER BY created_at, id
+            LIMIT :limit + 1
+
+        so page 1 and page 10 000 cost the same. sort='-rating' orders by the
+        materialized rating_avg (best first) using
+        ix_places_rating_avg_created_at_id, without touching reviews.
+
+        Args:
+            limit (int): Maximum number of places to return (>= 1)
+            cursor (str, optional): Cursor returned with the previous page
+                                    (None for the first page)
+            filters (dict, optional): Listing filters (see class docstring);
+                                      must be the same for every page
+            sort (str): Key of SORT_ORDERS ('created_at' or '-rating');
+                        must be the same for every page
+
+        Returns:
+            tuple: (list of Place objects, next cursor str or None if last page)
+
+        Raises:
+            ValueError: If the cursor or sort is invalid
+
+        Usage:
+            >>> places, cursor = repo.get_places_page(20)
+            >>> more, cursor = repo.get_places_page(20, cursor)
+        """
+        if sort not in SORT_ORDERS:
+            raise ValueError(f"sort must be one of: {', '.join(SORT_ORDERS)}")
+
+        query = self._apply_filters(self._eager_query(), filters)
+        if cursor:
+            query = query.filter(self._after_cursor(sort, decode_cursor(cursor, sort)))
+
+        # Fetch one extra row to know whether another page exists
+        rows = self._apply_sort(query, sort).limit(limit + 1).all()
+
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, encode_cursor(rows[-1], sort)
+        return rows, None
+
+    def get_places_nearby(self, latitude, longitude, radius_km, limit=None):
+        """
+        Get places within radius_km of a point, closest first.
+        
+        Two-step search that never scans the places table (except close to
+        the poles, where no geohash cell is wide enough: only the latitude
+        band prunes):
+        1. Candidate pruning in SQL: the point's geohash cell (at a precision
+           where cells are wider than the circle, in degrees) plus its 8 neighbors
+           always cover the search circle. Each cell is an indexed range scan
+           on places.geohash (geohash >= 'u09t' AND geohash < 'u09t~'),
+           combined with the circle's bounding box on latitude/longitude.
+           Only (id, latitude, longitude) are fetched for candidates.
+        2. Exact check in Python: haversine distance on the candidates,
+           then the matching places are loaded (relationships eager-loaded).
+        
+        Args:
+            latitude (float): Search center latitude (-90 to 90)
+            longitude (float): Search center longitude (-180 to 180)
+            radius_km (float): Search radius in kilometers (> 0)
+            limit (int, optional): Maximum number of places to return
+            
+        Returns:
+            list: (Place, distance_km) tuples sorted by distance
+        """
+        query = db.session.query(self.model.id, self.model.latitude, self.model.longitude)
+        precision = geohash_precision_for_radius(radius_km, latitude)
+        if precision:
+            center = encode_geohash(latitude, longitude, precision)
+            cells = [center] + geohash_neighbors(center)
+            query = query.filter(or_(*(
+                and_(self.model.geohash >= cell, self.model.geohash < cell + '~')
+                for cell in cells
+            )))
+        # else: no cell is wide enough (close to a pole), the latitude band
+        # below is the only pruning
+
+        # Bounding box of the circle (cheap extra pruning inside each cell)
+        lat_delta = math.degrees(radius_km / 6371.0088)
+        lat_min, lat_max = latitude - lat_delta, latitude + lat_delta
+        query = query.filter(self.model.latitude >= lat_min, self.model.latitude <= lat_max)
+
+        matches = []
+        for place_id, place_lat, place_lon in query:
+            distance = haversine_km(latitude, longitude, place_lat, place_lon)
+            if distance <= radius_km:
+                matches.append((distance, place_id))
+        matches.sort()
+        if limit is not None:
+            matches = matches[:limit]
+        if not matches:
+            return []
+
+        places = {
+            place.id: place
+            for place in self._eager_query().filter(self.model.id.in_([m[1] for m in matches]))
+        }
+        return [(places[place_id], distance) for distance, place_id in matches if place_id in places]
+
+    def adjust_ratings(self, place_id, deltas):
+        """
+        Apply rating changes to a place's materialized aggregates.
+        
+        Runs a single UPDATE computed by the database from the current row
+        values, so concurrent review writes on the same place cannot lose
+        updates (no read-modify-write in Python):
+        
+            UPDATE places SET rating_count = rating_count + :dc,
+                              rating_sum = rating_sum + :ds,
+                              rating_4 = rating_4 + 1, ...,
+                              rating_avg = CASE WHEN rating_count + :dc > 0
+                                           THEN (rating_sum + :ds) * 1.0 / (rating_count + :dc)
+                                           ELSE 0 END,
+                              updated_at = :now
+            WHERE id = :place_id
+        
+        Does not commit: the caller commits together with the review write.
+        
+        Args:
+            place_id (str): UUID of the place
+            deltas (dict): {star value (1-5): change in number of reviews}
+                           e.g. {4: +1} new 4-star review,
+                                {4: -1, 2: +1} review changed from 4 to 2
+        """
+        deltas = {star: delta for star, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        Model = self.model
+        count_delta = sum(deltas.values())
+        sum_delta = sum(star * delta for star, delta in deltas.items())
+        new_count = Model.rating_count + count_delta
+        new_sum = Model.rating_sum + sum_delta
+
+        values = {
+            Model.rating_count: new_count,
+            Model.rating_sum: new_sum,
+            Model.rating_avg: case((new_count > 0, new_sum * 1.0 / new_count), else_=0.0),
+            # The place's public representation changed (ratings, reviews)
+            Model.updated_at: datetime.utcnow(),
+        }
+        for star, delta in deltas.items():
+            column = getattr(Model, f'rating_{star}')
+            values[column] = column + delta
+
+        Model.query.filter(Model.id == place_id).update(values, synchronize_session=False)
+
+        # The UPDATE bypassed the ORM: make an already-loaded instance re-read the row
+        place = db.session.identity_map.get(identity_key(Model, place_id))
+        if place is not None:
+            db.session.expire(place, list(RATING_COLUMNS) + ['updated_at'])
+        # Nor is it seen by the entity cache flush hook: evict on commit
+        entity_cache.invalidate_after_commit(db.session, Model.__tablename__, place_id)
+
+    def get_rating_deltas_by_user(self, user_id):
+        """
+        Rating changes caused by removing every review written by a user.
+        
+        Used before deleting a user (their reviews are cascade-deleted) so the
+        aggregates of the places they reviewed can be corrected. A single
+        GROUP BY over the user's reviews (indexed on reviews.user_id).
+        
+        Args:
+            user_id (str): UUID of the user
+            
+        Returns:
+            dict: {place_id: {star value: negative count}}
+        """
+        rows = (
+            db.session.query(Review.place_id, Review.rating, func.count(Review.id))
+            .filter(Review.user_id == user_id)
+            .group_by(Review.place_id, Review.rating)
+        )
+        deltas = {}
+        for place_id, rating, count in rows:
+            deltas.setdefault(place_id, {})[rating] = -count
+        return deltas
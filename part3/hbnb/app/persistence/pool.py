@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+"""
+Connection pool settings of the app's engine (DB_POOL_* in config.py).
+
+Flask-SQLAlchemy only gets SQLALCHEMY_DATABASE_URI, so without this module
+a MySQL/PostgreSQL deployment runs on SQLAlchemy's pool defaults: 5
+connections + 10 overflow, a 30 s wait for a free connection and no check
+of idle connections. Bursts then hang workers for 30 s, and the first
+query after a server-side idle disconnect (wait_timeout, a proxy, a
+failover) fails.
+
+init_app() turns the DB_POOL_* settings into SQLALCHEMY_ENGINE_OPTIONS
+(entries already set there win):
+
+    DB_POOL_SIZE      pool_size      connections kept open
+    DB_MAX_OVERFLOW   max_overflow   extra connections during bursts
+    DB_POOL_TIMEOUT   timeout        seconds to wait for a free connection;
+                                     then sqlalchemy.exc.TimeoutError,
+                                     answered 503 + Retry-After by the API
+    DB_POOL_RECYCLE   pool_recycle   connections older than this (seconds)
+                                     are replaced before the server drops them
+    DB_POOL_PRE_PING  pool_pre_ping  ping at checkout, reconnect when dead
+
+DB_POOL_TIMEOUT reaches the pool through its class (poolclass), not as
+pool_timeout: Flask-SQLAlchemy builds the engine with engine_from_config(),
+which casts pool_timeout to int and would turn 0.5 s into 0 (no wait).
+
+Checkout waits are observed by app.utils.metrics (hbnb_db_pool_checkout_seconds,
+hbnb_db_pool_timeouts_total).
+
+In-memory SQLite databases (tests) share one connection (StaticPool): no
+pool settings apply and none are set.
+
+Usage:
+    >>> pool.init_app(app)    # before db.init_app(app)
+"""
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+
+
+def engine_options(config):
+    """
+    Pool arguments of create_engine() for a configuration.
+
+    Args:
+        config (Mapping): Flask config (SQLALCHEMY_DATABASE_URI, DB_POOL_*)
+
+    Returns:
+        dict: poolclass, pool_size, max_overflow, pool_recycle, pool_pre_ping
+              (empty for in-memory SQLite)
+    """
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return {}
+    return {
+        'poolclass': _queue_pool(config.get('DB_POOL_TIMEOUT', 3.0)),
+        'pool_size': config.get('DB_POOL_SIZE', 10),
+        'max_overflow': config.get('DB_MAX_OVERFLOW', 10),
+        'pool_recycle': config.get('DB_POOL_RECYCLE', 1800),
+        'pool_pre_ping': config.get('DB_POOL_PRE_PING', True),
+    }
+
+
+def init_app(app):
+    """
+    Merge the DB_POOL_* settings into SQLALCHEMY_ENGINE_OPTIONS.
+
+    Args:
+        app (Flask): Application, before db.init_app(app) creates its engine
+    """
+    options = engine_options(app.config)
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+
+def _queue_pool(timeout):
+    """QueuePool class waiting `timeout` seconds (fractions kept) for a connection"""
+    class TimedQueuePool(QueuePool):
+        def __init__(self, creator, **kw):
+            kw.setdefault('timeout', timeout)  # engine.dispose() passes the current one
+            super().__init__(creator, **kw)
+    return TimedQueuePool
@@ -0,0 +1,178 @@
+#!/usr/bin/python3
+"""
+Per-request SQL statistics for the HBnB application.
+
+Every statement the app's engine sends during an HTTP request is counted
+and timed (before/after_cursor_execute engine events). For each request:
+
+- The response gets a Server-Timing header, shown by the browser devtools
+  (Network > Timing) next to the request:
+      Server-Timing: db;dur=12.41;desc="7 queries", db-slowest;dur=4.02
+- One structured log line (JSON) goes to the 'hbnb.sql' logger:
+      {"method": "GET", "path": "/api/v1/places/", "status": 200,
+       "queries": 7, "db_ms": 12.41, "slowest_ms": 4.02,
+       "slowest": "SELECT places.title, ...", "flagged": false}
+  at DEBUG level, or WARNING when the request ran more than
+  SQL_QUERY_WARN_THRESHOLD statements: an N+1 pattern (one query per row
+  of a list) shows up as a flagged request instead of being found by hand
+
+The header is written when the response leaves the view. Statements run
+by a streamed body (?stream=) come later: they are only in the log line,
+written when the request context is torn down.
+
+Only the SQL text of the slowest statement is kept (truncated), never its
+parameters. SQL_STATS = False turns the whole thing off.
+
+Usage:
+    >>> query_stats = QueryStats()
+    >>> query_stats.init_app(app, db)
+"""
+
+import json
+import logging
+import time
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger('hbnb.sql')
+
+# Characters of the slowest statement kept in the log line
+STATEMENT_MAX_LENGTH = 300
+
+
+class RequestQueryStats:
+    """
+    Statements of one request (kept on flask.g as sql_stats).
+
+    Attributes:
+        count (int): Number of statements (an executemany counts once)
+        total (float): Time spent in the database (seconds)
+        slowest (float): Duration of the slowest statement (seconds)
+        slowest_statement (str): Its SQL text
+    """
+
+    __slots__ = ('count', 'total', 'slowest', 'slowest_statement')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.slowest_statement = None
+
+    def record(self, statement, elapsed):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.slowest:
+            self.slowest = elapsed
+            self.slowest_statement = statement
+
+    def server_timing(self):
+        """Server-Timing header value (durations in milliseconds)"""
+        return (f'db;dur={self.total * 1000:.2f};desc="{self.count} queries", '
+                f'db-slowest;dur={self.slowest * 1000:.2f}')
+
+
+class QueryStats:
+    """
+    Request-scoped SQL counters (Flask extension style).
+
+    Settings:
+        SQL_STATS (bool): Enable the instrumentation
+        SQL_QUERY_WARN_THRESHOLD (int): Requests with more statements are
+            logged as warnings (0 disables the flag)
+    """
+
+    def __init__(self, app=None, db=None):
+        """Create the extension (inactive until init_app() is called)"""
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        """
+        Listen to the app's engine and register the request hooks.
+
+        Args:
+            app (Flask): Application to hook
+            db (SQLAlchemy): Flask-SQLAlchemy instance (an app context is pushed to reach its engine)
+        """
+        app.extensions['query_stats'] = self
+        if not app.config.get('SQL_STATS', True):
+            return
+        with app.app_context():
+            engine = db.engine
+        for name, listener in (('before_cursor_execute', _before_execute),
+                               ('after_cursor_execute', _after_execute)):
+            if not event.contains(engine, name, listener):
+                event.listen(engine, name, listener)
+        app.before_request(self._begin_request)
+        app.after_request(self._add_header)
+        app.teardown_request(self._log_request)
+
+    @staticmethod
+    def current():
+        """
+        Statistics of the current request.
+
+        Returns:
+            RequestQueryStats or None: None outside a request (or when disabled)
+        """
+        return g.get('sql_stats') if has_request_context() else None
+
+    # -----------------------
+    # Request hooks
+    # -----------------------
+
+    def _begin_request(self):
+        """before_request: start counting"""
+        g.sql_stats = RequestQueryStats()
+
+    def _add_header(self, response):
+        """after_request: Server-Timing header (statements run so far)"""
+        stats = g.get('sql_stats')
+        g.sql_status = response.status_code
+        if stats is not None:
+            timing = stats.server_timing()
+            existing = response.headers.get('Server-Timing')
+            response.headers['Server-Timing'] = f'{existing}, {timing}' if existing else timing
+        return response
+
+    def _log_request(self, _error):
+        """teardown_request: one log line, including statements of streamed bodies"""
+        stats = g.pop('sql_stats', None)
+        if stats is None:
+            return
+        threshold = current_app.config.get('SQL_QUERY_WARN_THRESHOLD', 0)
+        flagged = bool(threshold) and stats.count > threshold
+        level = logging.WARNING if flagged else logging.DEBUG
+        if not logger.isEnabledFor(level):
+            return
+        slowest = stats.slowest_statement
+        logger.log(level, json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'status': g.get('sql_status'),
+            'queries': stats.count,
+            'db_ms': round(stats.total * 1000, 2),
+            'slowest_ms': round(stats.slowest * 1000, 2),
+            'slowest': ' '.join(slowest.split())[:STATEMENT_MAX_LENGTH] if slowest else None,
+            'flagged': flagged,
+        }))
+
+
+# -----------------------
+# Engine events
+# -----------------------
+
+def _before_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+    # On the execution context: a failed statement leaves nothing behind
+    if context is not None and has_request_context() and 'sql_stats' in g:
+        context.sql_started = time.perf_counter()
+
+
+def _after_execute(_conn, _cursor, statement, _parameters, context, _executemany):
+    started = getattr(context, 'sql_started', None)
+    if started is not None:
+        stats = g.get('sql_stats')
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - started)
@@ -177,7 +177,15 @@ class InMemoryRepository(Repository):
 
 # ========== SQLAlchemy Repository (Production Implementation) ==========
 
-from app import db
+import threading
+import time
+from functools import wraps
+
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import lazyload
+
+from app import db, entity_cache
+from app.utils.metrics import REPOSITORY_OPERATIONS, REPOSITORY_SECONDS
 
 
 class SQLAlchemyRepository(Repository):
@@ -197,8 +205,17 @@ class SQLAlchemyRepository(Repository):
     - Production environment
     - Data that must be persisted
     - Complex queries and relationships
+    
+    Every public method, of this class and of its subclasses, is counted
+    and timed by model (hbnb_repository_operations_total, see
+    instrument_repository).
     """
     
+    def __init_subclass__(cls, **kwargs):
+        """Instrument the public methods of each repository subclass"""
+        super().__init_subclass__(**kwargs)
+        instrument_repository(cls)
+    
     def __init__(self, model):
         """
         Initialize repository with a SQLAlchemy model.
@@ -221,14 +238,14 @@ class SQLAlchemyRepository(Repository):
             obj: SQLAlchemy model instance to add
             
         Returns:
-            The added object (with ID populated after commit)
+            The added object (with ID populated by the flush)
             
         Database operations:
         1. db.session.add(obj) - Stage object for insertion
-        2. db.session.commit() - Execute INSERT query
+        2. db.session.flush() - Execute INSERT query (committed by the unit of work)
         """
         db.session.add(obj)
-        db.session.commit()
+        db.session.flush()
         return obj
     
     def get(self, obj_id):
@@ -246,17 +263,49 @@ class SQLAlchemyRepository(Repository):
         """
         return self.model.query.get(obj_id)
     
-    def get_all(self):
+    def get_dict(self, obj_id):
+        """
+        Retrieve the serialized form (to_dict()) of an object, through the entity cache.
+        
+        Args:
+            obj_id (str): UUID of the object
+            
+        Returns:
+            dict: Detached snapshot of obj.to_dict(), or None if not found
+            
+        Cache behavior (see app.persistence.cache.EntityCache):
+        - Hit: no database access at all
+        - Miss: self.get(obj_id) + to_dict(), then the snapshot is kept
+        - Any committed write touching the object (or an entity embedded
+          in its snapshot) evicts it
+        
+        Use this for read-only responses; use get() when the object
+        must be modified.
+        """
+        return entity_cache.get_or_load(self.model, obj_id, self.get)
+    
+    def get_all(self, updated_since=None):
         """
         Retrieve all objects of this model from database.
         
+        Args:
+            updated_since (datetime, optional): Only objects created or
+                modified at or after this naive UTC time (change feeds),
+                oldest change first
+        
         Returns:
-            list: List of all objects (not ordered by default)
+            list: List of all objects (not ordered without updated_since)
             
         SQL equivalent:
             SELECT * FROM table
+            SELECT * FROM table WHERE updated_at >= :since ORDER BY updated_at, id
         """
-        return self.model.query.all()
+        if updated_since is None:
+            return self.model.query.all()
+        return (self.model.query
+                .filter(self.model.updated_at >= updated_since)
+                .order_by(self.model.updated_at, self.model.id)
+                .all())
     
     def update(self, obj_id, data):
         """
@@ -271,11 +320,11 @@ class SQLAlchemyRepository(Repository):
             
         Database operations:
         1. Retrieve object by ID
-        2. Call obj.update(data) - Updates attributes and commits
+        2. Call obj.update(data) - Updates attributes and flushes
         """
         obj = self.get(obj_id)
         if obj:
-            # obj.update() is from BaseModel (updates attributes + commits)
+            # obj.update() is from BaseModel (updates attributes + flushes)
             obj.update(data)
             return obj
         return None
@@ -291,18 +340,22 @@ class SQLAlchemyRepository(Repository):
             bool: True if deleted, False if not found
             
         Database operations:
-        1. Retrieve object by ID
+        1. Retrieve object by ID (columns only, no relationship loaded)
         2. db.session.delete(obj) - Stage for deletion
-        3. db.session.commit() - Execute DELETE query
+        3. db.session.flush() - Execute DELETE query (committed by the unit of work)
         
         Note:
-            Cascade rules (e.g., cascade='all, delete-orphan') are
-            automatically handled by SQLAlchemy relationships.
+            Children of relationships declared with passive_deletes=True
+            (a user's places and reviews, a place's reviews) are removed by
+            ON DELETE CASCADE in the database, not loaded and deleted one by
+            one (see app.persistence.cascades).
         """
-        obj = self.get(obj_id)
+        # Subclasses' get() may eager-load children, which the ORM would
+        # then delete row by row: look the object up without them
+        obj = db.session.get(self.model, obj_id, options=[lazyload('*')])
         if obj:
             db.session.delete(obj)
-            db.session.commit()
+            db.session.flush()
             return True
         return False
     
@@ -324,4 +377,174 @@ class SQLAlchemyRepository(Repository):
             >>> user = repo.get_by_attribute('email', 'john@example.com')
             >>> amenity = repo.get_by_attribute('name', 'WiFi')
         """
-        return self.model.query.filter_by(**{attr_name: attr_value}).first()
\ No newline at end of file
+        return self.model.query.filter_by(**{attr_name: attr_value}).first()
+
+    def exists(self, obj_id):
+        """
+        Check whether an object exists, without loading it.
+        
+        Args:
+            obj_id (str): UUID of the object
+            
+        Returns:
+            bool: True if a row has this ID
+            
+        SQL equivalent:
+            SELECT EXISTS (SELECT 1 FROM table WHERE id = obj_id)
+        """
+        return db.session.scalar(select(exists().where(self.model.id == obj_id)))
+
+    # -----------------------
+    # Versions (conditional GET, see app.utils.http_cache)
+    # -----------------------
+
+    def get_version(self, obj_id):
+        """
+        Get the version of one object (validator of its conditional GET).
+        
+        With the entity cache enabled, the version kept next to the cached
+        snapshot is returned (no query on a hit; a miss loads the snapshot
+        the view is about to serve anyway). Otherwise query_version() reads
+        it with one small SELECT.
+        
+        Args:
+            obj_id (str): UUID of the object
+            
+        Returns:
+            tuple: Version, or None if the object does not exist
+        """
+        if entity_cache.enabled:
+            return entity_cache.get_version(self.model, obj_id, self.get)
+        return self.query_version(obj_id)
+
+    def query_version(self, obj_id):
+        """
+        Get the version of one object from the database, without loading it.
+        
+        Subclasses whose to_dict() embeds other entities also include the
+        updated_at of those entities (and their counts, so removals are seen).
+        
+        Args:
+            obj_id (str): UUID of the object
+            
+        Returns:
+            tuple: (updated_at,) or None if the object does not exist
+            
+        SQL equivalent:
+            SELECT updated_at FROM table WHERE id = obj_id
+        """
+        row = db.session.execute(
+            select(self.model.updated_at).where(self.model.id == obj_id)
+        ).first()
+        return None if row is None else (row[0],)
+
+    def get_collection_version(self):
+        """
+        Get the version of the whole collection (list endpoints).
+        
+        Any insert or update raises max(updated_at); any delete lowers count
+        and writes a tombstone, whose deleted_at is folded into the timestamp
+        (Last-Modified must move forward on deletions too).
+        
+        Returns:
+            tuple: (latest updated_at/deleted_at or None when empty, count)
+            
+        SQL equivalent:
+            SELECT (SELECT max(updated_at) FROM table),
+                   (SELECT max(deleted_at) FROM tombstones WHERE entity_type = 'table'),
+                   (SELECT count(*) FROM table)
+        """
+        row = db.session.execute(
+            select(
+                select(func.max(self.model.updated_at)).scalar_subquery(),
+                self._last_deletion(self.model.__tablename__),
+                select(func.count()).select_from(self.model).scalar_subquery(),
+            )
+        ).one()
+        return self._fold_version(row, 2)
+
+    @staticmethod
+    def _last_deletion(*tables):
+        """
+        Scalar subquery: time of the last deletion of an entity of `tables`.
+        
+        Args:
+            *tables (str): Table names ('places', 'reviews', ...)
+            
+        Returns:
+            ScalarSelect: max(tombstones.deleted_at), NULL when nothing was deleted
+        """
+        from app.models.tombstone import Tombstone
+
+        return (
+            select(func.max(Tombstone.deleted_at))
+            .where(Tombstone.entity_type.in_(tables))
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _fold_version(row, timestamps):
+        """
+        Reduce a version row to (latest timestamp, *counts).
+        
+        Args:
+            row: Result row, the first `timestamps` columns being updated_at values
+            timestamps (int): Number of timestamp columns
+            
+        Returns:
+            tuple: (max of the non-NULL timestamps or None, *remaining columns)
+        """
+        stamps = [value for value in row[:timestamps] if value is not None]
+        return (max(stamps) if stamps else None, *row[timestamps:])
+
+
+# ========== Repository metrics ==========
+
+# Nesting depth of instrumented calls on this thread (only the outermost counts)
+_calls = threading.local()
+
+
+def instrument_repository(cls):
+    """
+    Count and time the public methods defined by a repository class.
+    
+    Args:
+        cls: SQLAlchemyRepository or a subclass (done by __init_subclass__)
+        
+    Metrics (app.utils.metrics), labelled (model, method name):
+    - hbnb_repository_operations_total: number of calls
+    - hbnb_repository_operation_seconds_total: time spent in them
+    
+    Only the outermost call is recorded: update() calling get(), or an
+    override calling super(), is one operation. For generator methods
+    (iter_all) the time covers creating the generator, not iterating it.
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith('_') or not callable(method) or getattr(method, '__instrumented__', False):
+            continue
+        if isinstance(method, (staticmethod, classmethod)):
+            continue
+        setattr(cls, name, _instrumented(name, method))
+    return cls
+
+
+def _instrumented(name, method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        depth = getattr(_calls, 'depth', 0)
+        if depth:
+            return method(self, *args, **kwargs)
+        _calls.depth = 1
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _calls.depth = 0
+            labels = (self.model.__name__, name)
+            REPOSITORY_OPERATIONS.inc(labels)
+            REPOSITORY_SECONDS.inc(labels, time.perf_counter() - started)
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+instrument_repository(SQLAlchemyRepository)
@@ -4,9 +4,18 @@ Review-specific repository for database operations.
 Extends SQLAlchemyRepository with review-specific queries:
 - get_reviews_by_place(): Find all reviews for a place
 - get_reviews_by_user(): Find all reviews by a user
+- exists_for(): Has a user already reviewed a place (indexed EXISTS)
+- iter_all(): All reviews through a server-side cursor (streamed responses)
+- query_version() / get_collection_version(): Review + author + place timestamps (ETags)
 """
 
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import joinedload
+
+from app import db
+from app.models.place import Place
 from app.models.review import Review
+from app.models.user import User
 from app.persistence.repository import SQLAlchemyRepository
 
 
@@ -14,22 +23,81 @@ class ReviewRepository(SQLAlchemyRepository):
     """
     Repository for Review-specific database operations.
     Inherits: get(id), get_all(), add(), update(id, data), delete(id)
-    Review-specific: get_reviews_by_place(), get_reviews_by_user()
+    Review-specific: get_reviews_by_place(), get_reviews_by_user(), exists_for(), iter_all()
     """
     
     def __init__(self):
         """Initialize ReviewRepository with Review model"""
         super().__init__(Review)
     
-    def get_reviews_by_place(self, place_id):
+    def get_reviews_by_place(self, place_id, updated_since=None):
         """
         Get all reviews for a specific place.
-        Args: place_id (str): UUID of the place
+        Args: place_id (str): UUID of the place,
+              updated_since (datetime, optional): Only reviews created/modified at or after this time
         Returns: list: Review objects (empty list if none)
         Use cases: Place details page, calculate average rating
         """
-        return self.model.query.filter_by(place_id=place_id).all()
+        query = self.model.query.filter_by(place_id=place_id)
+        if updated_since is not None:
+            query = query.filter(self.model.updated_at >= updated_since)
+        return query.all()
     
+    def iter_all(self, batch_size=500, updated_since=None):
+        """
+        Get all reviews through a server-side cursor, batch_size rows per fetch.
+        Args: batch_size (int): Rows per fetch,
+              updated_since (datetime, optional): Only reviews created/modified at or after this time
+        Returns: Query: Iterable of Review objects with user and place joined
+                 (what Review.to_dict() reads), memory bounded by batch_size
+        """
+        # Place.amenities is lazy='subquery', which yield_per cannot batch:
+        # to_dict() only reads place.id/title, so it is not loaded at all
+        query = self.model.query.options(joinedload(Review.user),
+                                         joinedload(Review.place).lazyload(Place.amenities))
+        if updated_since is not None:
+            query = query.filter(self.model.updated_at >= updated_since)
+        return query.execution_options(stream_results=True).yield_per(batch_size)
+
+    def query_version(self, obj_id):
+        """
+        Version of a review and of the author/place names embedded by to_dict().
+        Args: obj_id (str): UUID of the review
+        Returns: tuple: (latest of reviews/users/places.updated_at,) or None if not found
+        """
+        row = db.session.execute(
+            select(Review.updated_at, User.updated_at, Place.updated_at)
+            .join(User, User.id == Review.user_id)
+            .join(Place, Place.id == Review.place_id)
+            .where(Review.id == obj_id)
+        ).first()
+        return None if row is None else self._fold_version(row, 3)
+
+    def get_collection_version(self, place_id=None):
+        """
+        Version of a review listing (all reviews, or the reviews of one place).
+        Args: place_id (str, optional): Restrict to the reviews of this place
+        Returns: tuple: (latest of reviews/users/places.updated_at and of their
+                 deletions, review count)
+        """
+        last_review = select(func.max(Review.updated_at))
+        count = select(func.count()).select_from(Review)
+        last_place = select(func.max(Place.updated_at))
+        if place_id is not None:
+            last_review = last_review.where(Review.place_id == place_id)
+            count = count.where(Review.place_id == place_id)
+            last_place = last_place.where(Place.id == place_id)
+        row = db.session.execute(
+            select(
+                last_review.scalar_subquery(),
+                select(func.max(User.updated_at)).scalar_subquery(),
+                last_place.scalar_subquery(),
+                self._last_deletion('reviews', 'users', 'places'),
+                count.scalar_subquery(),
+            )
+        ).one()
+        return self._fold_version(row, 4)
+
     def get_reviews_by_user(self, user_id):
         """
         Get all reviews written by a specific user.
@@ -37,4 +105,17 @@ class ReviewRepository(SQLAlchemyRepository):
         Returns: list: Review objects (empty list if none)
         Use cases: User profile, review history
         """
-        return self.model.query.filter_by(user_id=user_id).all()
\ No newline at end of file
+        return self.model.query.filter_by(user_id=user_id).all()
+    
+    def exists_for(self, user_id, place_id):
+        """
+        Check whether a user has already reviewed a place.
+        Args: user_id (str): UUID of the user, place_id (str): UUID of the place
+        Returns: bool: True if a review exists for this (user, place) pair
+        Performance: SELECT EXISTS(...) answered by the index backing the
+                     unique_user_place_review constraint - cost does not depend
+                     on how many reviews the place has, and no row is loaded
+        """
+        return db.session.query(
+            exists().where(self.model.user_id == user_id, self.model.place_id == place_id)
+        ).scalar()
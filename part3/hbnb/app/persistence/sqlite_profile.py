@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+"""
+Per-connection setup of SQLite databases (the SQLITE_PRAGMAS profile).
+
+SQLite keeps most settings per connection, and its defaults are made for
+embedded use: a rollback journal (a writer locks readers out while it
+commits), an fsync at every commit, a 2 MB page cache, no memory mapping,
+no foreign keys, and an immediate "database is locked" on contention.
+init_app() sends the PRAGMAs of SQLITE_PRAGMAS (config.py) on every new
+connection of the app's engine, in order:
+
+    busy_timeout  first: the pragmas below may need a lock
+    journal_mode  WAL: readers never wait for a writer, nor a writer for
+                  readers (one writer at a time). Stored in the database
+                  file: later connections find it already set
+    synchronous   NORMAL: with WAL, fsync at checkpoints only. A power loss
+                  may lose the last commits, never corrupts the database
+    cache_size    page cache per connection (negative: KiB)
+    mmap_size     reads through a memory map instead of read() calls
+    temp_store    temporary tables and indexes (sorts) in memory
+
+foreign_keys=ON is always sent, whatever the profile says: the ON DELETE
+CASCADE foreign keys depend on it (see app.persistence.cascades).
+
+Nothing is done for other databases. In-memory SQLite databases (tests)
+ignore journal_mode and mmap_size.
+
+Usage:
+    >>> sqlite_profile.init_app(app, db)    # before anything connects
+"""
+
+from functools import partial
+
+from sqlalchemy import event
+
+# Sent whatever SQLITE_PRAGMAS contains (cascades rely on it)
+REQUIRED_PRAGMAS = {'foreign_keys': 'ON'}
+
+
+def init_app(app, db):
+    """
+    Apply SQLITE_PRAGMAS to every new connection of the app's SQLite engine.
+
+    Args:
+        app (Flask): Application (reads SQLITE_PRAGMAS; an app context is pushed to reach its engine)
+        db (SQLAlchemy): Flask-SQLAlchemy instance
+    """
+    with app.app_context():
+        engine = db.engine
+    if engine.dialect.name != 'sqlite' or getattr(engine, '_sqlite_pragmas', None) is not None:
+        return
+    pragmas = {**app.config.get('SQLITE_PRAGMAS', {}), **REQUIRED_PRAGMAS}
+    engine._sqlite_pragmas = pragmas
+    event.listen(engine, 'connect', partial(_apply_pragmas, pragmas))
+
+
+def _apply_pragmas(pragmas, dbapi_connection, _connection_record):
+    """connect: one PRAGMA statement per setting"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+    finally:
+        cursor.close()
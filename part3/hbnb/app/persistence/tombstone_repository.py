@@ -0,0 +1,33 @@
+#!/usr/bin/python3
+"""
+Tombstone repository for database operations.
+Reads the deletion log written by app.persistence.tombstones.TombstoneLog:
+- get_deleted_since(): Entities deleted at or after a time (change feeds)
+"""
+
+from app.models.tombstone import Tombstone
+from app.persistence.repository import SQLAlchemyRepository
+
+
+class TombstoneRepository(SQLAlchemyRepository):
+    """
+    Repository for Tombstone rows (read only: rows are written by TombstoneLog).
+    Tombstone-specific: get_deleted_since()
+    """
+
+    def __init__(self):
+        """Initialize TombstoneRepository with Tombstone model"""
+        super().__init__(Tombstone)
+
+    def get_deleted_since(self, since, entity_type=None):
+        """
+        Get the deletions recorded at or after a time, oldest first.
+        Args: since (datetime): Naive UTC lower bound (inclusive),
+              entity_type (str, optional): Table name ('places', 'reviews', ...)
+        Returns: list: Tombstone objects ordered by (deleted_at, id)
+        Index: ix_tombstones_entity_type_deleted_at (ix_tombstones_deleted_at without type)
+        """
+        query = self.model.query.filter(self.model.deleted_at >= since)
+        if entity_type is not None:
+            query = query.filter(self.model.entity_type == entity_type)
+        return query.order_by(self.model.deleted_at, self.model.id).all()
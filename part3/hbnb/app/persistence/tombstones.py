@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+"""
+Deletion log (tombstones) for the HBnB application.
+
+Clients mirroring the API poll list endpoints with ?updated_since=<time>
+to fetch what changed. A deleted row cannot show up in such a listing, so
+every deletion of a user, place, review or amenity also writes a row to
+the tombstones table, read back by GET /api/v1/changes/deleted.
+
+Design:
+- Hooked on the SQLAlchemy session (after_flush), like EntityCache and
+  AmenityCatalog: repository delete(), BaseModel.delete() and cascades
+  (a user's places and reviews, a place's reviews, deleted by the
+  database: see app.persistence.cascades) are all recorded, with no call
+  to add in the delete paths
+- Written in the same transaction as the DELETE, with one multi-row
+  INSERT per flush: a rolled-back deletion leaves no tombstone, a
+  committed one always has its tombstone
+"""
+
+from datetime import datetime
+
+from sqlalchemy import event
+
+from app.persistence.cascades import deleted_entities
+
+# Tables whose deletions are recorded (the API resources)
+TRACKED_TABLES = frozenset(('users', 'places', 'reviews', 'amenities'))
+
+
+class TombstoneLog:
+    """
+    Write a tombstone for every deleted API entity (Flask extension style).
+
+    Usage:
+        >>> tombstone_log = TombstoneLog()
+        >>> tombstone_log.init_app(app, db)
+        >>> place_repo.delete(place_id)   # flush -> INSERT INTO tombstones
+    """
+
+    def __init__(self, app=None, db=None):
+        """Create the log (inactive until init_app() is called)"""
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        """
+        Watch the db session for deletions.
+
+        Args:
+            app (Flask): Application (registered in app.extensions)
+            db (SQLAlchemy): Flask-SQLAlchemy instance whose session is watched
+        """
+        # Session hooks are process-wide: register them only once
+        if not event.contains(db.session, 'after_flush', self._record):
+            event.listen(db.session, 'after_flush', self._record)
+        app.extensions['tombstone_log'] = self
+
+    @staticmethod
+    def _record(session, _flush_context):
+        """after_flush: insert one tombstone per deleted entity of a tracked table"""
+        from app.models.tombstone import Tombstone
+
+        now = datetime.utcnow()
+        rows = [
+            {'entity_type': table, 'entity_id': obj_id, 'deleted_at': now}
+            for table, obj_id in sorted(deleted_entities(session))
+            if table in TRACKED_TABLES
+        ]
+        if rows:
+            session.connection().execute(Tombstone.__table__.insert(), rows)
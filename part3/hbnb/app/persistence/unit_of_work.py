@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+"""
+Unit of work for the HBnB application: one COMMIT per request.
+
+Model methods (BaseModel.save/update/delete) and repositories only FLUSH:
+the SQL is sent inside the current transaction but nothing is committed.
+Committing is decided here, at a single place:
+
+- Inside an HTTP request: facade writes run in transaction() blocks, and
+  the request's transaction is committed once by an after_request hook
+  (rolled back instead if the response is an error, >= 400)
+- Outside a request (scripts, shell, tests using app_context()): the
+  outermost transaction() block commits when it exits
+
+In both cases an exception escaping the outermost transaction() block
+rolls everything back, so a facade operation is all-or-nothing.
+
+Usage:
+    >>> unit_of_work = UnitOfWork()
+    >>> unit_of_work.init_app(app, db)
+    >>> with unit_of_work.transaction():
+    ...     place.update({'title': 'Loft'})      # flush only
+    ...     review_repo.add(review)             # flush only
+    # -> one COMMIT (at block exit, or at the end of the request)
+"""
+
+from contextlib import contextmanager
+
+from flask import g, jsonify
+
+
+class UnitOfWork:
+    """
+    Request-scoped transaction boundary (Flask extension style).
+
+    State lives on flask.g (one per app context / request):
+        uow_depth (int): Nesting level of transaction() blocks
+        uow_request (bool): True while serving an HTTP request
+        uow_writes (bool): A transaction() block completed in this request
+    """
+
+    def __init__(self, app=None, db=None):
+        """Create the unit of work (inactive until init_app() is called)"""
+        self._db = None
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        """
+        Register the request hooks that commit once per request.
+
+        Args:
+            app (Flask): Application to hook
+            db (SQLAlchemy): Flask-SQLAlchemy instance whose session is committed
+        """
+        self._db = db
+        app.before_request(self._begin_request)
+        app.after_request(self._end_request)
+        app.extensions['unit_of_work'] = self
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into one atomic unit.
+
+        Blocks can be nested (a facade method calling another one): only the
+        outermost block commits or rolls back.
+
+        Yields:
+            The SQLAlchemy session
+
+        Raises:
+            Whatever the block raises, after rolling back (outermost block only)
+        """
+        depth = g.get('uow_depth', 0)
+        g.uow_depth = depth + 1
+        try:
+            yield self._db.session
+        except BaseException:
+            g.uow_depth = depth
+            if depth == 0:
+                self._db.session.rollback()
+                # Earlier writes of this request were rolled back too
+                g.uow_writes = False
+            raise
+        g.uow_depth = depth
+        if depth == 0:
+            if g.get('uow_request'):
+                # Committed once by _end_request()
+                g.uow_writes = True
+            else:
+                self._db.session.commit()
+
+    # -----------------------
+    # Request hooks
+    # -----------------------
+
+    def _begin_request(self):
+        """before_request: writes are committed at the end of the request"""
+        g.uow_request = True
+        g.uow_writes = False
+
+    def _end_request(self, response):
+        """
+        after_request: commit the request's writes once (or roll them back on an error response).
+
+        Returns:
+            The response, or a 500 response if the COMMIT itself failed
+        """
+        if not g.pop('uow_writes', False):
+            return response
+        if response.status_code >= 400:
+            self._db.session.rollback()
+            return response
+        try:
+            self._db.session.commit()
+        except Exception as e:
+            self._db.session.rollback()
+            response = jsonify({'error': 'Transaction failed', 'message': str(e)})
+            response.status_code = 500
+        return response
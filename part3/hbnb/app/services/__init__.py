@@ -1,3 +1,3 @@
-from app.services.facade import HBnBFacade
+from app.services.facade import HBnBFacade, DuplicateReviewError
 
 facade = HBnBFacade()
\ No newline at end of file
@@ -5,15 +5,37 @@ Provides a simplified interface to complex subsystem operations (repositories, m
 Centralizes business logic and coordinates interactions between repositories.
 """
 
+from sqlalchemy.exc import IntegrityError
+
 from app.persistence.user_repository import UserRepository
 from app.persistence.amenity_repository import AmenityRepository
 from app.persistence.place_repository import PlaceRepository
 from app.persistence.review_repository import ReviewRepository
+from app.persistence.tombstone_repository import TombstoneRepository
 from app.models.user import User
 from app.models.amenity import Amenity
-from app.models.place import Place
+from app.models.place import Place, place_amenity
 from app.models.review import Review
-from app import db
+from app import db, amenity_catalog, unit_of_work
+
+
+# How each database reports a unique_user_place_review violation:
+# PostgreSQL/MySQL name the constraint, SQLite lists its columns
+_DUPLICATE_REVIEW_MARKERS = ('unique_user_place_review', 'reviews.user_id, reviews.place_id')
+
+
+def _is_duplicate_review(error):
+    """True if an IntegrityError is the one-review-per-(user, place) constraint"""
+    message = str(error.orig)
+    return any(marker in message for marker in _DUPLICATE_REVIEW_MARKERS)
+
+
+class DuplicateReviewError(Exception):
+    """
+    Raised when a user reviews a place they have already reviewed.
+    Detected by the unique_user_place_review constraint at INSERT time
+    (mapped to 409 Conflict by the API).
+    """
 
 
 class HBnBFacade:
@@ -28,6 +50,16 @@ class HBnBFacade:
         self.amenity_repo = AmenityRepository()
         self.place_repo = PlaceRepository()
         self.review_repo = ReviewRepository()
+        self.tombstone_repo = TombstoneRepository()
+
+    def transaction(self):
+        """
+        Unit of work around a facade operation (context manager, nestable).
+        Repositories and models only flush; the outermost block commits (outside
+        a request) or the request commits once when it ends. Errors roll back.
+        Usage: with facade.transaction(): facade.create_place(...); facade.create_review(...)
+        """
+        return unit_of_work.transaction()
 
     # ======================
     # ===== USERS =====
@@ -40,28 +72,66 @@ class HBnBFacade:
         Returns: User: Created user object
         Raises: ValueError: If email is missing or already registered
         """
-        email = user_data.get('email')
-        if not email:
-            raise ValueError("Email is required")
+        with self.transaction():
+            email = user_data.get('email')
+            if not email:
+                raise ValueError("Email is required")
         
-        if self.user_repo.get_user_by_email(email):
-            raise ValueError("Email already registered")
+            if self.user_repo.get_user_by_email(email):
+                raise ValueError("Email already registered")
 
-        user = User(**user_data)
-        self.user_repo.add(user)
-        return user
+            user = User(**user_data)
+            self.user_repo.add(user)
+            return user
 
     def get_user(self, user_id):
         """Get user by ID. Returns: User or None"""
         return self.user_repo.get(user_id)
 
+    def get_user_dict(self, user_id):
+        """
+        Get the serialized user (to_dict()) through the entity cache.
+        Returns: dict or None. Read-only: use get_user() to modify the user.
+        """
+        return self.user_repo.get_dict(user_id)
+
+    def get_user_version(self, user_id):
+        """Version of a user for conditional GETs. Returns: (updated_at,) or None if not found"""
+        return self.user_repo.get_version(user_id)
+
+    def get_users_version(self):
+        """Version of the user list. Returns: (max updated_at, count)"""
+        return self.user_repo.get_collection_version()
+
     def get_user_by_email(self, email):
         """Get user by email. Returns: User or None"""
         return self.user_repo.get_user_by_email(email)
 
-    def get_all_user(self):
-        """Get all users. Returns: list of User objects"""
-        return self.user_repo.get_all()
+    def authenticate(self, email, password):
+        """
+        Check login credentials and upgrade the password hash if its cost is outdated.
+        Args: email (str), password (str): Plain text password
+        Returns: User if the credentials are valid, None otherwise
+        Raises: BcryptPoolSaturated: If the bcrypt pool is full (503)
+        """
+        user = self.user_repo.get_user_by_email(email)
+        if not user or not user.verify_password(password):
+            return None
+        
+        # BCRYPT_LOG_ROUNDS changed since this hash was made: re-hash now
+        if user.password_needs_rehash():
+            with self.transaction():
+                user.hash_password(password)
+                user.save()
+        return user
+
+    def get_all_user(self, updated_since=None):
+        """
+        Get all users.
+        Args: updated_since (datetime, optional): Only users created/modified at or after this time
+        Returns: list of User objects
+        """
+        return self.user_repo.get_all(updated_since)
 
     def update_user(self, user_id, data):
         """
@@ -70,42 +140,49 @@ class HBnBFacade:
         Returns: Updated User or None if not found
         Raises: ValueError: If trying to update protected fields or duplicate email
         """
-        user = self.user_repo.get(user_id)
-        if not user:
-            return None
+        with self.transaction():
+            user = self.user_repo.get(user_id)
+            if not user:
+                return None
         
-        # Prevent updating immutable fields
-        for field in ['id', 'created_at']:
-            if field in data:
-                raise ValueError(f"Cannot update '{field}'")
+            # Prevent updating immutable fields
+            for field in ['id', 'created_at']:
+                if field in data:
+                    raise ValueError(f"Cannot update '{field}'")
         
-        # Validate email uniqueness
-        if 'email' in data:
-            existing_user = self.user_repo.get_user_by_email(data['email'])
-            if existing_user and existing_user.id != user_id:
-                raise ValueError("Email already in use")
+            # Validate email uniqueness
+            if 'email' in data:
+                existing_user = self.user_repo.get_user_by_email(data['email'])
+                if existing_user and existing_user.id != user_id:
+                    raise ValueError("Email already in use")
         
-        # Hash password if provided
-        if 'password' in data:
-            user.hash_password(data['password'])
-            data.pop('password')
+            # Hash password if provided
+            if 'password' in data:
+                user.hash_password(data['password'])
+                data.pop('password')
         
-        user.update(data)
-        return user
+            user.update(data)
+            return user
 
     def delete_user(self, user_id):
         """
-        Delete user (cascade deletes places and reviews via SQLAlchemy).
+        Delete user (the database cascades to their places and reviews).
         Args: user_id (str): User UUID
         Returns: bool: True if deleted, False if not found
         """
-        user = self.user_repo.get(user_id)
-        if not user:
-            return False
+        with self.transaction():
+            user = self.user_repo.get(user_id)
+            if not user:
+                return False
+        
+            # The user's reviews disappear with them: take them out of the
+            # rating aggregates of the places they reviewed (same transaction)
+            for place_id, deltas in self.place_repo.get_rating_deltas_by_user(user_id).items():
+                self.place_repo.adjust_ratings(place_id, deltas)
         
-        # SQLAlchemy cascade will handle deletion of related places and reviews
-        self.user_repo.delete(user_id)
-        return True
+            # ON DELETE CASCADE removes their places, those places' reviews and their reviews
+            self.user_repo.delete(user_id)
+            return True
 
     # ======================
     # ===== AMENITIES =====
@@ -118,23 +195,77 @@ class HBnBFacade:
         Returns: Amenity: Created amenity object
         Raises: ValueError: If name missing or place/owner not found
         """
-        name = amenity_data.get("name")
-        if not name:
-            raise ValueError("Amenity name is required")
+        with self.transaction():
+            name = amenity_data.get("name")
+            if not name:
+                raise ValueError("Amenity name is required")
         
-        amenity = Amenity(name=name)
+            amenity = Amenity(name=name)
         
-        self.amenity_repo.add(amenity)
+            self.amenity_repo.add(amenity)
         
-        return amenity
+            return amenity
 
     def get_amenity(self, amenity_id):
         """Get amenity by ID. Returns: Amenity or None"""
         return self.amenity_repo.get(amenity_id)
 
-    def get_all_amenities(self):
-        """Get all amenities. Returns: list of Amenity objects"""
-        return self.amenity_repo.get_all()
+    def get_amenity_dict(self, amenity_id):
+        """
+        Get the serialized amenity (to_dict()) through the entity cache.
+        Returns: dict or None. Read-only: use get_amenity() to modify the amenity.
+        """
+        return self.amenity_repo.get_dict(amenity_id)
+
+    def get_amenity_version(self, amenity_id):
+        """Version of an amenity for conditional GETs. Returns: (updated_at,) or None if not found"""
+        return self.amenity_repo.get_version(amenity_id)
+
+    def get_amenities_version(self):
+        """Version of the amenity list. Returns: (max updated_at, count)"""
+        return self.amenity_repo.get_collection_version()
+
+    def get_all_amenities(self, updated_since=None):
+        """
+        Get all amenities.
+        Args: updated_since (datetime, optional): Only amenities created/modified at or after this time
+        Returns: list of Amenity objects
+        """
+        return self.amenity_repo.get_all(updated_since)
+
+    def get_unknown_amenity_ids(self, amenity_ids):
+        """
+        Check amenity ids against the in-memory amenity catalog (no SELECT when all exist).
+        Args: amenity_ids (list): Amenity UUIDs
+        Returns: list: Ids that do not exist (empty if all are valid)
+        """
+        return amenity_catalog.unknown_ids(amenity_ids)
+
+    def get_amenity_id_by_name(self, name):
+        """
+        Find an amenity id by name, case-insensitive (in-memory amenity catalog).
+        Args: name (str): Amenity name
+        Returns: str: Amenity UUID or None if the name is free
+        """
+        return amenity_catalog.id_for_name(name)
+
+    def _load_amenities(self, amenity_ids):
+        """
+        Validate amenity ids (catalog) and load them with one IN query.
+        Args: amenity_ids (list): Amenity UUIDs
+        Returns: list of Amenity objects
+        Raises: ValueError: If an amenity ID does not exist
+        """
+        unknown = amenity_catalog.unknown_ids(amenity_ids)
+        if unknown:
+            raise ValueError(f"Amenity ID '{unknown[0]}' not found")
+        amenities = self.amenity_repo.get_amenities_by_ids(amenity_ids)
+        if len(amenities) != len(set(amenity_ids)):
+            # Deleted by another process since the catalog was loaded
+            found = {a.id for a in amenities}
+            missing = next(a_id for a_id in amenity_ids if a_id not in found)
+            raise ValueError(f"Amenity ID '{missing}' not found")
+        return amenities
 
     def update_amenity(self, amenity_id, amenity_data):
         """
@@ -143,18 +274,19 @@ class HBnBFacade:
         Returns: Updated Amenity or None if not found
         Raises: ValueError: If trying to update protected fields
         """
-        amenity = self.get_amenity(amenity_id)
-        if not amenity:
-            return None
+        with self.transaction():
+            amenity = self.get_amenity(amenity_id)
+            if not amenity:
+                return None
         
-        for field in ['id', 'created_at']:
-            if field in amenity_data:
-                raise ValueError(f"Cannot update '{field}'")
+            for field in ['id', 'created_at']:
+                if field in amenity_data:
+                    raise ValueError(f"Cannot update '{field}'")
         
-        if 'name' in amenity_data:
-            amenity.update({'name': amenity_data['name']})
+            if 'name' in amenity_data:
+                amenity.update({'name': amenity_data['name']})
         
-        return amenity
+            return amenity
 
     def delete_amenity(self, amenity_id):
         """
@@ -162,13 +294,9 @@ class HBnBFacade:
         Args: amenity_id (str): Amenity UUID
         Returns: bool: True if deleted, False if not found
         """
-        amenity = self.amenity_repo.get(amenity_id)
-        if not amenity:
-            return False
-        
-        # SQLAlchemy cascade will handle removal from place_amenity table
-        self.amenity_repo.delete(amenity_id)
-        return True
+        with self.transaction():
+            # ON DELETE CASCADE removes its place_amenity rows (places are not loaded)
+            return self.amenity_repo.delete(amenity_id)
 
     # ======================
     # ===== PLACES =====
@@ -177,44 +305,194 @@ class HBnBFacade:
     def create_place(self, place_data):
         """
         Create place with owner validation and amenity associations.
+        Amenity ids are checked against the amenity catalog, then loaded with a single IN query.
         Args: place_data (dict): title, price, latitude, longitude, owner_id, amenities (list of IDs)
         Returns: Place: Created place object
         Raises: ValueError: If owner not found or amenity ID invalid
         """
-        owner = self.user_repo.get(place_data.get("owner_id"))
-        if not owner:
-            raise ValueError("Owner not found")
-
-        # Retrieve amenity objects from IDs
-        amenity_ids = place_data.get("amenities", [])
-        amenities = []
-        if amenity_ids:
-            for a_id in amenity_ids:
-                amenity = self.amenity_repo.get(a_id)
-                if not amenity:
-                    raise ValueError(f"Amenity ID '{a_id}' not found")
-                amenities.append(amenity)
-
-        place = Place(
-            title=place_data["title"],
-            description=place_data.get("description", ""),
-            price=place_data["price"],
-            latitude=place_data["latitude"],
-            longitude=place_data["longitude"],
-            owner_id=owner.id,
-            amenities=amenities
-        )
+        with self.transaction():
+            owner = self.user_repo.get(place_data.get("owner_id"))
+            if not owner:
+                raise ValueError("Owner not found")
+
+            # Retrieve amenity objects from IDs (validated in memory, loaded with one query)
+            amenities = self._load_amenities(place_data.get("amenities") or [])
+
+            place = Place(
+                title=place_data["title"],
+                description=place_data.get("description", ""),
+                price=place_data["price"],
+                latitude=place_data["latitude"],
+                longitude=place_data["longitude"],
+                owner_id=owner.id,
+                amenities=amenities
+            )
         
-        self.place_repo.add(place)
-        return place
+            self.place_repo.add(place)
+            return place
+
+    def create_places_batch(self, places_data, owner_id):
+        """
+        Create many places for one owner in a single transaction.
+        All amenity ids of the batch are checked with one IN query, valid places
+        are inserted with session.add_all() (batched INSERTs), their amenity links
+        with one executemany on place_amenity, and everything is committed once
+        (single unit of work).
+        Invalid items are skipped and reported, they do not abort the batch.
+        Args: places_data (list of dict): Same fields as create_place() (owner_id ignored),
+              owner_id (str): UUID of the owner of every place
+        Returns: list: One (place_id, None) or (None, error message) tuple per item, in input order
+        Raises: ValueError: If owner not found
+        """
+        with self.transaction():
+            owner = self.user_repo.get(owner_id)
+            if not owner:
+                raise ValueError("Owner not found")
+
+            # Per-item amenity ids first (list, or the item's error message),
+            # then one query for the amenities of the valid items
+            item_amenities = []
+            for item in places_data:
+                try:
+                    item_amenities.append(self._batch_amenity_ids(item))
+                except TypeError as e:
+                    item_amenities.append(str(e))
+            wanted = list(dict.fromkeys(
+                a_id for ids in item_amenities if isinstance(ids, list) for a_id in ids
+            ))
+            known = {a.id for a in self.amenity_repo.get_amenities_by_ids(wanted)}
+
+            results, places, links = [], [], []
+            for item, amenity_ids in zip(places_data, item_amenities):
+                if isinstance(amenity_ids, str):
+                    results.append((None, amenity_ids))
+                    continue
+                try:
+                    missing = [f for f in ("title", "price", "latitude", "longitude")
+                               if item.get(f) is None]
+                    if missing:
+                        raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+                    for a_id in amenity_ids:
+                        if a_id not in known:
+                            raise ValueError(f"Amenity ID '{a_id}' not found")
+                    # Amenities are linked below with plain INSERTs: going through
+                    # place.amenities would lazy-load (and autoflush) amenity.places per item
+                    place = Place(
+                        title=item["title"],
+                        description=item.get("description", ""),
+                        price=item["price"],
+                        latitude=item["latitude"],
+                        longitude=item["longitude"],
+                        owner_id=owner.id
+                    )
+                except (ValueError, TypeError) as e:
+                    results.append((None, str(e)))
+                    continue
+                places.append(place)
+                links.append(amenity_ids)
+                results.append((place, None))
+
+            if places:
+                db.session.add_all(places)
+                db.session.flush()  # batched INSERT INTO places, ids assigned
+                rows = [{"place_id": place.id, "amenity_id": a_id}
+                        for place, amenity_ids in zip(places, links) for a_id in amenity_ids]
+                if rows:
+                    db.session.execute(place_amenity.insert(), rows)
+                # Read ids now: after the commit every attribute is expired (one SELECT each)
+                results = [(place.id if place is not None else None, error) for place, error in results]
+            return results
+
+    @staticmethod
+    def _batch_amenity_ids(item):
+        """
+        Amenity ids of one batch item, duplicates removed.
+        Returns: list of str
+        Raises: TypeError: If the item is not an object or its amenities not a list of strings
+        """
+        if not isinstance(item, dict):
+            raise TypeError("Place must be an object")
+        amenity_ids = item.get("amenities") or []
+        if not isinstance(amenity_ids, list) or not all(isinstance(a_id, str) for a_id in amenity_ids):
+            raise TypeError("Amenities must be a list of amenity IDs")
+        return list(dict.fromkeys(amenity_ids))
 
     def get_place(self, place_id):
-        """Get place by ID. Returns: Place or None"""
+        """Get place by ID with owner/amenities/reviews eager-loaded. Returns: Place or None"""
         return self.place_repo.get(place_id)
 
-    def get_all_places(self):
-        """Get all places. Returns: list of Place objects"""
-        return self.place_repo.get_all()
+    def get_place_dict(self, place_id):
+        """
+        Get the serialized place (to_dict()) through the entity cache.
+        Returns: dict or None. Read-only: use get_place() to modify the place.
+        """
+        return self.place_repo.get_dict(place_id)
+
+    def get_place_owner_id(self, place_id):
+        """
+        Owner of a place, read without loading the place or its reviews.
+        Returns: str owner UUID, or None if the place does not exist
+        """
+        return self.place_repo.get_owner_id(place_id)
+
+    def get_place_version(self, place_id):
+        """
+        Version of a place and of what its to_dict() embeds (owner, amenities, reviews).
+        Returns: tuple (latest updated_at, review count, amenity count) or None if not found
+        """
+        return self.place_repo.get_version(place_id)
+
+    def get_places_version(self):
+        """Version of the place listings. Returns: tuple (latest updated_at, *counts)"""
+        return self.place_repo.get_collection_version()
+
+    def get_all_places(self, filters=None, sort=None):
+        """
+        Get all places with relationships eager-loaded (constant query count).
+        Args: filters (dict, optional): min_price, max_price, amenities, lat_min/lat_max/lon_min/lon_max,
+              sort (str, optional): 'created_at' or '-rating' (best rated first)
+        Returns: list of Place objects
+        Raises: ValueError: If sort is unknown
+        """
+        return self.place_repo.get_all(filters, sort)
+
+    def iter_places(self, filters=None, sort=None, batch_size=500):
+        """
+        Iterate over all places without loading them at once (streamed listings).
+        Args: filters (dict, optional): Same filters as get_all_places(),
+              sort (str, optional): Same orders as get_all_places(), batch_size (int): Rows per fetch
+        Returns: iterable of Place objects (server-side cursor)
+        Raises: ValueError: If sort is unknown (before any row is read)
+        """
+        return self.place_repo.iter_all(filters, sort, batch_size)
+
+    def get_places_page(self, limit, cursor=None, filters=None, sort='created_at'):
+        """
+        Get one page of places (keyset pagination on the sort key, created_at, id).
+        Args: limit (int): Page size, cursor (str, optional): Cursor from the previous page,
+              filters (dict, optional): Same filters as get_all_places(),
+              sort (str): 'created_at' (default) or '-rating'
+        Returns: tuple: (list of Place objects, next cursor or None)
+        Raises: ValueError: If limit < 1, sort is unknown or cursor is invalid
+        """
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        return self.place_repo.get_places_page(limit, cursor, filters, sort)
+
+    def get_places_nearby(self, latitude, longitude, radius_km, limit=None):
+        """
+        Get places within a radius of a point, closest first (geohash + haversine).
+        Args: latitude (float), longitude (float), radius_km (float), limit (int, optional)
+        Returns: list of (Place, distance_km) tuples
+        Raises: ValueError: If coordinates are out of range or radius is not positive
+        """
+        if not -90 <= latitude <= 90:
+            raise ValueError("lat must be between -90 and 90")
+        if not -180 <= longitude <= 180:
+            raise ValueError("lon must be between -180 and 180")
+        if radius_km <= 0:
+            raise ValueError("radius_km must be positive")
+        return self.place_repo.get_places_nearby(latitude, longitude, radius_km, limit)
 
     def update_place(self, place_id, place_data):
         """
@@ -223,45 +501,37 @@ class HBnBFacade:
         Returns: Updated Place or None if not found
         Raises: ValueError: If trying to update protected fields or invalid amenity ID
         """
-        place = self.place_repo.get(place_id)
-        if not place:
-            return None
+        with self.transaction():
+            place = self.place_repo.get(place_id)
+            if not place:
+                return None
         
-        # Prevent updating immutable fields
-        for field in ['id', 'owner_id', 'created_at']:
-            if field in place_data:
-                raise ValueError(f"Cannot update '{field}'")
+            # Prevent updating immutable fields
+            for field in ['id', 'owner_id', 'created_at']:
+                if field in place_data:
+                    raise ValueError(f"Cannot update '{field}'")
         
-        update_data = {}
-        for key, value in place_data.items():
-            if key == "amenities":
-                # Validate and retrieve amenity objects
-                new_amenities = []
-                for a_id in value:
-                    amenity = self.amenity_repo.get(a_id)
-                    if not amenity:
-                        raise ValueError(f"Amenity ID '{a_id}' not found")
-                    new_amenities.append(amenity)
-                update_data["amenities"] = new_amenities
-            elif hasattr(place, key):
-                update_data[key] = value
-
-        place.update(update_data)
-        return place
+            update_data = {}
+            for key, value in place_data.items():
+                if key == "amenities":
+                    # Validate and retrieve amenity objects (one query)
+                    update_data["amenities"] = self._load_amenities(value)
+                elif hasattr(place, key):
+                    update_data[key] = value
+
+            place.update(update_data)
+            return place
 
     def delete_place(self, place_id):
         """
-        Delete place (cascade deletes reviews via SQLAlchemy).
+        Delete place (the database cascades to its reviews and amenity links).
         Args: place_id (str): Place UUID
         Returns: bool: True if deleted, False if not found
         """
-        place = self.place_repo.get(place_id)
-        if not place:
-            return False
-        
-        # SQLAlchemy cascade will handle deletion of related reviews
-        self.place_repo.delete(place_id)
-        return True
+        with self.transaction():
+            # Not get(): its eager-loaded reviews would be deleted one by one;
+            # ON DELETE CASCADE removes them with the place
+            return self.place_repo.delete(place_id)
 
     # ======================
     # ===== REVIEWS =====
@@ -269,79 +539,150 @@ class HBnBFacade:
     
     def create_review(self, review_data):
         """
-        Create review with user/place validation.
+        Create review with user/place validation and update the place's rating aggregates.
+        One review per (user, place) is enforced by the unique_user_place_review
+        constraint: the INSERT is attempted directly (in a savepoint) and a violation
+        is reported, so no pre-check query is needed. Aggregates are updated after it.
         Args: review_data (dict): text, rating, user_id, place_id
         Returns: Review: Created review object
         Raises: ValueError: If user_id or place_id invalid/missing
+                DuplicateReviewError: If the user has already reviewed the place
         """
-        user_id = review_data.get('user_id')
-        place_id = review_data.get('place_id')
-
-        if not user_id or not self.user_repo.get(user_id):
-            raise ValueError("Invalid or missing user_id")
-        if not place_id or not self.place_repo.get(place_id):
-            raise ValueError("Invalid or missing place_id")
-
-        review = Review(**review_data)
-        self.review_repo.add(review)
-        return review
+        with self.transaction():
+            user_id = review_data.get('user_id')
+            place_id = review_data.get('place_id')
+
+            # Existence checks only: get() would eager-load every review of the place
+            if not user_id or not self.user_repo.exists(user_id):
+                raise ValueError("Invalid or missing user_id")
+            if not place_id or not self.place_repo.exists(place_id):
+                raise ValueError("Invalid or missing place_id")
+
+            review = Review(**review_data)
+            try:
+                # Savepoint: a duplicate rolls back this INSERT only, not the
+                # rest of the unit of work
+                with db.session.begin_nested():
+                    self.review_repo.add(review)
+            except IntegrityError as e:
+                # Only the duplicate case is a conflict (other violations are real errors)
+                if _is_duplicate_review(e):
+                    raise DuplicateReviewError("You have already reviewed this place") from None
+                raise
+            # Aggregates UPDATE once the review row exists: same unit of work, committed together
+            self.place_repo.adjust_ratings(place_id, {review.rating: 1})
+            return review
 
     def get_review(self, review_id):
         """Get review by ID. Returns: Review or None"""
         return self.review_repo.get(review_id)
 
-    def get_all_reviews(self):
-        """Get all reviews. Returns: list of Review objects"""
-        return self.review_repo.get_all()
+    def get_review_dict(self, review_id):
+        """
+        Get the serialized review (to_dict()) through the entity cache.
+        Returns: dict or None. Read-only: use get_review() to modify the review.
+        """
+        return self.review_repo.get_dict(review_id)
+
+    def get_review_version(self, review_id):
+        """Version of a review, its author and place names. Returns: (updated_at,) or None"""
+        return self.review_repo.get_version(review_id)
 
-    def get_reviews_by_place(self, place_id):
+    def get_reviews_version(self, place_id=None):
+        """
+        Version of a review listing.
+        Args: place_id (str, optional): Only the reviews of this place
+        Returns: tuple (latest updated_at, review count)
+        """
+        return self.review_repo.get_collection_version(place_id)
+
+    def get_all_reviews(self, updated_since=None):
+        """
+        Get all reviews.
+        Args: updated_since (datetime, optional): Only reviews created/modified at or after this time
+        Returns: list of Review objects
+        """
+        return self.review_repo.get_all(updated_since)
+
+    def iter_reviews(self, batch_size=500, updated_since=None):
+        """
+        Iterate over all reviews without loading them at once (streamed listings).
+        Args: batch_size (int): Rows per fetch,
+              updated_since (datetime, optional): Only reviews created/modified at or after this time
+        Returns: iterable of Review objects (server-side cursor)
+        """
+        return self.review_repo.iter_all(batch_size, updated_since)
+
+    def get_reviews_by_place(self, place_id, updated_since=None):
         """
         Get all reviews for a place.
-        Args: place_id (str): Place UUID
+        Args: place_id (str): Place UUID,
+              updated_since (datetime, optional): Only reviews created/modified at or after this time
         Returns: list of Review objects (empty if place not found)
         """
         if not self.place_repo.get(place_id):
             return []
-        return self.review_repo.get_reviews_by_place(place_id)
+        return self.review_repo.get_reviews_by_place(place_id, updated_since)
 
     def user_has_reviewed_place(self, user_id, place_id):
         """
         Check if user has already reviewed a place.
         Args: user_id (str): User UUID, place_id (str): Place UUID
         Returns: bool: True if user has reviewed place
+        Note: Single indexed EXISTS query (see ReviewRepository.exists_for)
         """
-        reviews = self.get_reviews_by_place(place_id)
-        for review in reviews:
-            if review.user_id == user_id:
-                return True
-        return False
+        return self.review_repo.exists_for(user_id, place_id)
 
     def update_review(self, review_id, review_data):
         """
         Update review (cannot update id/user_id/place_id/created_at).
+        A rating change moves the review between buckets of the place's rating aggregates.
         Args: review_id (str): Review UUID, review_data (dict): Fields to update
         Returns: Updated Review or None if not found
         Raises: ValueError: If trying to update protected fields
         """
-        review = self.review_repo.get(review_id)
-        if not review:
-            return None
-
-        # Prevent updating immutable fields
-        for field in ['id', 'user_id', 'place_id', 'created_at']:
-            if field in review_data:
-                raise ValueError(f"Cannot update '{field}'")
+        with self.transaction():
+            review = self.review_repo.get(review_id)
+            if not review:
+                return None
+
+            # Prevent updating immutable fields
+            for field in ['id', 'user_id', 'place_id', 'created_at']:
+                if field in review_data:
+                    raise ValueError(f"Cannot update '{field}'")
+        
+            if 'rating' in review_data:
+                # Validate first so the aggregates never see an invalid rating
+                new_rating = review.validate_rating('rating', review_data['rating'])
+                if new_rating != review.rating:
+                    self.place_repo.adjust_ratings(review.place_id, {review.rating: -1, new_rating: 1})
         
-        review.update(review_data)
-        return review
+            # Same unit of work as the aggregates UPDATE
+            review.update(review_data)
+            return review
 
     def delete_review(self, review_id):
         """
-        Delete review.
+        Delete review and remove it from the place's rating aggregates.
         Args: review_id (str): Review UUID
         Returns: bool: True if deleted, False if not found
         """
-        review = self.review_repo.get(review_id)
-        if not review:
-            return False
-        return self.review_repo.delete(review_id)
\ No newline at end of file
+        with self.transaction():
+            review = self.review_repo.get(review_id)
+            if not review:
+                return False
+            self.place_repo.adjust_ratings(review.place_id, {review.rating: -1})
+            return self.review_repo.delete(review_id)
+
+    # ======================
+    # ===== CHANGES =====
+    # ======================
+
+    def get_deleted_since(self, since, entity_type=None):
+        """
+        Get the entities deleted at or after a time (tombstones), oldest first.
+        Args: since (datetime): Naive UTC lower bound (inclusive),
+              entity_type (str, optional): 'users', 'places', 'reviews' or 'amenities'
+        Returns: list of Tombstone objects
+        """
+        return self.tombstone_repo.get_deleted_since(since, entity_type)
@@ -0,0 +1,190 @@
+#!/usr/bin/python3
+"""
+Bounded worker pool for bcrypt hashing and verification.
+
+bcrypt is slow on purpose (~250 ms at cost 12). Run on the request thread,
+a burst of logins occupies every worker and starves cheap requests (place
+listings, reads). This module runs bcrypt on a dedicated thread pool:
+
+- At most BCRYPT_POOL_SIZE hashes run at the same time
+- At most BCRYPT_QUEUE_DEPTH more wait for a thread
+- Anything beyond that fails immediately with BcryptPoolSaturated
+  (mapped to 503 + Retry-After by the API) instead of piling up
+- A caller waits at most BCRYPT_TIMEOUT seconds for its result
+
+The bcrypt C implementation releases the GIL, so the pool threads use
+other CPU cores while the request threads keep serving reads.
+
+The work factor comes from BCRYPT_LOG_ROUNDS. Hashes with another cost
+are reported by needs_rehash() so they can be upgraded at the next login.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import bcrypt as _bcrypt
+
+from app.utils.metrics import BCRYPT_DURATION
+
+
+class BcryptPoolSaturated(Exception):
+    """Raised when every bcrypt thread and queue slot is taken (HTTP 503)"""
+
+
+class BcryptPool:
+    """
+    bcrypt executor with a bounded queue (Flask extension style).
+
+    Usage:
+        >>> bcrypt_pool = BcryptPool()
+        >>> bcrypt_pool.init_app(app)
+        >>> hashed = bcrypt_pool.hash_password('secret123')
+        >>> bcrypt_pool.check_password(hashed, 'secret123')
+        True
+
+    Without init_app() (e.g. a standalone script) the work runs inline.
+    """
+
+    def __init__(self, app=None):
+        """Create the pool (inline mode until init_app() is called)"""
+        self._executor = None
+        self._slots = None
+        self.rounds = 12
+        self.timeout = 10.0
+        self._stats_lock = threading.Lock()
+        self._completed = 0
+        self._rejected = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """
+        Start the worker threads configured for this application.
+
+        Args:
+            app (Flask): Reads BCRYPT_POOL_SIZE, BCRYPT_QUEUE_DEPTH,
+                         BCRYPT_TIMEOUT and BCRYPT_LOG_ROUNDS
+        """
+        size = app.config.get('BCRYPT_POOL_SIZE', 4)
+        depth = app.config.get('BCRYPT_QUEUE_DEPTH', 16)
+        self.rounds = app.config.get('BCRYPT_LOG_ROUNDS', 12)
+        self.timeout = app.config.get('BCRYPT_TIMEOUT', 10.0)
+
+        previous = self._executor
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='bcrypt')
+        # One slot per running or queued job
+        self._slots = threading.BoundedSemaphore(size + depth)
+        if previous is not None:
+            previous.shutdown(wait=False)
+        with self._stats_lock:
+            self._completed = self._rejected = 0
+
+        app.extensions['bcrypt_pool'] = self
+
+    # -----------------------
+    # Public API
+    # -----------------------
+
+    def hash_password(self, password):
+        """
+        Hash a password with the configured work factor (BCRYPT_LOG_ROUNDS).
+
+        Args:
+            password (str): Plain text password
+
+        Returns:
+            str: 60-character bcrypt hash
+
+        Raises:
+            BcryptPoolSaturated: If the pool and its queue are full
+        """
+        return self._run(_hash, password, self.rounds)
+
+    def check_password(self, hashed, password):
+        """
+        Check a password against a bcrypt hash (constant time).
+
+        Args:
+            hashed (str): Stored bcrypt hash
+            password (str): Plain text password to check
+
+        Returns:
+            bool: True if the password matches
+
+        Raises:
+            BcryptPoolSaturated: If the pool and its queue are full
+        """
+        if not hashed or not password:
+            return False
+        return self._run(_check, hashed, password)
+
+    def needs_rehash(self, hashed):
+        """
+        Tell whether a hash was made with another work factor than BCRYPT_LOG_ROUNDS.
+
+        Args:
+            hashed (str): Stored bcrypt hash ("$2b$<cost>$<salt+hash>")
+
+        Returns:
+            bool: True if the cost differs (or the hash cannot be parsed)
+        """
+        try:
+            return int(hashed.split('$')[2]) != self.rounds
+        except (AttributeError, IndexError, ValueError):
+            return True
+
+    def stats(self):
+        """
+        Returns:
+            dict: completed and rejected job counters
+        """
+        with self._stats_lock:
+            return {'completed': self._completed, 'rejected': self._rejected}
+
+    # -----------------------
+    # Internals
+    # -----------------------
+
+    def _run(self, fn, *args):
+        """Run fn(*args) on the pool and wait for its result"""
+        executor, slots = self._executor, self._slots
+        if executor is None:
+            return fn(*args)
+
+        if not slots.acquire(blocking=False):
+            with self._stats_lock:
+                self._rejected += 1
+            raise BcryptPoolSaturated("Too many password operations in progress, retry later")
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _future: self._done(slots))
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # The job keeps its slot until it finishes
+            raise BcryptPoolSaturated("Password operation timed out, retry later")
+
+    def _done(self, slots):
+        slots.release()
+        with self._stats_lock:
+            self._completed += 1
+
+
+def _hash(password, rounds):
+    # Timed where it runs: the pool's queue wait is not bcrypt's cost
+    with BCRYPT_DURATION.time(('hash',)):
+        return _bcrypt.hashpw(password.encode('utf-8'), _bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def _check(hashed, password):
+    try:
+        with BCRYPT_DURATION.time(('verify',)):
+            return _bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    except ValueError:
+        # Malformed stored hash
+        return False
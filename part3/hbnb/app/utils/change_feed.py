@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""
+Resume point of the change feeds (X-Sync-Since response header).
+
+updated_at and deleted_at are stamped when the session flushes, but the
+rows only become visible at the COMMIT, at the end of the request (unit of
+work). A row stamped at 12:00:00.100 may commit after another request has
+read a row stamped at 12:00:00.200: a client resuming from the largest
+timestamp it received (12:00:00.200) would never see the first row.
+
+Feed requests (?updated_since= on the list endpoints, ?since= on
+/changes/deleted) therefore answer with an X-Sync-Since header: the time
+the request started minus CHANGE_FEED_LAG seconds. Every row stamped
+before that point had committed when the request read the database, as
+long as no transaction lasts longer than CHANGE_FEED_LAG. Sending the
+header back as the next lower bound misses nothing; rows stamped after it
+may come back twice.
+
+The time is taken in the first hooks of the request, before anything
+reads the database.
+
+Usage:
+    >>> change_feed.init_app(app)   # before the hooks that query the database
+"""
+
+from datetime import datetime, timedelta
+
+from flask import current_app, g, request
+
+SYNC_HEADER = 'X-Sync-Since'
+
+# Query arguments making a request a change feed poll
+FEED_ARGUMENTS = ('updated_since', 'since')
+
+
+def init_app(app):
+    """
+    Add X-Sync-Since to the responses of change feed requests.
+
+    Args:
+        app (Flask): Application (reads CHANGE_FEED_LAG)
+    """
+    app.before_request(_begin_request)
+    app.after_request(_end_request)
+
+
+def sync_point(started, lag):
+    """
+    Lower bound for the next poll of a feed read at `started`.
+
+    Args:
+        started (datetime): Naive UTC time before the feed was read
+        lag (float): Longest transaction duration (seconds)
+
+    Returns:
+        str: ISO 8601 UTC timestamp ('Z' suffix)
+    """
+    return (started - timedelta(seconds=lag)).isoformat() + 'Z'
+
+
+def _begin_request():
+    """before_request: note when a feed request started"""
+    if any(name in request.args for name in FEED_ARGUMENTS):
+        g.feed_started = datetime.utcnow()
+
+
+def _end_request(response):
+    """after_request: X-Sync-Since on successful feed responses (304 included)"""
+    started = g.pop('feed_started', None)
+    if started is not None and response.status_code in (200, 304):
+        response.headers[SYNC_HEADER] = sync_point(started, current_app.config.get('CHANGE_FEED_LAG', 5.0))
+    return response
@@ -0,0 +1,205 @@
+#!/usr/bin/python3
+"""
+Geographic helpers for the HBnB application.
+
+This module provides the small amount of geometry needed by radius search:
+- encode_geohash(): Encode a (latitude, longitude) pair as a geohash string
+- geohash_neighbors(): The 8 cells surrounding a geohash cell
+- geohash_cell_degrees(): Cell size of a geohash length
+- geohash_precision_for_radius(): Longest prefix whose cells cover a radius
+- haversine_km(): Great-circle distance between two points
+
+Geohash in one sentence:
+    The world is recursively split into a grid of cells, each cell gets a
+    base32 name, and cells sharing a prefix are close to each other. Storing
+    the geohash of each place lets "places near X" become a handful of
+    indexed prefix lookups (LIKE 'u09t%') instead of a full table scan.
+"""
+
+import math
+
+# Base32 alphabet used by geohash (no a, i, l, o)
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+_DECODE = {char: index for index, char in enumerate(_BASE32)}
+
+# Mean Earth radius in kilometers (used by haversine)
+EARTH_RADIUS_KM = 6371.0088
+
+# Number of characters stored in Place.geohash (~4.8m x 4.8m cells)
+GEOHASH_LENGTH = 9
+
+
+def encode_geohash(latitude, longitude, length=GEOHASH_LENGTH):
+    """
+    Encode a coordinate as a geohash string.
+    
+    Args:
+        latitude (float): Latitude (-90 to 90)
+        longitude (float): Longitude (-180 to 180)
+        length (int): Number of base32 characters to produce
+        
+    Returns:
+        str: Geohash (e.g., 48.8566, 2.3522 -> 'u09tvw0f6')
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # Geohash interleaves bits, starting with longitude
+
+    while len(chars) < length:
+        if even:
+            mid = (lon_range[0] + lon_range[1]) / 2
+            if longitude >= mid:
+                bits = (bits << 1) | 1
+                lon_range[0] = mid
+            else:
+                bits <<= 1
+                lon_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if latitude >= mid:
+                bits = (bits << 1) | 1
+                lat_range[0] = mid
+            else:
+                bits <<= 1
+                lat_range[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(chars)
+
+
+def decode_geohash_bounds(geohash):
+    """
+    Decode a geohash to the bounding box of its cell.
+    
+    Args:
+        geohash (str): Geohash string
+        
+    Returns:
+        tuple: (lat_min, lat_max, lon_min, lon_max)
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        value = _DECODE[char]
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            target = lon_range if even else lat_range
+            mid = (target[0] + target[1]) / 2
+            if bit:
+                target[0] = mid
+            else:
+                target[1] = mid
+            even = not even
+    return lat_range[0], lat_range[1], lon_range[0], lon_range[1]
+
+
+def geohash_neighbors(geohash):
+    """
+    Return the 8 cells surrounding a geohash cell (same length).
+    
+    Computed from the cell center shifted by one cell size in each
+    direction. Longitude wraps around the antimeridian; rows beyond the
+    poles are dropped.
+    
+    Args:
+        geohash (str): Center cell
+        
+    Returns:
+        list: Geohashes of the neighboring cells (without duplicates)
+    """
+    lat_min, lat_max, lon_min, lon_max = decode_geohash_bounds(geohash)
+    height = lat_max - lat_min
+    width = lon_max - lon_min
+    center_lat = (lat_min + lat_max) / 2
+    center_lon = (lon_min + lon_max) / 2
+
+    neighbors = []
+    for d_lat in (-1, 0, 1):
+        for d_lon in (-1, 0, 1):
+            if d_lat == 0 and d_lon == 0:
+                continue
+            lat = center_lat + d_lat * height
+            if lat < -90 or lat > 90:
+                continue
+            lon = (center_lon + d_lon * width + 180) % 360 - 180
+            cell = encode_geohash(lat, lon, len(geohash))
+            if cell != geohash and cell not in neighbors:
+                neighbors.append(cell)
+    return neighbors
+
+
+def geohash_cell_degrees(length):
+    """
+    Size of the geohash cells of a given length, in degrees.
+    
+    Each character adds 5 bits, alternately to longitude and latitude
+    (longitude first): the size is the same everywhere, in degrees.
+    
+    Args:
+        length (int): Geohash length
+        
+    Returns:
+        tuple: (height in degrees of latitude, width in degrees of longitude)
+    """
+    lon_bits = (5 * length + 1) // 2
+    lat_bits = 5 * length // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lon_bits
+
+
+def geohash_precision_for_radius(radius_km, latitude=0.0):
+    """
+    Longest geohash length whose cells are at least as large as the circle's
+    half-extent, so the circle lies inside the center's cell and its 8 neighbors.
+    
+    Compared in degrees: a cell is a fixed number of degrees of longitude,
+    but a degree of longitude covers cos(latitude) times fewer kilometers
+    towards the poles, so the circle spans more degrees of longitude at high
+    latitudes (its poleward edge being the widest).
+    
+    Args:
+        radius_km (float): Search radius in kilometers
+        latitude (float): Search center latitude
+        
+    Returns:
+        int: Geohash length to use for the prefix search (1 to GEOHASH_LENGTH),
+             or 0 when no length works (the circle reaches a pole or is too
+             large): no prefix filter can be used
+    """
+    angle = radius_km / EARTH_RADIUS_KM  # radians of arc
+    lat_extent = math.degrees(angle)
+    if abs(latitude) + lat_extent >= 90.0:
+        return 0
+    # Largest longitude offset of the circle (at its poleward edge)
+    lon_extent = math.degrees(math.asin(min(1.0, math.sin(angle) / math.cos(math.radians(latitude)))))
+    for length in range(GEOHASH_LENGTH, 0, -1):
+        height, width = geohash_cell_degrees(length)
+        if height >= lat_extent and width >= lon_extent:
+            return length
+    return 0
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance between two points on Earth.
+    
+    Args:
+        lat1, lon1 (float): First point in degrees
+        lat2, lon2 (float): Second point in degrees
+        
+    Returns:
+        float: Distance in kilometers
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
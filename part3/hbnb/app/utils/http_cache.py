@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+"""
+Conditional GET (ETag / Last-Modified / 304) for the HBnB API.
+
+A GET decorated with @conditional(version_loader) works like this:
+1. version_loader(**view_args) returns the "version" of what the response
+   shows, a tuple whose first item is the last modification time:
+   - single resources: kept next to the entity cache snapshot (no query on
+     a hit), or one small SELECT when the cache is disabled
+   - lists: one SELECT of max(updated_at), of the last deletion
+     (tombstones) and row counts
+   (see SQLAlchemyRepository.get_version / get_collection_version)
+2. The strong ETag is a hash of (URL, X-Fields mask, version): the same
+   URL with another mask is another body. The Last-Modified header is
+   version[0], and "Vary: X-Fields" tells caches to key on the mask
+3. If the request's If-None-Match matches the ETag, or there is no
+   If-None-Match and If-Modified-Since is not older than Last-Modified,
+   the answer is 304 Not Modified with an empty body. The resource is not
+   loaded, serialized or encoded
+4. Otherwise the view runs normally and the validators are added to its
+   200 response
+
+Responses also carry "Cache-Control: no-cache": browsers keep the body but
+revalidate it on every use. This is what lets part4/scripts.js fetch()
+calls get 304s without any change on the client side.
+
+Usage:
+    >>> @places_ns.route('/<string:place_id>')
+    ... class PlaceResource(Resource):
+    ...     @conditional(lambda place_id: facade_instance.get_place_version(place_id))
+    ...     @places_ns.marshal_with(place_response)
+    ...     def get(self, place_id):
+    ...         ...
+"""
+
+import hashlib
+from datetime import timezone
+from functools import wraps
+
+from flask import Response, current_app, request
+from werkzeug.http import http_date
+from werkzeug.wrappers import Response as BaseResponse
+
+
+def conditional(version_loader):
+    """
+    Decorate a Resource GET method with ETag / Last-Modified validation.
+
+    Place it ABOVE @ns.marshal_with(...): a 304 must be returned before the
+    marshalling wrapper runs.
+
+    Args:
+        version_loader (callable): version_loader(**view_args) -> tuple
+            (last_modified datetime or None, *counts), or None when the
+            resource does not exist (the view then runs and answers 404)
+
+    Returns:
+        callable: Decorator
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(resource, *args, **kwargs):
+            version = version_loader(*args, **kwargs)
+            if version is None:
+                return func(resource, *args, **kwargs)
+
+            etag, last_modified = _validators(version)
+            headers = {'ETag': f'"{etag}"', 'Cache-Control': 'no-cache', 'Vary': _mask_header()}
+            if last_modified is not None:
+                headers['Last-Modified'] = http_date(last_modified)
+
+            if _not_modified(etag, last_modified):
+                return Response(status=304, headers=headers)
+            return _add_headers(func(resource, *args, **kwargs), headers)
+        return wrapper
+    return decorator
+
+
+# -----------------------
+# Internals
+# -----------------------
+
+def _validators(version):
+    """Return (strong ETag value, Last-Modified datetime in UTC or None)"""
+    # The URL (with its query string) and the field mask are part of the tag:
+    # two listings with different filters or masks never share a validator
+    mask = request.headers.get(_mask_header())
+    digest = hashlib.blake2b(repr((request.full_path, mask, version)).encode('utf-8'), digest_size=16)
+    last_modified = version[0]
+    if last_modified is not None:
+        # Stored as naive UTC; HTTP dates have a one second resolution
+        last_modified = last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+    return digest.hexdigest(), last_modified
+
+
+def _mask_header():
+    """Name of the flask-restx field mask header (X-Fields by default)"""
+    return current_app.config.get('RESTX_MASK_HEADER', 'X-Fields')
+
+
+def _not_modified(etag, last_modified):
+    """Evaluate If-None-Match (weak comparison), else If-Modified-Since (RFC 9110)"""
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    since = request.if_modified_since
+    return since is not None and last_modified is not None and last_modified <= since
+
+
+def _add_headers(result, headers):
+    """Attach the validators to a view result (successful responses only)"""
+    if isinstance(result, BaseResponse):
+        if result.status_code == 200:
+            result.headers.update(headers)
+        return result
+    if isinstance(result, tuple):
+        # (data, code) or (data, code, headers), as accepted by flask-restx
+        data = result[0]
+        code = result[1] if len(result) > 1 else 200
+        if code != 200:
+            return result
+        merged = dict(result[2]) if len(result) > 2 else {}
+        merged.update(headers)
+        return data, code, merged
+    return result, 200, headers
@@ -0,0 +1,192 @@
+#!/usr/bin/python3
+"""
+JSON encoding of API responses: fast encoder and streamed lists.
+
+Encoder (JSON_ENCODER setting):
+- 'orjson': orjson.dumps() (C/Rust, bytes out, several times faster than json)
+- 'json':   the standard library (what flask-restx uses by default)
+- 'auto':   orjson when it is installed, json otherwise (default)
+
+create_app() registers the selected encoder as the 'application/json'
+representation of the flask-restx Api, so every namespace uses it.
+
+Streaming (large GET lists):
+    stream_json_array(rows, serialize)  -> application/json, "[row,row,...]"
+    stream_ndjson(rows, serialize)      -> application/x-ndjson, one row per line
+
+Rows are pulled from an iterator (a server-side cursor, see
+PlaceRepository.iter_all) and encoded STREAM_BATCH_SIZE at a time, so the
+process never holds the whole result set, neither as ORM objects nor as
+one big encoded string. Peak memory depends on the batch size, not on the
+number of rows.
+
+An error in the middle of a stream cannot change the status code any more
+(200 is already sent): the body is cut short, which clients see as
+invalid JSON (array) or a truncated last line (NDJSON).
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from flask import Response, current_app, make_response, stream_with_context
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+# -----------------------
+# Encoders
+# -----------------------
+
+def _default(value):
+    """Types neither encoder handles natively (same output with both)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps_orjson(data):
+    return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _dumps_json(data):
+    return json.dumps(data, default=_default, separators=(',', ':')).encode('utf-8')
+
+
+def get_encoder(name='auto'):
+    """
+    Select the JSON encoder.
+
+    Args:
+        name (str): 'auto', 'orjson' or 'json'
+
+    Returns:
+        callable: dumps(data) -> bytes (compact UTF-8 JSON)
+
+    Raises:
+        ValueError: If name is unknown, or 'orjson' is asked for but not installed
+    """
+    if name == 'auto':
+        name = 'orjson' if orjson is not None else 'json'
+    if name == 'orjson':
+        if orjson is None:
+            raise ValueError("JSON_ENCODER is 'orjson' but orjson is not installed")
+        return _dumps_orjson
+    if name == 'json':
+        return _dumps_json
+    raise ValueError(f"Unknown JSON_ENCODER {name!r} (expected 'auto', 'orjson' or 'json')")
+
+
+def init_app(app):
+    """
+    Store the configured encoder in app.extensions['json_encoder'].
+
+    Args:
+        app (Flask): Reads JSON_ENCODER
+    """
+    app.extensions['json_encoder'] = get_encoder(app.config.get('JSON_ENCODER', 'auto'))
+
+
+def output_json(data, code, headers=None):
+    """
+    flask-restx representation for 'application/json' using the app's encoder.
+
+    Drop-in replacement for flask_restx.representations.output_json
+    (body ends with a newline, extra headers are kept).
+    """
+    dumps = current_app.extensions['json_encoder']
+    response = make_response(dumps(data) + b'\n', code)
+    response.headers.extend(headers or {})
+    response.mimetype = 'application/json'
+    return response
+
+
+# -----------------------
+# Streaming
+# -----------------------
+
+def _batches(rows, serialize, batch_size):
+    """Yield lists of encoded rows, batch_size rows at a time"""
+    dumps = current_app.extensions['json_encoder']
+    batch = []
+    for row in rows:
+        batch.append(dumps(serialize(row)))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def stream_json_array(rows, serialize, batch_size=None):
+    """
+    Stream rows as one JSON array (chunked transfer).
+
+    Args:
+        rows (iterable): Rows to send (e.g. ORM objects from a server-side cursor)
+        serialize (callable): serialize(row) -> JSON-compatible dict
+        batch_size (int, optional): Rows per chunk (default: STREAM_BATCH_SIZE)
+
+    Returns:
+        Response: 200 application/json, body produced while the client reads it
+    """
+    batch_size = batch_size or current_app.config.get('STREAM_BATCH_SIZE', 500)
+
+    def generate():
+        separator = b'['
+        for batch in _batches(rows, serialize, batch_size):
+            yield separator + b','.join(batch)
+            separator = b','
+        yield b'[]\n' if separator == b'[' else b']\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def stream_ndjson(rows, serialize, batch_size=None):
+    """
+    Stream rows as newline-delimited JSON (one object per line).
+
+    Args:
+        rows (iterable): Rows to send
+        serialize (callable): serialize(row) -> JSON-compatible dict
+        batch_size (int, optional): Rows per chunk (default: STREAM_BATCH_SIZE)
+
+    Returns:
+        Response: 200 application/x-ndjson
+    """
+    batch_size = batch_size or current_app.config.get('STREAM_BATCH_SIZE', 500)
+
+    def generate():
+        for batch in _batches(rows, serialize, batch_size):
+            yield b'\n'.join(batch) + b'\n'
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+
+def stream_list(stream, rows, serialize):
+    """
+    Stream rows in the format asked for by a list endpoint's ?stream= argument.
+
+    Args:
+        stream (str): 'array' or 'ndjson'
+        rows (iterable): Rows to send
+        serialize (callable): serialize(row) -> JSON-compatible dict
+
+    Returns:
+        Response: Streamed response
+    """
+    if stream == 'ndjson':
+        return stream_ndjson(rows, serialize)
+    return stream_json_array(rows, serialize)
@@ -0,0 +1,353 @@
+#!/usr/bin/python3
+"""
+Prometheus metrics for the HBnB application (GET /metrics).
+
+Exposed (text exposition format 0.0.4):
+- hbnb_http_request_duration_seconds{namespace,route,method}   histogram
+- hbnb_http_requests_total{namespace,route,method,status}       counter
+    namespace is the flask-restx namespace of the route ('places',
+    'reviews', 'users', 'amenities', 'auth', 'changes'), route its URL
+    rule ('/api/v1/places/<string:place_id>'), so ids never become labels
+- hbnb_repository_operations_total{model,operation}             counter
+- hbnb_repository_operation_seconds_total{model,operation}      counter
+    every public SQLAlchemyRepository method, by model (see
+    app.persistence.repository.instrument_repository)
+- hbnb_bcrypt_duration_seconds{operation}                       histogram
+    hash / verify, measured where bcrypt runs (BcryptPool threads)
+- hbnb_db_pool_checkout_seconds                                 histogram
+    time to get a connection from the engine's pool (waits included)
+- hbnb_db_pool_timeouts_total                                   counter
+    checkouts that gave up after DB_POOL_TIMEOUT (see app.persistence.pool)
+
+Recording takes no lock: each thread writes to its own dict of cells
+(threading.local), registered once in the registry. A scrape copies every
+thread's dict and adds them up. The cells of threads that exited (threaded
+servers start one per request) are folded into one dict, when a new thread
+registers or at a scrape: the counters never go down, and memory and scrape
+time follow the live threads. A recording costs about a microsecond.
+
+Each process has its own registry: with several workers, a scrape sees the
+worker that answered it (scrape each worker, or run one per container).
+
+Usage:
+    >>> metrics.init_app(app, db)          # early: times the other hooks too
+    >>> metrics.register_namespaces(api)   # once the namespaces are added
+    >>> REPOSITORY_OPERATIONS.inc(('Place', 'get'))
+    >>> with BCRYPT_DURATION.time(('hash',)): ...
+"""
+
+import threading
+import time
+from bisect import bisect_left
+
+from flask import Response, current_app, g, request
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Default histogram buckets (seconds): 1 ms to 10 s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Registry:
+    """Metric definitions and the per-thread cells holding their values"""
+
+    def __init__(self):
+        self._metrics = []
+        self._local = threading.local()
+        self._shards = []  # (thread, cells) of the threads that recorded something
+        self._retired = {}  # cells of the threads that exited, summed
+        self._lock = threading.Lock()  # taken once per thread, and by collect()
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def shard(self):
+        """The calling thread's cells: {(metric name, label values): value}"""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._prune()
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def _prune(self):
+        """Fold the cells of exited threads into the retired cells (lock held)"""
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                _add_cells(self._retired, shard)  # its owner writes no more
+        self._shards = live
+
+    def collect(self):
+        """
+        Values summed over every thread.
+
+        Returns:
+            dict: {(metric name, label values): int/float, or a list for histograms}
+        """
+        totals = {}
+        with self._lock:
+            self._prune()
+            _add_cells(totals, self._retired)
+            shards = [shard for _thread, shard in self._shards]
+        for shard in shards:
+            # dict.copy() is atomic: the owner thread may be adding cells
+            _add_cells(totals, shard.copy())
+        return totals
+
+    def render(self):
+        """Text exposition format of every metric"""
+        totals = self.collect()
+        by_metric = {}
+        for (name, labels), value in totals.items():
+            by_metric.setdefault(name, []).append((labels, value))
+        lines = []
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.help}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for labels, value in sorted(by_metric.get(metric.name, ()), key=lambda item: item[0]):
+                lines.extend(metric.samples(labels, value))
+        return '\n'.join(lines) + '\n'
+
+
+def _add_cells(totals, cells):
+    """Add cells (numbers, or lists of bucket counts) into totals"""
+    for key, value in cells.items():
+        if isinstance(value, list):
+            total = totals.get(key)
+            if total is None:
+                totals[key] = list(value)
+            else:
+                for i, cell in enumerate(value):
+                    total[i] += cell
+        else:
+            totals[key] = totals.get(key, 0) + value
+
+
+class Counter:
+    """Monotonic counter, one value per label combination"""
+
+    kind = 'counter'
+
+    def __init__(self, registry, name, help, labelnames=()):
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self._registry = registry
+        registry.register(self)
+
+    def inc(self, labels=(), amount=1):
+        shard = self._registry.shard()
+        key = (self.name, labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    def samples(self, labels, value):
+        return [f'{self.name}{_labels(self.labelnames, labels)} {_number(value)}']
+
+
+class Histogram:
+    """Distribution of observed values (cumulative buckets, sum, count)"""
+
+    kind = 'histogram'
+
+    def __init__(self, registry, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._registry = registry
+        registry.register(self)
+
+    def observe(self, value, labels=()):
+        shard = self._registry.shard()
+        key = (self.name, labels)
+        cells = shard.get(key)
+        if cells is None:
+            # One cell per bucket, +Inf, then the sum
+            cells = shard[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        cells[bisect_left(self.buckets, value)] += 1
+        cells[-1] += value
+
+    def time(self, labels=()):
+        """Context manager observing the duration of its block"""
+        return _Timer(self, labels)
+
+    def samples(self, labels, cells):
+        names, lines, cumulative = self.labelnames + ('le',), [], 0
+        for bound, count in zip(self.buckets + ('+Inf',), cells[:-1]):
+            cumulative += count
+            le = bound if isinstance(bound, str) else repr(float(bound))
+            lines.append(f'{self.name}_bucket{_labels(names, labels + (le,))} {cumulative}')
+        lines.append(f'{self.name}_sum{_labels(self.labelnames, labels)} {_number(cells[-1])}')
+        lines.append(f'{self.name}_count{_labels(self.labelnames, labels)} {cumulative}')
+        return lines
+
+
+class _Timer:
+    __slots__ = ('_histogram', '_labels', '_started')
+
+    def __init__(self, histogram, labels):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._started, self._labels)
+
+
+def _labels(names, values):
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# -----------------------
+# HBnB metrics
+# -----------------------
+
+registry = Registry()
+
+REQUEST_DURATION = Histogram(registry, 'hbnb_http_request_duration_seconds',
+                             'Time to serve a request (streamed bodies included).',
+                             ('namespace', 'route', 'method'))
+REQUESTS = Counter(registry, 'hbnb_http_requests_total', 'Requests served.',
+                   ('namespace', 'route', 'method', 'status'))
+REPOSITORY_OPERATIONS = Counter(registry, 'hbnb_repository_operations_total',
+                                'SQLAlchemyRepository method calls.', ('model', 'operation'))
+REPOSITORY_SECONDS = Counter(registry, 'hbnb_repository_operation_seconds_total',
+                             'Time spent in SQLAlchemyRepository methods.', ('model', 'operation'))
+BCRYPT_DURATION = Histogram(registry, 'hbnb_bcrypt_duration_seconds',
+                            'Duration of one bcrypt hash or verification.', ('operation',),
+                            buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5))
+POOL_CHECKOUT = Histogram(registry, 'hbnb_db_pool_checkout_seconds',
+                          'Time to check a connection out of the database pool.',
+                          buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0))
+POOL_TIMEOUTS = Counter(registry, 'hbnb_db_pool_timeouts_total',
+                        'Checkouts that gave up after DB_POOL_TIMEOUT (answered 503).')
+
+
+class Metrics:
+    """
+    Request timing, pool checkout timing and the /metrics endpoint (Flask extension style).
+
+    Settings:
+        METRICS_ENABLED (bool): Register the hooks and the endpoint
+        METRICS_PATH (str): URL of the endpoint (default /metrics)
+    """
+
+    def __init__(self, app=None, db=None):
+        """Create the extension (inactive until init_app() is called)"""
+        self._namespaces = {}   # flask-restx Resource class -> namespace name
+        self._endpoints = {}    # Flask endpoint -> namespace name (resolved lazily)
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        """
+        Register the request hooks, time pool checkouts and add the endpoint.
+
+        Args:
+            app (Flask): Application to hook
+            db (SQLAlchemy): Flask-SQLAlchemy instance (an app context is pushed to reach its engine)
+        """
+        app.extensions['metrics'] = self
+        if not app.config.get('METRICS_ENABLED', True):
+            return
+        with app.app_context():
+            _time_pool_checkouts(db.engine)
+        app.before_request(self._begin_request)
+        app.after_request(self._end_response)
+        app.teardown_request(self._end_request)
+        app.add_url_rule(app.config.get('METRICS_PATH', '/metrics'), 'metrics', self.metrics_view)
+
+    def register_namespaces(self, api):
+        """
+        Label requests with their flask-restx namespace.
+
+        Args:
+            api (Api): flask-restx Api, after add_namespace() calls
+        """
+        for namespace in api.namespaces:
+            for route in namespace.resources:
+                self._namespaces[route.resource] = namespace.name
+        self._endpoints.clear()
+
+    @staticmethod
+    def metrics_view():
+        """GET /metrics: every metric of this process"""
+        return Response(registry.render(), content_type=CONTENT_TYPE)
+
+    # -----------------------
+    # Request hooks
+    # -----------------------
+
+    def _begin_request(self):
+        """before_request: start the request clock"""
+        g.metrics_started = time.perf_counter()
+
+    @staticmethod
+    def _end_response(response):
+        """after_request: remember the status (the request ends at teardown)"""
+        g.metrics_status = response.status_code
+        return response
+
+    def _end_request(self, _error):
+        """teardown_request: observe the duration, streamed body included"""
+        started = g.pop('metrics_started', None)
+        if started is None or request.endpoint == 'metrics':
+            return
+        elapsed = time.perf_counter() - started
+        rule = request.url_rule
+        route = rule.rule if rule is not None else 'unmatched'
+        namespace = self._namespace(request.endpoint)
+        REQUEST_DURATION.observe(elapsed, (namespace, route, request.method))
+        REQUESTS.inc((namespace, route, request.method, str(g.get('metrics_status', 500))))
+
+    def _namespace(self, endpoint):
+        try:
+            return self._endpoints[endpoint]
+        except KeyError:
+            view = current_app.view_functions.get(endpoint)
+            name = self._namespaces.get(getattr(view, 'view_class', None), 'none')
+            self._endpoints[endpoint] = name
+            return name
+
+
+def _time_pool_checkouts(engine):
+    """
+    Observe POOL_CHECKOUT (and count POOL_TIMEOUTS) around engine.raw_connection().
+
+    SQLAlchemy has events after a checkout, none before: the engine's
+    raw_connection (called by every Connection, so by every Session) is
+    wrapped instead. Done on the engine, not its pool, so it survives
+    engine.dispose() replacing the pool.
+    """
+    if getattr(engine, '_metrics_timed', False):
+        return
+    raw_connection = engine.raw_connection
+
+    def timed_raw_connection():
+        started = time.perf_counter()
+        try:
+            return raw_connection()
+        except PoolTimeoutError:
+            POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_CHECKOUT.observe(time.perf_counter() - started)
+
+    engine.raw_connection = timed_raw_connection
+    engine._metrics_timed = True
@@ -0,0 +1,335 @@
+#!/usr/bin/python3
+"""
+Compiled serializers for the HBnB models and API response models.
+
+Serializing a row used to be two generic passes:
+1. BaseModel.to_dict(): loop over self.__table__.columns, getattr() each
+   column, isinstance(value, datetime) check on every value
+2. flask-restx marshal_with(): walk the response model, call field.output()
+   (get_value + format) for every key of the resulting dict
+
+Both walk metadata that never changes at runtime. This module generates,
+once per class, a plain Python function with the columns / fields unrolled:
+
+- compile_serializer(Model): ORM object -> dict of column values
+  (what the reflective loop of BaseModel.to_dict() produced)
+- compile_marshaller(api_model): to_dict() output -> response dict
+  (what flask-restx marshal() produces for that model, X-Fields mask
+  included: one more function is generated per mask received)
+
+Generated code for Amenity, for example:
+
+    def serialize_Amenity(obj):
+        try:
+            _d = obj.__dict__
+            c0 = _d['id']
+            c1 = _d['created_at']
+            ...
+        except KeyError:
+            # Expired/unloaded attribute: let the ORM load it
+            c0 = obj.id
+            ...
+        return {'id': c0, 'created_at': c1.isoformat() if isinstance(c1, _datetime) else c1, ...}
+
+Usage:
+    >>> serialize = serializer_for(Place)
+    >>> serialize(place)['title']
+    'Loft'
+    >>> marshal_place = compile_marshaller(place_response)
+    >>> marshal = marshal_place.for_request()          # honors X-Fields
+    >>> [marshal(p.to_dict()) for p in places]          # list mode
+"""
+
+import threading
+from datetime import datetime
+
+from flask import current_app, request
+from flask_restx import fields as restx_fields
+from flask_restx.inputs import boolean as _restx_boolean
+from flask_restx.mask import Mask
+from sqlalchemy import DateTime
+
+# Model class -> compiled serializer
+_SERIALIZERS = {}
+_SERIALIZERS_LOCK = threading.Lock()
+
+
+# -----------------------
+# ORM serializers
+# -----------------------
+
+def compile_serializer(model):
+    """
+    Generate the column serializer of a model class.
+
+    Columns listed in the class attribute __serialize_exclude__ are never
+    read nor output (e.g. User.password).
+
+    Args:
+        model: SQLAlchemy model class (subclass of BaseModel)
+
+    Returns:
+        callable: serialize(obj) -> dict with one key per column (datetimes
+                  as ISO 8601 strings) plus '__class__'
+    """
+    exclude = set(getattr(model, '__serialize_exclude__', ()))
+    columns = [c for c in model.__table__.columns if c.name not in exclude]
+    # Column name -> mapped attribute name (they only differ with Column('x', ...) aliases)
+    mapper = model.__mapper__
+    attrs = [mapper.get_property_by_column(c).key for c in columns]
+
+    fast = [f"        c{i} = _d[{attr!r}]" for i, attr in enumerate(attrs)]
+    slow = [f"        c{i} = obj.{attr}" for i, attr in enumerate(attrs)]
+    items = []
+    for i, column in enumerate(columns):
+        if isinstance(column.type, DateTime):
+            value = f"c{i}.isoformat() if isinstance(c{i}, _datetime) else c{i}"
+        else:
+            value = f"c{i}"
+        items.append(f"        {column.name!r}: {value},")
+    items.append(f"        '__class__': {model.__name__!r},")
+
+    name = f"serialize_{model.__name__}"
+    source = "\n".join([
+        f"def {name}(obj):",
+        "    try:",
+        "        _d = obj.__dict__",
+        *fast,
+        "    except KeyError:",
+        "        # Expired, deferred or never loaded: go through the ORM descriptors",
+        *slow,
+        "    return {",
+        *items,
+        "    }",
+    ])
+    return _build(name, source, {'_datetime': datetime}, f"<serializer {model.__name__}>")
+
+
+def serializer_for(model):
+    """
+    Return the compiled serializer of a model class (compiled on first use).
+
+    Args:
+        model: SQLAlchemy model class
+
+    Returns:
+        callable: serialize(obj) -> dict
+    """
+    serializer = _SERIALIZERS.get(model)
+    if serializer is None:
+        with _SERIALIZERS_LOCK:
+            serializer = _SERIALIZERS.get(model)
+            if serializer is None:
+                serializer = _SERIALIZERS[model] = compile_serializer(model)
+    return serializer
+
+
+def compile_serializers(models):
+    """
+    Compile the serializers of several models up front (application startup).
+
+    Args:
+        models (iterable): SQLAlchemy model classes
+    """
+    for model in models:
+        serializer_for(model)
+
+
+# -----------------------
+# Response marshallers (list mode)
+# -----------------------
+
+class CompiledMarshaller:
+    """
+    Generated equivalent of flask_restx.marshal(data, api_model, mask=...).
+
+    Used by the list endpoints instead of marshal_list_with(): the response
+    shape is applied by straight-line code rather than by walking the
+    model's fields for every row. Missing keys become None and values are
+    converted like the restx fields do (str/int/float/bool, nested models,
+    lists). Fields the generator does not know (custom types, attribute=,
+    default=) fall back to the field's own output() method, so the result
+    is always the same as marshal().
+
+    X-Fields masks are applied like marshal_with() does: the mask is parsed
+    once per request and the masked model (restx Mask.apply) is compiled
+    too. Masked functions are kept per mask string, MAX_MASKS at most
+    (clients choose the masks: the oldest one is dropped beyond that).
+
+    Usage:
+        >>> marshal_place = CompiledMarshaller(place_response)
+        >>> marshal_place(place.to_dict())        # no mask
+        >>> marshal = marshal_place.for_request()  # mask of the current request
+    """
+
+    MAX_MASKS = 32
+
+    def __init__(self, api_model):
+        """
+        Args:
+            api_model: flask-restx Model (e.g. place_response)
+        """
+        self.api_model = api_model
+        self._marshal = _compile(api_model.name, api_model)
+        self._masked = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, data):
+        """Marshal one to_dict() output without mask"""
+        return self._marshal(data)
+
+    def for_request(self):
+        """
+        Return the function marshalling rows for the current request.
+
+        Returns:
+            callable: marshal(data: dict) -> dict, restricted to the fields of
+                      the request's X-Fields header (RESTX_MASK_HEADER) if any
+
+        Raises:
+            flask_restx.mask.ParseError: Malformed mask (answered 400 by restx)
+        """
+        mask = request.headers.get(current_app.config.get('RESTX_MASK_HEADER', 'X-Fields'))
+        if not mask:
+            return self._marshal
+        return self.masked(mask)
+
+    def masked(self, mask):
+        """
+        Return the function applying a field mask (compiled on first use).
+
+        Args:
+            mask (str): Mask in X-Fields syntax (e.g. "id,title,owner{id}")
+
+        Returns:
+            callable: marshal(data: dict) -> dict
+        """
+        marshal = self._masked.get(mask)
+        if marshal is None:
+            # skip=True: unknown names are ignored, as marshal_with() does
+            fields = Mask(mask, skip=True).apply(getattr(self.api_model, 'resolved', self.api_model))
+            marshal = _compile(f"{self.api_model.name}_masked", fields)
+            with self._lock:
+                if len(self._masked) >= self.MAX_MASKS:
+                    self._masked.pop(next(iter(self._masked)))
+                self._masked[mask] = marshal
+        return marshal
+
+
+def compile_marshaller(api_model):
+    """
+    Compile the list-mode marshaller of a response model.
+
+    Args:
+        api_model: flask-restx Model (e.g. place_response)
+
+    Returns:
+        CompiledMarshaller: marshal(data: dict) -> dict, plus for_request()
+    """
+    return CompiledMarshaller(api_model)
+
+
+def _compile(name, api_model):
+    """Generate the marshal function of a model or of a masked fields dict"""
+    namespace = {'_boolean': _restx_boolean}
+    functions = {}
+    return namespace[_compile_model(api_model, namespace, functions, name)]
+
+
+def _compile_model(api_model, namespace, functions, name=None):
+    """Generate marshal_<Model>(src) (and its nested models) into namespace"""
+    # Masked models are plain dicts of fields (no name): keyed by identity
+    if name is None:
+        name = getattr(api_model, 'name', None) or f"nested_{len(functions)}"
+    cache_key = getattr(api_model, 'name', None) or id(api_model)
+    func_name = f"marshal_{_identifier(name)}"
+    if cache_key in functions:
+        # Already generated (or being generated: recursive model)
+        return functions[cache_key]
+    functions[cache_key] = func_name
+
+    items = []
+    # resolved: own fields + inherited ones (places_ns.inherit), like marshal_with()
+    for key, field in getattr(api_model, 'resolved', api_model).items():
+        items.append(f"        {key!r}: {_field_expr(key, field, namespace, functions)},")
+
+    source = "\n".join([
+        f"def {func_name}(src):",
+        "    get = src.get",
+        "    return {",
+        *items,
+        "    }",
+    ])
+    namespace[func_name] = _build(func_name, source, namespace, f"<marshaller {name}>")
+    return func_name
+
+
+def _field_expr(key, field, namespace, functions):
+    """Python expression producing the marshalled value of one field"""
+    if isinstance(field, type):
+        field = field()
+    generic = (field.attribute is not None or field.default is not None
+               or getattr(field, 'mask', None) or getattr(field, 'skip_none', False))
+    value = f"get({key!r})"
+
+    if not generic:
+        converter = _converter(field)
+        if converter is not None:
+            return f"None if (v := {value}) is None else {converter('v')}"
+
+        if isinstance(field, restx_fields.Nested) and not field.as_list and not field.allow_null:
+            nested = _compile_model(field.nested, namespace, functions)
+            return f"{nested}({value} or {{}})"
+
+        if isinstance(field, restx_fields.List):
+            container = field.container
+            if isinstance(container, type):
+                container = container()
+            if (isinstance(container, restx_fields.Nested) and not container.allow_null
+                    and not getattr(container, 'mask', None)):
+                nested = _compile_model(container.nested, namespace, functions)
+                item = f"{nested}(i or {{}})"
+            elif (converter := _converter(container)) is not None:
+                item = f"None if i is None else {converter('i')}"
+            else:
+                item = None
+            if item is not None and container.default is None and container.attribute is None:
+                # restx: a dict (single nested object) is wrapped in a list
+                return (f"None if (v := {value}) is None else "
+                        f"[{item} for i in (v if isinstance(v, (list, tuple, set)) else [v])]")
+
+    # Anything else: delegate to the field itself (exact restx behaviour)
+    field_name = f"_field_{len(namespace)}"
+    namespace[field_name] = field
+    return f"{field_name}.output({key!r}, src)"
+
+
+def _converter(field):
+    """Return expr -> converted expr for scalar fields, or None"""
+    kind = type(field)
+    if kind is restx_fields.String:
+        return lambda v: f"str({v})"
+    if kind is restx_fields.Integer:
+        return lambda v: f"int({v})"
+    if kind is restx_fields.Float:
+        return lambda v: f"float({v})"
+    if kind is restx_fields.Boolean:
+        return lambda v: f"({v} if {v} is True or {v} is False else _boolean({v}))"
+    return None
+
+
+# -----------------------
+# Internals
+# -----------------------
+
+def _identifier(name):
+    return ''.join(ch if ch.isalnum() else '_' for ch in name)
+
+
+def _build(func_name, source, namespace, filename):
+    """Compile generated source and return the function it defines"""
+    code = compile(source, filename, 'exec')
+    exec(code, namespace)
+    function = namespace[func_name]
+    function.__source__ = source
+    return function
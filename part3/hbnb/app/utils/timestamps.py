@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+"""
+Timestamp helpers for the HBnB application.
+
+Every timestamp column (created_at, updated_at, deleted_at) stores naive
+UTC datetimes (datetime.utcnow()). Timestamps received from clients are
+converted to the same form before they reach a query, otherwise SQLite
+would compare strings in different formats.
+"""
+
+from datetime import datetime, timezone
+
+
+def iso_timestamp(value):
+    """
+    Parse an ISO 8601 timestamp into a naive UTC datetime.
+
+    Usable as a reqparse argument type (a ValueError becomes a 400).
+
+    Args:
+        value (str): e.g. '2024-05-01T12:00:00Z', '2024-05-01T14:00:00+02:00'
+                     or '2024-05-01T12:00:00' (taken as UTC)
+
+    Returns:
+        datetime: Naive datetime in UTC
+
+    Raises:
+        ValueError: If value is not an ISO 8601 timestamp
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{value!r} is not an ISO 8601 timestamp")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+# Swagger documentation of the argument type
+iso_timestamp.__schema__ = {'type': 'string', 'format': 'date-time'}
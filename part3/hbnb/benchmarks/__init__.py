@@ -0,0 +1,11 @@
+#!/usr/bin/python3
+"""
+Benchmarks for the HBnB API (not part of the test suite).
+
+Each module is a standalone script run from the part3/hbnb directory:
+    python -m benchmarks.bench_nearby --places 1000000
+
+benchmarks.loadtest is the end-to-end suite (seeded dataset, HTTP
+workloads, throughput/p50/p99 reports comparable across commits):
+    python -m benchmarks.loadtest run --scale 10k --output report.json
+"""
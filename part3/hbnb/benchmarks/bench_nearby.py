@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+"""
+Benchmark: radius search with the geohash index vs a full table scan.
+
+Builds (once) a SQLite database with N random places spread over Europe,
+then times, for random search centers:
+- geohash: PlaceRepository.get_places_nearby() (prefix cells + haversine)
+- full scan: SELECT id, latitude, longitude FROM places + haversine on every row
+
+Usage (from part3/hbnb):
+    python -m benchmarks.bench_nearby                      # 1 000 000 places
+    python -m benchmarks.bench_nearby --places 100000 --queries 50 --radius 5
+
+The database file is reused between runs when it already holds N places.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+from config import Config
+
+
+def build_config(db_path):
+    """Return a config class pointing the app at the benchmark database"""
+    class BenchmarkConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        AUTO_MIGRATE = True
+    return BenchmarkConfig
+
+
+def seed(db, count, rng):
+    """Insert one owner and `count` random places with Core bulk inserts"""
+    from app.models.place import Place
+    from app.models.user import User
+    from app.utils.geo import encode_geohash
+
+    now = datetime.utcnow()
+    owner_id = str(uuid.uuid4())
+    db.session.execute(User.__table__.insert(), [{
+        'id': owner_id, 'first_name': 'Bench', 'last_name': 'Owner',
+        'email': f'bench-{owner_id}@example.com', 'password': 'x',
+        'is_admin': False, 'created_at': now, 'updated_at': now,
+    }])
+
+    batch = []
+    for i in range(count):
+        lat = rng.uniform(36.0, 60.0)
+        lon = rng.uniform(-10.0, 30.0)
+        batch.append({
+            'id': str(uuid.uuid4()), 'title': f'Place {i}', 'description': None,
+            'price': 100, 'latitude': lat, 'longitude': lon,
+            'geohash': encode_geohash(lat, lon), 'owner_id': owner_id,
+            'created_at': now, 'updated_at': now,
+        })
+        if len(batch) == 50000:
+            db.session.execute(Place.__table__.insert(), batch)
+            batch = []
+            print(f"  seeded {i + 1} places")
+    if batch:
+        db.session.execute(Place.__table__.insert(), batch)
+    db.session.commit()
+
+
+def full_scan(db, lat, lon, radius_km):
+    """Baseline: haversine on every row of the table"""
+    from app.models.place import Place
+    from app.utils.geo import haversine_km
+
+    rows = db.session.query(Place.id, Place.latitude, Place.longitude)
+    return [
+        place_id for place_id, p_lat, p_lon in rows
+        if haversine_km(lat, lon, p_lat, p_lon) <= radius_km
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--places', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--radius', type=float, default=10.0, help='radius in km')
+    parser.add_argument('--scan-queries', type=int, default=3,
+                        help='number of full-scan queries (slow at 1M rows)')
+    parser.add_argument('--db', default=None, help='SQLite file (default: temp dir)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.gettempdir(), f'hbnb_bench_nearby_{args.places}.db')
+
+    from app import create_app, db
+    from app.models.place import Place
+    from app.persistence.place_repository import PlaceRepository
+
+    app = create_app(build_config(db_path))
+    rng = random.Random(args.seed)
+
+    with app.app_context():
+        existing = db.session.query(Place.id).count()
+        if existing != args.places:
+            print(f"Seeding {args.places} places into {db_path} ...")
+            db.session.query(Place).delete()
+            db.session.commit()
+            seed(db, args.places, rng)
+
+        repo = PlaceRepository()
+        centers = [(rng.uniform(40.0, 56.0), rng.uniform(-5.0, 25.0)) for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        found = 0
+        for lat, lon in centers:
+            found += len(repo.get_places_nearby(lat, lon, args.radius))
+            db.session.expunge_all()
+        geohash_ms = (time.perf_counter() - start) * 1000 / len(centers)
+
+        scan_centers = centers[:args.scan_queries]
+        start = time.perf_counter()
+        for lat, lon in scan_centers:
+            full_scan(db, lat, lon, args.radius)
+        scan_ms = (time.perf_counter() - start) * 1000 / max(len(scan_centers), 1)
+
+    print(f"places={args.places} radius={args.radius}km")
+    print(f"geohash search : {geohash_ms:9.2f} ms/query ({found / len(centers):.1f} results avg)")
+    print(f"full scan      : {scan_ms:9.2f} ms/query")
+    print(f"speedup        : {scan_ms / geohash_ms:9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+"""
+Benchmark: per-row serialization cost of Place and Review objects.
+
+Builds N in-memory Place and N Review objects (all columns loaded, owner /
+user / place relationships set, like rows returned by the repositories),
+then times per row:
+- columns  : reflective loop over __table__.columns vs compiled serializer
+- marshal  : flask-restx marshal() vs compiled marshaller (list mode)
+- pipeline : to_dict() + marshal(), the way a list endpoint serializes,
+             with the reflective loop + restx vs compiled + list mode
+
+Usage (from part3/hbnb):
+    python -m benchmarks.bench_serializers                 # 100 000 rows per model
+    python -m benchmarks.bench_serializers --rows 20000
+"""
+
+import argparse
+import time
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from config import TestingConfig
+
+
+def reflective_columns(obj):
+    """The column loop BaseModel.to_dict() ran for every row before compilation"""
+    data = {}
+    for column in obj.__table__.columns:
+        if column.name in obj.__serialize_exclude__:
+            continue
+        value = getattr(obj, column.name)
+        data[column.name] = value.isoformat() if isinstance(value, datetime) else value
+    data['__class__'] = obj.__class__.__name__
+    return data
+
+
+def build_rows(count):
+    """Return (places, reviews) sharing one owner and one reviewer"""
+    from app.models.place import Place
+    from app.models.review import Review
+    from app.models.user import User
+
+    now = datetime.utcnow()
+    owner = User(id=str(uuid.uuid4()), first_name='Bench', last_name='Owner',
+                 email='owner@example.com', password='benchmark', is_admin=False,
+                 created_at=now, updated_at=now)
+    guest = User(id=str(uuid.uuid4()), first_name='Bench', last_name='Guest',
+                 email='guest@example.com', password='benchmark', is_admin=False,
+                 created_at=now, updated_at=now)
+    places, reviews = [], []
+    for i in range(count):
+        place = Place(id=str(uuid.uuid4()), title=f'Place {i}', description='Quiet flat',
+                      price=Decimal('120.00'), latitude=48.85, longitude=2.35,
+                      geohash='u09tvw0f6', owner_id=owner.id, owner=owner,
+                      rating_count=1, rating_sum=4, rating_avg=4.0, rating_1=0, rating_2=0,
+                      rating_3=0, rating_4=1, rating_5=0, created_at=now, updated_at=now)
+        places.append(place)
+        reviews.append(Review(id=str(uuid.uuid4()), text='Great stay, would come back',
+                              rating=4, user_id=guest.id, user=guest, place_id=place.id,
+                              place=place, created_at=now, updated_at=now))
+    return places, reviews
+
+
+def per_row_us(func, rows):
+    start = time.perf_counter()
+    for row in rows:
+        func(row)
+    return (time.perf_counter() - start) * 1e6 / len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000, help='objects per model')
+    args = parser.parse_args()
+
+    from flask_restx import marshal
+    from app import create_app
+    import app.models.BaseModel as base_model
+    from app.utils.serializers import compile_marshaller, serializer_for
+
+    app = create_app(TestingConfig)
+    with app.app_context():
+        from app.api.v1.places import place_response
+        from app.api.v1.reviews import review_response_model
+        from app.models.place import Place
+        from app.models.review import Review
+
+        print(f"Building {args.rows} places and {args.rows} reviews ...")
+        places, reviews = build_rows(args.rows)
+
+        print(f"{'':8} {'stage':9} {'reflective/restx':>17} {'compiled':>10} {'speedup':>8}   (us/row)")
+        for label, model, rows, api_model in (('Place', Place, places, place_response),
+                                               ('Review', Review, reviews, review_response_model)):
+            compiled = serializer_for(model)
+            marshaller = compile_marshaller(api_model)
+            dicts = [obj.to_dict() for obj in rows]
+
+            stages = [
+                ('columns', per_row_us(reflective_columns, rows), per_row_us(compiled, rows)),
+                ('marshal', per_row_us(lambda d: marshal(d, api_model), dicts),
+                 per_row_us(marshaller, dicts)),
+            ]
+
+            # Whole list endpoint row: to_dict() + marshal, old vs new
+            base_model.serializer_for = lambda _model: reflective_columns
+            try:
+                old = per_row_us(lambda obj: marshal(obj.to_dict(), api_model), rows)
+            finally:
+                base_model.serializer_for = serializer_for
+            new = per_row_us(lambda obj: marshaller(obj.to_dict()), rows)
+            stages.append(('pipeline', old, new))
+
+            for stage, before, after in stages:
+                print(f"{label:8} {stage:9} {before:17.2f} {after:10.2f} {before / after:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+"""
+Benchmark: read throughput while reviews are being written, with and
+without the SQLite profile (Config.SQLITE_PRAGMAS).
+
+On a copy of the load-test database (benchmarks.loadtest), one writer
+thread posts reviews without pause while reader threads run the browse
+and place_detail workloads (entity cache off: every read hits SQLite).
+Runs twice:
+- profile:  Config.SQLITE_PRAGMAS (WAL, synchronous=NORMAL, mmap, cache...)
+- defaults: SQLite's own settings (rollback journal, synchronous=FULL),
+            with the same busy_timeout (without it, writes fail at once
+            instead of waiting) and foreign_keys=ON (always sent)
+
+Usage (from part3/hbnb):
+    python -m benchmarks.bench_sqlite_profile
+    python -m benchmarks.bench_sqlite_profile --scale 100k --readers 8 --requests 2000
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from benchmarks.loadtest import report, runner
+from benchmarks.loadtest.drivers import WSGIClient
+from benchmarks.loadtest.workloads import WORKLOADS
+
+PROFILES = {
+    'profile': None,  # Config.SQLITE_PRAGMAS
+    'defaults': {'busy_timeout': 5000, 'journal_mode': 'DELETE', 'synchronous': 'FULL'},
+}
+
+
+def run(profile, args):
+    from app import create_app, db
+
+    base = runner.build_config(runner.prepare_database(args.scale, args.seed, 4), 4)
+    overrides = {'ENTITY_CACHE_SIZE': 0, 'SQL_STATS': False}
+    if PROFILES[profile] is not None:
+        overrides['SQLITE_PRAGMAS'] = PROFILES[profile]
+    app = create_app(type('BenchmarkConfig', (base,), overrides))
+    dataset = runner.load_dataset(app, args.scale)
+
+    # Writer: review_submit until the readers are done
+    stop = threading.Event()
+    writes = {'ok': 0, 'failed': 0}
+
+    def writer():
+        client, index, rng = WSGIClient(app), 0, random.Random(args.seed)
+        while not stop.is_set():
+            try:
+                status = WORKLOADS['review_submit'].operation(client, dataset, {}, rng, index)
+            except Exception:  # e.g. database is locked: counted, not fatal
+                status = None
+            writes['ok' if status == 201 else 'failed'] += 1
+            index += 1
+
+    thread = threading.Thread(target=writer)
+    started = time.perf_counter()
+    thread.start()
+    results = {}
+    try:
+        for name in ('browse', 'place_detail'):
+            outcome = runner.run_workload(WORKLOADS[name], lambda: WSGIClient(app), dataset,
+                                          args.requests, args.readers, args.seed, warmup=10)
+            results[name] = report.summarize(outcome)
+    finally:
+        stop.set()
+        thread.join()
+    elapsed = time.perf_counter() - started
+    with app.app_context():
+        journal = db.session.execute(db.text('PRAGMA journal_mode')).scalar()
+        db.session.remove()
+        db.engine.dispose()
+    return results, writes, elapsed, journal
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', default='10k', help='load-test dataset size (10k, 100k, 1m or a number)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=1000, help='reads per workload')
+    args = parser.parse_args()
+    if args.scale.isdigit():
+        args.scale = int(args.scale)
+
+    for profile in PROFILES:
+        results, writes, elapsed, journal = run(profile, args)
+        print(f"\n{profile} (journal_mode={journal}): "
+              f"{writes['ok'] / elapsed:.1f} reviews written/s, {writes['failed']} failed writes")
+        report.print_table(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+"""
+Benchmark: GET /places/ as one JSON document vs streamed (?stream=array).
+
+Seeds (once) a SQLite database with the largest requested number of places
+(price = row number, so ?max_price=N selects exactly N places), then for
+each size measures, through the Flask test client:
+- time to produce the whole body (stdlib json vs orjson vs streamed orjson)
+- peak Python memory while producing it (tracemalloc)
+
+The full response grows with N; the streamed one should stay flat (it
+depends on STREAM_BATCH_SIZE only).
+
+Usage (from part3/hbnb):
+    python -m benchmarks.bench_streaming                         # 5k, 20k, 50k places
+    python -m benchmarks.bench_streaming --sizes 1000 10000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+from config import Config
+
+
+def build_config(db_path, encoder):
+    """Return a config class pointing the app at the benchmark database"""
+    class BenchmarkConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        AUTO_MIGRATE = True
+        JSON_ENCODER = encoder
+        ENTITY_CACHE_SIZE = 0
+    return BenchmarkConfig
+
+
+def seed(db, count):
+    """Insert one owner and `count` places priced 1..count (Core bulk inserts)"""
+    from app.models.place import Place
+    from app.models.user import User
+    from app.utils.geo import encode_geohash
+
+    now = datetime.utcnow()
+    owner_id = str(uuid.uuid4())
+    db.session.execute(User.__table__.insert(), [{
+        'id': owner_id, 'first_name': 'Bench', 'last_name': 'Owner',
+        'email': f'bench-{owner_id}@example.com', 'password': 'x',
+        'is_admin': False, 'created_at': now, 'updated_at': now,
+    }])
+    rows = [{
+        'id': str(uuid.uuid4()), 'title': f'Place {i}', 'description': 'Bright flat, close to the station',
+        'price': i, 'latitude': 48.85, 'longitude': 2.35, 'geohash': encode_geohash(48.85, 2.35),
+        'owner_id': owner_id, 'created_at': now, 'updated_at': now,
+    } for i in range(1, count + 1)]
+    db.session.execute(Place.__table__.insert(), rows)
+    db.session.commit()
+
+
+def measure(client, url):
+    """Return (seconds, peak MiB, body bytes) to produce the whole response body"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = client.get(url)
+    size = sum(len(chunk) for chunk in response.response)
+    response.close()
+    elapsed = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5000, 20000, 50000])
+    parser.add_argument('--db', default=None, help='SQLite file (default: temp dir)')
+    args = parser.parse_args()
+
+    largest = max(args.sizes)
+    db_path = args.db or os.path.join(tempfile.gettempdir(), f'hbnb_bench_streaming_{largest}.db')
+
+    from app import create_app, db
+    from app.models.place import Place
+
+    apps = {encoder: create_app(build_config(db_path, encoder)) for encoder in ('json', 'orjson')}
+    with apps['json'].app_context():
+        if db.session.query(Place.id).count() != largest:
+            print(f"Seeding {largest} places into {db_path} ...")
+            db.session.query(Place).delete()
+            db.session.commit()
+            seed(db, largest)
+
+    print(f"{'places':>8} {'mode':18} {'time (s)':>9} {'peak (MiB)':>11} {'body (MiB)':>11}")
+    for size in args.sizes:
+        cases = (
+            ('full, json', apps['json'], f'/api/v1/places/?max_price={size}'),
+            ('full, orjson', apps['orjson'], f'/api/v1/places/?max_price={size}'),
+            ('stream, orjson', apps['orjson'], f'/api/v1/places/?max_price={size}&stream=array'),
+        )
+        for label, app, url in cases:
+            elapsed, peak, body = measure(app.test_client(), url)
+            print(f"{size:8} {label:18} {elapsed:9.2f} {peak:11.1f} {body / 2 ** 20:11.1f}")
+
+
+if __name__ == '__main__':
+    main()
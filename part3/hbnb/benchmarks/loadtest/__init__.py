@@ -0,0 +1,21 @@
+#!/usr/bin/python3
+"""
+Reproducible load tests of the HBnB API.
+
+- datagen:   seeded synthetic dataset (users, amenities, places with their
+             amenity links, reviews) at 10k / 100k / 1m reviews
+- workloads: browse, place_detail, review_submit, login_storm, admin_edits
+- drivers:   in-process WSGI test client, or a real HTTP server
+- report:    throughput / p50 / p99 per workload, JSON reports, comparison
+
+Usage (from part3/hbnb):
+    python -m benchmarks.loadtest generate --scale 100k
+    python -m benchmarks.loadtest run --scale 10k --driver wsgi --output before.json
+    python -m benchmarks.loadtest run --scale 10k --driver server --concurrency 8 \\
+        --workloads browse,place_detail --requests 5000 --output after.json
+    python -m benchmarks.loadtest compare before.json after.json
+
+Same scale, seed and settings give the same database and the same request
+sequence on every commit (thread interleaving aside), so reports of two
+commits can be compared. Run them on the same machine.
+"""
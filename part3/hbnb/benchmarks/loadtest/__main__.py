@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""Command line of the load tests (see benchmarks.loadtest)"""
+
+import argparse
+import sys
+
+from config import Config
+from benchmarks.loadtest import datagen, report
+from benchmarks.loadtest.workloads import WORKLOADS
+
+
+def size(value):
+    """--scale: a datagen.SCALES name or a number of reviews"""
+    if value.lower() in datagen.SCALES:
+        return value.lower()
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected one of {', '.join(datagen.SCALES)} or a number")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.loadtest',
+                                     description='Reproducible load tests of the HBnB API.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def dataset_options(command):
+        command.add_argument('--scale', type=size, default='10k', help='10k, 100k, 1m or a number of reviews')
+        command.add_argument('--seed', type=int, default=42)
+        command.add_argument('--bcrypt-rounds', type=int, default=Config.BCRYPT_LOG_ROUNDS,
+                             help='work factor of the users\' password hash (login cost)')
+        command.add_argument('--data-dir', default=None, help='where generated databases are kept')
+
+    generate = commands.add_parser('generate', help='build the database of a scale (once)')
+    dataset_options(generate)
+
+    run = commands.add_parser('run', help='run workloads and report throughput / p50 / p99')
+    dataset_options(run)
+    run.add_argument('--driver', choices=('wsgi', 'server'), default='wsgi')
+    run.add_argument('--workloads', default=','.join(WORKLOADS),
+                     help=f"comma-separated, among {', '.join(WORKLOADS)}")
+    run.add_argument('--requests', type=int, default=None,
+                     help='measured requests per workload (default: per workload)')
+    run.add_argument('--concurrency', type=int, default=4)
+    run.add_argument('--warmup', type=int, default=20)
+    run.add_argument('--output', help='write the JSON report here')
+
+    compare = commands.add_parser('compare', help='compare two JSON reports')
+    compare.add_argument('base')
+    compare.add_argument('new')
+
+    args = parser.parse_args(argv)
+    if args.command == 'compare':
+        report.compare(report.read(args.base), report.read(args.new))
+        return 0
+
+    from benchmarks.loadtest import runner
+    db_path = runner.prepare_database(args.scale, args.seed, args.bcrypt_rounds, args.data_dir)
+    if args.command == 'generate':
+        print(db_path)
+        return 0
+
+    names = [name.strip() for name in args.workloads.split(',') if name.strip()]
+    unknown = [name for name in names if name not in WORKLOADS]
+    if unknown:
+        parser.error(f"unknown workload(s): {', '.join(unknown)}")
+
+    from app import create_app
+    from benchmarks.loadtest.drivers import HTTPClient, ServerProcess, WSGIClient
+
+    app = create_app(runner.build_config(db_path, args.bcrypt_rounds))
+    dataset = runner.load_dataset(app, args.scale)
+    env = report.environment(scale=args.scale, seed=args.seed, driver=args.driver,
+                             concurrency=args.concurrency, bcrypt_rounds=args.bcrypt_rounds,
+                             warmup=args.warmup)
+    results = {}
+
+    def run_all(client_factory):
+        for name in names:
+            workload = WORKLOADS[name]
+            print(f"running {name} ...", file=sys.stderr)
+            outcome = runner.run_workload(workload, client_factory, dataset,
+                                          args.requests or workload.requests,
+                                          args.concurrency, args.seed, args.warmup)
+            results[name] = report.summarize(outcome)
+
+    if args.driver == 'wsgi':
+        run_all(lambda: WSGIClient(app))
+    else:
+        with ServerProcess(db_path, args.bcrypt_rounds) as server:
+            run_all(lambda: HTTPClient(server.host, server.port))
+
+    print(f"scale={args.scale} seed={args.seed} driver={args.driver} concurrency={args.concurrency} "
+          f"commit={str(env['commit'])[:10]}{' (dirty)' if env['dirty'] else ''}")
+    report.print_table(results)
+    if args.output:
+        report.write(args.output, env, results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
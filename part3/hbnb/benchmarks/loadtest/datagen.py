@@ -0,0 +1,167 @@
+#!/usr/bin/python3
+"""
+Seeded synthetic dataset for the load tests.
+
+The same (size, seed) always produces the same rows, ids included, so runs
+on different commits load identical databases. Sizes are numbers of
+reviews, the biggest table:
+
+    scale   reviews    places   users (+ writers, admin)   amenities
+    10k      10 000       500    1 000 (+100)                     50
+    100k    100 000     5 000   10 000 (+1 000)                   50
+    1m    1 000 000    50 000  100 000 (+1 000)                   50
+
+Each place gets REVIEWS_PER_PLACE reviews from distinct users (never its
+owner), 0 to 5 amenities, and rating aggregates consistent with its
+reviews (what the facade would have maintained). "Writers" are users with
+no review at all: the review_submit workload posts as them without
+hitting the one-review-per-place rule. Every user has the password
+PASSWORD (hashed once, at the app's BCRYPT_LOG_ROUNDS).
+
+Rows are written with Core bulk inserts (no ORM objects, no per-row
+bcrypt): about a minute for the 1m scale.
+"""
+
+import random
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+import bcrypt
+
+SCALES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+REVIEWS_PER_PLACE = 20
+AMENITIES = 50
+PASSWORD = 'benchmark-password'
+ADMIN_EMAIL = 'admin@bench.hbnb'
+BATCH = 10_000
+
+# Creation times are spread from this date on (1 minute apart)
+EPOCH = datetime(2024, 1, 1)
+
+Plan = namedtuple('Plan', ('reviews', 'places', 'users', 'writers', 'amenities'))
+
+
+def plan(size):
+    """
+    Row counts for a dataset of `size` reviews.
+
+    Args:
+        size (int or str): Number of reviews, or a SCALES name
+
+    Returns:
+        Plan: reviews, places, users, writers, amenities
+    """
+    size = SCALES.get(size, size) if isinstance(size, str) else size
+    places = max(size // REVIEWS_PER_PLACE, 1)
+    users = max(size // 10, REVIEWS_PER_PLACE + 1)
+    writers = min(1000, max(10, size // 100))
+    return Plan(places * REVIEWS_PER_PLACE, places, users, writers, AMENITIES)
+
+
+def user_email(index):
+    return f'user{index}@bench.hbnb'
+
+
+def writer_email(index):
+    return f'writer{index}@bench.hbnb'
+
+
+def generate(db, size, seed=42, rounds=12, progress=print):
+    """
+    Insert the dataset into the (empty, migrated) database of the current app context.
+
+    Args:
+        db (SQLAlchemy): Flask-SQLAlchemy instance
+        size (int or str): Number of reviews, or a SCALES name
+        seed (int): Random seed (same seed, same rows)
+        rounds (int): bcrypt work factor of the shared password hash
+        progress (callable): Receives progress messages
+
+    Returns:
+        Plan: What was inserted
+    """
+    from app.models.amenity import Amenity
+    from app.models.place import Place, place_amenity
+    from app.models.review import Review
+    from app.models.user import User
+    from app.utils.geo import encode_geohash
+
+    counts = plan(size)
+    rng = random.Random(seed)
+    password = bcrypt.hashpw(PASSWORD.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+    def new_id():
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    def timestamp(index):
+        return EPOCH + timedelta(minutes=index)
+
+    def insert(table, rows):
+        if rows:
+            db.session.execute(table.insert(), rows)
+
+    # Users: regular users (hosts and reviewers), writers, one admin
+    user_ids = []
+    rows = []
+    people = ([(user_email(i), 'User', str(i), False) for i in range(counts.users)]
+              + [(writer_email(i), 'Writer', str(i), False) for i in range(counts.writers)]
+              + [(ADMIN_EMAIL, 'Admin', 'Bench', True)])
+    for index, (email, first_name, last_name, is_admin) in enumerate(people):
+        user_id = new_id()
+        user_ids.append(user_id)
+        rows.append({'id': user_id, 'first_name': first_name, 'last_name': last_name, 'email': email,
+                     'password': password, 'is_admin': is_admin,
+                     'created_at': timestamp(index), 'updated_at': timestamp(index)})
+        if len(rows) == BATCH:
+            insert(User.__table__, rows)
+            rows = []
+    insert(User.__table__, rows)
+    progress(f"  {len(people)} users")
+
+    amenity_ids = [new_id() for _ in range(counts.amenities)]
+    insert(Amenity.__table__, [
+        {'id': amenity_id, 'name': f'Amenity {i}', 'created_at': EPOCH, 'updated_at': EPOCH}
+        for i, amenity_id in enumerate(amenity_ids)
+    ])
+
+    # Places, each with its links and reviews (aggregates computed on the way)
+    step = counts.users // REVIEWS_PER_PLACE
+    places, links, reviews = [], [], []
+    review_index = 0
+    for p in range(counts.places):
+        place_id = new_id()
+        latitude, longitude = rng.uniform(36.0, 60.0), rng.uniform(-10.0, 30.0)
+        histogram = [0] * 6
+        for k in range(REVIEWS_PER_PLACE):
+            rating = rng.choices((1, 2, 3, 4, 5), weights=(5, 10, 20, 35, 30))[0]
+            histogram[rating] += 1
+            reviewer = (p + 1 + k * step) % counts.users  # distinct, never the owner
+            reviews.append({'id': new_id(), 'text': f'Review {review_index} of place {p}',
+                            'rating': rating, 'user_id': user_ids[reviewer], 'place_id': place_id,
+                            'created_at': timestamp(p + k), 'updated_at': timestamp(p + k)})
+            review_index += 1
+        total = sum(rating * count for rating, count in enumerate(histogram))
+        places.append({
+            'id': place_id, 'title': f'Place {p}', 'description': f'Synthetic place number {p}',
+            'price': rng.randint(20, 500), 'latitude': latitude, 'longitude': longitude,
+            'geohash': encode_geohash(latitude, longitude), 'owner_id': user_ids[p % counts.users],
+            'rating_count': REVIEWS_PER_PLACE, 'rating_sum': total,
+            'rating_avg': total / REVIEWS_PER_PLACE,
+            **{f'rating_{n}': histogram[n] for n in range(1, 6)},
+            'created_at': timestamp(p), 'updated_at': timestamp(p),
+        })
+        links.extend({'place_id': place_id, 'amenity_id': amenity_id}
+                     for amenity_id in rng.sample(amenity_ids, rng.randint(0, 5)))
+        if len(reviews) >= BATCH:
+            insert(Place.__table__, places)
+            insert(place_amenity, links)
+            insert(Review.__table__, reviews)
+            places, links, reviews = [], [], []
+            progress(f"  {p + 1} places, {review_index} reviews")
+    insert(Place.__table__, places)
+    insert(place_amenity, links)
+    insert(Review.__table__, reviews)
+    db.session.commit()
+    progress(f"  {counts.places} places, {review_index} reviews")
+    return counts
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+"""
+How the workloads reach the application.
+
+- wsgi:   Flask test client, in this process. No network, no server: the
+          cost of the app itself (routing, views, ORM, serialization)
+- server: a real HTTP server (werkzeug, threaded) in a child process,
+          driven over keep-alive HTTP connections. Adds parsing, sockets
+          and the server's threads, like production
+
+Both expose request(method, path, json=None, headers=None) -> (status,
+headers), one client per load thread. Bodies are always read in full.
+"""
+
+import http.client
+import json as jsonlib
+import logging
+import multiprocessing
+import socket
+import time
+
+
+class WSGIClient:
+    """In-process client: Flask's test client"""
+
+    def __init__(self, app):
+        self._client = app.test_client()
+
+    def request(self, method, path, json=None, headers=None):
+        response = self._client.open(path, method=method, json=json, headers=headers)
+        response.get_data()
+        status, response_headers = response.status_code, response.headers
+        response.close()
+        return status, response_headers
+
+
+class HTTPClient:
+    """One keep-alive HTTP/1.1 connection to the benchmark server"""
+
+    def __init__(self, host, port):
+        self._address = (host, port)
+        self._connection = http.client.HTTPConnection(host, port, timeout=60)
+
+    def request(self, method, path, json=None, headers=None):
+        headers = dict(headers or {})
+        body = None
+        if json is not None:
+            body = jsonlib.dumps(json)
+            headers['Content-Type'] = 'application/json'
+        try:
+            return self._send(method, path, body, headers)
+        except (http.client.HTTPException, ConnectionError):
+            # The server closed the idle connection: reconnect once
+            self._connection.close()
+            self._connection = http.client.HTTPConnection(*self._address, timeout=60)
+            return self._send(method, path, body, headers)
+
+    def _send(self, method, path, body, headers):
+        self._connection.request(method, path, body=body, headers=headers)
+        response = self._connection.getresponse()
+        response.read()
+        return response.status, response.headers
+
+    def close(self):
+        self._connection.close()
+
+
+class ServerProcess:
+    """
+    The application served by werkzeug (threaded) in a child process.
+
+    Usage:
+        >>> with ServerProcess(db_path, rounds=12) as server:
+        ...     client = HTTPClient(server.host, server.port)
+    """
+
+    def __init__(self, db_path, rounds, host='127.0.0.1'):
+        self.host = host
+        self.port = _free_port(host)
+        # spawn: a clean interpreter (no engine or threads inherited by fork)
+        self._process = multiprocessing.get_context('spawn').Process(
+            target=serve, args=(db_path, rounds, host, self.port), daemon=True)
+
+    def __enter__(self):
+        self._process.start()
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection((self.host, self.port), timeout=1).close()
+                return self
+            except OSError:
+                if not self._process.is_alive():
+                    raise RuntimeError('The benchmark server exited during startup')
+                time.sleep(0.1)
+        raise RuntimeError('The benchmark server did not start within 60 s')
+
+    def __exit__(self, *exc):
+        self._process.terminate()
+        self._process.join(10)
+
+
+def serve(db_path, rounds, host, port):
+    """Child process: create the app on db_path and serve it until terminated"""
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    from app import create_app
+    from benchmarks.loadtest.runner import build_config
+
+    class QuietHandler(WSGIRequestHandler):
+        """HTTP/1.1 (keep-alive) and no access log line per request"""
+        protocol_version = 'HTTP/1.1'
+
+        def log_request(self, *args, **kwargs):
+            pass
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    app = create_app(build_config(db_path, rounds))
+    make_server(host, port, app, threaded=True, request_handler=QuietHandler).serve_forever()
+
+
+def _free_port(host):
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+"""
+Load test reports: summary per workload, JSON files, comparisons.
+
+A report file holds the environment (commit, Python, scale, driver,
+concurrency...) and, per workload: requests, errors (unexpected statuses),
+throughput (requests/s), p50, p99, mean and max latency (ms). Percentiles
+are nearest-rank on all measured requests.
+
+Two reports of the same scale, driver and concurrency (on two commits)
+can be compared with `python -m benchmarks.loadtest compare A.json B.json`.
+"""
+
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an ascending list"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(run):
+    """
+    Args:
+        run (Run): Result of runner.run_workload
+
+    Returns:
+        dict: requests, errors, error_statuses, throughput, p50_ms, p99_ms, mean_ms, max_ms
+    """
+    ordered = sorted(run.latencies)
+    count = len(ordered)
+    return {
+        'requests': count,
+        'errors': sum(run.unexpected.values()),
+        'error_statuses': dict(run.unexpected),
+        'throughput': round(count / run.elapsed, 1) if run.elapsed else 0.0,
+        'p50_ms': round(percentile(ordered, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(ordered, 0.99) * 1000, 3),
+        'mean_ms': round(sum(ordered) / count * 1000, 3) if count else 0.0,
+        'max_ms': round(ordered[-1] * 1000, 3) if count else 0.0,
+    }
+
+
+def environment(**settings):
+    """What a result depends on: code version, interpreter, machine, run settings"""
+    return {
+        'commit': _git('rev-parse', 'HEAD'),
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': _cpus(),
+        **settings,
+    }
+
+
+def print_table(results, out=sys.stdout):
+    out.write(f"{'workload':<14} {'requests':>8} {'errors':>6} {'req/s':>9} "
+              f"{'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}\n")
+    for name, r in results.items():
+        out.write(f"{name:<14} {r['requests']:>8} {r['errors']:>6} {r['throughput']:>9.1f} "
+                  f"{r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['max_ms']:>9.2f}\n")
+        if r['error_statuses']:
+            out.write(f"{'':<14} unexpected statuses: {r['error_statuses']}\n")
+
+
+def write(path, env, results):
+    with open(path, 'w') as file:
+        json.dump({'environment': env, 'results': results}, file, indent=2, sort_keys=True)
+
+
+def read(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(base, new, out=sys.stdout):
+    """
+    Print the change of every metric from report `base` to report `new`.
+
+    Differences in the run settings (scale, driver, concurrency, machine)
+    are listed first: such reports measure different things.
+    """
+    base_env, new_env = base['environment'], new['environment']
+    for key in ('scale', 'seed', 'driver', 'concurrency', 'bcrypt_rounds', 'cpus', 'python'):
+        if base_env.get(key) != new_env.get(key):
+            out.write(f"warning: {key} differs ({base_env.get(key)} vs {new_env.get(key)})\n")
+    out.write(f"base {str(base_env.get('commit'))[:10]}  new {str(new_env.get('commit'))[:10]}\n")
+    out.write(f"{'workload':<14} {'metric':<10} {'base':>10} {'new':>10} {'change':>8}\n")
+    for name, new_result in new['results'].items():
+        base_result = base['results'].get(name)
+        if base_result is None:
+            continue
+        for metric in ('throughput', 'p50_ms', 'p99_ms', 'errors'):
+            old, value = base_result[metric], new_result[metric]
+            change = f"{(value - old) / old * 100:+.1f}%" if old else ''
+            out.write(f"{name:<14} {metric:<10} {old:>10} {value:>10} {change:>8}\n")
+
+
+def _git(*args):
+    try:
+        return subprocess.run(('git',) + args, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not on Linux
+        return os.cpu_count()
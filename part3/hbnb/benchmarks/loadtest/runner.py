@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+"""
+Database preparation and the load loop.
+
+The generated database is built once per (size, seed, bcrypt rounds) and
+kept in the data directory; every run works on a fresh copy of it, so the
+write workloads (review_submit, admin_edits) always start from the same
+state.
+
+A run of a workload: `warmup` operations on one thread (not measured),
+then `requests` operations shared by `concurrency` threads, each with its
+own client and its own random generator (seeded from the run seed and the
+thread number). Operation numbers come from one shared counter.
+"""
+
+import itertools
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from collections import Counter, namedtuple
+
+from config import Config
+from benchmarks.loadtest import datagen
+
+Dataset = namedtuple('Dataset', ('place_ids', 'amenity_ids', 'users', 'writer_tokens', 'admin_token'))
+Run = namedtuple('Run', ('latencies', 'unexpected', 'elapsed'))
+
+
+def build_config(db_path, rounds):
+    """Config class of the application under test"""
+    class LoadTestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        AUTO_MIGRATE = True
+        BCRYPT_LOG_ROUNDS = rounds
+    return LoadTestConfig
+
+
+def prepare_database(size, seed, rounds, data_dir=None, progress=print):
+    """
+    Generate the dataset (once) and return the path of a fresh copy.
+
+    Args:
+        size (int or str): Number of reviews, or a datagen.SCALES name
+        seed (int): Dataset seed
+        rounds (int): bcrypt work factor of the users' password hash
+        data_dir (str): Where databases are kept (default: the temp directory)
+
+    Returns:
+        str: SQLite file to run against
+    """
+    from app import create_app, db
+
+    data_dir = data_dir or tempfile.gettempdir()
+    counts = datagen.plan(size)
+    base = os.path.join(data_dir, f'hbnb_loadtest_{counts.reviews}_{seed}_r{rounds}.db')
+    if not os.path.exists(base + '.done'):
+        if os.path.exists(base):
+            os.remove(base)
+        progress(f"Generating {counts.reviews} reviews (seed {seed}) into {base} ...")
+        app = create_app(build_config(base, rounds))
+        with app.app_context():
+            datagen.generate(db, size, seed, rounds, progress)
+            db.engine.dispose()
+        open(base + '.done', 'w').close()
+
+    run_path = base[:-len('.db')] + '.run.db'
+    shutil.copyfile(base, run_path)
+    return run_path
+
+
+def load_dataset(app, size):
+    """Ids and JWTs the workloads need, read from the database under test"""
+    from flask_jwt_extended import create_access_token
+    from sqlalchemy import select
+
+    from app import db
+    from app.models.amenity import Amenity
+    from app.models.place import Place
+    from app.models.user import User
+
+    counts = datagen.plan(size)
+    with app.app_context():
+        place_ids = db.session.scalars(select(Place.id).order_by(Place.created_at, Place.id)).all()
+        amenity_ids = db.session.scalars(select(Amenity.id).order_by(Amenity.id)).all()
+        by_email = dict(db.session.execute(select(User.email, User.id)).all())
+        writer_tokens = [
+            create_access_token(identity=by_email[datagen.writer_email(i)], additional_claims={'is_admin': False})
+            for i in range(counts.writers)
+        ]
+        admin_token = create_access_token(identity=by_email[datagen.ADMIN_EMAIL],
+                                          additional_claims={'is_admin': True})
+        db.session.remove()
+    return Dataset(place_ids, amenity_ids, counts.users, writer_tokens, admin_token)
+
+
+def run_workload(workload, client_factory, dataset, requests, concurrency, seed, warmup=20):
+    """
+    Run one workload.
+
+    Args:
+        workload (Workload): What to run
+        client_factory (callable): Returns a new client (one per thread)
+        dataset (Dataset): Ids and tokens
+        requests (int): Measured operations
+        concurrency (int): Load threads
+        seed (int): Seed of the threads' random generators
+        warmup (int): Unmeasured operations run first
+
+    Returns:
+        Run: latencies (seconds), unexpected statuses (Counter), elapsed (seconds)
+    """
+    client = client_factory()
+    state, rng = {}, random.Random(seed)
+    for index in range(warmup):
+        workload.operation(client, dataset, state, rng, index)
+
+    counter = itertools.count(warmup)
+    last = warmup + requests
+    latencies = [[] for _ in range(concurrency)]
+    unexpected = [Counter() for _ in range(concurrency)]
+
+    def worker(number):
+        client = client_factory()
+        state, rng = {}, random.Random(seed * 1000 + number + 1)
+        times, statuses = latencies[number], unexpected[number]
+        while True:
+            index = next(counter)
+            if index >= last:
+                return
+            started = time.perf_counter()
+            try:
+                status = workload.operation(client, dataset, state, rng, index)
+            except Exception as e:  # a failed request is a result, not a crash
+                status = type(e).__name__
+            times.append(time.perf_counter() - started)
+            if status != workload.expected:
+                statuses[str(status)] += 1
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return Run([t for times in latencies for t in times], sum(unexpected, Counter()), elapsed)
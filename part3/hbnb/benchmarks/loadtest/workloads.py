@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+"""
+Scripted workloads: each operation is one HTTP request.
+
+    browse         GET /places/ pages: newest, best rated, price range,
+                   amenity filter, radius search, next page by cursor
+    place_detail   GET /places/<id> (70%) or its reviews (30%)
+    review_submit  POST /places/<id>/reviews as a writer (JWT), every
+                   (writer, place) pair once: 201 every time
+    login_storm    POST /auth/login of random users (bcrypt verification)
+    admin_edits    PUT /places/<id> (80%) and PUT /amenities/<id> (20%)
+                   as the admin
+
+An operation gets (client, dataset, state, rng, index): state is a dict
+private to the load thread (e.g. the last page cursor), index the
+operation number within the run. It returns the status code, counted as
+an error unless it is the workload's expected status.
+"""
+
+from collections import namedtuple
+from urllib.parse import quote
+
+from benchmarks.loadtest.datagen import PASSWORD, user_email
+
+Workload = namedtuple('Workload', ('name', 'requests', 'expected', 'operation'))
+
+
+def browse(client, dataset, state, rng, _index):
+    # The next page repeats the query of the page it follows (cursors are
+    # tied to their sort and filters)
+    query, cursor = state.get('query'), state.get('cursor')
+    if cursor and rng.random() < 0.3:
+        path = f'{query}&cursor={quote(cursor)}'
+    else:
+        choice = rng.random()
+        if choice < 0.3:
+            query = '/api/v1/places/?limit=20'
+        elif choice < 0.5:
+            query = '/api/v1/places/?limit=20&sort=-rating'
+        elif choice < 0.7:
+            low = rng.randrange(20, 400)
+            query = f'/api/v1/places/?limit=20&min_price={low}&max_price={low + 50}'
+        elif choice < 0.85:
+            query = f'/api/v1/places/?limit=20&amenities={rng.choice(dataset.amenity_ids)}'
+        else:
+            query = (f'/api/v1/places/nearby?lat={rng.uniform(40.0, 56.0):.4f}'
+                     f'&lon={rng.uniform(-5.0, 25.0):.4f}&radius_km=50&limit=20')
+        path = query
+    status, headers = client.request('GET', path)
+    state['query'], state['cursor'] = query, headers.get('X-Next-Cursor')
+    return status
+
+
+def place_detail(client, dataset, _state, rng, _index):
+    place_id = rng.choice(dataset.place_ids)
+    if rng.random() < 0.7:
+        return client.request('GET', f'/api/v1/places/{place_id}')[0]
+    return client.request('GET', f'/api/v1/places/{place_id}/reviews')[0]
+
+
+def review_submit(client, dataset, _state, rng, index):
+    writers = len(dataset.writer_tokens)
+    token = dataset.writer_tokens[index % writers]
+    place_id = dataset.place_ids[(index // writers) % len(dataset.place_ids)]
+    return client.request('POST', f'/api/v1/places/{place_id}/reviews',
+                          json={'text': f'Benchmark review number {index}', 'rating': rng.randint(1, 5)},
+                          headers={'Authorization': f'Bearer {token}'})[0]
+
+
+def login_storm(client, dataset, _state, rng, _index):
+    email = user_email(rng.randrange(dataset.users))
+    return client.request('POST', '/api/v1/auth/login', json={'email': email, 'password': PASSWORD})[0]
+
+
+def admin_edits(client, dataset, _state, rng, index):
+    headers = {'Authorization': f'Bearer {dataset.admin_token}'}
+    if rng.random() < 0.8:
+        place_id = rng.choice(dataset.place_ids)
+        return client.request('PUT', f'/api/v1/places/{place_id}',
+                              json={'title': f'Edited place {index}', 'price': rng.randint(20, 500)},
+                              headers=headers)[0]
+    amenity = rng.randrange(len(dataset.amenity_ids))
+    return client.request('PUT', f'/api/v1/amenities/{dataset.amenity_ids[amenity]}',
+                          json={'name': f'Amenity {amenity} rev {index}'}, headers=headers)[0]
+
+
+# Default number of requests per run (bcrypt makes logins ~1000x slower)
+WORKLOADS = {w.name: w for w in (
+    Workload('browse', 2000, 200, browse),
+    Workload('place_detail', 2000, 200, place_detail),
+    Workload('review_submit', 1000, 201, review_submit),
+    Workload('login_storm', 50, 200, login_storm),
+    Workload('admin_edits', 1000, 200, admin_edits),
+)}
@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 """
 Flask configuration classes for different environments.
-Provides base config (Config) and environment-specific configs (DevelopmentConfig, ProductionConfig).
+Provides base config (Config) and environment-specific configs (DevelopmentConfig, TestingConfig).
 Uses environment variables for sensitive data (SECRET_KEY, JWT_SECRET_KEY, DATABASE_URL).
 """
 
@@ -26,12 +26,91 @@ class Config:
     # Database URI (defaults to SQLite in development)
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///hbnb_dev.db')
     
+    # Connection pool (see app.persistence.pool; not used by in-memory SQLite)
+    # A request waiting DB_POOL_TIMEOUT seconds for a connection gets 503
+    # instead of holding its worker; DB_POOL_RECYCLE stays below the server's
+    # idle timeout (MySQL wait_timeout, proxies) and pre-ping catches the rest
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 3.0))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', '1') == '1'
+
+    # SQLite profile: PRAGMAs sent on every new connection, in this order
+    # (see app.persistence.sqlite_profile; foreign_keys=ON is always sent)
+    # WAL lets readers run while a review is being written
+    SQLITE_PRAGMAS = {
+        'busy_timeout': 5000,       # ms to wait for a lock before "database is locked"
+        'journal_mode': 'WAL',      # readers and the writer never block each other
+        'synchronous': 'NORMAL',    # fsync at WAL checkpoints, not at every commit
+        'foreign_keys': 'ON',       # ON DELETE CASCADE
+        'cache_size': -65536,       # 64 MiB page cache per connection (negative: KiB)
+        'mmap_size': 268435456,     # 256 MiB of the file read through a memory map
+        'temp_store': 'MEMORY',     # sorts and temporary indexes in memory
+    }
+    
     # Disable SQLAlchemy event system (saves memory, prevents deprecation warnings)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
     # Debug mode (disabled by default, enabled in DevelopmentConfig)
     DEBUG = False
 
+    # Keyset pagination on list endpoints (GET /places/?limit=&cursor=)
+    # Clients asking for more than PAGE_MAX_LIMIT rows get PAGE_MAX_LIMIT rows
+    PAGE_DEFAULT_LIMIT = 20
+    PAGE_MAX_LIMIT = 100
+
+    # bcrypt work factor (2^N rounds). Existing hashes with another cost
+    # are upgraded at the next successful login
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+
+    # Password hashing pool: BCRYPT_POOL_SIZE concurrent hashes, BCRYPT_QUEUE_DEPTH
+    # waiting; beyond that requests get 503 instead of blocking the web workers
+    BCRYPT_POOL_SIZE = int(os.getenv('BCRYPT_POOL_SIZE', 4))
+    BCRYPT_QUEUE_DEPTH = int(os.getenv('BCRYPT_QUEUE_DEPTH', 16))
+    BCRYPT_TIMEOUT = 10.0  # seconds a request waits for its hash
+
+    # Maximum number of places in one POST /places/batch request
+    PLACE_BATCH_MAX_SIZE = 10000
+
+    # JSON encoder of API responses: 'auto' (orjson when installed), 'orjson' or 'json'
+    JSON_ENCODER = os.getenv('JSON_ENCODER', 'auto')
+
+    # Rows fetched and encoded per chunk by streamed lists (?stream=array|ndjson)
+    STREAM_BATCH_SIZE = 500
+
+    # Largest radius accepted by GET /places/nearby (kilometers)
+    NEARBY_MAX_RADIUS_KM = 500
+
+    # Read-through cache of serialized entities (GET /<resource>/<id>)
+    # ENTITY_CACHE_SIZE = 0 disables it; the TTL bounds staleness across workers
+    ENTITY_CACHE_SIZE = int(os.getenv('ENTITY_CACHE_SIZE', 1024))
+    ENTITY_CACHE_TTL = float(os.getenv('ENTITY_CACHE_TTL', 60))
+
+    # Minimum delay between two reloads of the amenity catalog triggered by
+    # unknown amenity ids (amenities created by another worker)
+    AMENITY_CATALOG_RELOAD_INTERVAL = 1.0
+
+    # Change feeds (?updated_since=, /changes/deleted): the X-Sync-Since header
+    # to resume from lies CHANGE_FEED_LAG seconds before the request, which
+    # must exceed the longest transaction (see app.utils.change_feed)
+    CHANGE_FEED_LAG = float(os.getenv('CHANGE_FEED_LAG', 5.0))
+
+    # Per-request SQL statistics (Server-Timing header, 'hbnb.sql' log lines)
+    # Requests running more than SQL_QUERY_WARN_THRESHOLD statements are
+    # logged as warnings (N+1 patterns); 0 disables the flag
+    SQL_STATS = os.getenv('SQL_STATS', '1') == '1'
+    SQL_QUERY_WARN_THRESHOLD = int(os.getenv('SQL_QUERY_WARN_THRESHOLD', 20))
+
+    # Prometheus metrics of this process (see app.utils.metrics)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', '1') == '1'
+    METRICS_PATH = '/metrics'
+
+    # Apply pending schema migrations at startup (see app.persistence.migrations)
+    # Off in production: deploys run `flask db upgrade` once, workers only
+    # check the schema version and answer 503 while it is out of date
+    AUTO_MIGRATE = os.getenv('AUTO_MIGRATE', '0') == '1'
+
 
 class DevelopmentConfig(Config):
     """
@@ -40,10 +119,23 @@ class DevelopmentConfig(Config):
     """
     DEBUG = True  # Enable Flask debug mode (detailed error pages, auto-reload)
     SQLALCHEMY_ECHO = True  # Print all SQL queries to console (for debugging)
+    AUTO_MIGRATE = True  # Bring hbnb_dev.db up to date on start
+
+
+class TestingConfig(Config):
+    """
+    Testing environment configuration.
+    Uses a private in-memory SQLite database so tests never touch hbnb_dev.db.
+    """
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    BCRYPT_LOG_ROUNDS = 4  # Minimum cost: fast test suite
+    AUTO_MIGRATE = True  # Each in-memory database starts empty
 
 
 # Configuration dictionary (maps environment name to config class)
 config = {
     'development': DevelopmentConfig,
+    'testing': TestingConfig,
     'default': DevelopmentConfig
 }
\ No newline at end of file
@@ -0,0 +1,100 @@
+import unittest
+from sqlalchemy import event, text
+from flask_jwt_extended import create_access_token
+from app import create_app, db, amenity_catalog
+from app.models.user import User
+from config import TestingConfig
+
+
+class TestAmenityCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            admin = User(first_name="Admin", last_name="Root", email="admin@example.com",
+                         password="securepassword123", is_admin=True)
+            db.session.add(admin)
+            db.session.commit()
+            self.admin_id = admin.id
+            token = create_access_token(identity=admin.id, additional_claims={"is_admin": True})
+        self.headers = {'Authorization': f'Bearer {token}'}
+
+    def _create_amenity(self, name):
+        return self.client.post('/api/v1/amenities/', json={'name': name}, headers=self.headers)
+
+    def _create_place(self, amenities):
+        return self.client.post('/api/v1/places/', headers=self.headers, json={
+            'title': 'Loft', 'price': 80.0, 'latitude': 48.85, 'longitude': 2.35,
+            'owner_id': self.admin_id, 'amenities': amenities})
+
+    def test_duplicate_name_is_case_insensitive(self):
+        self.assertEqual(self._create_amenity('WiFi').status_code, 201)
+        self.assertEqual(self._create_amenity(' wifi ').status_code, 409)
+
+    def test_rename_updates_both_maps(self):
+        wifi_id = self._create_amenity('WiFi').get_json()['id']
+        self._create_amenity('Pool')
+        response = self.client.put(f'/api/v1/amenities/{wifi_id}', json={'name': 'pool'},
+                                   headers=self.headers)
+        self.assertEqual(response.status_code, 409)
+        response = self.client.put(f'/api/v1/amenities/{wifi_id}', json={'name': 'Fiber'},
+                                   headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        with self.app.app_context():
+            self.assertIsNone(amenity_catalog.id_for_name('wifi'))
+            self.assertEqual(amenity_catalog.id_for_name('FIBER'), wifi_id)
+
+    def test_place_amenity_validation_uses_catalog(self):
+        wifi_id = self._create_amenity('WiFi').get_json()['id']
+        statements = []
+        with self.app.app_context():
+            engine = db.engine
+            event.listen(engine, 'before_cursor_execute',
+                         lambda conn, cursor, statement, *args: statements.append(statement))
+            self.assertEqual(amenity_catalog.unknown_ids([wifi_id]), [])
+            version = amenity_catalog.version
+        self.assertEqual(statements, [])
+
+        response = self._create_place([wifi_id])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([a['id'] for a in response.get_json()['amenities']], [wifi_id])
+        self.assertEqual(self._create_place(['missing-id']).status_code, 400)
+
+        self.client.delete(f'/api/v1/amenities/{wifi_id}', headers=self.headers)
+        with self.app.app_context():
+            self.assertGreater(amenity_catalog.version, version)
+            amenity_catalog.reload_interval = 3600
+            self.assertEqual(amenity_catalog.unknown_ids([wifi_id]), [wifi_id])
+
+    def test_savepoint_rollback_keeps_outer_changes(self):
+        from app import facade
+        wifi_id = self._create_amenity('WiFi').get_json()['id']
+        with self.app.app_context():
+            amenity_catalog.reload_interval = 3600
+            with facade.transaction():
+                facade.update_amenity(wifi_id, {'name': 'Fiber'})
+                with db.session.begin_nested() as savepoint:
+                    savepoint.rollback()
+            self.assertEqual(amenity_catalog.id_for_name('fiber'), wifi_id)
+            self.assertIsNone(amenity_catalog.id_for_name('wifi'))
+            # Changes made inside the rolled-back savepoint are not applied
+            with facade.transaction():
+                facade.update_amenity(wifi_id, {'name': 'Cable'})
+                with db.session.begin_nested() as savepoint:
+                    facade.update_amenity(wifi_id, {'name': 'Satellite'})
+                    savepoint.rollback()
+            self.assertEqual(amenity_catalog.id_for_name('cable'), wifi_id)
+            self.assertIsNone(amenity_catalog.id_for_name('satellite'))
+
+    def test_unknown_id_reloads_catalog(self):
+        with self.app.app_context():
+            self.assertEqual(amenity_catalog.unknown_ids(['external']), ['external'])
+            # Written by "another process": invisible to the session hooks
+            db.session.execute(text(
+                "INSERT INTO amenities (id, name, created_at, updated_at) "
+                "VALUES ('external', 'Sauna', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"))
+            db.session.commit()
+            amenity_catalog.reload_interval = 0
+            self.assertEqual(amenity_catalog.unknown_ids(['external']), [])
+            self.assertEqual(amenity_catalog.name_for_id('external'), 'Sauna')
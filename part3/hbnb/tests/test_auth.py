@@ -0,0 +1,57 @@
+import unittest
+import bcrypt
+from app import create_app, db, bcrypt_pool
+from app.models.user import User
+from config import TestingConfig
+
+
+class TestLogin(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            user = User(first_name="Jane", last_name="Doe",
+                        email="jane@example.com", password="securepassword123")
+            db.session.add(user)
+            db.session.commit()
+            self.user_id = user.id
+
+    def _login(self, password="securepassword123"):
+        return self.client.post('/api/v1/auth/login',
+                                json={'email': 'jane@example.com', 'password': password})
+
+    def _stored_hash(self):
+        with self.app.app_context():
+            return db.session.get(User, self.user_id).password
+
+    def test_login(self):
+        self.assertEqual(self._login().status_code, 200)
+        self.assertEqual(self._login('wrong-password').status_code, 401)
+
+    def test_hash_uses_configured_work_factor(self):
+        self.assertTrue(self._stored_hash().startswith('$2b$04$'))
+
+    def test_outdated_hash_is_upgraded_on_login(self):
+        old = bcrypt.hashpw(b"securepassword123", bcrypt.gensalt(5)).decode()
+        with self.app.app_context():
+            db.session.get(User, self.user_id).password = old
+            db.session.commit()
+        self.assertEqual(self._login().status_code, 200)
+        self.assertTrue(self._stored_hash().startswith('$2b$04$'))
+        self.assertEqual(self._login().status_code, 200)
+
+    def test_saturated_pool_returns_503(self):
+        # Take every slot of the pool (running + queued jobs)
+        taken = 0
+        while bcrypt_pool._slots.acquire(blocking=False):
+            taken += 1
+        try:
+            response = self._login()
+        finally:
+            for _ in range(taken):
+                bcrypt_pool._slots.release()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers['Retry-After'], '1')
+        self.assertEqual(bcrypt_pool.stats()['rejected'], 1)
+        self.assertEqual(self._login().status_code, 200)
@@ -0,0 +1,114 @@
+import unittest
+from unittest import mock
+from sqlalchemy import event
+from app import create_app, db, entity_cache
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from config import TestingConfig
+
+
+class TestEntityCache(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        from app import facade
+        self.facade = facade
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            guest = User(first_name="Guest", last_name="Doe",
+                         email="guest@example.com", password="securepassword123")
+            db.session.add_all([owner, guest])
+            db.session.flush()
+            place = Place(title="Loft", price=80.0, latitude=48.85,
+                          longitude=2.35, owner_id=owner.id)
+            db.session.add(place)
+            db.session.commit()
+            self.owner_id, self.guest_id, self.place_id = owner.id, guest.id, place.id
+
+    def _get_place(self):
+        response = self.client.get(f'/api/v1/places/{self.place_id}')
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_repeated_reads_do_not_query_the_database(self):
+        self._get_place()
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', before_execute)
+        try:
+            for _ in range(3):
+                self._get_place()
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_execute)
+        self.assertEqual(statements, [])
+        # Each GET reads the cached version (ETag), then the snapshot
+        self.assertEqual(entity_cache.stats()['hits'], 7)
+        self.assertEqual(entity_cache.stats()['misses'], 1)
+
+    def test_update_invalidates_snapshot(self):
+        self._get_place()
+        with self.app.app_context():
+            self.facade.update_place(self.place_id, {'title': 'Renovated loft'})
+        self.assertEqual(self._get_place()['title'], 'Renovated loft')
+
+    def test_embedded_entity_change_invalidates_snapshot(self):
+        self._get_place()
+        with self.app.app_context():
+            db.session.get(User, self.owner_id).update({'first_name': 'Renamed'})
+            db.session.commit()
+        self.assertEqual(self._get_place()['owner']['first_name'], 'Renamed')
+
+    def test_new_child_invalidates_parent(self):
+        self.assertEqual(self._get_place()['reviews'], [])
+        with self.app.app_context():
+            db.session.add(Review(text="Lovely", rating=5,
+                                  user_id=self.guest_id, place_id=self.place_id))
+            db.session.commit()
+        self.assertEqual(len(self._get_place()['reviews']), 1)
+
+    def test_rollback_keeps_snapshot(self):
+        self._get_place()
+        with self.app.app_context():
+            db.session.get(Place, self.place_id).title = 'Never committed'
+            db.session.flush()
+            db.session.rollback()
+        self.assertEqual(self._get_place()['title'], 'Loft')
+        self.assertEqual(entity_cache.stats()['misses'], 1)
+
+    def test_savepoint_rollback_keeps_outer_invalidations(self):
+        from app.services.facade import DuplicateReviewError
+        review = {'text': 'Lovely', 'rating': 5, 'user_id': self.guest_id, 'place_id': self.place_id}
+        with self.app.app_context():
+            self.facade.create_review(review)
+            self.assertEqual(self.facade.get_user_dict(self.guest_id)['first_name'], 'Guest')
+            with self.facade.transaction():
+                self.facade.update_user(self.guest_id, {'first_name': 'Renamed'})
+                with self.assertRaises(DuplicateReviewError):
+                    self.facade.create_review(review)
+            self.assertEqual(self.facade.get_user_dict(self.guest_id)['first_name'], 'Renamed')
+
+    def test_lru_eviction_and_ttl(self):
+        with mock.patch.object(entity_cache, 'max_size', 1):
+            self._get_place()
+            self.client.get(f'/api/v1/users/{self.owner_id}')
+            self.assertEqual(entity_cache.stats()['evictions'], 1)
+            self.assertEqual(entity_cache.stats()['size'], 1)
+
+        with mock.patch('app.persistence.cache.time.monotonic',
+                        return_value=10 ** 9):
+            self._get_place()
+        self.assertEqual(entity_cache.stats()['misses'], 3)
+
+    def test_snapshots_are_detached_copies(self):
+        with self.app.app_context():
+            snapshot = self.facade.get_place_dict(self.place_id)
+            snapshot['title'] = 'Mutated by caller'
+            self.assertEqual(self.facade.get_place_dict(self.place_id)['title'], 'Loft')
@@ -0,0 +1,105 @@
+import unittest
+from sqlalchemy import event, text
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place, place_amenity
+from app.models.review import Review
+from app.models.amenity import Amenity
+from app.models.tombstone import Tombstone
+from config import TestingConfig
+
+
+class TestDatabaseCascades(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        from app import facade
+        self.facade = facade
+        self.client = self.app.test_client()
+
+    def _seed(self, places, reviews_per_place):
+        """A host with `places` places, each reviewed by `reviews_per_place` guests"""
+        with self.app.app_context():
+            host = User(first_name="Host", last_name="Smith",
+                        email="host@example.com", password="securepassword123")
+            wifi = Amenity(name="WiFi")
+            guests = [User(first_name="Guest", last_name=f"N{i}",
+                           email=f"guest{i}@example.com", password="securepassword123")
+                      for i in range(reviews_per_place)]
+            db.session.add_all([host, wifi, *guests])
+            db.session.flush()
+            place_ids, review_ids = [], []
+            for i in range(places):
+                place = Place(title=f"Place {i}", price=50.0, latitude=48.0,
+                              longitude=2.0, owner_id=host.id)
+                place.amenities.append(wifi)
+                db.session.add(place)
+                db.session.flush()
+                place_ids.append(place.id)
+                for guest in guests:
+                    review = Review(text="Lovely", rating=4, user_id=guest.id, place_id=place.id)
+                    db.session.add(review)
+                    db.session.flush()
+                    review_ids.append(review.id)
+            db.session.commit()
+            return host.id, wifi.id, place_ids, review_ids
+
+    def _count_statements(self, func):
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+            event.listen(engine, 'before_cursor_execute', before_execute)
+            try:
+                func()
+            finally:
+                event.remove(engine, 'before_cursor_execute', before_execute)
+        return statements
+
+    def test_foreign_keys_enabled(self):
+        with self.app.app_context():
+            self.assertEqual(db.session.execute(text('PRAGMA foreign_keys')).scalar(), 1)
+
+    def test_delete_user_statement_count_does_not_grow(self):
+        counts = []
+        for places, reviews in ((1, 1), (4, 6)):
+            self.setUp()
+            host_id, _wifi_id, _place_ids, _review_ids = self._seed(places, reviews)
+            statements = self._count_statements(lambda: self.facade.delete_user(host_id))
+            # No review or place is ever loaded as an ORM object
+            self.assertFalse([s for s in statements if s.startswith('SELECT reviews.text')])
+            counts.append(len(statements))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_delete_user_removes_descendants_and_writes_tombstones(self):
+        host_id, wifi_id, place_ids, review_ids = self._seed(2, 3)
+        # Cache the snapshot of a review written by another user on the host's place
+        self.assertEqual(self.client.get(f'/api/v1/{review_ids[0]}').status_code, 200)
+        with self.app.app_context():
+            self.assertTrue(self.facade.delete_user(host_id))
+            self.assertEqual(db.session.query(Place).count(), 0)
+            self.assertEqual(db.session.query(Review).count(), 0)
+            self.assertEqual(db.session.execute(place_amenity.select()).all(), [])
+            self.assertIsNotNone(db.session.get(Amenity, wifi_id))
+            tombstones = {(t.entity_type, t.entity_id) for t in db.session.query(Tombstone)}
+        expected = {('users', host_id)} | {('places', p) for p in place_ids} | {('reviews', r) for r in review_ids}
+        self.assertEqual(tombstones, expected)
+        self.assertEqual(self.client.get(f'/api/v1/{review_ids[0]}').status_code, 404)
+
+    def test_delete_place_and_amenity(self):
+        host_id, wifi_id, place_ids, review_ids = self._seed(2, 2)
+        with self.app.app_context():
+            self.assertTrue(self.facade.delete_place(place_ids[0]))
+            self.assertEqual(db.session.query(Review).count(), 2)
+            self.assertTrue(self.facade.delete_amenity(wifi_id))
+            self.assertEqual(db.session.execute(place_amenity.select()).all(), [])
+            self.assertIsNotNone(db.session.get(Place, place_ids[1]))
+            self.assertFalse(self.facade.delete_place(place_ids[0]))
+        self.assertEqual(self.client.get(f'/api/v1/places/{place_ids[1]}').get_json()['amenities'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+from datetime import datetime, timedelta
+from sqlalchemy import inspect
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from app.models.tombstone import Tombstone
+from app.utils.timestamps import iso_timestamp
+from config import TestingConfig
+
+OLD = datetime(2020, 1, 1)
+SINCE = '2023-01-01T00:00:00Z'
+
+
+class TestChangeFeed(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        from app import facade
+        self.facade = facade
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            guest = User(first_name="Guest", last_name="Doe",
+                         email="guest@example.com", password="securepassword123")
+            wifi, pool = Amenity(name="WiFi"), Amenity(name="Pool")
+            db.session.add_all([owner, guest, wifi, pool])
+            db.session.flush()
+            old_place = Place(title="Old", price=50.0, latitude=48.0, longitude=2.0, owner_id=owner.id)
+            new_place = Place(title="New", price=80.0, latitude=48.0, longitude=2.0, owner_id=owner.id)
+            db.session.add_all([old_place, new_place])
+            db.session.flush()
+            review = Review(text="Lovely", rating=5, user_id=guest.id, place_id=new_place.id)
+            db.session.add(review)
+            db.session.commit()
+            # Everything but the new place, its review and the guest was last touched in 2020
+            for obj in (owner, wifi, old_place):
+                db.session.execute(type(obj).__table__.update()
+                                   .where(type(obj).__table__.c.id == obj.id)
+                                   .values(updated_at=OLD))
+            db.session.commit()
+            self.owner_id, self.guest_id = owner.id, guest.id
+            self.old_place_id, self.new_place_id = old_place.id, new_place.id
+            self.review_id, self.pool_id = review.id, pool.id
+
+    def _ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.get_data())
+        return [item['id'] for item in response.get_json()]
+
+    def test_updated_since_on_every_list(self):
+        self.assertEqual(self._ids(f'/api/v1/places/?updated_since={SINCE}'), [self.new_place_id])
+        self.assertEqual(self._ids(f'/api/v1/users/?updated_since={SINCE}'), [self.guest_id])
+        self.assertEqual(self._ids(f'/api/v1/amenities/?updated_since={SINCE}'), [self.pool_id])
+        self.assertEqual(self._ids(f'/api/v1/?updated_since={SINCE}'), [self.review_id])
+        self.assertEqual(self._ids(f'/api/v1/places/{self.new_place_id}/reviews?updated_since={SINCE}'),
+                         [self.review_id])
+        self.assertEqual(len(self._ids('/api/v1/places/')), 2)
+
+    def test_updated_since_with_pagination_and_stream(self):
+        self.assertEqual(self._ids(f'/api/v1/places/?updated_since={SINCE}&limit=10'), [self.new_place_id])
+        response = self.client.get(f'/api/v1/?updated_since={SINCE}&stream=array')
+        self.assertEqual([r['id'] for r in response.get_json()], [self.review_id])
+
+    def test_timezone_offsets_are_converted_to_utc(self):
+        # 2019-12-31T23:30:00-01:00 is 2020-01-01T00:30:00 UTC, after OLD
+        self.assertEqual(self._ids('/api/v1/places/?updated_since=2019-12-31T23:30:00-01:00&max_price=60'), [])
+        self.assertEqual(self._ids('/api/v1/places/?updated_since=2019-12-31T22:30:00-01:00&max_price=60'),
+                         [self.old_place_id])
+
+    def test_sync_header_covers_late_commits(self):
+        first = self.client.get(f'/api/v1/places/?updated_since={SINCE}')
+        resume = first.headers['X-Sync-Since']
+        self.assertLessEqual(iso_timestamp(resume), datetime.utcnow() - timedelta(seconds=5))
+        newest = max(iso_timestamp(p['updated_at']) for p in first.get_json())
+
+        # Stamped (flushed) before the first poll read, committed after it
+        with self.app.app_context():
+            late = Place(title="Late", price=90.0, latitude=48.0, longitude=2.0, owner_id=self.owner_id)
+            db.session.add(late)
+            db.session.flush()
+            db.session.execute(Place.__table__.update().where(Place.__table__.c.id == late.id)
+                               .values(updated_at=newest - timedelta(milliseconds=1)))
+            db.session.commit()
+            late_id = late.id
+
+        self.assertIn(late_id, self._ids(f'/api/v1/places/?updated_since={resume}'))
+        # Resuming from the largest updated_at received would skip it
+        self.assertNotIn(late_id, self._ids(f'/api/v1/places/?updated_since={newest.isoformat()}'))
+        deleted = self.client.get(f'/api/v1/changes/deleted?since={SINCE}')
+        self.assertIn('X-Sync-Since', deleted.headers)
+        self.assertNotIn('X-Sync-Since', self.client.get('/api/v1/places/').headers)
+
+    def test_invalid_updated_since(self):
+        response = self.client.get('/api/v1/places/?updated_since=yesterday')
+        self.assertEqual(response.status_code, 400)
+
+    def test_delete_writes_tombstones_for_cascades(self):
+        with self.app.app_context():
+            self.facade.delete_place(self.new_place_id)
+        response = self.client.get(f'/api/v1/changes/deleted?since={SINCE}')
+        self.assertEqual(response.status_code, 200)
+        deleted = {(t['type'], t['id']) for t in response.get_json()}
+        self.assertEqual(deleted, {('places', self.new_place_id), ('reviews', self.review_id)})
+
+        response = self.client.get(f'/api/v1/changes/deleted?since={SINCE}&type=reviews')
+        self.assertEqual([t['id'] for t in response.get_json()], [self.review_id])
+        response = self.client.get('/api/v1/changes/deleted?since=2999-01-01T00:00:00')
+        self.assertEqual(response.get_json(), [])
+
+    def test_rolled_back_delete_leaves_no_tombstone(self):
+        with self.app.app_context():
+            with self.assertRaises(RuntimeError):
+                with self.facade.transaction():
+                    self.facade.delete_amenity(self.pool_id)
+                    raise RuntimeError("abort")
+            self.assertEqual(db.session.query(Tombstone).count(), 0)
+            self.assertIsNotNone(db.session.get(Amenity, self.pool_id))
+
+    def test_deleted_requires_since(self):
+        self.assertEqual(self.client.get('/api/v1/changes/deleted').status_code, 400)
+        self.assertEqual(self.client.get(f'/api/v1/changes/deleted?since={SINCE}&type=tombstones').status_code, 400)
+
+    def test_updated_at_is_indexed(self):
+        with self.app.app_context():
+            inspector = inspect(db.engine)
+            for table in ('users', 'places', 'reviews', 'amenities'):
+                columns = [index['column_names'] for index in inspector.get_indexes(table)]
+                self.assertIn(['updated_at'], columns, table)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+import unittest
+from datetime import datetime
+from sqlalchemy import event
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from config import TestingConfig
+
+
+class UncachedConfig(TestingConfig):
+    ENTITY_CACHE_SIZE = 0
+
+
+class ConditionalGetMixin:
+    """Same scenarios with versions read from the entity cache or from SQL"""
+
+    config = TestingConfig
+
+    def setUp(self):
+        self.app = create_app(self.config)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            guest = User(first_name="Guest", last_name="Doe",
+                         email="guest@example.com", password="securepassword123")
+            wifi = Amenity(name="WiFi")
+            db.session.add_all([owner, guest, wifi])
+            db.session.flush()
+            place = Place(title="Loft", price=80.0, latitude=48.85,
+                          longitude=2.35, owner_id=owner.id)
+            place.amenities.append(wifi)
+            db.session.add(place)
+            db.session.commit()
+            self.owner_id, self.guest_id = owner.id, guest.id
+            self.place_id, self.wifi_id = place.id, wifi.id
+
+    def _etag(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Cache-Control'], 'no-cache')
+        return response.headers['ETag']
+
+    def _revalidate(self, url, etag):
+        return self.client.get(url, headers={'If-None-Match': etag}).status_code
+
+    def _add_review(self):
+        with self.app.app_context():
+            review = Review(text="Lovely", rating=5, user_id=self.guest_id, place_id=self.place_id)
+            db.session.add(review)
+            db.session.commit()
+            return review.id
+
+    def test_not_modified(self):
+        url = f'/api/v1/places/{self.place_id}'
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response.headers)
+        etag = response.headers['ETag']
+        not_modified = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.get_data(), b'')
+        self.assertEqual(not_modified.headers['ETag'], etag)
+        self.assertEqual(self._revalidate(url, '"stale"'), 200)
+        self.assertEqual(self._revalidate(url, '*'), 304)
+
+    def test_if_modified_since(self):
+        url = f'/api/v1/users/{self.owner_id}'
+        last_modified = self.client.get(url).headers['Last-Modified']
+        response = self.client.get(url, headers={'If-Modified-Since': last_modified})
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get(url, headers={'If-Modified-Since': 'Mon, 01 Jan 2001 00:00:00 GMT'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_embedded_changes_give_new_place_etag(self):
+        url = f'/api/v1/places/{self.place_id}'
+        etag = self._etag(url)
+        review_id = self._add_review()
+        self.assertEqual(self._revalidate(url, etag), 200)
+
+        etag = self._etag(url)
+        with self.app.app_context():
+            db.session.get(User, self.owner_id).update({'first_name': 'Renamed'})
+            db.session.commit()
+        self.assertEqual(self._revalidate(url, etag), 200)
+
+        etag = self._etag(url)
+        with self.app.app_context():
+            db.session.delete(db.session.get(Review, review_id))
+            db.session.commit()
+        self.assertEqual(self._revalidate(url, etag), 200)
+
+        etag = self._etag(url)
+        with self.app.app_context():
+            place = db.session.get(Place, self.place_id)
+            place.amenities.clear()
+            db.session.commit()
+        self.assertEqual(self._revalidate(url, etag), 200)
+        self.assertEqual(self._revalidate(url, self._etag(url)), 304)
+
+    def test_collection_etags(self):
+        for url in ('/api/v1/places/', '/api/v1/users/', '/api/v1/amenities/', '/api/v1/',
+                    f'/api/v1/places/{self.place_id}/reviews'):
+            etag = self._etag(url)
+            self.assertEqual(self._revalidate(url, etag), 304, url)
+        etags = {url: self._etag(url) for url in ('/api/v1/places/', '/api/v1/',
+                                                   f'/api/v1/places/{self.place_id}/reviews')}
+        self._add_review()
+        for url, etag in etags.items():
+            self.assertEqual(self._revalidate(url, etag), 200, url)
+
+    def test_query_string_is_part_of_the_etag(self):
+        self.assertNotEqual(self._etag('/api/v1/places/?min_price=10'),
+                            self._etag('/api/v1/places/?min_price=100'))
+
+    def test_field_mask_is_part_of_the_etag(self):
+        url = f'/api/v1/places/{self.place_id}'
+        full = self.client.get(url)
+        masked = self.client.get(url, headers={'X-Fields': 'id,title'})
+        self.assertEqual(set(masked.get_json()), {'id', 'title'})
+        self.assertNotEqual(full.headers['ETag'], masked.headers['ETag'])
+        self.assertIn('X-Fields', masked.headers['Vary'])
+        # The full body's tag does not validate the masked body
+        response = self.client.get(url, headers={'X-Fields': 'id,title', 'If-None-Match': full.headers['ETag']})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.get_json()), {'id', 'title'})
+
+    def test_deletions_move_list_last_modified(self):
+        review_id = self._add_review()
+        with self.app.app_context():
+            # Older than any deletion: HTTP dates have a one second resolution
+            for model in (User, Place, Review, Amenity):
+                db.session.execute(db.update(model).values(updated_at=datetime(2020, 1, 1)))
+            db.session.commit()
+        urls = ('/api/v1/places/', '/api/v1/amenities/', f'/api/v1/places/{self.place_id}/reviews')
+        dates = {url: self.client.get(url).headers['Last-Modified'] for url in urls}
+        for url, date in dates.items():
+            self.assertEqual(self.client.get(url, headers={'If-Modified-Since': date}).status_code, 304, url)
+        with self.app.app_context():
+            db.session.delete(db.session.get(Review, review_id))
+            db.session.delete(db.session.get(Amenity, self.wifi_id))
+            db.session.commit()
+        for url, date in dates.items():
+            self.assertEqual(self.client.get(url, headers={'If-Modified-Since': date}).status_code, 200, url)
+
+    def test_review_etag(self):
+        url = f'/api/v1/{self._add_review()}'
+        etag = self._etag(url)
+        self.assertEqual(self._revalidate(url, etag), 304)
+        with self.app.app_context():
+            db.session.get(User, self.guest_id).update({'first_name': 'Renamed'})
+            db.session.commit()
+        self.assertEqual(self._revalidate(url, etag), 200)
+
+    def test_missing_resource_has_no_etag(self):
+        response = self.client.get('/api/v1/places/unknown')
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response.headers)
+
+
+class TestConditionalGetCached(ConditionalGetMixin, unittest.TestCase):
+
+    def test_not_modified_runs_no_query(self):
+        url = f'/api/v1/places/{self.place_id}'
+        etag = self._etag(url)
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', before_execute)
+        try:
+            self.assertEqual(self._revalidate(url, etag), 304)
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_execute)
+        self.assertEqual(statements, [])
+
+
+class TestConditionalGetUncached(ConditionalGetMixin, unittest.TestCase):
+    config = UncachedConfig
+
+    def test_not_modified_does_not_load_the_place(self):
+        url = f'/api/v1/places/{self.place_id}'
+        etag = self._etag(url)
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', before_execute)
+        try:
+            self.assertEqual(self._revalidate(url, etag), 304)
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_execute)
+        # Only the version SELECT, no place/owner/amenities/reviews loading
+        self.assertEqual(len(statements), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
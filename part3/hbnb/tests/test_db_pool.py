@@ -0,0 +1,89 @@
+import os
+import tempfile
+import time
+import unittest
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.persistence.pool import engine_options
+from app.utils.metrics import registry
+from config import TestingConfig
+from tests.test_metrics import sample
+
+
+class TestDatabasePool(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, 'hbnb.db')
+
+        class PoolConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+            DB_POOL_SIZE = 1
+            DB_MAX_OVERFLOW = 0
+            DB_POOL_TIMEOUT = 0.5
+            DB_POOL_RECYCLE = 600
+        self.app = create_app(PoolConfig)
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.engine.dispose()
+        self.tmp.cleanup()
+
+    def test_settings_reach_the_engine(self):
+        with self.app.app_context():
+            pool = db.engine.pool
+            self.assertEqual(pool.size(), 1)
+            self.assertEqual(pool._max_overflow, 0)
+            self.assertEqual(pool._timeout, 0.5)  # fractions are kept
+            self.assertEqual(pool._recycle, 600)
+            self.assertTrue(pool._pre_ping)
+
+    def test_in_memory_sqlite_has_no_pool_settings(self):
+        self.assertEqual(engine_options({'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:'}), {})
+        app = create_app(TestingConfig)
+        self.assertEqual(app.test_client().get('/api/v1/amenities/').status_code, 200)
+
+    def test_exhausted_pool_answers_503(self):
+        before = sample(registry.render(), 'hbnb_db_pool_timeouts_total')
+        client = self.app.test_client()
+        with self.app.app_context():
+            held = db.engine.connect()  # the pool's only connection
+            try:
+                started = time.perf_counter()
+                response = client.get('/api/v1/amenities/')
+                elapsed = time.perf_counter() - started
+            finally:
+                held.close()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers['Retry-After'], '1')
+        self.assertGreaterEqual(elapsed, 0.45)
+        self.assertLess(elapsed, 2)
+        self.assertEqual(sample(registry.render(), 'hbnb_db_pool_timeouts_total'), before + 1)
+        # The connection is back: requests are served again
+        self.assertEqual(client.get('/api/v1/amenities/').status_code, 200)
+
+    def test_exhausted_pool_answers_503_on_writes(self):
+        # Write routes catch unexpected errors as 500: pool timeouts must get through
+        with self.app.app_context():
+            token = create_access_token(identity='admin-id', additional_claims={'is_admin': True})
+        headers = {'Authorization': f'Bearer {token}'}
+        client = self.app.test_client()
+        writes = (
+            ('/api/v1/amenities/', {'name': 'WiFi'}),
+            ('/api/v1/places/', {'title': 'Loft', 'price': 100, 'latitude': 48.8, 'owner_id': 'admin-id',
+                                 'longitude': 2.3, 'amenities': []}),
+        )
+        with self.app.app_context():
+            held = db.engine.connect()
+            try:
+                responses = [client.post(path, json=body, headers=headers) for path, body in writes]
+            finally:
+                held.close()
+        for response in responses:
+            self.assertEqual(response.status_code, 503, response.get_json())
+            self.assertEqual(response.headers['Retry-After'], '1')
+            self.assertNotIn('QueuePool', response.get_data(as_text=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
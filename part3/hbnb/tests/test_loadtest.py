@@ -0,0 +1,60 @@
+import tempfile
+import unittest
+from sqlalchemy import func, select
+from app import create_app, db
+from app.models.place import Place
+from app.models.review import Review
+from benchmarks.loadtest import datagen, report, runner
+from benchmarks.loadtest.drivers import WSGIClient
+from benchmarks.loadtest.workloads import WORKLOADS
+
+
+class TestLoadTest(unittest.TestCase):
+    """Smallest dataset: the generator and every workload still work"""
+
+    SIZE = 400
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.db_path = runner.prepare_database(cls.SIZE, 7, 4, cls.tmp.name, progress=lambda _message: None)
+        cls.app = create_app(runner.build_config(cls.db_path, 4))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_dataset_is_consistent(self):
+        counts = datagen.plan(self.SIZE)
+        with self.app.app_context():
+            self.assertEqual(db.session.scalar(select(func.count()).select_from(Review)), counts.reviews)
+            self.assertEqual(db.session.scalar(select(func.count()).select_from(Place)), counts.places)
+            # Aggregates match the reviews, no place is reviewed by its owner
+            mismatched = db.session.scalar(
+                select(func.count()).select_from(Place).where(Place.rating_sum != (
+                    select(func.sum(Review.rating)).where(Review.place_id == Place.id).scalar_subquery())))
+            self.assertEqual(mismatched, 0)
+            own = db.session.scalar(select(func.count()).select_from(Review).join(Place)
+                                    .where(Review.user_id == Place.owner_id))
+            self.assertEqual(own, 0)
+
+    def test_same_seed_same_ids(self):
+        with tempfile.TemporaryDirectory() as other:
+            path = runner.prepare_database(self.SIZE, 7, 4, other, progress=lambda _message: None)
+            first = runner.load_dataset(self.app, self.SIZE).place_ids
+            second = runner.load_dataset(create_app(runner.build_config(path, 4)), self.SIZE).place_ids
+        self.assertEqual(first, second)
+
+    def test_every_workload_runs_without_errors(self):
+        dataset = runner.load_dataset(self.app, self.SIZE)
+        for name, workload in WORKLOADS.items():
+            with self.subTest(workload=name):
+                summary = report.summarize(runner.run_workload(
+                    workload, lambda: WSGIClient(self.app), dataset, requests=20, concurrency=2, seed=1, warmup=2))
+                self.assertEqual(summary['requests'], 20)
+                self.assertEqual(summary['errors'], 0, summary['error_statuses'])
+                self.assertLessEqual(summary['p50_ms'], summary['p99_ms'])
+
+
+if __name__ == '__main__':
+    unittest.main()
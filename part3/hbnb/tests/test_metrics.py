@@ -0,0 +1,112 @@
+import re
+import threading
+import unittest
+from app import create_app
+from app.utils.metrics import Counter, Histogram, Registry
+from config import TestingConfig
+
+
+def sample(text, name, **labels):
+    """Value of one sample of the exposition text (0 when absent)"""
+    for line in text.splitlines():
+        match = re.fullmatch(r'(\w+)(?:\{(.*)\})? (\S+)', line)
+        if match and match.group(1) == name:
+            found = dict(re.findall(r'(\w+)="([^"]*)"', match.group(2) or ''))
+            if all(found.get(key) == value for key, value in labels.items()):
+                return float(match.group(3))
+    return 0.0
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_threads_are_summed(self):
+        registry = Registry()
+        counter = Counter(registry, 'test_total', 'Test.', ('kind',))
+        histogram = Histogram(registry, 'test_seconds', 'Test.', buckets=(0.1, 1.0))
+
+        def work():
+            for _ in range(1000):
+                counter.inc(('a',))
+                histogram.observe(0.5)
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        histogram.observe(0.05)
+
+        text = registry.render()
+        self.assertIn('# TYPE test_seconds histogram', text)
+        self.assertEqual(sample(text, 'test_total', kind='a'), 4000)
+        self.assertEqual(sample(text, 'test_seconds_bucket', le='0.1'), 1)
+        self.assertEqual(sample(text, 'test_seconds_bucket', le='1.0'), 4001)
+        self.assertEqual(sample(text, 'test_seconds_bucket', le='+Inf'), 4001)
+        self.assertEqual(sample(text, 'test_seconds_count'), 4001)
+        self.assertAlmostEqual(sample(text, 'test_seconds_sum'), 2000.05)
+
+    def test_exited_threads_are_folded(self):
+        # Threaded servers start one thread per request
+        registry = Registry()
+        counter = Counter(registry, 'test_total', 'Test.')
+        histogram = Histogram(registry, 'test_seconds', 'Test.', buckets=(1.0,))
+
+        def work():
+            counter.inc()
+            histogram.observe(0.5)
+        for batch in range(20):
+            threads = [threading.Thread(target=work) for _ in range(100)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            if batch == 9:
+                self.assertEqual(sample(registry.render(), 'test_total'), 1000)
+
+        self.assertLessEqual(len(registry._shards), 100)
+        text = registry.render()
+        self.assertLessEqual(len(registry._shards), 1)
+        self.assertEqual(sample(text, 'test_total'), 2000)
+        self.assertEqual(sample(text, 'test_seconds_bucket', le='1.0'), 2000)
+        self.assertEqual(sample(text, 'test_seconds_count'), 2000)
+
+
+class TestMetricsEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+
+    def _metrics(self):
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith('text/plain'))
+        return response.get_data(as_text=True)
+
+    def test_request_and_repository_metrics(self):
+        before = self._metrics()
+        route = dict(namespace='places', route='/api/v1/places/<string:place_id>', method='GET')
+        self.client.get('/api/v1/places/missing')
+        after = self._metrics()
+
+        self.assertEqual(sample(after, 'hbnb_http_request_duration_seconds_count', **route)
+                         - sample(before, 'hbnb_http_request_duration_seconds_count', **route), 1)
+        self.assertEqual(sample(after, 'hbnb_http_requests_total', status='404', **route)
+                         - sample(before, 'hbnb_http_requests_total', status='404', **route), 1)
+        operations = dict(model='Place', operation='get_dict')
+        self.assertEqual(sample(after, 'hbnb_repository_operations_total', **operations)
+                         - sample(before, 'hbnb_repository_operations_total', **operations), 1)
+        self.assertGreater(sample(after, 'hbnb_db_pool_checkout_seconds_count'), 0)
+
+    def test_bcrypt_durations(self):
+        before = self._metrics()
+        self.client.post('/api/v1/users/', json={
+            "first_name": "Jane", "last_name": "Doe",
+            "email": "jane.doe@example.com", "password": "securepassword123"
+        })
+        after = self._metrics()
+        self.assertEqual(sample(after, 'hbnb_bcrypt_duration_seconds_count', operation='hash')
+                         - sample(before, 'hbnb_bcrypt_duration_seconds_count', operation='hash'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
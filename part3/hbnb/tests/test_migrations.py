@@ -0,0 +1,148 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from sqlalchemy import text
+from app import create_app, db
+from app.persistence import migrations
+from config import TestingConfig
+
+# Schema of a database created by db.create_all() before migrations existed
+LEGACY_SCHEMA = """
+CREATE TABLE users (
+    first_name VARCHAR(255) NOT NULL, last_name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL, password VARCHAR(255) NOT NULL, is_admin BOOLEAN NOT NULL,
+    id VARCHAR(36) NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_users_email ON users (email);
+CREATE TABLE amenities (
+    name VARCHAR(255) NOT NULL,
+    id VARCHAR(36) NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_amenities_name ON amenities (name);
+CREATE TABLE places (
+    title VARCHAR(255) NOT NULL, description TEXT, price NUMERIC(10, 2) NOT NULL,
+    latitude FLOAT NOT NULL, longitude FLOAT NOT NULL, owner_id VARCHAR(36) NOT NULL,
+    id VARCHAR(36) NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY(owner_id) REFERENCES users (id)
+);
+CREATE INDEX ix_places_owner_id ON places (owner_id);
+CREATE TABLE place_amenity (
+    place_id VARCHAR(36) NOT NULL, amenity_id VARCHAR(36) NOT NULL,
+    PRIMARY KEY (place_id, amenity_id),
+    FOREIGN KEY(place_id) REFERENCES places (id) ON DELETE CASCADE,
+    FOREIGN KEY(amenity_id) REFERENCES amenities (id) ON DELETE CASCADE
+);
+CREATE TABLE reviews (
+    text TEXT NOT NULL, rating INTEGER NOT NULL,
+    user_id VARCHAR(36) NOT NULL, place_id VARCHAR(36) NOT NULL,
+    id VARCHAR(36) NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT unique_user_place_review UNIQUE (user_id, place_id),
+    FOREIGN KEY(user_id) REFERENCES users (id),
+    FOREIGN KEY(place_id) REFERENCES places (id)
+);
+CREATE INDEX ix_reviews_user_id ON reviews (user_id);
+CREATE INDEX ix_reviews_place_id ON reviews (place_id);
+INSERT INTO users VALUES ('Host', 'Smith', 'host@example.com', 'x', 0, 'u1', '2024-01-01', '2024-01-01');
+INSERT INTO users VALUES ('Guest', 'One', 'g1@example.com', 'x', 0, 'u2', '2024-01-01', '2024-01-01');
+INSERT INTO users VALUES ('Guest', 'Two', 'g2@example.com', 'x', 0, 'u3', '2024-01-01', '2024-01-01');
+INSERT INTO places VALUES ('Loft', NULL, 80, 48.8566, 2.3522, 'u1', 'p1', '2024-01-01', '2024-01-01');
+INSERT INTO places VALUES ('Orphan', NULL, 10, 0, 0, 'gone', 'p2', '2024-01-01', '2024-01-01');
+INSERT INTO reviews VALUES ('Great', 5, 'u2', 'p1', 'r1', '2024-01-01', '2024-01-01');
+INSERT INTO reviews VALUES ('Fine', 2, 'u3', 'p1', 'r2', '2024-01-01', '2024-01-01');
+INSERT INTO reviews VALUES ('Lost', 3, 'u2', 'p2', 'r3', '2024-01-01', '2024-01-01');
+"""
+
+
+def file_config(path, auto_migrate):
+    class FileConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        AUTO_MIGRATE = auto_migrate
+    return FileConfig
+
+
+class TestFreshDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+
+    def test_empty_database_is_created_at_head(self):
+        with self.app.app_context():
+            self.assertEqual(migrations.current_version(db.engine), migrations.head_version())
+            with db.engine.connect() as connection:
+                recorded = connection.execute(text('SELECT version FROM schema_version')).scalars().all()
+        self.assertEqual(recorded, [m.version for m in migrations.available()])
+
+    def test_upgrade_at_head_applies_nothing(self):
+        with self.app.app_context():
+            self.assertEqual(migrations.upgrade(db.engine, db.metadata), [])
+
+    def test_current_command(self):
+        result = self.app.test_cli_runner().invoke(args=['db', 'current'])
+        self.assertIn(f'Schema at version {migrations.head_version()}', result.output)
+        self.assertNotIn('Pending', result.output)
+
+
+class TestLegacyDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'legacy.db')
+        with sqlite3.connect(self.path) as connection:
+            connection.executescript(LEGACY_SCHEMA)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _sql(self, query):
+        with sqlite3.connect(self.path) as connection:
+            connection.execute('PRAGMA foreign_keys=ON')
+            return connection.execute(query).fetchall()
+
+    def test_auto_migrate_upgrades_to_head(self):
+        app = create_app(file_config(self.path, auto_migrate=True))
+        with app.app_context():
+            self.assertEqual(migrations.current_version(db.engine), migrations.head_version())
+
+        # Columns added and backfilled, orphans removed
+        rows = self._sql('SELECT id, geohash, rating_count, rating_sum, rating_avg, rating_2, rating_5 FROM places')
+        self.assertEqual(len(rows), 1)
+        place_id, geohash, count, total, average, twos, fives = rows[0]
+        self.assertEqual((place_id, count, total, average, twos, fives), ('p1', 2, 7, 3.5, 1, 1))
+        self.assertTrue(geohash.startswith('u09tvw'))
+        self.assertEqual(self._sql('SELECT id FROM reviews ORDER BY id'), [('r1',), ('r2',)])
+
+        # Indexes and tables of the current models
+        indexes = {name for (name,) in self._sql("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        for name in ('ix_places_geohash', 'ix_places_rating_avg_created_at_id',
+                     'ix_place_amenity_amenity_id', 'ix_tombstones_deleted_at', 'ix_reviews_updated_at',
+                     'ix_reviews_user_id'):
+            self.assertIn(name, indexes)
+
+        # Foreign keys now cascade: deleting the host removes the place and its reviews
+        self._sql("DELETE FROM users WHERE id = 'u1'")
+        self.assertEqual(self._sql('SELECT count(*) FROM places'), [(0,)])
+        self.assertEqual(self._sql('SELECT count(*) FROM reviews'), [(0,)])
+
+    def test_outdated_schema_answers_503_until_upgraded(self):
+        app = create_app(file_config(self.path, auto_migrate=False))
+        client = app.test_client()
+        response = client.get('/api/v1/amenities/')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.get_json()['message'], 'Database schema is out of date')
+
+        result = app.test_cli_runner().invoke(args=['db', 'upgrade'])
+        self.assertIn('Applied 0004 cascade_foreign_keys', result.output)
+        self.assertEqual(client.get('/api/v1/amenities/').status_code, 200)
+
+        # Running it again is a no-op
+        result = app.test_cli_runner().invoke(args=['db', 'upgrade'])
+        self.assertNotIn('Applied', result.output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,373 @@
+import math
+import unittest
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.utils.geo import EARTH_RADIUS_KM, encode_geohash, geohash_neighbors, geohash_precision_for_radius
+from config import TestingConfig
+
+
+class TestPlaceEndpoints(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            db.session.add(owner)
+            db.session.flush()
+            for i in range(5):
+                db.session.add(Place(title=f"Place {i}", price=10.0 * (i + 1),
+                                     latitude=48.0 + i, longitude=2.0 + i,
+                                     owner_id=owner.id))
+            db.session.commit()
+
+    def test_list_places_without_pagination(self):
+        response = self.client.get('/api/v1/places/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), 5)
+        self.assertNotIn('X-Next-Cursor', response.headers)
+
+    def test_keyset_pagination_walks_all_places(self):
+        seen = []
+        response = self.client.get('/api/v1/places/?limit=2')
+        while True:
+            self.assertEqual(response.status_code, 200)
+            seen.extend(p['id'] for p in response.get_json())
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                break
+            response = self.client.get(f'/api/v1/places/?limit=2&cursor={cursor}')
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(len(set(seen)), 5)
+
+    def test_price_filter(self):
+        response = self.client.get('/api/v1/places/?min_price=20&max_price=40')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(p['price'] for p in response.get_json()), [20.0, 30.0, 40.0])
+
+    def test_bounding_box_filter_with_pagination(self):
+        response = self.client.get('/api/v1/places/?lat_min=49&lat_max=50&lon_min=3&limit=1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), 1)
+        self.assertIn('lat_min=49', response.headers['Link'])
+        cursor = response.headers['X-Next-Cursor']
+        response = self.client.get(f'/api/v1/places/?lat_min=49&lat_max=50&lon_min=3&limit=1&cursor={cursor}')
+        self.assertEqual(len(response.get_json()), 1)
+        self.assertNotIn('X-Next-Cursor', response.headers)
+
+    def test_amenities_filter_requires_all(self):
+        from app.models.amenity import Amenity
+        with self.app.app_context():
+            wifi, pool = Amenity(name="WiFi"), Amenity(name="Pool")
+            db.session.add_all([wifi, pool])
+            places = Place.query.order_by(Place.price).all()
+            places[0].amenities = [wifi, pool]
+            places[1].amenities = [wifi]
+            db.session.commit()
+            wifi_id, pool_id, expected = wifi.id, pool.id, places[0].id
+        response = self.client.get(f'/api/v1/places/?amenities={wifi_id},{pool_id}')
+        self.assertEqual([p['id'] for p in response.get_json()], [expected])
+        response = self.client.get(f'/api/v1/places/?amenities={wifi_id}')
+        self.assertEqual(len(response.get_json()), 2)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/v1/places/?limit=2&cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 400)
+
+
+class TestPlaceListQueryCount(unittest.TestCase):
+    """GET /places/ must not issue per-row queries (N+1)"""
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+
+    def _seed(self, count):
+        from app.models.amenity import Amenity
+        from app.models.review import Review
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email=f"host{count}@example.com", password="securepassword123")
+            guest = User(first_name="Guest", last_name="Doe",
+                         email=f"guest{count}@example.com", password="securepassword123")
+            wifi = Amenity(name=f"WiFi {count}")
+            db.session.add_all([owner, guest, wifi])
+            db.session.flush()
+            for i in range(count):
+                place = Place(title=f"Place {i}", price=50.0, latitude=10.0,
+                              longitude=10.0, owner_id=owner.id, amenities=[wifi])
+                db.session.add(place)
+                db.session.flush()
+                db.session.add(Review(text="Nice stay", rating=4,
+                                      user_id=guest.id, place_id=place.id))
+            db.session.commit()
+
+    def _count_statements(self, url):
+        from sqlalchemy import event
+        statements = []
+        with self.app.app_context():
+            engine = db.engine
+
+        def before_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, 'before_cursor_execute', before_execute)
+        try:
+            response = self.client.get(url)
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_execute)
+        self.assertEqual(response.status_code, 200)
+        return len(statements)
+
+    def test_statement_count_does_not_grow_with_rows(self):
+        self._seed(2)
+        small = self._count_statements('/api/v1/places/')
+        self._seed(20)
+        large = self._count_statements('/api/v1/places/')
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, 4)
+
+
+class TestPlaceNearby(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            db.session.add(owner)
+            db.session.flush()
+            # Paris center, ~1.1 km north, Versailles (~17 km), London (~340 km)
+            for title, lat, lon in [("Louvre", 48.8606, 2.3376), ("Montmartre", 48.8867, 2.3431),
+                                    ("Versailles", 48.8049, 2.1204), ("London", 51.5074, -0.1278)]:
+                db.session.add(Place(title=title, price=100.0, latitude=lat,
+                                     longitude=lon, owner_id=owner.id))
+            db.session.commit()
+
+    def test_geohash_follows_coordinates(self):
+        with self.app.app_context():
+            place = Place.query.filter_by(title="Louvre").first()
+            self.assertTrue(place.geohash.startswith('u09tv'))
+            place.update({'latitude': 51.5074, 'longitude': -0.1278})
+            self.assertTrue(place.geohash.startswith('gcpvj'))
+
+    def test_nearby_returns_places_in_radius_sorted(self):
+        response = self.client.get('/api/v1/places/nearby?lat=48.8566&lon=2.3522&radius_km=5')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual([p['title'] for p in data], ["Louvre", "Montmartre"])
+        self.assertLess(data[0]['distance_km'], data[1]['distance_km'])
+
+        response = self.client.get('/api/v1/places/nearby?lat=48.8566&lon=2.3522&radius_km=25')
+        self.assertEqual(len(response.get_json()), 3)
+
+    @staticmethod
+    def _ring(lat, lon, radius_km, count=36):
+        """Points at radius_km from (lat, lon), every 360/count degrees of bearing"""
+        angle, phi, lam = radius_km / EARTH_RADIUS_KM, math.radians(lat), math.radians(lon)
+        points = []
+        for i in range(count):
+            bearing = math.radians(i * 360 / count)
+            phi2 = math.asin(math.sin(phi) * math.cos(angle)
+                             + math.cos(phi) * math.sin(angle) * math.cos(bearing))
+            lam2 = lam + math.atan2(math.sin(bearing) * math.sin(angle) * math.cos(phi),
+                                    math.cos(angle) - math.sin(phi) * math.sin(phi2))
+            points.append((math.degrees(phi2), (math.degrees(lam2) + 180) % 360 - 180))
+        return points
+
+    def test_cells_cover_the_circle_at_high_latitudes(self):
+        for lat, lon, radius in [(70.3, 20.1, 40), (74.5, 18.9, 100), (78.2, 15.6, 250),
+                                 (80.0, -40.0, 500), (-75.0, 120.0, 5)]:
+            precision = geohash_precision_for_radius(radius, lat)
+            self.assertGreater(precision, 0)
+            center = encode_geohash(lat, lon, precision)
+            cells = {center, *geohash_neighbors(center)}
+            for point in self._ring(lat, lon, radius * 0.999):
+                self.assertIn(encode_geohash(*point, precision), cells, (lat, radius, point))
+
+    def test_nearby_finds_every_place_near_the_pole(self):
+        # Widest cells (length 1) are too narrow here: no prefix filter applies
+        lat, lon, radius = 85.893, 78.539, 390
+        ring = self._ring(lat, lon, radius * 0.98)
+        with self.app.app_context():
+            owner_id = User.query.first().id
+            db.session.add_all([Place(title=f"Arctic {i}", price=100.0, latitude=round(p_lat, 4),
+                                      longitude=round(p_lon, 4), owner_id=owner_id)
+                                for i, (p_lat, p_lon) in enumerate(ring)])
+            db.session.commit()
+        response = self.client.get(f'/api/v1/places/nearby?lat={lat}&lon={lon}&radius_km={radius}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), len(ring))
+
+    def test_nearby_rejects_invalid_radius(self):
+        response = self.client.get('/api/v1/places/nearby?lat=48.8&lon=2.3&radius_km=-1')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get('/api/v1/places/nearby?lat=48.8&lon=2.3&radius_km=100000')
+        self.assertEqual(response.status_code, 400)
+
+
+class TestPlaceRatings(unittest.TestCase):
+    """Rating aggregates stored on places follow review writes"""
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        from app import facade
+        self.facade = facade
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            users = [User(first_name="User", last_name=str(i), email=f"user{i}@example.com",
+                          password="securepassword123") for i in range(3)]
+            db.session.add_all(users)
+            db.session.flush()
+            self.user_ids = [u.id for u in users]
+            self.place_ids = []
+            for i in range(3):
+                place = Place(title=f"Place {i}", price=50.0, latitude=48.0,
+                              longitude=2.0, owner_id=users[0].id)
+                db.session.add(place)
+                db.session.flush()
+                self.place_ids.append(place.id)
+            db.session.commit()
+
+    def _review(self, user, place, rating):
+        return self.facade.create_review({'text': 'Nice stay', 'rating': rating,
+                                          'user_id': self.user_ids[user],
+                                          'place_id': self.place_ids[place]})
+
+    def _place(self, place):
+        return self.client.get(f'/api/v1/places/{self.place_ids[place]}').get_json()
+
+    def test_aggregates_follow_review_writes(self):
+        with self.app.app_context():
+            first = self._review(1, 0, 4).id
+            self._review(2, 0, 2)
+        data = self._place(0)
+        self.assertEqual((data['rating_count'], data['rating_sum']), (2, 6))
+        self.assertEqual(data['rating_average'], 3.0)
+        self.assertEqual(data['rating_histogram'], [0, 1, 0, 1, 0])
+
+        with self.app.app_context():
+            self.facade.update_review(first, {'rating': 5})
+        data = self._place(0)
+        self.assertEqual(data['rating_histogram'], [0, 1, 0, 0, 1])
+        self.assertEqual(data['rating_average'], 3.5)
+
+        with self.app.app_context():
+            self.facade.delete_review(first)
+        data = self._place(0)
+        self.assertEqual((data['rating_count'], data['rating_sum']), (1, 2))
+        self.assertEqual(data['rating_histogram'], [0, 1, 0, 0, 0])
+
+    def test_deleting_user_removes_their_ratings(self):
+        with self.app.app_context():
+            self._review(1, 0, 5)
+            self._review(2, 0, 1)
+            self.facade.delete_user(self.user_ids[2])
+        data = self._place(0)
+        self.assertEqual((data['rating_count'], data['rating_sum']), (1, 5))
+        self.assertEqual(data['rating_histogram'], [0, 0, 0, 0, 1])
+
+    def test_sort_by_rating_with_pagination(self):
+        with self.app.app_context():
+            self._review(1, 1, 5)
+            self._review(1, 2, 3)
+        expected = [self.place_ids[1], self.place_ids[2], self.place_ids[0]]
+        response = self.client.get('/api/v1/places/?sort=-rating')
+        self.assertEqual([p['id'] for p in response.get_json()], expected)
+
+        seen = []
+        response = self.client.get('/api/v1/places/?sort=-rating&limit=1')
+        while True:
+            seen.extend(p['id'] for p in response.get_json())
+            cursor = response.headers.get('X-Next-Cursor')
+            if not cursor:
+                break
+            response = self.client.get(f'/api/v1/places/?sort=-rating&limit=1&cursor={cursor}')
+        self.assertEqual(seen, expected)
+
+    def test_cursor_is_bound_to_its_sort(self):
+        cursor = self.client.get('/api/v1/places/?limit=1').headers['X-Next-Cursor']
+        response = self.client.get(f'/api/v1/places/?sort=-rating&limit=1&cursor={cursor}')
+        self.assertEqual(response.status_code, 400)
+
+
+class TestPlaceBatch(unittest.TestCase):
+
+    def setUp(self):
+        from flask_jwt_extended import create_access_token
+        from app.models.amenity import Amenity
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            wifi = Amenity(name="WiFi")
+            db.session.add_all([owner, wifi])
+            db.session.commit()
+            self.owner_id, self.wifi_id = owner.id, wifi.id
+            token = create_access_token(identity=owner.id, additional_claims={"is_admin": False})
+        self.headers = {'Authorization': f'Bearer {token}'}
+
+    def _item(self, **overrides):
+        item = {'title': 'Loft', 'price': 80.0, 'latitude': 48.85, 'longitude': 2.35,
+                'owner_id': self.owner_id, 'amenities': [self.wifi_id]}
+        item.update(overrides)
+        return item
+
+    def test_all_items_created_with_one_commit(self):
+        commits = []
+        with self.app.app_context():
+            from sqlalchemy import event
+            engine = db.engine
+        listener = lambda conn: commits.append(1)
+        event.listen(engine, 'commit', listener)
+        try:
+            response = self.client.post('/api/v1/places/batch', headers=self.headers,
+                                        json=[self._item(title=f'Loft {i}') for i in range(50)])
+        finally:
+            event.remove(engine, 'commit', listener)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([r['index'] for r in response.get_json()], list(range(50)))
+        self.assertEqual(len(commits), 1)
+        with self.app.app_context():
+            places = Place.query.all()
+            self.assertEqual(len(places), 50)
+            self.assertTrue(all(p.amenities[0].id == self.wifi_id for p in places))
+
+    def test_invalid_items_are_reported_per_item(self):
+        response = self.client.post('/api/v1/places/batch', headers=self.headers, json=[
+            self._item(),
+            self._item(price=-5),
+            self._item(amenities=['missing-id']),
+            self._item(owner_id='someone-else'),
+            self._item(title=None),
+        ])
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([r['status'] for r in response.get_json()], [201, 400, 400, 403, 400])
+        with self.app.app_context():
+            self.assertEqual(Place.query.count(), 1)
+
+    def test_malformed_amenities_are_reported_per_item(self):
+        response = self.client.post('/api/v1/places/batch', headers=self.headers, json=[
+            self._item(),
+            self._item(amenities=5),
+            self._item(amenities=[['x']]),
+            self._item(title='Studio', amenities=[]),
+        ])
+        self.assertEqual(response.status_code, 207)
+        results = response.get_json()
+        self.assertEqual([r['status'] for r in results], [201, 400, 400, 201])
+        self.assertIn('Amenities must be a list', results[1]['error'])
+        with self.app.app_context():
+            self.assertEqual(Place.query.count(), 2)
+
+    def test_rejects_non_array_and_oversized_batches(self):
+        response = self.client.post('/api/v1/places/batch', headers=self.headers, json=self._item())
+        self.assertEqual(response.status_code, 400)
+        self.app.config['PLACE_BATCH_MAX_SIZE'] = 2
+        response = self.client.post('/api/v1/places/batch', headers=self.headers,
+                                    json=[self._item()] * 3)
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,77 @@
+import json
+import re
+import unittest
+from sqlalchemy import event
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from config import TestingConfig
+
+
+class StrictConfig(TestingConfig):
+    SQL_QUERY_WARN_THRESHOLD = 2
+
+
+class DisabledConfig(TestingConfig):
+    SQL_STATS = False
+
+
+class TestQueryStats(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(StrictConfig)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            db.session.add(owner)
+            db.session.flush()
+            db.session.add(Place(title="Loft", price=80.0, latitude=48.85,
+                                 longitude=2.35, owner_id=owner.id))
+            db.session.commit()
+
+    def _timing(self, response):
+        header = response.headers['Server-Timing']
+        match = re.fullmatch(r'db;dur=([\d.]+);desc="(\d+) queries", db-slowest;dur=([\d.]+)', header)
+        self.assertIsNotNone(match, header)
+        return float(match.group(1)), int(match.group(2)), float(match.group(3))
+
+    def test_server_timing_counts_the_request_statements(self):
+        statements = []
+        with self.app.app_context():
+            engine = db.engine
+
+        def count(*_args):
+            statements.append(1)
+        event.listen(engine, 'after_cursor_execute', count)
+        try:
+            response = self.client.get('/api/v1/places/')
+        finally:
+            event.remove(engine, 'after_cursor_execute', count)
+
+        self.assertEqual(response.status_code, 200)
+        total, queries, slowest = self._timing(response)
+        self.assertEqual(queries, len(statements))
+        self.assertGreater(queries, 0)
+        self.assertLessEqual(slowest, total)
+
+    def test_requests_over_the_threshold_are_flagged(self):
+        with self.assertLogs('hbnb.sql', 'DEBUG') as logs:
+            response = self.client.get('/api/v1/places/')
+        _total, queries, _slowest = self._timing(response)
+        line = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(line['queries'], queries)
+        self.assertEqual((line['method'], line['path'], line['status']), ('GET', '/api/v1/places/', 200))
+        self.assertEqual(line['flagged'], queries > 2)
+        self.assertEqual(logs.records[-1].levelname, 'WARNING' if queries > 2 else 'DEBUG')
+        self.assertTrue(line['slowest'].startswith('SELECT'))
+
+    def test_disabled(self):
+        app = create_app(DisabledConfig)
+        response = app.test_client().get('/api/v1/amenities/')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Server-Timing', response.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
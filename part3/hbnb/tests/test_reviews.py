@@ -0,0 +1,103 @@
+import unittest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from config import TestingConfig
+
+
+class TestReviewEndpoints(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            guest = User(first_name="Guest", last_name="Doe",
+                         email="guest@example.com", password="securepassword123")
+            db.session.add_all([owner, guest])
+            db.session.flush()
+            place = Place(title="Loft", price=80.0, latitude=48.85,
+                          longitude=2.35, owner_id=owner.id)
+            db.session.add(place)
+            db.session.commit()
+            self.guest_id, self.place_id = guest.id, place.id
+            token = create_access_token(identity=guest.id, additional_claims={"is_admin": False})
+        self.headers = {'Authorization': f'Bearer {token}'}
+
+    def _post(self, url, payload):
+        return self.client.post(url, json=payload, headers=self.headers)
+
+    def test_duplicate_review_is_conflict(self):
+        payload = {'text': 'Great', 'rating': 5, 'user_id': self.guest_id, 'place_id': self.place_id}
+        self.assertEqual(self._post('/api/v1/', payload).status_code, 201)
+        response = self._post('/api/v1/', dict(payload, rating=1))
+        self.assertEqual(response.status_code, 409)
+        # The rejected review must not leak into the place's rating aggregates
+        place = self.client.get(f'/api/v1/places/{self.place_id}').get_json()
+        self.assertEqual((place['rating_count'], place['rating_sum']), (1, 5))
+
+    def test_duplicate_review_under_place_is_conflict(self):
+        url = f'/api/v1/places/{self.place_id}/reviews'
+        self.assertEqual(self._post(url, {'text': 'Great place to stay', 'rating': 4}).status_code, 201)
+        self.assertEqual(self._post(url, {'text': 'Second review attempt', 'rating': 4}).status_code, 409)
+
+    def test_duplicate_review_keeps_earlier_writes(self):
+        from app import facade
+        from app.models.amenity import Amenity
+        from app.services.facade import DuplicateReviewError
+        review = {'text': 'Great', 'rating': 5, 'user_id': self.guest_id, 'place_id': self.place_id}
+        with self.app.app_context():
+            facade.create_review(review)
+            with facade.transaction():
+                facade.create_amenity({'name': 'Sauna'})
+                with self.assertRaises(DuplicateReviewError):
+                    facade.create_review(dict(review, rating=1))
+            # Only the savepoint of the rejected INSERT was rolled back
+            self.assertEqual(Amenity.query.filter_by(name='Sauna').count(), 1)
+            place = db.session.get(Place, self.place_id)
+            db.session.refresh(place)
+            self.assertEqual((place.rating_count, place.rating_sum), (1, 5))
+
+    def test_post_cost_does_not_depend_on_review_count(self):
+        with self.app.app_context():
+            owner_id = db.session.get(Place, self.place_id).owner_id
+            popular = Place(title="Popular", price=50.0, latitude=48.85, longitude=2.35, owner_id=owner_id)
+            db.session.add(popular)
+            db.session.flush()
+            for n in range(50):
+                reviewer = User(first_name="Fan", last_name=str(n), email=f"fan{n}@example.com",
+                                password="securepassword123")
+                db.session.add(reviewer)
+                db.session.flush()
+                db.session.add(Review(text="Loved it", rating=5, user_id=reviewer.id, place_id=popular.id))
+            db.session.commit()
+            popular_id = popular.id
+
+        loaded = []
+
+        def on_load(target, _context):
+            loaded.append(type(target).__name__)
+        event.listen(db.Model, 'load', on_load, propagate=True)
+        try:
+            counts = {}
+            for place_id in (self.place_id, popular_id):
+                del loaded[:]
+                url = f'/api/v1/places/{place_id}/reviews'
+                self.assertEqual(self._post(url, {'text': 'Nice stay overall', 'rating': 4}).status_code, 201)
+                counts[place_id] = len(loaded)
+        finally:
+            event.remove(db.Model, 'load', on_load)
+        self.assertEqual(counts[self.place_id], counts[popular_id])
+        self.assertNotIn('Review', loaded)
+
+    def test_exists_for(self):
+        from app import facade
+        with self.app.app_context():
+            self.assertFalse(facade.review_repo.exists_for(self.guest_id, self.place_id))
+            facade.create_review({'text': 'Great', 'rating': 5,
+                                  'user_id': self.guest_id, 'place_id': self.place_id})
+            self.assertTrue(facade.review_repo.exists_for(self.guest_id, self.place_id))
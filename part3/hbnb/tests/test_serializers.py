@@ -0,0 +1,131 @@
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from flask_restx import marshal
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from app.utils.serializers import compile_marshaller, serializer_for
+from config import TestingConfig
+
+
+def reflective_to_dict(obj):
+    """The column loop BaseModel.to_dict() used before serializers were compiled"""
+    data = {}
+    for column in obj.__table__.columns:
+        if column.name in obj.__serialize_exclude__:
+            continue
+        value = getattr(obj, column.name)
+        data[column.name] = value.isoformat() if isinstance(value, datetime) else value
+    data['__class__'] = obj.__class__.__name__
+    return data
+
+
+class TestCompiledSerializers(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            guest = User(first_name="Guest", last_name="Doe",
+                         email="guest@example.com", password="securepassword123")
+            wifi = Amenity(name="WiFi")
+            db.session.add_all([owner, guest, wifi])
+            db.session.flush()
+            place = Place(title="Loft", description=None, price=80.5, latitude=48.85,
+                          longitude=2.35, owner_id=owner.id)
+            place.amenities.append(wifi)
+            db.session.add(place)
+            db.session.flush()
+            db.session.add(Review(text="Lovely stay", rating=4,
+                                  user_id=guest.id, place_id=place.id))
+            db.session.commit()
+
+    def test_matches_reflective_loop(self):
+        with self.app.app_context():
+            for model in (User, Place, Review, Amenity):
+                for obj in db.session.query(model):
+                    self.assertEqual(serializer_for(model)(obj), reflective_to_dict(obj))
+
+    def test_expired_object_is_reloaded(self):
+        with self.app.app_context():
+            place = db.session.query(Place).one()
+            expected = reflective_to_dict(place)
+            db.session.expire(place)
+            self.assertEqual(serializer_for(Place)(place), expected)
+
+    def test_pending_object(self):
+        with self.app.app_context():
+            amenity = Amenity(name="Pool")
+            self.assertEqual(serializer_for(Amenity)(amenity), reflective_to_dict(amenity))
+
+    def test_excluded_columns(self):
+        with self.app.app_context():
+            user = db.session.query(User).first()
+            self.assertNotIn('password', user.to_dict())
+            place = db.session.query(Place).one()
+            data = place.to_dict()
+            for key in ('owner_id', 'rating_1', 'rating_5'):
+                self.assertNotIn(key, data)
+            self.assertEqual(len(data['rating_histogram']), 5)
+
+    def test_marshallers_match_restx(self):
+        from app.api.v1.places import place_response, place_nearby_response
+        from app.api.v1.reviews import review_response_model
+        from app.api.v1.users import user_response_model
+        from app.api.v1.amenities import amenity_response_model
+        with self.app.app_context():
+            samples = [
+                (place_response, [p.to_dict() for p in db.session.query(Place)]),
+                (review_response_model, [r.to_dict() for r in db.session.query(Review)]),
+                (user_response_model, [u.to_dict() for u in db.session.query(User)]),
+                (amenity_response_model, [a.to_dict() for a in db.session.query(Amenity)]),
+            ]
+        # Edge cases: missing keys, None nested/list values, loose types
+        samples.append((place_nearby_response, [
+            {},
+            {'id': 1, 'price': Decimal('10.50'), 'owner': None, 'amenities': None,
+             'reviews': [None, {'rating': '4'}], 'rating_histogram': (1, None, 3),
+             'distance_km': 2},
+        ]))
+        samples.append((user_response_model, [{'is_admin': None}, {'is_admin': 1}]))
+        for api_model, rows in samples:
+            compiled = compile_marshaller(api_model)
+            for row in rows:
+                self.assertEqual(compiled(row), dict(marshal(row, api_model)), api_model.name)
+
+    def test_list_endpoints_keep_response_shape(self):
+        from app.api.v1.places import place_response
+        response = self.client.get('/api/v1/places/')
+        self.assertEqual(response.status_code, 200)
+        with self.app.app_context():
+            expected = [marshal(p.to_dict(), place_response) for p in db.session.query(Place)]
+        self.assertEqual(response.get_json(), expected)
+
+    def test_masked_marshallers_match_restx(self):
+        from app.api.v1.places import place_response
+        with self.app.app_context():
+            rows = [p.to_dict() for p in db.session.query(Place)]
+        compiled = compile_marshaller(place_response)
+        for mask in ('id,title', '{price,owner{first_name},reviews{rating}}', 'amenities{name},unknown', '*'):
+            for row in rows:
+                self.assertEqual(compiled.masked(mask)(row), dict(marshal(row, place_response, mask=mask)), mask)
+        self.assertIs(compiled.masked('id,title'), compiled.masked('id,title'))
+
+    def test_list_endpoints_apply_x_fields(self):
+        response = self.client.get('/api/v1/amenities/', headers={'X-Fields': 'name'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), [{'name': 'WiFi'}])
+        response = self.client.get('/api/v1/places/', headers={'X-Fields': 'title,owner{id}'})
+        self.assertEqual([set(p) for p in response.get_json()], [{'title', 'owner'}])
+        self.assertEqual(set(response.get_json()[0]['owner']), {'id'})
+        # Same answer as the single-item route for a malformed mask
+        self.assertEqual(self.client.get('/api/v1/amenities/', headers={'X-Fields': 'name{'}).status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
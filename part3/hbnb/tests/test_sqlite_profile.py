@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from sqlalchemy import text
+from app import create_app, db
+from config import TestingConfig
+
+
+def file_config(path, pragmas=None):
+    class FileConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        if pragmas is not None:
+            SQLITE_PRAGMAS = pragmas
+    return FileConfig
+
+
+class TestSQLiteProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'hbnb.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _pragma(self, name):
+        return db.session.execute(text(f'PRAGMA {name}')).scalar()
+
+    def test_profile_is_applied_to_each_connection(self):
+        app = create_app(file_config(self.path))
+        with app.app_context():
+            self.assertEqual(self._pragma('journal_mode'), 'wal')
+            self.assertEqual(self._pragma('synchronous'), 1)  # NORMAL
+            self.assertEqual(self._pragma('foreign_keys'), 1)
+            self.assertEqual(self._pragma('busy_timeout'), 5000)
+            self.assertEqual(self._pragma('cache_size'), -65536)
+            self.assertEqual(self._pragma('mmap_size'), 268435456)
+
+    def test_foreign_keys_without_profile(self):
+        app = create_app(file_config(self.path, pragmas={}))
+        with app.app_context():
+            self.assertEqual(self._pragma('journal_mode'), 'delete')
+            self.assertEqual(self._pragma('foreign_keys'), 1)
+
+    def _commit_during_read(self, config):
+        """Commit an INSERT while another connection is inside a read transaction"""
+        app = create_app(config)
+        with app.app_context():
+            with db.engine.connect() as reader, db.engine.connect() as writer:
+                reader.exec_driver_sql('BEGIN')
+                self.assertEqual(reader.exec_driver_sql('SELECT count(*) FROM amenities').scalar(), 0)
+                writer.exec_driver_sql('PRAGMA busy_timeout=0')
+                writer.exec_driver_sql('BEGIN IMMEDIATE')
+                writer.exec_driver_sql(
+                    "INSERT INTO amenities (id, name, created_at, updated_at) "
+                    "VALUES ('a1', 'WiFi', '2024-01-01', '2024-01-01')")
+                try:
+                    writer.exec_driver_sql('COMMIT')
+                    # The reader keeps its snapshot until its transaction ends
+                    return reader.exec_driver_sql('SELECT count(*) FROM amenities').scalar()
+                finally:
+                    reader.exec_driver_sql('COMMIT')
+
+    def test_readers_do_not_block_writers(self):
+        self.assertEqual(self._commit_during_read(file_config(self.path)), 0)
+
+    def test_rollback_journal_blocks_writers(self):
+        with self.assertRaisesRegex(Exception, 'locked'):
+            self._commit_during_read(file_config(self.path, pragmas={'journal_mode': 'DELETE'}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import json
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import event
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from app.utils.json_encoding import get_encoder
+from config import TestingConfig
+
+
+class StreamingConfig(TestingConfig):
+    STREAM_BATCH_SIZE = 2
+
+
+class TestStreamedLists(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(StreamingConfig)
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            guest = User(first_name="Guest", last_name="Doe",
+                         email="guest@example.com", password="securepassword123")
+            wifi = Amenity(name="WiFi")
+            db.session.add_all([owner, guest, wifi])
+            db.session.flush()
+            for i in range(5):
+                place = Place(title=f"Place {i}", price=10.0 * (i + 1),
+                              latitude=48.0 + i, longitude=2.0 + i, owner_id=owner.id)
+                place.amenities.append(wifi)
+                db.session.add(place)
+                db.session.flush()
+                db.session.add(Review(text="Lovely stay", rating=1 + i % 5,
+                                      user_id=guest.id, place_id=place.id))
+            db.session.commit()
+
+    def test_array_stream_matches_list(self):
+        expected = self.client.get('/api/v1/places/?sort=created_at').get_json()
+        response = self.client.get('/api/v1/places/?sort=created_at&stream=array')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(json.loads(response.get_data()), expected)
+
+    def test_ndjson_stream_matches_list(self):
+        expected = self.client.get('/api/v1/places/?min_price=20').get_json()
+        response = self.client.get('/api/v1/places/?min_price=20&stream=ndjson')
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = response.get_data().decode().splitlines()
+        self.assertEqual(sorted((json.loads(line) for line in lines), key=lambda p: p['id']),
+                         sorted(expected, key=lambda p: p['id']))
+
+    def test_empty_stream(self):
+        response = self.client.get('/api/v1/places/?min_price=1000&stream=array')
+        self.assertEqual(json.loads(response.get_data()), [])
+        response = self.client.get('/api/v1/places/?min_price=1000&stream=ndjson')
+        self.assertEqual(response.get_data(), b'')
+
+    def test_rows_are_fetched_in_batches(self):
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', before_execute)
+        try:
+            chunks = list(self.client.get('/api/v1/places/?stream=ndjson').response)
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_execute)
+        # 5 places, 2 per batch: 3 chunks, amenities/reviews loaded once per batch
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(len([s for s in statements if 'FROM reviews' in s and 'count(' not in s]), 3)
+
+    def test_stream_rejects_pagination(self):
+        response = self.client.get('/api/v1/places/?stream=array&limit=2')
+        self.assertEqual(response.status_code, 400)
+
+    def test_reviews_stream(self):
+        expected = self.client.get('/api/v1/').get_json()
+        response = self.client.get('/api/v1/?stream=array')
+        self.assertEqual(sorted(json.loads(response.get_data()), key=lambda r: r['id']),
+                         sorted(expected, key=lambda r: r['id']))
+
+
+class TestJsonEncoders(unittest.TestCase):
+
+    def test_encoders_agree(self):
+        data = {'price': Decimal('10.50'), 'at': datetime(2024, 1, 2, 3, 4, 5),
+                'tags': ['a', None], 'name': 'Café'}
+        self.assertEqual(json.loads(get_encoder('json')(data)),
+                         json.loads(get_encoder('orjson')(data)))
+
+    def test_unknown_encoder(self):
+        with self.assertRaises(ValueError):
+            get_encoder('yaml')
+
+    def test_stdlib_encoder_app(self):
+        class StdlibJsonConfig(TestingConfig):
+            JSON_ENCODER = 'json'
+        client = create_app(StdlibJsonConfig).test_client()
+        response = client.get('/api/v1/amenities/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from sqlalchemy import event
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from config import TestingConfig
+
+
+class TestUnitOfWork(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        from app import facade
+        self.facade = facade
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            owner = User(first_name="Host", last_name="Smith",
+                         email="host@example.com", password="securepassword123")
+            wifi, pool = Amenity(name="WiFi"), Amenity(name="Pool")
+            db.session.add_all([owner, wifi, pool])
+            db.session.flush()
+            place = Place(title="Loft", price=80.0, latitude=48.85,
+                          longitude=2.35, owner_id=owner.id)
+            db.session.add(place)
+            db.session.commit()
+            self.owner_id, self.place_id = owner.id, place.id
+            self.amenity_ids = [wifi.id, pool.id]
+            token = create_access_token(identity=owner.id, additional_claims={"is_admin": False})
+        self.headers = {'Authorization': f'Bearer {token}'}
+
+        self.commits = []
+        with self.app.app_context():
+            self.engine = db.engine
+        event.listen(self.engine, 'commit', self._on_commit)
+
+    def tearDown(self):
+        event.remove(self.engine, 'commit', self._on_commit)
+
+    def _on_commit(self, conn):
+        self.commits.append(conn)
+
+    def _title(self):
+        with self.app.app_context():
+            return db.session.get(Place, self.place_id).title
+
+    def test_request_commits_once(self):
+        response = self.client.put(f'/api/v1/places/{self.place_id}', headers=self.headers,
+                                   json={'title': 'Renovated loft', 'amenities': self.amenity_ids})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.commits), 1)
+        self.assertEqual(self._title(), 'Renovated loft')
+
+    def test_read_only_request_does_not_commit(self):
+        self.client.get(f'/api/v1/places/{self.place_id}')
+        self.assertEqual(self.commits, [])
+
+    def test_nested_transactions_commit_once_outside_requests(self):
+        with self.app.app_context():
+            with self.facade.transaction():
+                self.facade.update_place(self.place_id, {'title': 'First'})
+                self.facade.create_amenity({'name': 'Sauna'})
+        self.assertEqual(len(self.commits), 1)
+        self.assertEqual(self._title(), 'First')
+
+    def test_error_rolls_back_the_whole_unit(self):
+        with self.app.app_context():
+            with self.assertRaises(ValueError):
+                with self.facade.transaction():
+                    self.facade.update_place(self.place_id, {'title': 'Never saved'})
+                    self.facade.update_place(self.place_id, {'price': -1})
+        self.assertEqual(self.commits, [])
+        self.assertEqual(self._title(), 'Loft')
+
+    def test_error_response_rolls_back_request_writes(self):
+        app, facade, place_id = self.app, self.facade, self.place_id
+
+        @app.route('/_test/failing-write')
+        def failing_write():
+            facade.update_place(place_id, {'title': 'Never saved'})
+            return {'error': 'rejected after the write'}, 400
+
+        self.assertEqual(self.client.get('/_test/failing-write').status_code, 400)
+        self.assertEqual(self.commits, [])
+        self.assertEqual(self._title(), 'Loft')
@@ -355,8 +355,9 @@ function checkAuthenticationAndFetchPlaces() {
 
 /**
  * Fetches the list of places from the API
+ * Optional maxPrice is sent as ?max_price= so the server does the filtering
  */
-async function fetchPlaces(token = null) {
+async function fetchPlaces(token = null, maxPrice = '') {
     try {
         const headers = {
             'Content-Type': 'application/json'
@@ -367,7 +368,13 @@ async function fetchPlaces(token = null) {
             headers['Authorization'] = `Bearer ${token}`;
         }
 
-        const response = await fetch(`${API_URL}/places/`, {
+        const params = new URLSearchParams();
+        if (maxPrice !== '' && maxPrice !== 'All') {
+            params.set('max_price', maxPrice);
+        }
+        const query = params.toString() ? `?${params.toString()}` : '';
+
+        const response = await fetch(`${API_URL}/places/${query}`, {
             method: 'GET',
             headers: headers
         });
@@ -451,26 +458,10 @@ function initializePriceFilter() {
 }
 
 /**
- * Filters places by price (client-side)
+ * Filters places by price (server-side, via GET /places/?max_price=)
  */
 function filterPlacesByPrice(maxPrice) {
-    const placeCards = document.querySelectorAll('.place-card');
-
-    placeCards.forEach(card => {
-        const price = parseFloat(card.dataset.price);
-
-        if (maxPrice === '' || maxPrice === 'All') {
-            // Show all places
-            card.style.display = 'block';
-        } else {
-            // Show only places within the price range
-            if (price <= parseFloat(maxPrice)) {
-                card.style.display = 'block';
-            } else {
-                card.style.display = 'none';
-            }
-        }
-    });
+    fetchPlaces(getCookie('token'), maxPrice);
 }
 
 /**